@@ -0,0 +1,245 @@
+"""
+Capture Replay Module
+기록된 상태 스트림 재생 - 현장 데이터를 장비처럼 응답 (시뮬레이터 재생 모드)
+- .rfcap: 헤더 16바이트 + 레코드 (시각 float64 + 상태 응답 데이터 56바이트 원본) - 메모리 맵으로 읽음
+- .csv: DataManager.save_excel 내보내기 (초 단위 시각은 같은 초 안에서 균등 분배)
+- 재생: speed 1.0 = 원래 시간, N = N배속, 0 = 상태 요청마다 다음 레코드 (최대 속도)
+
+사용 예:
+    python capture_replay.py record --host 192.168.0.10 --port 5000 --interval 0.05 field.rfcap
+    python capture_replay.py convert rf_data_20250101_120000.csv field.rfcap
+    python capture_replay.py info field.rfcap
+    python rf_sim_core.py --replay field.rfcap --replay-speed 4
+"""
+
+import os
+import csv
+import time
+import struct
+import socket
+import argparse
+import datetime
+import numpy as np
+
+MAGIC = b"RFCAP1\x00\x00"
+HEADER = struct.Struct('<8sII')  # magic, 레코드 크기, 예비
+STATUS_SIZE = 56
+
+# 상태 응답 데이터 레이아웃 (VHF 매뉴얼 기준, rf_sim_core.STATUS_STRUCT와 동일 순서)
+STATUS_DTYPE = [
+    ("rf_on_off", "u1"), ("control_mode", "u1"), ("system_state", "<u2"),
+    ("led_state", "<u2"), ("alarm_state", "<u2"),
+    ("set_power", "<f4"), ("forward_power", "<f4"), ("reflect_power", "<f4"), ("delivery_power", "<f4"),
+    ("frequency", "<f4"), ("gamma", "<f4"), ("real_gamma", "<f4"), ("image_gamma", "<f4"), ("rf_phase", "<f4"),
+    ("temperature", "<f4"), ("factory_info2", "<u4"), ("firmware_version", "<f4"),
+]
+RECORD_DTYPE = np.dtype([("time", "<f8")] + STATUS_DTYPE)
+STATUS_FIELDS = [name for name, _ in STATUS_DTYPE if name != "factory_info2"]
+
+# DataManager.add_data_entry 컬럼 -> 상태 키
+CSV_FLOAT_COLUMNS = {
+    "Set Power": "set_power", "Forward Power": "forward_power", "Reflect Power": "reflect_power",
+    "Delivery Power": "delivery_power", "Gamma": "gamma", "Real Gamma": "real_gamma",
+    "Image Gamma": "image_gamma", "RF Phase": "rf_phase", "Temperature": "temperature",
+    "Firmware Version": "firmware_version",
+}
+CONTROL_MODES = {
+    "User Port": 0, "Serial": 1, "Ethernet": 2, "EtherCAT": 3, "Serial+User": 4, "Ethernet+User": 5
+}
+
+
+# ========================================
+# 파일 입출력
+# ========================================
+def write_header(f):
+    f.write(HEADER.pack(MAGIC, RECORD_DTYPE.itemsize, 0))
+
+
+def open_capture(path):
+    """.rfcap 메모리 맵 (읽기 전용 구조화 배열)"""
+    with open(path, "rb") as f:
+        magic, record_size, _ = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"rfcap 형식 아님: {path}")
+    count = (os.path.getsize(path) - HEADER.size) // record_size
+    if count <= 0:
+        raise ValueError(f"레코드 없음: {path}")
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def _parse_hex(text):
+    """'0x0021' / 'Alarm 0x0004' / 'None' -> int"""
+    text = (text or "").strip()
+    if "0x" in text:
+        return int(text.split("0x")[1], 16)
+    return int(text) if text.isdigit() else 0
+
+
+def load_csv(path):
+    """DataManager.save_excel CSV -> 레코드 배열 (주파수 MHz -> Hz)"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    if not rows:
+        raise ValueError(f"데이터 없음: {path}")
+
+    records = np.zeros(len(rows), dtype=RECORD_DTYPE)
+    seconds = np.array([datetime.datetime.strptime(row["Time"], "%Y-%m-%d %H:%M:%S").timestamp()
+                        for row in rows])
+    # 같은 초에 기록된 행은 그 초 안에서 균등 분배
+    _, first, counts = np.unique(seconds, return_index=True, return_counts=True)
+    offsets = np.concatenate([np.arange(n) / n for n in counts[np.argsort(first)]])
+    records["time"] = seconds + offsets
+
+    for i, row in enumerate(rows):
+        rec = records[i]
+        rec["rf_on_off"] = 1 if row.get("RF Status") == "On" else 0
+        rec["control_mode"] = CONTROL_MODES.get(row.get("Control Mode"), 0)
+        rec["system_state"] = _parse_hex(row.get("System State"))
+        rec["led_state"] = _parse_hex(row.get("LED State"))
+        rec["alarm_state"] = _parse_hex(row.get("Alarm State"))
+        rec["frequency"] = float(row.get("Frequency") or 0) * 1000000
+        for column, key in CSV_FLOAT_COLUMNS.items():
+            rec[key] = float(row.get(column) or 0)
+    return records
+
+
+def load_capture(path):
+    """확장자별 로드 (.csv는 메모리로, 그 외는 rfcap 메모리 맵)"""
+    if path.lower().endswith(".csv"):
+        return load_csv(path)
+    return open_capture(path)
+
+
+def save_capture(records, path):
+    with open(path, "wb") as f:
+        write_header(f)
+        f.write(np.ascontiguousarray(records, dtype=RECORD_DTYPE).tobytes())
+
+
+# ========================================
+# 재생
+# ========================================
+class CaptureReplay:
+    """
+    기록 재생기 - 클라이언트별 재생 위치 (client_state["replay"])
+    - speed > 0: 첫 상태 요청 시각 기준 경과 시간 * speed 위치의 레코드
+    - speed == 0: 요청마다 다음 레코드
+    - loop: 끝나면 처음부터 (아니면 마지막 레코드 유지)
+    """
+
+    def __init__(self, records, speed=1.0, loop=True):
+        self.records = records
+        self.speed = speed
+        self.loop = loop
+        self.offsets = np.asarray(records["time"], dtype=np.float64) - float(records["time"][0])
+        # 반복 주기 = 기록 길이 + 평균 샘플 간격
+        step = self.offsets[-1] / (len(records) - 1) if len(records) > 1 else 1.0
+        self.period = self.offsets[-1] + step
+
+    @classmethod
+    def load(cls, path, speed=1.0, loop=True):
+        return cls(load_capture(path), speed, loop)
+
+    def __len__(self):
+        return len(self.records)
+
+    def index_at(self, client_state, current_time):
+        playback = client_state.setdefault("replay", {"start": current_time, "count": 0})
+        count = len(self.records)
+        if self.speed <= 0:
+            index = playback["count"]
+            playback["count"] += 1
+            return index % count if self.loop else min(index, count - 1)
+
+        position = (current_time - playback["start"]) * self.speed
+        if self.loop:
+            position %= self.period
+        return max(int(np.searchsorted(self.offsets, position, side="right")) - 1, 0)
+
+    def status_at(self, client_state, current_time):
+        """현재 재생 위치의 상태 dict (create_status_response 입력 형식)"""
+        record = self.records[self.index_at(client_state, current_time)]
+        return {key: record[key].item() for key in STATUS_FIELDS}
+
+
+# ========================================
+# 기록 (실장비/시뮬레이터 상태 폴링)
+# ========================================
+def record(host, port, path, interval=0.05, duration=None):
+    """상태 요청을 주기적으로 보내 응답 데이터를 .rfcap으로 저장 - 반환: 레코드 수"""
+    from rf_sim_core import RFProtocol
+
+    request = RFProtocol.create_frame(RFProtocol.CMD_DEVICE_STATUS_GET, RFProtocol.SUBCMD_DEVICE_STATUS)
+    frame_size = 6 + STATUS_SIZE + 2
+    count = 0
+    start = time.monotonic()
+    with socket.create_connection((host, port), timeout=5.0) as sock, open(path, "wb") as f:
+        write_header(f)
+        next_time = start
+        try:
+            while duration is None or time.monotonic() - start < duration:
+                sock.sendall(request)
+                frame = b""
+                while len(frame) < frame_size:
+                    chunk = sock.recv(frame_size - len(frame))
+                    if not chunk:
+                        raise ConnectionError("장비 연결 종료")
+                    frame += chunk
+                parsed = RFProtocol.parse_frame(frame)
+                if parsed and len(parsed["data"]) >= STATUS_SIZE:
+                    f.write(struct.pack('<d', time.time()) + parsed["data"][:STATUS_SIZE])
+                    count += 1
+                next_time += interval
+                time.sleep(max(next_time - time.monotonic(), 0.0))
+        except KeyboardInterrupt:
+            pass
+    return count
+
+
+def describe(records):
+    times = records["time"]
+    span = float(times[-1] - times[0])
+    rate = (len(records) - 1) / span if span > 0 else 0.0
+    rf_on = int(np.count_nonzero(records["rf_on_off"]))
+    return (f"{len(records)}개 레코드, {span:.1f}초 ({rate:.1f}/s), "
+            f"{datetime.datetime.fromtimestamp(float(times[0])):%Y-%m-%d %H:%M:%S} 시작, "
+            f"RF On {rf_on}개, 최대 Forward {float(records['forward_power'].max()):.1f}W")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상태 스트림 기록/변환")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="장비 상태 폴링 기록")
+    rec.add_argument("path")
+    rec.add_argument("--host", default="127.0.0.1")
+    rec.add_argument("--port", type=int, default=5000)
+    rec.add_argument("--interval", type=float, default=0.05, help="폴링 주기 (초)")
+    rec.add_argument("--duration", type=float, help="기록 시간 (초, 기본: Ctrl+C까지)")
+
+    conv = sub.add_parser("convert", help="CSV -> rfcap")
+    conv.add_argument("source")
+    conv.add_argument("path")
+
+    info = sub.add_parser("info", help="기록 요약")
+    info.add_argument("path")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "record":
+            count = record(args.host, args.port, args.path, args.interval, args.duration)
+            print(f"{count}개 레코드 저장: {args.path}")
+        elif args.command == "convert":
+            records = load_csv(args.source)
+            save_capture(records, args.path)
+            print(f"변환 완료: {args.path} ({describe(records)})")
+        else:
+            print(describe(load_capture(args.path)))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"오류: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
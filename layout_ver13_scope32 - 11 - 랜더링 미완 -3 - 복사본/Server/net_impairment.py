@@ -0,0 +1,182 @@
+"""
+Network Impairment Module
+시뮬레이터 응답 경로 네트워크 장애 주입 - 지연 분포, 지터, 분할/병합 전송, 연결 리셋, 응답 정지/누락
+- 프로파일: default + 명령별 지연 + 시나리오별 덮어쓰기 (JSON 파일 또는 내장 프리셋)
+- 연결마다 독립 난수 (seed + 연결 키) - 같은 시드/명령 순서면 같은 장애 패턴
+
+프로파일 형식 (모든 키 생략 가능):
+    {
+      "default": {
+        "latency_ms": {"dist": "lognormal", "median": 2.0, "sigma": 0.5},
+        "command_latency_ms": {"0x10/0x01": 1.0, "0x04/0x09": {"dist": "uniform", "min": 20, "max": 60}},
+        "jitter_ms": 0.5,
+        "fragment": {"probability": 0.1, "max_chunks": 4, "gap_ms": 1.0},
+        "coalesce_ms": 5.0,
+        "reset_probability": 0.0001,
+        "stall": {"probability": 0.001, "duration_ms": 3000},
+        "drop_probability": 0.0
+      },
+      "scenarios": {"4": {"reset_probability": 0.01}}
+    }
+지연 분포: 숫자(고정), fixed(value), uniform(min, max), normal(mean, std), lognormal(median, sigma), exponential(mean)
+"""
+
+import os
+import json
+import math
+import random
+import zlib
+
+# 동작
+SEND = "send"
+DROP = "drop"
+RESET = "reset"
+
+# 내장 프리셋
+PRESETS = {
+    "none": {},
+    "lan": {
+        "default": {"latency_ms": {"dist": "lognormal", "median": 0.5, "sigma": 0.3}, "jitter_ms": 0.2},
+    },
+    "slow_firmware": {
+        "default": {
+            "latency_ms": {"dist": "lognormal", "median": 8.0, "sigma": 0.6},
+            "command_latency_ms": {"0x04/0x09": {"dist": "uniform", "min": 40, "max": 120}},
+            "jitter_ms": 2.0,
+            "stall": {"probability": 0.002, "duration_ms": 1500},
+        },
+    },
+    "lossy": {
+        "default": {
+            "latency_ms": {"dist": "normal", "mean": 5.0, "std": 3.0},
+            "jitter_ms": 5.0,
+            "fragment": {"probability": 0.3, "max_chunks": 6, "gap_ms": 2.0},
+            "coalesce_ms": 10.0,
+            "reset_probability": 0.0005,
+            "stall": {"probability": 0.001, "duration_ms": 5000},
+            "drop_probability": 0.0005,
+        },
+    },
+}
+
+
+def load_impairment(spec, seed=None):
+    """프리셋 이름 또는 JSON 파일 경로 -> NetworkImpairment (None/'none'이면 None)"""
+    if not spec or spec == "none":
+        return None
+    if spec in PRESETS:
+        return NetworkImpairment(PRESETS[spec], seed)
+    if not os.path.exists(spec):
+        raise ValueError(f"장애 프로파일 없음: {spec} (프리셋: {', '.join(PRESETS)})")
+    with open(spec, "r", encoding="utf-8") as f:
+        return NetworkImpairment(json.load(f), seed)
+
+
+def command_key(cmd, subcmd):
+    """명령 키 문자열 '0x10/0x01'"""
+    return f"0x{cmd:02X}/0x{(subcmd or 0):02X}"
+
+
+def sample_ms(rng, spec):
+    """지연 분포 샘플 (ms, 0 이상)"""
+    if spec is None:
+        return 0.0
+    if isinstance(spec, (int, float)):
+        return max(float(spec), 0.0)
+    dist = spec.get("dist", "fixed")
+    if dist == "fixed":
+        value = spec.get("value", 0.0)
+    elif dist == "uniform":
+        value = rng.uniform(spec.get("min", 0.0), spec.get("max", 0.0))
+    elif dist == "normal":
+        value = rng.gauss(spec.get("mean", 0.0), spec.get("std", 0.0))
+    elif dist == "lognormal":
+        value = spec.get("median", 1.0) * math.exp(rng.gauss(0.0, spec.get("sigma", 0.0)))
+    elif dist == "exponential":
+        mean = spec.get("mean", 0.0)
+        value = rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+    else:
+        raise ValueError(f"알 수 없는 지연 분포: {dist}")
+    return max(float(value), 0.0)
+
+
+class ImpairmentLink:
+    """연결 1개의 장애 상태 - 독립 난수, 송신 순서 유지용 마지막 예정 시각"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.last_due = 0.0
+        self.stats = {SEND: 0, DROP: 0, RESET: 0, "fragmented": 0, "stalled": 0}
+
+
+class NetworkImpairment:
+    """응답 전송 계획 생성 (스레드/이벤트 루프 공용)"""
+
+    def __init__(self, config=None, seed=None):
+        config = config or {}
+        self.seed = seed
+        self.default = dict(config.get("default", {}))
+        # 시나리오 번호 -> default에 덮어쓴 프로파일
+        self.scenarios = {int(index): {**self.default, **profile}
+                          for index, profile in config.get("scenarios", {}).items()}
+
+    def profile(self, scenario_index):
+        return self.scenarios.get(scenario_index, self.default)
+
+    def new_link(self, link_key):
+        """연결별 난수 (seed가 없으면 매번 다름)"""
+        if self.seed is None:
+            return ImpairmentLink(random.Random())
+        return ImpairmentLink(random.Random(self.seed * 1000003 + zlib.crc32(repr(link_key).encode("utf-8"))))
+
+    def schedule(self, link, cmd, subcmd, response, scenario_index, now):
+        """
+        응답 1개의 전송 계획
+        반환: (SEND, [(전송 시각, 바이트), ...]) / (DROP, []) / (RESET, [])
+        - 전송 시각은 연결 내 순서 유지 (이전 응답보다 먼저 나가지 않음)
+        """
+        profile = self.profile(scenario_index)
+        rng = link.rng
+
+        if rng.random() < profile.get("reset_probability", 0.0):
+            link.stats[RESET] += 1
+            return RESET, []
+        if rng.random() < profile.get("drop_probability", 0.0):
+            link.stats[DROP] += 1
+            return DROP, []
+
+        latency = profile.get("command_latency_ms", {}).get(command_key(cmd, subcmd), profile.get("latency_ms"))
+        delay_ms = sample_ms(rng, latency)
+        jitter = profile.get("jitter_ms", 0.0)
+        if jitter > 0:
+            delay_ms = max(delay_ms + rng.uniform(-jitter, jitter), 0.0)
+
+        # 응답 정지 - 이후 응답도 이 시각 뒤로 밀림 (펌웨어 멈춤)
+        stall = profile.get("stall")
+        if stall and rng.random() < stall.get("probability", 0.0):
+            delay_ms += stall.get("duration_ms", 0.0)
+            link.stats["stalled"] += 1
+
+        due = now + delay_ms / 1000.0
+
+        # 병합 - 창 경계로 올림 처리해 같은 창의 응답을 한 번에 전송
+        window = profile.get("coalesce_ms", 0.0) / 1000.0
+        if window > 0:
+            due = math.ceil(due / window) * window
+        # 순서 유지는 올림 뒤에 적용 (창 경계 계산의 부동소수 오차로 이전 응답보다 앞서지 않도록)
+        due = max(due, link.last_due)
+
+        # 바이트 분할 - 임의 위치에서 잘라 gap 간격으로 전송
+        chunks = [(due, response)]
+        fragment = profile.get("fragment")
+        if fragment and len(response) > 1 and rng.random() < fragment.get("probability", 0.0):
+            count = rng.randint(2, max(2, min(fragment.get("max_chunks", 2), len(response))))
+            cuts = sorted(rng.sample(range(1, len(response)), count - 1))
+            gap = fragment.get("gap_ms", 0.0) / 1000.0
+            bounds = [0] + cuts + [len(response)]
+            chunks = [(due + i * gap, response[bounds[i]:bounds[i + 1]]) for i in range(count)]
+            link.stats["fragmented"] += 1
+
+        link.last_due = chunks[-1][0]
+        link.stats[SEND] += 1
+        return SEND, chunks
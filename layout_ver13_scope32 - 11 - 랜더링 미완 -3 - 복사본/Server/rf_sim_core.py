@@ -0,0 +1,2084 @@
+"""
+RF Simulator Core
+RF 발생기 시뮬레이터 코어 (Tk 비의존) - 프로토콜, 시나리오, 명령 처리, 소켓 서버
+- RFServer.start(): 연결당 스레드 방식 (GUI 서버)
+- RFServer.serve_forever(ports): selectors 단일 스레드 이벤트 루프 (다중 포트/다중 연결 부하 테스트)
+
+사용 예 (디스플레이 없이):
+    python rf_sim_core.py --port 5000 --count 200 --state-key port --seed 1234
+    python rf_sim_core.py --port 5000 --impair lossy --seed 1   # 네트워크 장애 주입 (net_impairment)
+    python rf_sim_core.py --port 5000 --replay field.rfcap      # 기록 재생 (capture_replay)
+"""
+
+import socket
+import struct
+import numpy as np
+import threading
+import selectors
+import argparse
+import time
+import zlib
+from collections import deque
+from datetime import datetime
+from net_impairment import RESET, load_impairment
+from capture_replay import CaptureReplay
+
+# 설정
+CONFIG_DIR = "data"
+HOST = "127.0.0.1"
+PORT = 5000
+SOCKET_TIMEOUT = 5.0
+MAX_CLIENTS = 10
+LISTEN_BACKLOG = 128  # selectors 서버 listen 대기열
+RECV_SIZE = 65536
+STATE_KEYS = ["ip", "port", "connection"]  # 장비 상태 공유 단위
+NOISE_BLOCK_SIZE = 1024  # 클라이언트별 사전 생성 샘플 수
+PINK_POLE = 0.95  # 1/f 노이즈 AR(1) 계수
+STATUS_STRUCT = struct.Struct('<BBHHHffffffffffIf')  # 상태 응답 56바이트 (VHF 매뉴얼 기준)
+CAL_DAC_IDLE = 2048  # Cal Control FWD/REF DAC 대기값 (이 값이면 검출기 직접 구동 없음)
+
+class RFProtocol:
+    """RF 프로토콜 정의 - VHF 매뉴얼 기준"""
+    _SOM_ = 0x16
+    _EOM_ = 0x1A
+    _DID_ = 0x00
+
+    # === 기본 명령어 ===
+    CMD_DEVICE_STATUS_GET = 0x10
+    SUBCMD_DEVICE_STATUS = 0x01
+    CMD_RF_ON = 0x00
+    SUBCMD_RF_ON = 0x01
+    CMD_RF_OFF = 0x00
+    SUBCMD_RF_OFF = 0x02
+    
+    # === 파워 설정 ===
+    CMD_SET_POWER = 0x07
+    SUBCMD_SET_POWER = 0x03
+    CMD_GET_POWER = 0x87
+    SUBCMD_GET_POWER = 0x03
+    
+    # === 제어 모드 ===
+    CMD_CONTROL_MODE_SET = 0x07
+    SUBCMD_CONTROL_MODE_SET = 0x01
+    CMD_CONTROL_MODE_GET = 0x87
+    SUBCMD_CONTROL_MODE_GET = 0x01
+    
+    # === 조절 모드 ===
+    CMD_REGULATION_MODE_SET = 0x01
+    SUBCMD_REGULATION_MODE_SET = 0x02
+    CMD_REGULATION_MODE_GET = 0x81
+    SUBCMD_REGULATION_MODE_GET = 0x02
+    
+    # === 램프 설정 ===
+    CMD_RAMP_CONFIG_SET = 0x01
+    SUBCMD_RAMP_CONFIG_SET = 0x0B
+    CMD_RAMP_CONFIG_GET = 0x81
+    SUBCMD_RAMP_CONFIG_GET = 0x0B
+    
+    # === CEX 설정 ===
+    CMD_CEX_CONFIG_SET = 0x01
+    SUBCMD_CEX_CONFIG_SET = 0x0C
+    CMD_CEX_CONFIG_GET = 0x81
+    SUBCMD_CEX_CONFIG_GET = 0x0C
+    
+    # === VHF Pulse 설정 (수정됨) ===
+    CMD_PULSE_SET = 0x02
+    SUBCMD_PULSE_MASTER_SLAVE_SET = 0x02  # 클라이언트 SUBCMD_PULSE_MODE (0: Master, 1: Slave)
+    SUBCMD_PULSE_MODE_SET = 0x03  # 수정: 0x02 -> 0x03 - Pulse On/Off (클라이언트 SUBCMD_PULSE_OFFON)
+    SUBCMD_PULSE_PARAMS_SET = 0x05  # 신규 추가
+    
+    CMD_PULSE_GET = 0x82
+    SUBCMD_PULSE_MODE_GET = 0x03
+    SUBCMD_PULSE_PARAMS_GET = 0x05
+    
+    # === RF 주파수 ===
+    CMD_SET_FREQUENCY = 0x04
+    SUBCMD_SET_FREQUENCY = 0x09
+    CMD_GET_FREQUENCY = 0x84
+    SUBCMD_GET_FREQUENCY = 0x09
+    
+    # === 주파수 튜닝 ===
+    CMD_FREQUENCY_TUNING = 0x04
+    CMD_FREQUENCY_TUNING_GET = 0x84
+    SUBCMD_FREQ_TUNING_ENABLE = 0x01
+    SUBCMD_FREQ_TUNING_RETUNING = 0x02
+    SUBCMD_FREQ_TUNING_MODE = 0x03
+    SUBCMD_FREQ_TUNING_MIN_FREQ = 0x06
+    SUBCMD_FREQ_TUNING_MAX_FREQ = 0x07
+    SUBCMD_FREQ_TUNING_START_FREQ = 0x08
+    SUBCMD_FREQ_TUNING_MIN_STEP = 0x0A
+    SUBCMD_FREQ_TUNING_MAX_STEP = 0x0B
+    SUBCMD_FREQ_TUNING_STOP_GAMMA = 0x0E
+    SUBCMD_FREQ_TUNING_RETURN_GAMMA = 0x0F
+    
+    # === Bank Function (신규 추가) ===
+    CMD_BANK_SET = 0x19
+    CMD_BANK_GET = 0x99
+    SUBCMD_BANK1_ENABLE = 0x01
+    SUBCMD_BANK1_EQUATION_ENABLE = 0x02
+    SUBCMD_BANK1_RESTART = 0x03
+    SUBCMD_BANK1_RF_TRIGGER = 0x04
+    SUBCMD_BANK1_PARAMS = 0x05
+    SUBCMD_BANK2_ENABLE = 0x06
+    SUBCMD_BANK2_EQUATION_ENABLE = 0x07
+    SUBCMD_BANK2_RESTART = 0x08
+    SUBCMD_BANK2_RF_TRIGGER = 0x09
+    SUBCMD_BANK2_PARAMS = 0x0A
+    
+    # === 알람 클리어 ===
+    CMD_CLEAR_ALARM = 0x04
+    SUBCMD_CLEAR_ALARM = 0x15
+    
+    # === 네트워크 설정 (CMD 수정됨) ===
+    CMD_NETWORK_MAC_GET = 0x97
+    SUBCMD_NETWORK_MAC_GET = 0x00
+    CMD_NETWORK_TCPIP_SET = 0x11  # 수정: 0x15 -> 0x11
+    SUBCMD_NETWORK_TCPIP_SET = 0x00
+    CMD_NETWORK_TCPIP_GET = 0x91  # 수정: 0x95 -> 0x91
+    SUBCMD_NETWORK_TCPIP_GET = 0x00
+
+
+    @staticmethod
+    def create_frame(cmd, subcmd, data=None):
+        """프레임 생성"""
+        frame = bytearray([RFProtocol._SOM_, RFProtocol._SOM_, RFProtocol._DID_, cmd])
+        data_len = len(data) + 1 if data else 1
+        frame.append(data_len)
+        frame.append(subcmd)
+        if data:
+            frame.extend(data)
+        checksum = sum(frame[2:]) & 0xFF
+        frame.append(checksum)
+        frame.append(RFProtocol._EOM_)
+        return bytes(frame)
+
+    @staticmethod
+    def parse_frame(data):
+        """프레임 파싱"""
+        if len(data) < 6 or data[0] != RFProtocol._SOM_ or data[1] != RFProtocol._SOM_ or data[-1] != RFProtocol._EOM_:
+            return None
+        di, cmd, data_no = data[2], data[3], data[4]
+        subcmd = data[5] if data_no > 0 else None
+        start_idx = 6
+        data_body = data[start_idx:-2] if data_no > 1 else b''
+        checksum = data[-2]
+        calc_cs = sum(data[2:-2]) & 0xFF
+        if calc_cs != checksum:
+            return None
+        return {"di": di, "cmd": cmd, "subcmd": subcmd, "data": data_body}
+
+class ClientNoiseStream:
+    """
+    클라이언트별 난수 스트림 - 독립 시드 RNG에서 블록 단위로 미리 생성해 순서대로 제공
+    - noise 블록: (화이트 N(0,1), 1/f AR(1) 단위 시퀀스, 스파이크 판정 U(0,1), 스파이크 N(0,1))
+    - uniform 블록: 시나리오 내부 난수 U(0,1)
+    - 1차 응답 블록: 같은 목표/시간상수가 유지되는 동안 지수 접근 궤적을 한 번에 계산
+    """
+
+    def __init__(self, seed_sequence, block_size=NOISE_BLOCK_SIZE):
+        self.rng = np.random.default_rng(seed_sequence)
+        self.block_size = block_size
+        self.pink_state = 0.0
+        self._noise = []
+        self._noise_index = 0
+        self._uniform = []
+        self._uniform_index = 0
+        self._responses = {}  # 이름 -> [목표, 시간상수, dt, 궤적, 인덱스]
+        # y[k] = a*y[k-1] + (1-a)*x[k] 닫힌 형태: y = a^(k+1) * (y0 + cumsum((1-a) * x / a^(k+1)))
+        self._pink_powers = PINK_POLE ** np.arange(1, block_size + 1)
+
+    def _refill_noise(self):
+        n = self.block_size
+        white = self.rng.standard_normal(n)
+        pink_input = self.rng.standard_normal(n)
+        pink = self._pink_powers * (self.pink_state + np.cumsum((1 - PINK_POLE) * pink_input / self._pink_powers))
+        self.pink_state = float(pink[-1])
+        spike_draw = self.rng.random(n)
+        spike = self.rng.standard_normal(n)
+        self._noise = np.column_stack((white, pink, spike_draw, spike)).tolist()
+        self._noise_index = 0
+
+    def next_noise(self):
+        """(white, pink, spike_draw, spike) 한 샘플"""
+        if self._noise_index >= len(self._noise):
+            self._refill_noise()
+        sample = self._noise[self._noise_index]
+        self._noise_index += 1
+        return sample
+
+    def uniform(self):
+        """U(0,1) 한 샘플"""
+        if self._uniform_index >= len(self._uniform):
+            self._uniform = self.rng.random(self.block_size).tolist()
+            self._uniform_index = 0
+        value = self._uniform[self._uniform_index]
+        self._uniform_index += 1
+        return value
+
+    def approach(self, name, current, target, time_constant, dt=0.1):
+        """
+        1차 응답 다음 값 - exponential_approach를 블록으로 미리 계산
+        목표/시간상수가 바뀌거나 current가 이전 출력과 다르면 (외부 변경) 궤적 재계산
+        """
+        entry = self._responses.get(name)
+        if (entry is None or entry[0] != target or entry[1] != time_constant or entry[2] != dt
+                or entry[4] >= len(entry[3]) or (entry[4] > 0 and entry[3][entry[4] - 1] != current)):
+            decay = np.exp(-dt / time_constant) ** np.arange(1, self.block_size + 1)
+            entry = [target, time_constant, dt, (target + (current - target) * decay).tolist(), 0]
+            self._responses[name] = entry
+        value = entry[3][entry[4]]
+        entry[4] += 1
+        return value
+
+
+class RealisticTestScenarioManager:
+    """
+    현실적인 RF 시스템 시뮬레이션 - 노이즈와 물리적 특성 반영
+    - 난수는 클라이언트별 ClientNoiseStream에서 (seed가 같으면 클라이언트 키별로 재현 가능)
+    - 현재 처리 중인 클라이언트 스트림은 스레드별로 선택 (use_client)
+    """
+    
+    def __init__(self, seed=None):
+        self.current_scenario = 0
+        self.seed = seed
+        self._local = threading.local()
+        self._default_stream = self.create_stream(None)
+        self.test_mode = "realistic"  # "sine_wave" 또는 "realistic"
+        
+        # 개별 노이즈 레벨 초기화
+        self.white_noise_level = 0.01  # 1%
+        self.pink_noise_level = 0.005  # 0.5%
+        self.spike_noise_level = 0.02  # 2%
+        self.spike_probability = 0.0001  # 0.01%
+        
+        # 실제 시스템 특성 파라미터
+        self.system_params = {
+            "power_regulation_time_constant": 0.1,  # 파워 제어 시간상수 (초)
+            "matching_response_time": 0.5,  # 매칭 네트워크 응답시간
+            "thermal_time_constant": 30.0,  # 열적 시간상수
+            "arc_recovery_time": 2.0,  # 아크 복구 시간
+            "cal_max_power": 1000.0,  # 캘리브레이션 구동 최대 출력 (DAC 4095)
+            "cal_ref_max_power": 200.0,  # REF DAC 구동 최대 반사 입력 (DAC 4095)
+            "cal_dac_exponent": 1.4,  # DAC-출력 비선형 지수
+            "load_q": 50.0,  # 부하 공진 Q (주파수 튜닝 모델)
+            "load_jump_interval": (6.0, 12.0),  # 부하 공진점 이동 간격 (초)
+            "load_jump_ratio": 0.1,  # 공진점 이동 폭 (튜닝 범위 대비)
+        }
+        
+        self.scenarios = [
+            self.normal_operation,
+            self.power_ramp_test,
+            self.plasma_ignition_test,
+            self.matching_network_aging,
+            self.arc_event_simulation,
+            self.thermal_cycling_test,
+            self.process_recipe_etch,
+            self.process_recipe_depo,
+            self.impedance_load_variation,
+            self.power_supply_ripple_test,
+            self.chamber_conditioning,
+            self.maintenance_mode_test
+        ]
+        
+        # 내부 상태 변수들
+        self.last_values = {}
+        self.internal_states = {}
+    
+    def create_stream(self, client_key):
+        """클라이언트 키별 독립 스트림 (seed + 키 해시로 SeedSequence 생성)"""
+        spawn_key = (zlib.crc32(repr(client_key).encode("utf-8")),)
+        return ClientNoiseStream(np.random.SeedSequence(self.seed, spawn_key=spawn_key))
+    
+    def use_client(self, client_state):
+        """현재 스레드에서 사용할 클라이언트 스트림 선택 (없으면 생성해 client_state에 보관)"""
+        stream = client_state.get("noise_stream")
+        if stream is None:
+            stream = client_state["noise_stream"] = self.create_stream(client_state.get("state_key"))
+        self._local.stream = stream
+        return stream
+    
+    @property
+    def stream(self):
+        return getattr(self._local, "stream", None) or self._default_stream
+    
+    def uniform(self, low=0.0, high=1.0):
+        """현재 클라이언트 스트림의 균등 난수"""
+        return low + (high - low) * self.stream.uniform()
+    
+    def set_test_mode(self, mode, white_noise=0.01, pink_noise=0.01, spike_noise=0.01, spike_probability=0.0001):
+        """테스트 모드 설정 - 개별 노이즈 제어"""
+        self.test_mode = mode
+        self.white_noise_level = white_noise / 100.0  # % to decimal
+        self.pink_noise_level = pink_noise / 100.0
+        self.spike_noise_level = spike_noise / 100.0
+        self.spike_probability = spike_probability / 100.0  # % to decimal
+        
+    def get_scenario_names(self):
+        """시나리오 이름 목록 반환"""
+        return [
+            "정상 운영",
+            "파워 램프 테스트",
+            "플라즈마 점화 과정",
+            "매칭 네트워크 에이징",
+            "아크 이벤트 시뮬레이션",
+            "열순환 테스트",
+            "에칭 공정 (펄스)",
+            "증착 공정 (CW)",
+            "부하 임피던스 변동",
+            "전원 리플 테스트",
+            "챔버 컨디셔닝",
+            "정비 모드"
+        ]
+    
+    def add_realistic_noise(self, base_value, white_factor=None, pink_factor=None, spike_factor=None):
+        """현실적인 노이즈 추가 - 개별 노이즈 제어"""
+        if white_factor is None:
+            white_factor = self.white_noise_level
+        if pink_factor is None:
+            pink_factor = self.pink_noise_level
+        if spike_factor is None:
+            spike_factor = self.spike_noise_level
+            
+        if self.test_mode == "sine_wave":
+            return base_value
+            
+        # 사전 생성 블록에서 한 샘플 (화이트, 1/f 단위 시퀀스, 스파이크 판정, 스파이크)
+        white, pink, spike_draw, spike = self.stream.next_noise()
+        
+        # 화이트 노이즈 (고주파)
+        white_noise = white * white_factor * 0.1 if white_factor > 0 else 0
+        
+        # 1/f 노이즈 (저주파 drift)
+        pink_noise = pink * pink_factor * 0.1 if pink_factor > 0 else 0
+        
+        # 간헐적 스파이크
+        spike_noise = 0
+        if spike_factor > 0 and spike_draw < self.spike_probability:
+            spike_noise = spike * spike_factor * 1.5
+            
+        total_noise = white_noise + pink_noise + spike_noise
+        return base_value * (1 + total_noise)
+    
+    def exponential_approach(self, current, target, time_constant, dt=0.1):
+        """지수적 접근 (1차 시스템 응답)"""
+        alpha = 1 - np.exp(-dt / time_constant)
+        return current + alpha * (target - current)
+    
+    def get_current_scenario_data(self, base_status, current_time, client_state):
+        """현재 시나리오에 따른 현실적인 테스트 데이터 생성"""
+        scenario_func = self.scenarios[self.current_scenario % len(self.scenarios)]
+        return scenario_func(base_status, current_time, client_state)
+    
+    def normal_operation(self, status, t, client_state):
+        """정상 운영 - 안정적이지만 현실적인 변동"""
+        client_key = id(client_state)
+        
+        if not client_state["rf_enabled"]:
+            status["forward_power"] = 0.0
+            status["reflect_power"] = 0.0
+        else:
+            set_power = client_state.get("set_power", 0)
+            if set_power > 0:
+                if self.test_mode == "sine_wave":
+                    # 사인파 모드: 수학적 변동
+                    power_variation = 0.05 * np.sin(2 * np.pi * 0.1 * t)  # ±5% 사인파
+                    status["forward_power"] = set_power * (1.0 + power_variation)
+                    status["reflect_power"] = status["forward_power"] * (0.02 + 0.03 * np.sin(2 * np.pi * 0.3 * t))
+                else:
+                    # 현실적 모드
+                    if (self.white_noise_level == 0 and 
+                        self.pink_noise_level == 0 and 
+                        self.spike_noise_level == 0):
+                        # 노이즈 완전 비활성화: 정확히 설정값 출력
+                        status["forward_power"] = float(set_power)
+                        status["reflect_power"] = float(set_power) * 0.03
+                    else:
+                        # ✅ 여기서 forward_power와 control_error 같이 초기화
+                        if client_key not in self.last_values:
+                            self.last_values[client_key] = {
+                                "forward_power": float(set_power),
+                                "control_error": 0.0
+                            }
+                        
+                        current_power = self.last_values[client_key]["forward_power"]
+                        
+                        regulated_power = self.stream.approach(
+                            "forward_power", current_power, float(set_power), 
+                            self.system_params["power_regulation_time_constant"]
+                        )
+                        
+                        status["forward_power"] = self.add_realistic_noise(regulated_power)
+                        
+                        base_reflect_ratio = 0.02 + 0.01 * self.uniform()
+                        status["reflect_power"] = self.add_realistic_noise(
+                            status["forward_power"] * base_reflect_ratio
+                        )
+                        
+                        self.last_values[client_key]["forward_power"] = regulated_power
+            else:
+                status["forward_power"] = 0.0
+                status["reflect_power"] = 0.0
+        
+        base_temp = 35 + (status["forward_power"] / 50)
+        if self.test_mode == "sine_wave":
+            status["temperature"] = base_temp + 5 * np.sin(2 * np.pi * 0.1 * t)
+        else:
+            if (self.white_noise_level == 0 and 
+                self.pink_noise_level == 0 and 
+                self.spike_noise_level == 0):
+                status["temperature"] = base_temp
+            else:
+                status["temperature"] = self.add_realistic_noise(base_temp, 0, 0, 0.1)
+        
+        status["led_state"] = 0x0021 if client_state["rf_enabled"] else 0x0001
+        status["alarm_state"] = 0x0000
+        return "정상 운영 (" + ("사인파" if self.test_mode == "sine_wave" else ("고정값" if self.white_noise_level == 0 and self.pink_noise_level == 0 and self.spike_noise_level == 0 else "현실적 노이즈")) + ")"
+
+    
+    def power_ramp_test(self, status, t, client_state):
+        """파워 램프 테스트 - 실제 제어 루프 동작"""
+        client_key = id(client_state)
+        
+        if not client_state["rf_enabled"]:
+            status["forward_power"] = 0.0
+            status["reflect_power"] = 0.0
+        else:
+            set_power = client_state.get("set_power", 0)
+            if set_power > 0:
+                # 램프 프로파일 (20초에 걸쳐 점진적 증가)
+                ramp_time = 20.0
+                progress = min((t % 30) / ramp_time, 1.0)
+                
+                # S-curve 램프 (부드러운 가속/감속)
+                if progress < 0.5:
+                    s_curve_progress = 2 * progress * progress
+                else:
+                    s_curve_progress = 1 - 2 * (1 - progress) * (1 - progress)
+                
+                target_power = set_power * s_curve_progress
+                
+                # 제어 루프 지연과 오버슛
+                if client_key not in self.last_values:
+                    self.last_values[client_key] = {"forward_power": 0.0, "control_error": 0.0}
+                
+                current_power = self.last_values[client_key]["forward_power"]
+                control_error = self.last_values[client_key]["control_error"]
+                
+                # PID 제어 시뮬레이션 (단순화)
+                error = target_power - current_power
+                control_output = target_power + 0.1 * error + 0.05 * control_error
+                
+                # 1차 지연으로 실제 파워 응답
+                if self.test_mode == "sine_wave":
+                    overshoot = 1.0 + 0.1 * np.sin(2 * np.pi * 2 * t) if progress < 0.9 else 1.0
+                    status["forward_power"] = target_power * overshoot
+                else:
+                    actual_power = self.stream.approach(
+                        "forward_power", current_power, control_output, 
+                        self.system_params["power_regulation_time_constant"]
+                    )
+                    status["forward_power"] = self.add_realistic_noise(actual_power, 0.02)
+                
+                # 램프업 중 매칭 지연으로 인한 높은 reflect
+                matching_lag = np.exp(-progress * 3)  # 매칭이 점진적으로 개선
+                reflect_ratio = 0.05 + 0.15 * matching_lag
+                if self.test_mode == "sine_wave":
+                    status["reflect_power"] = status["forward_power"] * reflect_ratio
+                else:
+                    status["reflect_power"] = self.add_realistic_noise(
+                        status["forward_power"] * reflect_ratio, 0.1
+                    )
+                
+                if self.test_mode != "sine_wave":
+                    self.last_values[client_key]["forward_power"] = actual_power
+                    self.last_values[client_key]["control_error"] = error
+            else:
+                status["forward_power"] = 0.0
+                status["reflect_power"] = 0.0
+        
+        base_temp = 30 + status["forward_power"] / 40
+        if self.test_mode == "sine_wave":
+            status["temperature"] = 25 + 15 * min((t % 30) / 30.0, 1.0)
+        else:
+            status["temperature"] = self.add_realistic_noise(base_temp, 0.02)
+        
+        status["led_state"] = 0x0021 if client_state["rf_enabled"] else 0x0001
+        status["alarm_state"] = 0x0000
+        return "파워 램프 테스트 (" + ("사인파" if self.test_mode == "sine_wave" else "제어 루프") + ")"
+    
+    def plasma_ignition_test(self, status, t, client_state):
+        """플라즈마 점화 - 실제 물리 현상"""
+        client_key = id(client_state)
+        
+        if not client_state["rf_enabled"]:
+            status["forward_power"] = 0.0
+            status["reflect_power"] = 0.0
+        else:
+            set_power = client_state.get("set_power", 0)
+            if set_power > 0:
+                # 점화 사이클 (10초 주기)
+                ignition_cycle = t % 10
+                
+                if self.test_mode == "sine_wave":
+                    # 기존 사인파 방식
+                    if ignition_cycle < 0.5:
+                        status["forward_power"] = set_power * 0.3
+                        status["reflect_power"] = status["forward_power"] * 0.8
+                    elif ignition_cycle < 1.0:
+                        status["forward_power"] = set_power * (0.3 + 0.7 * (ignition_cycle - 0.5) * 2)
+                        status["reflect_power"] = status["forward_power"] * (0.8 - 0.6 * (ignition_cycle - 0.5) * 2)
+                    else:
+                        status["forward_power"] = set_power * (0.95 + 0.05 * np.sin(2 * np.pi * t))
+                        status["reflect_power"] = status["forward_power"] * 0.05
+                else:
+                    # 현실적 점화 시뮬레이션
+                    if client_key not in self.internal_states:
+                        self.internal_states[client_key] = {"ignition_state": "pre_ignition"}
+                    
+                    state = self.internal_states[client_key]["ignition_state"]
+                    
+                    if ignition_cycle < 1.0 and state != "igniting":
+                        self.internal_states[client_key]["ignition_state"] = "igniting"
+                        ignition_probability = 0.7 + 0.3 * self.uniform()
+                    elif ignition_cycle < 1.5 and state == "igniting":
+                        ignition_probability = 0.9
+                    elif ignition_cycle >= 1.5:
+                        self.internal_states[client_key]["ignition_state"] = "ignited"
+                        ignition_probability = 1.0
+                    else:
+                        ignition_probability = 0.3
+                    
+                    if ignition_probability > 0.8:
+                        # 점화됨 - 안정적 파워
+                        status["forward_power"] = self.add_realistic_noise(set_power * 0.95, 0.01)
+                        status["reflect_power"] = self.add_realistic_noise(
+                            status["forward_power"] * 0.05, 0.02
+                        )
+                    else:
+                        # 점화 전 - 높은 reflect, 불안정한 파워
+                        unstable_power = set_power * (0.2 + 0.3 * self.uniform())
+                        status["forward_power"] = self.add_realistic_noise(unstable_power, 0.2)
+                        status["reflect_power"] = self.add_realistic_noise(
+                            status["forward_power"] * (0.6 + 0.3 * self.uniform()), 0.3
+                        )
+            else:
+                status["forward_power"] = 0.0
+                status["reflect_power"] = 0.0
+                if client_key in self.internal_states:
+                    self.internal_states[client_key]["ignition_state"] = "pre_ignition"
+        
+        base_temp = 38 + status["forward_power"] / 50
+        if self.test_mode == "sine_wave":
+            status["temperature"] = 40 + 10 * np.sin(2 * np.pi * 0.2 * t)
+        else:
+            status["temperature"] = self.add_realistic_noise(base_temp, 0.02)
+        
+        status["led_state"] = 0x0021 if client_state["rf_enabled"] else 0x0001
+        status["alarm_state"] = 0x0000
+        return "플라즈마 점화 시뮬레이션"
+    
+    # 나머지 시나리오들은 비슷한 패턴으로 구현
+    def matching_network_aging(self, status, t, client_state):
+        """매칭 네트워크 노화"""
+        if not client_state["rf_enabled"]:
+            status["forward_power"] = 0.0
+            status["reflect_power"] = 0.0
+        else:
+            set_power = client_state.get("set_power", 0)
+            if set_power > 0:
+                if self.test_mode == "sine_wave":
+                    drift_factor = 1.0 + 0.02 * (t / 60)
+                    status["forward_power"] = set_power * (0.98 + 0.02 * np.sin(2 * np.pi * 0.1 * t))
+                    base_reflect = 0.03 + 0.02 * min(drift_factor - 1.0, 0.1)
+                    status["reflect_power"] = status["forward_power"] * (base_reflect + 0.01 * np.sin(2 * np.pi * 0.3 * t))
+                else:
+                    aging_factor = 1.0 - 0.001 * (t / 3600)
+                    aging_factor = max(0.9, aging_factor)
+                    effective_power = set_power * aging_factor
+                    status["forward_power"] = self.add_realistic_noise(effective_power, 0.015)
+                    base_reflect = 0.03 + 0.02 * (1 - aging_factor) * 10
+                    status["reflect_power"] = self.add_realistic_noise(
+                        status["forward_power"] * base_reflect, 0.1
+                    )
+            else:
+                status["forward_power"] = 0.0
+                status["reflect_power"] = 0.0
+        
+        base_temp = 40 + status["forward_power"] / 45
+        status["temperature"] = self.add_realistic_noise(base_temp, 0.02) if self.test_mode != "sine_wave" else 42 + 3 * np.sin(2 * np.pi * 0.1 * t)
+        status["led_state"] = 0x0025 if status["reflect_power"] > status["forward_power"] * 0.1 else 0x0021
+        status["alarm_state"] = 0x0000
+        return "매칭 네트워크 노화"
+    
+    def arc_event_simulation(self, status, t, client_state):
+        return self.normal_operation(status, t, client_state)[:-1] + " - 아크)"
+    
+    def thermal_cycling_test(self, status, t, client_state):
+        return self.normal_operation(status, t, client_state)[:-1] + " - 열순환)"
+    
+    def process_recipe_etch(self, status, t, client_state):
+        return self.normal_operation(status, t, client_state)[:-1] + " - 에칭)"
+    
+    def process_recipe_depo(self, status, t, client_state):
+        return self.normal_operation(status, t, client_state)[:-1] + " - 증착)"
+    
+    def impedance_load_variation(self, status, t, client_state):
+        return self.normal_operation(status, t, client_state)[:-1] + " - 부하변동)"
+    
+    def power_supply_ripple_test(self, status, t, client_state):
+        return self.normal_operation(status, t, client_state)[:-1] + " - 전원리플)"
+    
+    def chamber_conditioning(self, status, t, client_state):
+        return self.normal_operation(status, t, client_state)[:-1] + " - 챔버컨디셔닝)"
+    
+    def maintenance_mode_test(self, status, t, client_state):
+        return self.normal_operation(status, t, client_state)[:-1] + " - 정비모드)"
+    
+    @staticmethod
+    def is_calibration_driving(client_state):
+        """Cal Control로 출력/검출기를 구동 중인지 (RF Set DAC > 0 또는 FWD/REF DAC가 대기값이 아님)"""
+        cal = client_state["cal_control"]
+        return cal["rfset_dac"] > 0 or cal["fwd_dac"] != CAL_DAC_IDLE or cal["ref_dac"] != CAL_DAC_IDLE
+
+    def _cal_channel(self, client_state, name, dac, max_power):
+        """DAC 코드 -> 1차 응답을 거친 구동값 (비선형 DAC 특성)"""
+        client_key = (name, id(client_state))
+        target_power = max_power * (dac / 4095.0) ** self.system_params["cal_dac_exponent"]
+        value = self.stream.approach(
+            name, self.last_values.get(client_key, 0.0), target_power,
+            self.system_params["power_regulation_time_constant"]
+        )
+        self.last_values[client_key] = value
+        return value
+
+    def calibration_drive(self, status, client_state):
+        """
+        캘리브레이션 구동 (RF OFF) - Cal Control DAC 값으로 출력 (비선형 DAC 특성 + 1차 응답)
+        - RF Set DAC: 출력 구동 (반사는 출력의 2%)
+        - FWD DAC / REF DAC: 대기값이 아니면 순방향/반사 검출기 입력을 직접 구동 (User FWD/LOAD, User REF 교정)
+        """
+        cal = client_state["cal_control"]
+        max_power = self.system_params["cal_max_power"]
+        forward_power = self._cal_channel(client_state, "cal_power", cal["rfset_dac"], max_power)
+        reflect_power = forward_power * 0.02
+        if cal["fwd_dac"] != CAL_DAC_IDLE:
+            forward_power = self._cal_channel(client_state, "cal_fwd", cal["fwd_dac"], max_power)
+        if cal["ref_dac"] != CAL_DAC_IDLE:
+            reflect_power = self._cal_channel(
+                client_state, "cal_ref", cal["ref_dac"], self.system_params["cal_ref_max_power"])
+
+        status["forward_power"] = self.add_realistic_noise(forward_power)
+        status["reflect_power"] = self.add_realistic_noise(reflect_power)
+        status["temperature"] = 35 + status["forward_power"] / 50
+        status["led_state"] = 0x0021
+        status["alarm_state"] = 0x0000
+        return "캘리브레이션 구동"
+    
+    def frequency_tuning_drive(self, status, client_state, current_time):
+        """
+        주파수 자동 튜닝 구동 - 공진 부하 반사계수 모델 + 힐클라이밍 튜너
+        - 부하: Γ = jx / (1 + jx), x = Q(f/f0 - f0/f), 공진점 f0는 주기적으로 이동
+        - 튜너: 감마 증가 시 방향 반전 + 스텝 절반, 감소 시 스텝 1.5배 (min/max step 제한)
+        - Stop Gamma 이하에서 정지, 재튜닝 Enable이면 Return Gamma 초과 시 재시작
+        """
+        f_min = float(client_state["freq_tuning_min"])
+        f_max = float(client_state["freq_tuning_max"])
+        if f_max <= f_min:
+            return
+        min_step = max(float(client_state["freq_tuning_min_step"]), 1.0)
+        max_step = max(float(client_state["freq_tuning_max_step"]), min_step)
+
+        tuner = client_state.setdefault("freq_tuner", {
+            "f0": (f_min + f_max) / 2, "next_jump": current_time, "active": False,
+            "direction": 1, "step": max_step, "last_gamma": None, "rf_was_on": False,
+        })
+
+        # RF On 시작 시 시작 주파수에서 튜닝 시작
+        if not tuner["rf_was_on"]:
+            client_state["rf_frequency"] = min(max(client_state["freq_tuning_start"], f_min), f_max)
+            tuner.update(active=True, step=max_step, last_gamma=None)
+        tuner["rf_was_on"] = True
+
+        # 부하 공진점 이동 (플라즈마 임피던스 변화)
+        if current_time >= tuner["next_jump"]:
+            low, high = self.system_params["load_jump_interval"]
+            span = (f_max - f_min) * self.system_params["load_jump_ratio"]
+            tuner["f0"] = min(max(tuner["f0"] + self.uniform(-span, span), f_min), f_max)
+            tuner["next_jump"] = current_time + self.uniform(low, high)
+
+        def reflection(f):
+            x = self.system_params["load_q"] * (f / tuner["f0"] - tuner["f0"] / f)
+            return complex(0.0, x) / complex(1.0, x)
+
+        frequency = float(client_state["rf_frequency"])
+        gamma = abs(reflection(frequency))
+
+        if tuner["active"]:
+            if gamma <= client_state["freq_tuning_stop_gamma"]:
+                tuner["active"] = False
+            else:
+                if tuner["last_gamma"] is not None and gamma > tuner["last_gamma"]:
+                    tuner["direction"] = -tuner["direction"]
+                    tuner["step"] = max(tuner["step"] * 0.5, min_step)
+                else:
+                    tuner["step"] = min(tuner["step"] * 1.5, max_step)
+                frequency = min(max(frequency + tuner["direction"] * tuner["step"], f_min), f_max)
+                client_state["rf_frequency"] = int(frequency)
+        elif client_state["freq_tuning_retuning"] and gamma > client_state["freq_tuning_return_gamma"]:
+            tuner.update(active=True, step=max_step)
+        tuner["last_gamma"] = gamma
+
+        gamma_vector = reflection(float(client_state["rf_frequency"]))
+        status["frequency"] = float(client_state["rf_frequency"])
+        status["reflect_power"] = status["forward_power"] * abs(gamma_vector)
+        status["delivery_power"] = max(0, status["forward_power"] - status["reflect_power"])
+        status["gamma"] = abs(gamma_vector)
+        status["real_gamma"] = gamma_vector.real
+        status["image_gamma"] = gamma_vector.imag
+        status["rf_phase"] = float(np.degrees(np.angle(gamma_vector)))
+
+class ClientStateMap(dict):
+    """장비 키 -> 상태 dict (없는 키는 factory(key)로 생성)"""
+
+    def __init__(self, factory):
+        super().__init__()
+        self.factory = factory
+
+    def __missing__(self, key):
+        state = self[key] = self.factory(key)
+        return state
+
+
+class RFServer:
+    """
+    RF 발생기 시뮬레이터 서버
+    - state_key: 장비 상태 구분 단위
+      ip: 클라이언트 IP별 (기존 동작), port: 수신 포트별 (포트 = 장비 1대), connection: 연결별
+    - manual_override: 수동 모드 값 dict (None이면 시나리오) - GUI가 주기적으로 갱신
+    - seed: 시나리오 난수 시드 (None이면 매번 다름) - 같은 시드/키/명령 순서면 같은 상태 값
+    - impairment: NetworkImpairment (None이면 즉시 응답) - 응답 지연/분할/병합/리셋/정지 주입
+    - replay: CaptureReplay (None이면 시나리오) - 상태 응답을 기록에서, SET/GET은 client_state로 처리
+    """
+
+    def __init__(self, host=HOST, port=PORT, gui_queue=None, state_key="ip", verbose=False, seed=None,
+                 impairment=None, replay=None):
+        if state_key not in STATE_KEYS:
+            raise ValueError(f"state_key must be one of {STATE_KEYS}")
+        self.host = host
+        self.port = port
+        self.gui_queue = gui_queue
+        self.state_key = state_key
+        self.verbose = verbose
+        self.server = None
+        self.clients = []
+        self.client_states = ClientStateMap(self.new_client_state)
+        self.manual_override = None
+        self.impairment = impairment
+        self.replay = replay
+        self.running = False
+        self.global_frame_count = 0
+        self.frame_count_lock = threading.Lock()
+
+        # 개선된 테스트 시나리오 매니저
+        self.scenario_manager = RealisticTestScenarioManager(seed)
+        self.auto_switch = False  # GUI에서 제어
+
+        # 서버 스레드
+        self.server_thread = None
+
+        # selectors 루프
+        self.selector = None
+        self.listeners = []
+        self._pending = {}  # id(connection) -> 장애 지연 응답이 남은 연결
+
+    @staticmethod
+    def new_client_state(state_key=None):
+        """장비 1대의 초기 상태 (state_key: 난수 스트림 시드용 장비 키)"""
+        return {
+            "state_key": state_key,
+            "rf_enabled": False,
+            "set_power": 0,
+            "alarm_state": 0,
+            "control_mode": 0,
+            "regulation_mode": 0,
+            "ramp_settings": {"mode": 0, "up_time": 0, "down_time": 0},
+            "cex_settings": {"enable": 0, "mode": 0, "output_phase": 0.0, "rf_phase": 0.0},
+            "pulse_settings": {"mode": 0, "onoff": 0, "duty": 0.0, "frequency": 0, "output_sync": 0, "input_sync": 0},
+            "rf_frequency": 13500000,
+            "freq_tuning_enabled": False,
+            "freq_tuning_mode": 0,
+            "freq_tuning_min": 13000000,
+            "freq_tuning_max": 14000000,
+            "freq_tuning_start": 13500000,
+            "freq_tuning_min_step": 1000,
+            "freq_tuning_max_step": 100000,
+            "freq_tuning_stop_gamma": 0.1,
+            "freq_tuning_return_gamma": 0.05,
+            "freq_tuning_retuning": 0,
+            "start_time": time.time(),
+            "frame_count": 0,
+            "led_state": 0x0001,
+            "alarm_state": 0x0001,
+            "cal_control": {"cal_mode": 0, "fwd_dac": 2048, "ref_dac": 2048, "rfset_dac": 0},
+            "cal_tables": {}  # (SET CMD, SUBCMD) -> 마지막으로 쓴 교정 테이블 컬럼
+        }
+
+    def log_message(self, message):
+        """GUI 로그에 메시지 추가 (GUI 없으면 verbose일 때만 출력)"""
+        if self.gui_queue:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self.gui_queue.put(f"[{timestamp}] {message}")
+        elif self.verbose:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+
+    def get_client_key(self, addr, listen_port=None):
+        """장비 상태 키 (state_key 기준)"""
+        ip, port = addr
+        if self.state_key == "port":
+            return listen_port if listen_port is not None else self.port
+        if self.state_key == "connection":
+            return (ip, port)
+        return ip
+
+    def start(self):
+        """서버 시작"""
+        try:
+            self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.server.bind((self.host, self.port))
+            self.server.listen(MAX_CLIENTS)
+            self.running = True
+            
+            self.log_message(f"RF Test Server started on {self.host}:{self.port}")
+            self.log_message(f"Server listening on all interfaces (0.0.0.0:{self.port})")
+            self.log_message(f"Client can connect to: localhost:{self.port} or <your_ip>:{self.port}")
+            
+            # 서버 스레드 시작
+            self.server_thread = threading.Thread(target=self._server_loop, daemon=True)
+            self.server_thread.start()
+            
+            return True
+        except Exception as e:
+            self.log_message(f"Failed to start server: {e}")
+            # 포트가 사용중인 경우 구체적인 안내
+            if "Address already in use" in str(e) or "지정된 주소를 사용할 수 없습니다" in str(e):
+                self.log_message(f"포트 {self.port}이 이미 사용중입니다. 다른 프로그램을 종료하거나 포트를 변경하세요.")
+            return False
+
+    def _server_loop(self):
+        """서버 메인 루프"""
+        self.log_message("Server thread started, waiting for client connections...")
+        
+        while self.running:
+            try:
+                self.server.settimeout(1.0)
+                client, addr = self.server.accept()
+                client.settimeout(SOCKET_TIMEOUT)
+                self.log_message(f"New client connected from {addr}")
+                self.clients.append(client)
+                
+                # 클라이언트 핸들러 스레드 시작
+                client_thread = threading.Thread(target=self.handle_client, args=(client, addr), daemon=True)
+                client_thread.start()
+                self.log_message(f"Started handler thread for client {addr}")
+                
+            except socket.timeout:
+                continue  # 타임아웃은 정상, 계속 대기
+            except Exception as e:
+                if self.running:
+                    self.log_message(f"Server accept error: {e}")
+                break
+        
+        self.log_message("Server loop ended")
+
+    def handle_client(self, client, addr):
+        """
+        클라이언트 연결 처리 메서드 (연결당 스레드)
+        - 클라이언트로부터 명령어를 수신하고 적절한 응답을 전송
+
+        Args:
+            client: 클라이언트 소켓 객체
+            addr: 클라이언트 주소 (IP, Port)
+        """
+        # 클라이언트 상태 키 생성
+        client_key = self.get_client_key(addr, self.port)
+        client_state = self.client_states[client_key]
+        self.log_message(f"Client {addr} using state key: {client_key}")
+        link = self.impairment.new_link((addr, self.port)) if self.impairment else None
+
+        # 수신 버퍼 추가
+        recv_buffer = bytearray()
+
+        while self.running:
+            try:
+                # 버퍼 크기를 256바이트로 증가
+                data = client.recv(256)
+
+                if not data:
+                    if client in self.clients:
+                        self.clients.remove(client)
+                    client.close()
+                    self.log_message(f"Client disconnected from {addr}")
+                    break
+
+                # 수신한 데이터를 버퍼에 추가
+                recv_buffer.extend(data)
+
+                # 한 번에 여러 프레임이 도착할 수 있으므로(파이프라인 전송) 모두 처리
+                for parsed in self.extract_frames(recv_buffer, client_state, addr):
+                    response = self.process_frame(parsed, client_state, addr)
+                    if not response:
+                        continue
+                    if link is None:
+                        client.sendall(response)
+                        continue
+
+                    # 장애 주입: 계획된 시각까지 대기 후 조각별 전송
+                    action, chunks = self.impairment.schedule(
+                        link, parsed["cmd"], parsed["subcmd"], response,
+                        self.scenario_manager.current_scenario, time.monotonic())
+                    if action == RESET:
+                        self.log_message(f"Impairment: reset connection {addr}")
+                        if client in self.clients:
+                            self.clients.remove(client)
+                        self.abort_socket(client)
+                        return
+                    for due, chunk in chunks:
+                        time.sleep(max(due - time.monotonic(), 0.0))
+                        client.sendall(chunk)
+
+            except Exception as e:
+                # 예외 발생 시 연결 정리
+                self.log_message(f"Error handling client {addr}: {e}")
+                try:
+                    client.shutdown(socket.SHUT_RDWR)
+                except:
+                    pass
+                if client in self.clients:
+                    self.clients.remove(client)
+                try:
+                    client.close()
+                except:
+                    pass
+                break
+
+    @staticmethod
+    def abort_socket(client):
+        """RST로 연결 강제 종료 (SO_LINGER 0) - 클라이언트에는 연결 리셋(10054/104)으로 보임"""
+        try:
+            client.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            client.close()
+        except OSError:
+            pass
+
+    def extract_frames(self, recv_buffer, client_state, addr):
+        """수신 버퍼에서 완전한 프레임 추출 (버퍼에서 제거) - 반환: 파싱된 프레임 목록"""
+        frames = []
+        while len(recv_buffer) >= 6:
+            # SOM 찾기
+            if recv_buffer[0] != 0x16 or recv_buffer[1] != 0x16:
+                # 잘못된 시작, 다음 SOM 후보까지 제거
+                next_som = recv_buffer.find(b'\x16', 1)
+                del recv_buffer[:next_som if next_som > 0 else len(recv_buffer)]
+                continue
+
+            data_no = recv_buffer[4]
+            expected_size = 6 + data_no + 1  # SOM(2) + DID + CMD + DATA_NO + SUBCMD + DATA + CS + EOM
+
+            if len(recv_buffer) < expected_size:
+                break  # 완전한 프레임 아님, 더 기다림
+
+            # 완전한 프레임 추출
+            frame_data = bytes(recv_buffer[:expected_size])
+            del recv_buffer[:expected_size]  # 처리된 프레임 제거
+
+            # 프레임 카운트 증가
+            with self.frame_count_lock:
+                self.global_frame_count += 1
+                client_state["frame_count"] += 1
+
+            # 프레임 파싱
+            parsed = RFProtocol.parse_frame(frame_data)
+
+            if not parsed:
+                self.log_message(f"Invalid frame from {addr}: hex={frame_data.hex()}")
+                continue
+
+            frames.append(parsed)
+        return frames
+
+    def process_frame(self, parsed, client_state, addr):
+        """
+        명령 프레임 1개 처리 - VHF 매뉴얼 기준 모든 명령어
+        반환: 응답 프레임 bytes (응답 없으면 None)
+        """
+        response = None
+        cmd, subcmd = parsed["cmd"], parsed["subcmd"]
+
+        # ==========================================
+        # === 기본 명령어 처리 ===
+        # ==========================================
+    
+        # 장비 상태 조회 (CMD=0x10, SUBCMD=0x01)
+        if cmd == RFProtocol.CMD_DEVICE_STATUS_GET and subcmd == RFProtocol.SUBCMD_DEVICE_STATUS:
+            status = self.create_complete_status(client_state, time.time())
+            response = RFProtocol.create_frame(cmd, subcmd, self.create_status_response(status))
+
+        # RF 출력 켜기 (CMD=0x00, SUBCMD=0x01)
+        elif cmd == RFProtocol.CMD_RF_ON and subcmd == RFProtocol.SUBCMD_RF_ON:
+            client_state["rf_enabled"] = True
+            self.log_message(f"RF On for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+
+        # RF 출력 끄기 (CMD=0x00, SUBCMD=0x02)
+        elif cmd == RFProtocol.CMD_RF_OFF and subcmd == RFProtocol.SUBCMD_RF_OFF:
+            client_state["rf_enabled"] = False
+            self.log_message(f"RF Off for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # 출력 파워 설정 (CMD=0x07, SUBCMD=0x03, 4바이트 UINT)
+        elif cmd == RFProtocol.CMD_SET_POWER and subcmd == RFProtocol.SUBCMD_SET_POWER:
+            if len(parsed["data"]) >= 4:
+                set_power_value = struct.unpack('<f', parsed["data"][:4])[0]
+                client_state["set_power"] = set_power_value
+                self.log_message(f"Set Power: {set_power_value}W for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+            else:
+                self.log_message(f"Invalid Set Power data length from {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 1))  # 에러 응답
+    
+        # ==========================================
+        # === 제어/조절 모드 설정 ===
+        # ==========================================
+    
+        # 제어 모드 설정 (CMD=0x07, SUBCMD=0x01, 2바이트 USHORT)
+        elif cmd == RFProtocol.CMD_CONTROL_MODE_SET and subcmd == RFProtocol.SUBCMD_CONTROL_MODE_SET:
+            if len(parsed["data"]) >= 2:
+                control_mode = struct.unpack('<H', parsed["data"][:2])[0]
+                client_state["control_mode"] = control_mode
+                self.log_message(f"Set Control Mode: {control_mode} for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+
+        # 조절 모드 설정 (CMD=0x01, SUBCMD=0x02, 2바이트 USHORT)
+        elif cmd == RFProtocol.CMD_REGULATION_MODE_SET and subcmd == RFProtocol.SUBCMD_REGULATION_MODE_SET:
+            if len(parsed["data"]) >= 2:
+                regulation_mode = struct.unpack('<H', parsed["data"][:2])[0]
+                client_state["regulation_mode"] = regulation_mode
+                self.log_message(f"Set Regulation Mode: {regulation_mode} for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+
+        # ==========================================
+        # === 램프 설정 ===
+        # ==========================================
+    
+        # 램프 설정 (CMD=0x01, SUBCMD=0x0B, 20바이트)
+        elif cmd == RFProtocol.CMD_RAMP_CONFIG_SET and subcmd == RFProtocol.SUBCMD_RAMP_CONFIG_SET:
+            if len(parsed["data"]) >= 20:
+                # 램프 설정 파라미터 파싱 (필요시)
+                # ramp_mode, ramp_up_time, ramp_down_time = ...
+                self.log_message(f"Set Ramp Config (20bytes) for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+
+        # ==========================================
+        # === CEX 설정 ===
+        # ==========================================
+    
+        # CEX 설정 (CMD=0x01, SUBCMD=0x0C, 12바이트)
+        elif cmd == RFProtocol.CMD_CEX_CONFIG_SET and subcmd == RFProtocol.SUBCMD_CEX_CONFIG_SET:
+            if len(parsed["data"]) >= 12:
+                # CEX 파라미터 파싱 (필요시)
+                # cex_enable, cex_mode, output_phase, rf_phase = ...
+                self.log_message(f"Set CEX Config (12bytes) for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # ==========================================
+        # === VHF Pulse 명령어 (수정됨) ===
+        # ==========================================
+    
+        # Pulse Master/Slave 설정 (CMD=0x02, SUBCMD=0x02, 1바이트)
+        elif cmd == RFProtocol.CMD_PULSE_SET and subcmd == RFProtocol.SUBCMD_PULSE_MASTER_SLAVE_SET:
+            if len(parsed["data"]) >= 1:
+                master_slave = struct.unpack('<B', parsed["data"][:1])[0]
+                client_state["pulse_master_slave"] = master_slave
+                self.log_message(f"Set Pulse Master/Slave: {master_slave} for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+
+        # Pulse 모드(On/Off) 설정 (CMD=0x02, SUBCMD=0x03, 1바이트)
+        elif cmd == RFProtocol.CMD_PULSE_SET and subcmd == RFProtocol.SUBCMD_PULSE_MODE_SET:
+            if len(parsed["data"]) >= 1:
+                pulse_mode = struct.unpack('<B', parsed["data"][:1])[0]
+                client_state["pulse_mode"] = pulse_mode
+                self.log_message(f"Set Pulse Mode: {pulse_mode} for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # Pulse 파라미터 설정 (CMD=0x02, SUBCMD=0x05, 33바이트)
+        elif cmd == RFProtocol.CMD_PULSE_SET and subcmd == RFProtocol.SUBCMD_PULSE_PARAMS_SET:
+            if len(parsed["data"]) >= 33:
+                # Pulse 시간 파라미터 파싱 (필요시)
+                # pulse0_high, pulse0_low, pulse0_repeat = ...
+                self.log_message(f"Set Pulse Parameters (33bytes) for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # ==========================================
+        # === RF 주파수 설정 ===
+        # ==========================================
+    
+        # RF 주파수 설정 (CMD=0x04, SUBCMD=0x09, 4바이트 UINT Hz)
+        elif cmd == RFProtocol.CMD_SET_FREQUENCY and subcmd == RFProtocol.SUBCMD_SET_FREQUENCY:
+            if len(parsed["data"]) >= 4:
+                frequency = struct.unpack('<I', parsed["data"][:4])[0]
+                client_state["rf_frequency"] = frequency
+                self.log_message(f"Set RF Frequency: {frequency}Hz ({frequency/1000000:.2f}MHz) for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # ==========================================
+        # === 주파수 튜닝 명령어 (11개) ===
+        # ==========================================
+    
+        # 주파수 튜닝 관련 모든 SUBCMD 처리 (CMD=0x04)
+        elif cmd == RFProtocol.CMD_FREQUENCY_TUNING:
+            # SUBCMD별 데이터 길이 검증 및 파싱
+            if subcmd == RFProtocol.SUBCMD_FREQ_TUNING_ENABLE:  # 0x01, 1바이트
+                if len(parsed["data"]) >= 1:
+                    enable = struct.unpack('<B', parsed["data"][:1])[0]
+                    client_state["freq_tuning_enabled"] = (enable == 1)
+                    self.log_message(f"Freq Tuning Enable: {enable} for {addr}")
+        
+            elif subcmd == RFProtocol.SUBCMD_FREQ_TUNING_RETUNING:  # 0x02, 2바이트
+                if len(parsed["data"]) >= 2:
+                    retuning_mode = struct.unpack('<H', parsed["data"][:2])[0]
+                    client_state["freq_tuning_retuning"] = retuning_mode
+                    self.log_message(f"Retuning Mode: {retuning_mode} for {addr}")
+        
+            elif subcmd == RFProtocol.SUBCMD_FREQ_TUNING_MODE:  # 0x03, 2바이트
+                if len(parsed["data"]) >= 2:
+                    tuning_mode = struct.unpack('<H', parsed["data"][:2])[0]
+                    client_state["freq_tuning_mode"] = tuning_mode
+                    self.log_message(f"Freq Tuning Mode: {tuning_mode} for {addr}")
+        
+            elif subcmd == RFProtocol.SUBCMD_FREQ_TUNING_MIN_FREQ:  # 0x06, 4바이트
+                if len(parsed["data"]) >= 4:
+                    min_freq = struct.unpack('<I', parsed["data"][:4])[0]
+                    client_state["freq_tuning_min"] = min_freq
+                    self.log_message(f"Min Frequency: {min_freq}Hz for {addr}")
+        
+            elif subcmd == RFProtocol.SUBCMD_FREQ_TUNING_MAX_FREQ:  # 0x07, 4바이트
+                if len(parsed["data"]) >= 4:
+                    max_freq = struct.unpack('<I', parsed["data"][:4])[0]
+                    client_state["freq_tuning_max"] = max_freq
+                    self.log_message(f"Max Frequency: {max_freq}Hz for {addr}")
+        
+            elif subcmd == RFProtocol.SUBCMD_FREQ_TUNING_START_FREQ:  # 0x08, 4바이트
+                if len(parsed["data"]) >= 4:
+                    start_freq = struct.unpack('<I', parsed["data"][:4])[0]
+                    client_state["freq_tuning_start"] = start_freq
+                    self.log_message(f"Start Frequency: {start_freq}Hz for {addr}")
+        
+            elif subcmd == RFProtocol.SUBCMD_FREQ_TUNING_MIN_STEP:  # 0x0A, 4바이트
+                if len(parsed["data"]) >= 4:
+                    min_step = struct.unpack('<I', parsed["data"][:4])[0]
+                    client_state["freq_tuning_min_step"] = min_step
+                    self.log_message(f"Min Step: {min_step}Hz for {addr}")
+        
+            elif subcmd == RFProtocol.SUBCMD_FREQ_TUNING_MAX_STEP:  # 0x0B, 4바이트
+                if len(parsed["data"]) >= 4:
+                    max_step = struct.unpack('<I', parsed["data"][:4])[0]
+                    client_state["freq_tuning_max_step"] = max_step
+                    self.log_message(f"Max Step: {max_step}Hz for {addr}")
+        
+            elif subcmd == RFProtocol.SUBCMD_FREQ_TUNING_STOP_GAMMA:  # 0x0E, 4바이트
+                if len(parsed["data"]) >= 4:
+                    stop_gamma = struct.unpack('<f', parsed["data"][:4])[0]
+                    client_state["freq_tuning_stop_gamma"] = stop_gamma
+                    self.log_message(f"Stop Gamma: {stop_gamma} for {addr}")
+        
+            elif subcmd == RFProtocol.SUBCMD_FREQ_TUNING_RETURN_GAMMA:  # 0x0F, 4바이트
+                if len(parsed["data"]) >= 4:
+                    return_gamma = struct.unpack('<f', parsed["data"][:4])[0]
+                    client_state["freq_tuning_return_gamma"] = return_gamma
+                    self.log_message(f"Return Gamma: {return_gamma} for {addr}")
+        
+            else:
+                self.log_message(f"Unknown Freq Tuning SUBCMD: 0x{subcmd:02X} for {addr}")
+        
+            # 모든 주파수 튜닝 명령어에 대한 공통 응답
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # ==========================================
+        # === Bank Function 명령어 (신규) ===
+        # ==========================================
+    
+        # Bank 명령어 처리 (CMD=0x19)
+        elif cmd == RFProtocol.CMD_BANK_SET:
+            # Bank1/2 Enable (SUBCMD=0x01/0x06, 4바이트 UINT)
+            if subcmd in [RFProtocol.SUBCMD_BANK1_ENABLE, RFProtocol.SUBCMD_BANK2_ENABLE]:
+                if len(parsed["data"]) >= 4:
+                    enable = struct.unpack('<I', parsed["data"][:4])[0]
+                    bank_num = 1 if subcmd == RFProtocol.SUBCMD_BANK1_ENABLE else 2
+                    self.log_message(f"Bank{bank_num} Enable: {enable} for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+        
+            # Bank1/2 Equation Enable (SUBCMD=0x02/0x07, 4바이트 UINT)
+            elif subcmd in [RFProtocol.SUBCMD_BANK1_EQUATION_ENABLE, RFProtocol.SUBCMD_BANK2_EQUATION_ENABLE]:
+                if len(parsed["data"]) >= 4:
+                    enable = struct.unpack('<I', parsed["data"][:4])[0]
+                    bank_num = 1 if subcmd == RFProtocol.SUBCMD_BANK1_EQUATION_ENABLE else 2
+                    self.log_message(f"Bank{bank_num} Equation Enable: {enable} for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+        
+            # Bank1/2 Restart (SUBCMD=0x03/0x08, 4바이트 UINT)
+            elif subcmd in [RFProtocol.SUBCMD_BANK1_RESTART, RFProtocol.SUBCMD_BANK2_RESTART]:
+                bank_num = 1 if subcmd == RFProtocol.SUBCMD_BANK1_RESTART else 2
+                self.log_message(f"Bank{bank_num} Restart for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+        
+            # Bank1/2 RF Trigger (SUBCMD=0x04/0x09, 4바이트 UINT)
+            elif subcmd in [RFProtocol.SUBCMD_BANK1_RF_TRIGGER, RFProtocol.SUBCMD_BANK2_RF_TRIGGER]:
+                bank_num = 1 if subcmd == RFProtocol.SUBCMD_BANK1_RF_TRIGGER else 2
+                self.log_message(f"Bank{bank_num} RF Trigger for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+        
+            # Bank1/2 Parameters (SUBCMD=0x05/0x0A, 20바이트)
+            elif subcmd in [RFProtocol.SUBCMD_BANK1_PARAMS, RFProtocol.SUBCMD_BANK2_PARAMS]:
+                if len(parsed["data"]) >= 20:
+                    bank_num = 1 if subcmd == RFProtocol.SUBCMD_BANK1_PARAMS else 2
+                    # 파라미터 파싱 (필요시): X0, A, B, C, D
+                    # x0, a, b, c, d = struct.unpack('<fffff', parsed["data"][:20])
+                    self.log_message(f"Bank{bank_num} Parameters Set (20bytes) for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+        
+            else:
+                # 기타 Bank 명령어들 기본 응답
+                self.log_message(f"Unknown Bank SUBCMD: 0x{subcmd:02X} for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        ################
+        # ==========================================
+        # === Developer Commands ===
+        # ==========================================
+        # Arc Management SET (CMD=0x03, SUBCMD=0x00, 16바이트)
+        elif cmd == 0x03 and subcmd == 0x00:
+            if len(parsed["data"]) >= 16:
+                # 데이터 파싱
+                reflected = struct.unpack('<B', parsed["data"][0:1])[0]
+                external = struct.unpack('<B', parsed["data"][1:2])[0]
+                latch = struct.unpack('<B', parsed["data"][2:3])[0]
+                output = struct.unpack('<B', parsed["data"][3:4])[0]
+                suppression = struct.unpack('<H', parsed["data"][4:6])[0]
+                initial_delay = struct.unpack('<H', parsed["data"][6:8])[0]
+                setpoint_delay = struct.unpack('<H', parsed["data"][8:10])[0]
+                attempts = struct.unpack('<H', parsed["data"][10:12])[0]
+                threshold = struct.unpack('<f', parsed["data"][12:16])[0]
+            
+                self.log_message(f"[SET] Arc Management from {addr}:")
+                self.log_message(f"  - Reflected Arc: {'Enabled' if reflected else 'Disabled'}")
+                self.log_message(f"  - External Arc: {'Enabled' if external else 'Disabled'}")
+                self.log_message(f"  - RF Latch: {'Turn On' if latch else 'Turn Off'}")
+                self.log_message(f"  - Arc Output: {'Enabled' if output else 'Disabled'}")
+                self.log_message(f"  - Suppression Time: {suppression} μs")
+                self.log_message(f"  - Initial Delay: {initial_delay} ms")
+                self.log_message(f"  - Setpoint Delay: {setpoint_delay} ms")
+                self.log_message(f"  - Attempts: {attempts}")
+                self.log_message(f"  - Threshold: {threshold:.1f} W")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # Arc Management GET (CMD=0x83, SUBCMD=0x00)
+        elif cmd == 0x83 and subcmd == 0x00:
+            # 시뮬레이션 Arc Management 데이터 (16바이트)
+            arc_data = bytearray()
+            arc_data.extend(struct.pack('<B', 0))    # en_reflected_arc_det
+            arc_data.extend(struct.pack('<B', 0))    # en_external_arc_input
+            arc_data.extend(struct.pack('<B', 0))    # rfpower_latch_state
+            arc_data.extend(struct.pack('<B', 0))    # en_arc_output_signal
+            arc_data.extend(struct.pack('<H', 100))  # suppression_time (100μs)
+            arc_data.extend(struct.pack('<H', 50))   # initial_delay_time (50ms)
+            arc_data.extend(struct.pack('<H', 100))  # setpoint_delay_time (100ms)
+            arc_data.extend(struct.pack('<H', 10))   # no_of_attempts
+            arc_data.extend(struct.pack('<f', 10.0)) # reflected_arc_threshold
+        
+            self.log_message(f"[GET] Arc Management to {addr}:")
+            self.log_message(f"  - Reflected Arc: Disabled")
+            self.log_message(f"  - External Arc: Disabled")
+            self.log_message(f"  - RF Latch: Turn Off")
+            self.log_message(f"  - Arc Output: Disabled")
+            self.log_message(f"  - Suppression Time: 100 μs")
+            self.log_message(f"  - Initial Delay: 50 ms")
+            self.log_message(f"  - Setpoint Delay: 100 ms")
+            self.log_message(f"  - Attempts: 10")
+            self.log_message(f"  - Threshold: 10.0 W")
+        
+            response = RFProtocol.create_frame(cmd, subcmd, bytes(arc_data))
+    
+        # SDD Config SET (CMD=0x05, SUBCMD=0x00, 4바이트)
+        elif cmd == 0x05 and subcmd == 0x00:
+            if len(parsed["data"]) >= 4:
+                gui_model = struct.unpack('<H', parsed["data"][0:2])[0]
+                pulsing_count = struct.unpack('<H', parsed["data"][2:4])[0]
+                self.log_message(f"Set SDD Config: GUI={gui_model}, Pulsing={pulsing_count} for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # SDD Config GET (CMD=0x85, SUBCMD=0x00)
+        elif cmd == 0x85 and subcmd == 0x00:
+            # 시뮬레이션 SDD Config 데이터 (4바이트)
+            sdd_data = bytearray()
+            sdd_data.extend(struct.pack('<H', 1))  # GUI_model
+            sdd_data.extend(struct.pack('<H', 100))  # pulsing_freq_duty_count
+            self.log_message(f"Get SDD Config for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, bytes(sdd_data))
+    
+        # Fast Data Acquisition SET (CMD=0x06, SUBCMD=0x00, 8바이트)
+        elif cmd == 0x06 and subcmd == 0x00:
+            if len(parsed["data"]) >= 8:
+                mem_type = parsed["data"][0]
+                trig_src = parsed["data"][1]
+                trig_pos = parsed["data"][2]
+                control = parsed["data"][3]
+                sample_rate = struct.unpack('<I', parsed["data"][4:8])[0]
+            
+                mem_types = ["Ring Buffer", "Single Shot"]
+                trig_srcs = ["Manual", "External", "Auto"]
+                trig_poss = ["Start", "Center", "End"]
+                controls = ["Stop", "Start", "Single"]
+            
+                self.log_message(f"[SET] Fast Acquisition from {addr}:")
+                self.log_message(f"  - Memory Type: {mem_types[mem_type]}")
+                self.log_message(f"  - Trigger Source: {trig_srcs[trig_src]}")
+                self.log_message(f"  - Trigger Position: {trig_poss[trig_pos]}")
+                self.log_message(f"  - Control: {controls[control]}")
+                self.log_message(f"  - Sample Rate: {sample_rate} Hz")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # Fast Data Acquisition GET (CMD=0x86, SUBCMD=0x00)
+        elif cmd == 0x86 and subcmd == 0x00:
+            # 시뮬레이션 Fast Acq 데이터 (8바이트)
+            fast_acq_data = bytearray()
+            fast_acq_data.append(0)  # memory_type (Ring Buffer)
+            fast_acq_data.append(0)  # trigger_source (Manual)
+            fast_acq_data.append(0)  # trigger_position (Start)
+            fast_acq_data.append(0)  # control (Stop)
+            fast_acq_data.extend(struct.pack('<I', 20000))  # sample_rate (10kHz)
+        
+            self.log_message(f"[GET] Fast Acquisition to {addr}:")
+            self.log_message(f"  - Memory Type: Ring Buffer")
+            self.log_message(f"  - Trigger Source: Manual")
+            self.log_message(f"  - Trigger Position: Start")
+            self.log_message(f"  - Control: Stop")
+            self.log_message(f"  - Sample Rate: 20000 Hz")
+        
+            response = RFProtocol.create_frame(cmd, subcmd, bytes(fast_acq_data))
+    
+        # DDS Control SET (CMD=0x08, SUBCMD=0x00, 24바이트)
+        elif cmd == 0x08 and subcmd == 0x00:
+            if len(parsed["data"]) >= 24:
+                ch0_gain = struct.unpack('<I', parsed["data"][0:4])[0]
+                ch1_gain = struct.unpack('<I', parsed["data"][4:8])[0]
+                ch0_phase = struct.unpack('<f', parsed["data"][8:12])[0]
+                ch1_phase = struct.unpack('<f', parsed["data"][12:16])[0]
+                rf_offset = struct.unpack('<i', parsed["data"][16:20])[0]
+                auto_offset = struct.unpack('<H', parsed["data"][20:22])[0]
+            
+                self.log_message(f"[SET] DDS Control from {addr}:")
+                self.log_message(f"  - Ch0 Amp Gain: {ch0_gain}")
+                self.log_message(f"  - Ch1 Amp Gain: {ch1_gain}")
+                self.log_message(f"  - Ch0 Phase (CEX): {ch0_phase:.2f}°")
+                self.log_message(f"  - Ch1 Phase (RF): {ch1_phase:.2f}°")
+                self.log_message(f"  - RF Freq Offset: {rf_offset}")
+                self.log_message(f"  - Auto RF Offset: {auto_offset}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # DDS Control GET (CMD=0x88, SUBCMD=0x00)
+        elif cmd == 0x88 and subcmd == 0x00:
+            # 시뮬레이션 DDS Control 데이터 (24바이트)
+            dds_data = bytearray()
+            dds_data.extend(struct.pack('<I', 1024))  # ch0_amp_gain
+            dds_data.extend(struct.pack('<I', 1024))  # ch1_amp_gain
+            dds_data.extend(struct.pack('<f', 0.0))  # ch0_phase_offset
+            dds_data.extend(struct.pack('<f', 0.0))  # ch1_phase_offset
+            dds_data.extend(struct.pack('<i', 0))  # rf_freqoffset
+            dds_data.extend(struct.pack('<H', 0))  # set_auto_rf_offset
+            dds_data.extend(struct.pack('<H', 0))  # dummy
+        
+            self.log_message(f"[GET] DDS Control to {addr}:")
+            self.log_message(f"  - Ch0 Amp Gain: 1024")
+            self.log_message(f"  - Ch1 Amp Gain: 1024")
+            self.log_message(f"  - Ch0 Phase (CEX): 0.00°")
+            self.log_message(f"  - Ch1 Phase (RF): 0.00°")
+            self.log_message(f"  - RF Freq Offset: 0")
+            self.log_message(f"  - Auto RF Offset: 0")
+        
+            response = RFProtocol.create_frame(cmd, subcmd, bytes(dds_data))
+    
+        # AGC Setup SET (CMD=0x0E, SUBCMD=0x00, 30바이트)
+        elif cmd == 0x0E and subcmd == 0x00:
+            if len(parsed["data"]) >= 32:
+                agc_on = struct.unpack('<H', parsed["data"][0:2])[0]
+                ref_time = struct.unpack('<H', parsed["data"][2:4])[0]
+                agc_times = [struct.unpack('<H', parsed["data"][4+i*2:6+i*2])[0] for i in range(4)]
+                gain_rates = [struct.unpack('<f', parsed["data"][12+i*4:16+i*4])[0] for i in range(4)]
+                init_gain = struct.unpack('<f', parsed["data"][28:32])[0]
+            
+                self.log_message(f"[SET] AGC Setup from {addr}:")
+                self.log_message(f"  - AGC On/Off: {'On' if agc_on else 'Off'}")
+                self.log_message(f"  - Ref Setup Time: {ref_time} ms")
+                self.log_message(f"  - AGC Setup Times: {agc_times[0]}, {agc_times[1]}, {agc_times[2]}, {agc_times[3]} ms")
+                self.log_message(f"  - Sensor Gain Rates: {gain_rates[0]:.3f}, {gain_rates[1]:.3f}, {gain_rates[2]:.3f}, {gain_rates[3]:.3f}")
+                self.log_message(f"  - Init Power Gain: {init_gain:.3f}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # AGC Setup GET (CMD=0x8E, SUBCMD=0x00)
+        elif cmd == 0x8E and subcmd == 0x00:
+            # 시뮬레이션 AGC Setup 데이터 (32바이트)
+            agc_data = bytearray()
+            agc_data.extend(struct.pack('<H', 0))  # agc_onoff
+            agc_data.extend(struct.pack('<H', 100))  # ref_setup_time
+            for _ in range(4):
+                agc_data.extend(struct.pack('<H', 0))  # agc_setup_time[4]
+            for _ in range(4):
+                agc_data.extend(struct.pack('<f', 0.0))  # sensor_gain_rate[4]
+            agc_data.extend(struct.pack('<f', 1.0))  # init_power_gain
+        
+            self.log_message(f"[GET] AGC Setup to {addr}:")
+            self.log_message(f"  - AGC On/Off: Off")
+            self.log_message(f"  - Ref Setup Time: 100 ms")
+            self.log_message(f"  - AGC Setup Times: 0, 0, 0, 0 ms")
+            self.log_message(f"  - Sensor Gain Rates: 0.000, 0.000, 0.000, 0.000")
+            self.log_message(f"  - Init Power Gain: 1.000")
+        
+            response = RFProtocol.create_frame(cmd, subcmd, bytes(agc_data))
+    
+        # Device Manager GET (CMD=0x8F, SUBCMD=0x00)
+        elif cmd == 0x8F and subcmd == 0x00:
+            # 시뮬레이션 Device Manager 데이터 (132바이트)
+            device_data = bytearray()
+            # modelname[32]
+            model_name = "VHF-5000".encode('utf-8')
+            device_data.extend(model_name + b'\x00' * (32 - len(model_name)))
+            # serialNo[12]
+            serial_no = "VHF12345".encode('utf-8')
+            device_data.extend(serial_no + b'\x00' * (12 - len(serial_no)))
+            # productiondate[24]
+            prod_date = "2024-01-15".encode('utf-8')
+            device_data.extend(prod_date + b'\x00' * (24 - len(prod_date)))
+            # hw_version[32]
+            hw_ver = "HW 1.0".encode('utf-8')
+            device_data.extend(hw_ver + b'\x00' * (32 - len(hw_ver)))
+            # fw_version[32]
+            fw_ver = "FW 1.22".encode('utf-8')
+            device_data.extend(fw_ver + b'\x00' * (32 - len(fw_ver)))
+            self.log_message(f"Get Device Manager for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, bytes(device_data))
+    
+        # System Control (CMD=0x10, multiple SUBCMD)
+        elif cmd == 0x10:
+            # SUBCMD 0x00: Save Config
+            if subcmd == 0x00:
+                if len(parsed["data"]) >= 1:
+                    config_type = parsed["data"][0]
+                    self.log_message(f"Save Config (type={config_type}) for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+        
+            # SUBCMD 0x01: Get State
+            elif subcmd == 0x01:
+                # 시뮬레이션 System State 데이터
+                state_data = struct.pack('<I', 0x00000001)  # Normal state
+                self.log_message(f"Get System State for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, state_data)
+        
+            # SUBCMD 0x02: Get ADC/DAC
+            elif subcmd == 0x02:
+                # ✅ System Control GET 명령어는 에러 코드 없이 바로 데이터만 전송
+                adc_dac_data = bytearray()
+                for _ in range(8):
+                    adc_dac_data.extend(struct.pack('<I', 2048))  # 8개 채널 (32바이트)
+                self.log_message(f"Get ADC/DAC for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(adc_dac_data))
+        
+            # SUBCMD 0x03: Get Gate Bias
+            elif subcmd == 0x03:
+                # 시뮬레이션 Gate Bias 데이터 (8개 float: 1.0~8.0)
+                gate_bias_data = bytearray()
+                for i in range(8):
+                    gate_bias_data.extend(struct.pack('<f', float(i + 1)))
+            
+                self.log_message(f"[GET] Gate Bias to {addr}:")
+                self.log_message(f"  - Module 1: B0={1.0:.3f}, B1={2.0:.3f}, B2={3.0:.3f}, B3={4.0:.3f}")
+                self.log_message(f"  - Module 2: B0={5.0:.3f}, B1={6.0:.3f}, B2={7.0:.3f}, B3={8.0:.3f}")
+            
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(gate_bias_data))
+        
+            # SUBCMD 0x04: Get DCC Interface
+            elif subcmd == 0x04:
+                # 시뮬레이션 DCC Interface 데이터
+                dcc_data = struct.pack('<I', 0)
+                self.log_message(f"Get DCC Interface for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, dcc_data)
+    
+        # ==========================================
+        # === Calibration Commands ===
+        # ==========================================
+    
+        # Calibration Control SET (CMD=0x09, SUBCMD=0x00, 12바이트)
+        elif cmd == 0x09 and subcmd == 0x00:
+            if len(parsed["data"]) >= 12:
+                cal_mode = struct.unpack('<H', parsed["data"][0:2])[0]
+                fwd_dac = struct.unpack('<H', parsed["data"][2:4])[0]
+                ref_dac = struct.unpack('<H', parsed["data"][4:6])[0]
+                rfset_dac = struct.unpack('<H', parsed["data"][6:8])[0]
+                client_state["cal_control"] = {
+                    "cal_mode": cal_mode, "fwd_dac": fwd_dac,
+                    "ref_dac": ref_dac, "rfset_dac": rfset_dac
+                }
+                self.log_message(f"Set Cal Control: mode={cal_mode}, fwd={fwd_dac}, ref={ref_dac}, rfset={rfset_dac} for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        # Calibration Control GET (CMD=0x89, SUBCMD=0x00)
+        elif cmd == 0x89 and subcmd == 0x00:
+            # 시뮬레이션 Cal Control 데이터 (12바이트)
+            cal_control = client_state["cal_control"]
+            cal_ctl_data = bytearray()
+            cal_ctl_data.extend(struct.pack('<H', cal_control["cal_mode"]))  # cal_mode
+            cal_ctl_data.extend(struct.pack('<H', cal_control["fwd_dac"]))  # fwd_dac_value
+            cal_ctl_data.extend(struct.pack('<H', cal_control["ref_dac"]))  # ref_dac_value
+            cal_ctl_data.extend(struct.pack('<H', cal_control["rfset_dac"]))  # rfset_dac_value
+            cal_ctl_data.extend(struct.pack('<H', 0))  # dummy2
+            cal_ctl_data.extend(struct.pack('<H', 0))  # dummy3
+            self.log_message(f"Get Cal Control for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, bytes(cal_ctl_data))
+    
+        # 교정 테이블 GET - SET으로 쓴 컬럼이 있으면 그대로 반환 (쓰기 후 읽기 검증용)
+        elif cmd & 0x80 and (cmd & 0x7F, subcmd) in client_state["cal_tables"]:
+            self.log_message(f"Get Cal Table CMD {cmd:02X} SUBCMD {subcmd:02X} (stored) for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, client_state["cal_tables"][(cmd & 0x7F, subcmd)])
+    
+        # RF Set DAC Table (CMD=0x0A/0x8A)
+        elif cmd == 0x0A:  # SET
+            if subcmd == 0x01:  # Target (104바이트 = 26*float)
+                if len(parsed["data"]) >= 104:
+                    self.log_message(f"Set RF Set DAC Table - Target (26 floats) for {addr}")
+                    client_state["cal_tables"][(cmd, subcmd)] = bytes(parsed["data"][:104])
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+            elif subcmd in [0x02, 0x03, 0x04]:  # DAC C/L/H (52바이트 = 26*uint16)
+                if len(parsed["data"]) >= 52:
+                    self.log_message(f"Set RF Set DAC Table - SUBCMD {subcmd:02X} (26 uint16) for {addr}")
+                    client_state["cal_tables"][(cmd, subcmd)] = bytes(parsed["data"][:52])
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        elif cmd == 0x8A:  # GET
+            if subcmd == 0x01:  # Target
+                # 시뮬레이션: 0~2500W, 100W 단위 (26포인트)
+                target_data = bytearray()
+                for i in range(26):
+                    target_data.extend(struct.pack('<f', float(i * 100)))
+                self.log_message(f"Get RF Set DAC Table - Target for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(target_data))
+            elif subcmd in [0x02, 0x03, 0x04]:  # DAC
+                # 시뮬레이션: DAC 값 (0~4095)
+                dac_data = bytearray()
+                for i in range(26):
+                    dac_val = int(200 + i * 150)  # 선형 증가
+                    dac_data.extend(struct.pack('<H', min(dac_val, 4095)))
+                self.log_message(f"Get RF Set DAC Table - SUBCMD {subcmd:02X} for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(dac_data))
+    
+        # FWD/LOAD Table (CMD=0x0B/0x8B)
+        elif cmd == 0x0B:  # SET
+            if subcmd == 0x01:  # Target (104바이트)
+                if len(parsed["data"]) >= 104:
+                    self.log_message(f"Set FWD/LOAD Table - Target for {addr}")
+                    client_state["cal_tables"][(cmd, subcmd)] = bytes(parsed["data"][:104])
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+            elif subcmd == 0x02:  # DAC (52바이트)
+                if len(parsed["data"]) >= 52:
+                    self.log_message(f"Set FWD/LOAD Table - DAC for {addr}")
+                    client_state["cal_tables"][(cmd, subcmd)] = bytes(parsed["data"][:52])
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        elif cmd == 0x8B:  # GET
+            if subcmd == 0x01:  # Target
+                target_data = bytearray()
+                for i in range(26):
+                    target_data.extend(struct.pack('<f', float(i * 100)))
+                self.log_message(f"Get FWD/LOAD Table - Target for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(target_data))
+            elif subcmd == 0x02:  # DAC
+                dac_data = bytearray()
+                for i in range(26):
+                    dac_val = int(200 + i * 150)
+                    dac_data.extend(struct.pack('<H', min(dac_val, 4095)))
+                self.log_message(f"Get FWD/LOAD Table - DAC for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(dac_data))
+    
+        # REF Table (CMD=0x0C/0x8C)
+        elif cmd == 0x0C:  # SET
+            if subcmd == 0x01:  # Target
+                if len(parsed["data"]) >= 104:
+                    self.log_message(f"Set REF Table - Target for {addr}")
+                    client_state["cal_tables"][(cmd, subcmd)] = bytes(parsed["data"][:104])
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+            elif subcmd == 0x02:  # DAC
+                if len(parsed["data"]) >= 52:
+                    self.log_message(f"Set REF Table - DAC for {addr}")
+                    client_state["cal_tables"][(cmd, subcmd)] = bytes(parsed["data"][:52])
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        elif cmd == 0x8C:  # GET
+            if subcmd == 0x01:  # Target
+                target_data = bytearray()
+                for i in range(26):
+                    target_data.extend(struct.pack('<f', float(i * 10)))  # 0~250W
+                self.log_message(f"Get REF Table - Target for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(target_data))
+            elif subcmd == 0x02:  # DAC
+                dac_data = bytearray()
+                for i in range(26):
+                    dac_val = int(200 + i * 140)
+                    dac_data.extend(struct.pack('<H', min(dac_val, 4095)))
+                self.log_message(f"Get REF Table - DAC for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(dac_data))
+    
+        # RF Set IN Table (CMD=0x0D/0x8D)
+        elif cmd == 0x0D:  # SET
+            if subcmd == 0x01:  # Target
+                if len(parsed["data"]) >= 104:
+                    self.log_message(f"Set RF Set IN Table - Target for {addr}")
+                    client_state["cal_tables"][(cmd, subcmd)] = bytes(parsed["data"][:104])
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+            elif subcmd == 0x03:  # ADC
+                if len(parsed["data"]) >= 52:
+                    self.log_message(f"Set RF Set IN Table - ADC for {addr}")
+                    client_state["cal_tables"][(cmd, subcmd)] = bytes(parsed["data"][:52])
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        elif cmd == 0x8D:  # GET
+            if subcmd == 0x01:  # Target
+                target_data = bytearray()
+                for i in range(26):
+                    target_data.extend(struct.pack('<f', float(i * 100)))
+                self.log_message(f"Get RF Set IN Table - Target for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(target_data))
+            elif subcmd == 0x03:  # ADC
+                adc_data = bytearray()
+                for i in range(26):
+                    adc_val = int(200 + i * 150)
+                    adc_data.extend(struct.pack('<H', min(adc_val, 4095)))
+                self.log_message(f"Get RF Set IN Table - ADC for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(adc_data))
+    
+        # DC Bias Table (CMD=0x13/0x93)
+        elif cmd == 0x13:  # SET
+            if subcmd == 0x01:  # Target
+                if len(parsed["data"]) >= 104:
+                    self.log_message(f"Set DC Bias Table - Target for {addr}")
+                    client_state["cal_tables"][(cmd, subcmd)] = bytes(parsed["data"][:104])
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+            elif subcmd == 0x02:  # ADC
+                if len(parsed["data"]) >= 52:
+                    self.log_message(f"Set DC Bias Table - ADC for {addr}")
+                    client_state["cal_tables"][(cmd, subcmd)] = bytes(parsed["data"][:52])
+                response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        elif cmd == 0x93:  # GET
+            if subcmd == 0x01:  # Target
+                target_data = bytearray()
+                for i in range(26):
+                    target_data.extend(struct.pack('<f', float(i * 2)))  # 0~50V
+                self.log_message(f"Get DC Bias Table - Target for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(target_data))
+            elif subcmd == 0x02:  # ADC
+                adc_data = bytearray()
+                for i in range(26):
+                    adc_val = int(200 + i * 140)
+                    adc_data.extend(struct.pack('<H', min(adc_val, 4095)))
+                self.log_message(f"Get DC Bias Table - ADC for {addr}")
+                response = RFProtocol.create_frame(cmd, subcmd, bytes(adc_data))
+    
+        # DCC Gate Bias Control (CMD=0x14/0x94, 0x15/0x95, 0x17/0x97, 0x18/0x98)
+        elif cmd in [0x14, 0x15, 0x17, 0x18]:  # SET commands
+            if len(parsed["data"]) >= 4:
+                value = struct.unpack('<f', parsed["data"][:4])[0]
+                cmd_name = {0x14: "Gate Max", 0x15: "Gate Min", 
+                           0x17: "Factor A", 0x18: "Factor B"}[cmd]
+                self.log_message(f"Set DCC {cmd_name}: {value} for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 0))
+    
+        elif cmd in [0x94, 0x95, 0x97, 0x98]:  # GET commands
+            # 시뮬레이션 값
+            sim_values = {0x94: 5.0, 0x95: -5.0, 0x97: 1.0, 0x98: 0.5}
+            value_data = struct.pack('<f', sim_values[cmd])
+            cmd_name = {0x94: "Gate Max", 0x95: "Gate Min", 
+                       0x97: "Factor A", 0x98: "Factor B"}[cmd]
+            self.log_message(f"Get DCC {cmd_name} for {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, value_data)
+    
+        # ==========================================
+        # === 알 수 없는 명령어 ===
+        # ==========================================
+        else:
+            self.log_message(f"Unknown command: CMD=0x{cmd:02X}, SUBCMD=0x{subcmd:02X} from {addr}")
+            response = RFProtocol.create_frame(cmd, subcmd, struct.pack('<B', 1))  # 에러 응답
+        ###############
+
+        return response
+
+    def create_complete_status(self, client_state, current_time):
+        """완전한 상태 데이터 생성 - 시나리오 또는 수동 모드 기반"""
+        
+        # 기본 상태 생성
+        status = {
+            "rf_on_off": 1 if client_state["rf_enabled"] else 0,
+            "set_power": client_state["set_power"],
+            "control_mode": client_state["control_mode"],
+            "alarm_state": client_state["alarm_state"],
+            "forward_power": 0.0,  # 기본값, 시나리오에서 설정됨
+            "reflect_power": 0.0,  # 기본값, 시나리오에서 설정됨
+            "delivery_power": 0.0,  # 계산됨
+            "frequency": float(client_state["rf_frequency"]),
+            "gamma": 0.5,
+            "real_gamma": 0.25,
+            "image_gamma": 0.15,
+            "rf_phase": 0.0,
+            "temperature": 40.0,  # 기본값, 시나리오에서 설정됨
+            "system_state": 0x0000,
+            "led_state": 0x0001,  # 기본값, 시나리오에서 설정됨
+            "firmware_version": 1.22
+        }
+        
+        # 이 클라이언트의 난수 스트림 선택
+        self.scenario_manager.use_client(client_state)
+        
+        # 모드에 따른 상태 결정 - 수동 값 (GUI가 manual_override로 전달)
+        manual = self.manual_override
+
+        # 기록 재생: 기록된 값 그대로 응답 (Delivery/Gamma 재계산 없음)
+        if self.replay is not None and not manual:
+            return self.replay.status_at(client_state, current_time)
+        if manual:
+            # 수동 모드: 전달받은 값 사용
+            status["forward_power"] = manual["forward_power"]
+            status["reflect_power"] = manual["reflect_power"]
+            status["temperature"] = manual["temperature"]
+            status["frequency"] = manual["frequency_mhz"] * 1000000  # MHz to Hz
+            status["led_state"] = manual["led_state"]
+            status["alarm_state"] = manual["alarm_state"]
+        elif not client_state["rf_enabled"] and self.scenario_manager.is_calibration_driving(client_state):
+            # 캘리브레이션 구동 (RF OFF 상태에서 Cal Control DAC로 직접 출력)
+            self.scenario_manager.calibration_drive(status, client_state)
+        else:
+            # 자동 시나리오 모드: 개선된 시나리오 사용
+            t = (current_time - client_state["start_time"]) % 30  # 30초 주기
+            # client_state를 시나리오에 전달
+            scenario_name = self.scenario_manager.get_current_scenario_data(status, t, client_state)
+        
+        # Delivery Power 계산 (Forward - Reflect)
+        status["delivery_power"] = max(0, status["forward_power"] - status["reflect_power"])
+        
+        # Gamma 계산 (reflect/forward 비율 기반)
+        if status["forward_power"] > 0:
+            gamma_magnitude = min(status["reflect_power"] / status["forward_power"], 1.0)
+            status["gamma"] = gamma_magnitude
+            status["real_gamma"] = gamma_magnitude * 0.7  # 실제 부분
+            status["image_gamma"] = gamma_magnitude * 0.3  # 허수 부분
+        else:
+            status["gamma"] = 0.0
+            status["real_gamma"] = 0.0
+            status["image_gamma"] = 0.0
+        
+        # 주파수 자동 튜닝 (RF On + Freq Tuning Enable)
+        if client_state["freq_tuning_enabled"] and client_state["rf_enabled"]:
+            self.scenario_manager.frequency_tuning_drive(status, client_state, current_time)
+        elif "freq_tuner" in client_state:
+            client_state["freq_tuner"]["rf_was_on"] = False
+        
+        return status
+
+    def create_status_response(self, status):
+        """상태 응답 데이터 생성 (STATUS_STRUCT 한 번에 pack, 56바이트)"""
+        return STATUS_STRUCT.pack(
+            # === HF와 동일: Bytes 0-7 ===
+            status["rf_on_off"], status["control_mode"], status["system_state"],
+            status["led_state"], status["alarm_state"],
+            # === HF와 동일: Bytes 8-43 ===
+            status["set_power"], status["forward_power"], status["reflect_power"], status["delivery_power"],
+            status["frequency"], status["gamma"], status["real_gamma"], status["image_gamma"], status["rf_phase"],
+            # === Bytes 44-47: temperature (Factory Info 1) ===
+            status["temperature"],
+            # === Bytes 48-51: Factory Info 2 (uint32 예비 필드) ===
+            0,
+            # === Bytes 52-55: firmware_version (Factory Info 3) ===
+            status["firmware_version"],
+        )
+
+    def stop(self):
+        """서버 정지"""
+        self.log_message("Stopping RF Test Server...")
+        self.running = False
+        
+        # 클라이언트 연결 정리
+        for client in self.clients[:]:
+            try:
+                client.close()
+            except:
+                pass
+        self.clients.clear()
+        
+        # 서버 소켓 정리
+        if self.server:
+            try:
+                self.server.close()
+            except:
+                pass
+        
+        self.log_message("RF Test Server stopped")
+
+    def set_scenario(self, scenario_index):
+        """시나리오 설정"""
+        if 0 <= scenario_index < len(self.scenario_manager.scenarios):
+            self.scenario_manager.current_scenario = scenario_index
+            scenario_names = self.scenario_manager.get_scenario_names()
+            self.log_message(f"시나리오 변경: {scenario_names[scenario_index]}")
+
+    # ==========================================
+    # === selectors 이벤트 루프 (헤드리스/부하 테스트) ===
+    # ==========================================
+
+    def serve_forever(self, ports=None):
+        """
+        단일 스레드 이벤트 루프로 여러 포트 서비스 (stop() 호출 시 종료)
+        - ports: 수신 포트 목록 (기본: self.port) - state_key="port"이면 포트마다 독립 장비
+        """
+        ports = list(ports or [self.port])
+        self.selector = selectors.DefaultSelector()
+        self.listeners = []
+        try:
+            for port in ports:
+                listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                listener.bind((self.host, port))
+                listener.listen(LISTEN_BACKLOG)
+                listener.setblocking(False)
+                self.selector.register(listener, selectors.EVENT_READ, ("listen", port))
+                self.listeners.append(listener)
+        except OSError as e:
+            self.log_message(f"Failed to listen on {self.host}:{port}: {e}")
+            self._close_selector()
+            return False
+
+        self.running = True
+        self.log_message(f"RF Simulator serving {len(ports)} port(s) on {self.host}:{ports[0]}"
+                         + (f"-{ports[-1]}" if len(ports) > 1 else "") + f" (state: {self.state_key})")
+        try:
+            while self.running:
+                for key, events in self.selector.select(timeout=self._pending_timeout()):
+                    kind = key.data[0]
+                    if kind == "listen":
+                        self._accept(key.fileobj, key.data[1])
+                    else:
+                        connection = key.data[1]
+                        if events & selectors.EVENT_READ:
+                            self._on_readable(connection)
+                        if events & selectors.EVENT_WRITE and not connection["closed"]:
+                            self._flush(connection)
+                if self._pending:
+                    self._release_pending(list(self._pending.values()))
+        finally:
+            self._close_selector()
+            self.running = False
+        return True
+
+    def _accept(self, listener, listen_port):
+        try:
+            client, addr = listener.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        client.setblocking(False)
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection = {
+            "socket": client, "addr": addr, "closed": False,
+            "recv": bytearray(), "send": bytearray(),
+            "state": self.client_states[self.get_client_key(addr, listen_port)],
+            "link": self.impairment.new_link((addr, listen_port)) if self.impairment else None,
+            "pending": deque(),  # (전송 시각, 바이트) - 장애 지연 응답
+        }
+        self.clients.append(client)
+        self.selector.register(client, selectors.EVENT_READ, ("client", connection))
+        self.log_message(f"New client connected from {addr} on port {listen_port}")
+
+    def _on_readable(self, connection):
+        try:
+            data = connection["socket"].recv(RECV_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self.log_message(f"Error handling client {connection['addr']}: {e}")
+            data = b""
+        if not data:
+            self._close_connection(connection)
+            return
+
+        connection["recv"].extend(data)
+        try:
+            for parsed in self.extract_frames(connection["recv"], connection["state"], connection["addr"]):
+                response = self.process_frame(parsed, connection["state"], connection["addr"])
+                if not response:
+                    continue
+                if connection["link"] is None:
+                    connection["send"].extend(response)
+                elif not self._queue_impaired(connection, parsed, response):
+                    return
+        except Exception as e:
+            # 연결 1개 오류가 루프 전체를 멈추지 않도록 해당 연결만 정리
+            self.log_message(f"Error handling client {connection['addr']}: {e}")
+            self._close_connection(connection)
+            return
+        if connection["pending"]:
+            self._release_pending([connection])
+        elif connection["send"]:
+            self._flush(connection)
+
+    def _queue_impaired(self, connection, parsed, response):
+        """장애 계획에 따라 응답 예약 - 리셋이면 연결 종료 후 False"""
+        action, chunks = self.impairment.schedule(
+            connection["link"], parsed["cmd"], parsed["subcmd"], response,
+            self.scenario_manager.current_scenario, time.monotonic())
+        if action == RESET:
+            self.log_message(f"Impairment: reset connection {connection['addr']}")
+            connection["socket"].setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            self._close_connection(connection)
+            return False
+        if chunks:
+            connection["pending"].extend(chunks)
+            self._pending[id(connection)] = connection
+        return True
+
+    def _pending_timeout(self):
+        """다음 예약 전송까지 남은 시간 (select 대기 시간, 최대 0.5초)"""
+        if not self._pending:
+            return 0.5
+        due = min(connection["pending"][0][0] for connection in self._pending.values())
+        return min(max(due - time.monotonic(), 0.0), 0.5)
+
+    def _release_pending(self, connections):
+        """전송 시각이 된 예약 응답을 송신 버퍼로 옮겨 전송"""
+        now = time.monotonic()
+        for connection in connections:
+            pending = connection["pending"]
+            while pending and pending[0][0] <= now:
+                connection["send"].extend(pending.popleft()[1])
+            if not pending:
+                self._pending.pop(id(connection), None)
+            if connection["send"] and not connection["closed"]:
+                self._flush(connection)
+
+    def _flush(self, connection):
+        """송신 버퍼 전송 - 다 못 보내면 쓰기 이벤트 대기"""
+        try:
+            sent = connection["socket"].send(connection["send"])
+            del connection["send"][:sent]
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError as e:
+            self.log_message(f"Error sending to client {connection['addr']}: {e}")
+            self._close_connection(connection)
+            return
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if connection["send"] else 0)
+        self.selector.modify(connection["socket"], events, ("client", connection))
+
+    def _close_connection(self, connection):
+        if connection["closed"]:
+            return
+        connection["closed"] = True
+        self._pending.pop(id(connection), None)
+        client = connection["socket"]
+        try:
+            self.selector.unregister(client)
+        except (KeyError, ValueError):
+            pass
+        if client in self.clients:
+            self.clients.remove(client)
+        try:
+            client.close()
+        except OSError:
+            pass
+        self.log_message(f"Client disconnected from {connection['addr']}")
+
+    def _close_selector(self):
+        if self.selector is None:
+            return
+        for key in list(self.selector.get_map().values()):
+            try:
+                key.fileobj.close()
+            except OSError:
+                pass
+        self.selector.close()
+        self.selector = None
+        self.listeners = []
+        self._pending.clear()
+        self.clients.clear()
+
+
+def main(argv=None):
+    """헤드리스 시뮬레이터 실행 (디스플레이 불필요)"""
+    parser = argparse.ArgumentParser(description="RF 발생기 시뮬레이터 (헤드리스)")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT, help="첫 포트")
+    parser.add_argument("--count", type=int, default=1, help="장비 수 (port부터 연속 포트)")
+    parser.add_argument("--state-key", choices=STATE_KEYS,
+                        help="상태 구분 단위 (기본: count > 1이면 port, 아니면 ip)")
+    parser.add_argument("--scenario", type=int, default=0, help="시나리오 번호")
+    parser.add_argument("--seed", type=int, help="시나리오 난수 시드 (장비별 독립 스트림, 재현용)")
+    parser.add_argument("--impair", help="네트워크 장애 프로파일 (프리셋 lan/slow_firmware/lossy 또는 JSON 경로)")
+    parser.add_argument("--replay", help="상태 기록 재생 (.rfcap 또는 save_excel CSV)")
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                        help="재생 배속 (1 = 원래 시간, 0 = 상태 요청마다 다음 레코드)")
+    parser.add_argument("--no-loop", action="store_true", help="재생 끝에서 마지막 레코드 유지")
+    parser.add_argument("--stats-interval", type=float, default=10.0, help="통계 출력 주기 (초, 0이면 끔)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="명령 로그 출력")
+    args = parser.parse_args(argv)
+
+    state_key = args.state_key or ("port" if args.count > 1 else "ip")
+    try:
+        impairment = load_impairment(args.impair, args.seed)
+    except (ValueError, OSError) as e:
+        print(f"장애 프로파일 로드 실패: {e}")
+        return 1
+    replay = None
+    if args.replay:
+        try:
+            replay = CaptureReplay.load(args.replay, args.replay_speed, not args.no_loop)
+        except (ValueError, OSError, KeyError) as e:
+            print(f"기록 로드 실패: {e}")
+            return 1
+    server = RFServer(args.host, args.port, state_key=state_key, verbose=args.verbose, seed=args.seed,
+                      impairment=impairment, replay=replay)
+    server.set_scenario(args.scenario)
+
+    if args.stats_interval > 0:
+        def report_stats():
+            last_frames, last_time = 0, time.monotonic()
+            while not server.running:
+                time.sleep(0.1)
+            while server.running:
+                time.sleep(args.stats_interval)
+                now, frames = time.monotonic(), server.global_frame_count
+                print(f"[STATS] clients {len(server.clients)}, devices {len(server.client_states)}, "
+                      f"frames {frames} ({(frames - last_frames) / (now - last_time):.0f}/s)")
+                last_frames, last_time = frames, now
+        threading.Thread(target=report_stats, daemon=True).start()
+
+    print(f"RF Simulator: {args.count} device(s) on {args.host}:{args.port}"
+          + (f"-{args.port + args.count - 1}" if args.count > 1 else "") + f", state key '{state_key}'"
+          + (f", impairment '{args.impair}'" if impairment else "")
+          + (f", replay '{args.replay}' ({len(replay)} records, x{args.replay_speed:g})" if replay else ""))
+    try:
+        ok = server.serve_forever(range(args.port, args.port + args.count))
+    except KeyboardInterrupt:
+        ok = True
+    finally:
+        server.running = False
+    if not ok:
+        print(f"서버 시작 실패: {args.host}:{args.port} (포트 사용 중 여부 확인)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
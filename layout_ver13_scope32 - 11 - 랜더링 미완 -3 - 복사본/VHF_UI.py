@@ -4,21 +4,29 @@ RF 파워 제너레이터 터미널 메인 실행 파일
 """
 import sys
 import os
+
+# 시작 시간 측정 모드 (--profile-startup) - 이후 import부터 측정
+from startup_profiler import profiler
+profiler.install_from_argv(sys.argv)
+
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from style_manager import apply_global_styles
 import pyqtgraph as pg
 
 # 로컬 모듈 import
 from main_window import MainWindow
 
+STARTUP_PROFILE_TIMEOUT_MS = 15000  # 상태 프레임이 없을 때 리포트 출력 시점
+
 def main():
     """메인 함수"""
     os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
     pg.setConfigOption('useOpenGL', True)
     pg.setConfigOption('antialias', True)
     # QApplication 생성
-    app = QApplication(sys.argv)
+    with profiler.span("QApplication"):
+        app = QApplication(sys.argv)
     
     # 애플리케이션 속성 설정
     app.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
@@ -33,8 +41,14 @@ def main():
     
     # 메인 윈도우 생성 및 표시
     try:
-        window = MainWindow()
-        window.show()
+        with profiler.span("MainWindow()"):
+            window = MainWindow()
+        with profiler.span("window.show()"):
+            window.show()
+        profiler.mark("창 표시")
+        if profiler.enabled:
+            QTimer.singleShot(STARTUP_PROFILE_TIMEOUT_MS,
+                              lambda: profiler.finish("제한 시간 (상태 프레임 없음)"))
         
         # 애플리케이션 실행
         sys.exit(app.exec_())
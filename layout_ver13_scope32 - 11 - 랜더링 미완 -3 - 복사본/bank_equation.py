@@ -0,0 +1,179 @@
+"""
+Bank Equation Module
+Bank 방정식 수열 평가 - Y(n) = A*X(n)^3 + B*X(n)^2 + C*X(n) + D, X(n+1) = Y(n)
+장비와 동일한 float32 연산, 파라미터 그리드 벡터 평가, 수렴/진동/발산 분류
+
+사용 예:
+    python bank_equation.py --x0 1 --a 0 --b -0.5:0.5:101 --c 0:2:101 --d 0 --length 200
+"""
+
+import argparse
+import numpy as np
+
+BANK_PARAM_KEYS = ["X0", "A", "B", "C", "D"]
+
+DEFAULT_LENGTH = 100
+DEFAULT_LIMIT = 1.0e6        # |X| 초과 시 발산으로 판정
+DEFAULT_TOL = 1.0e-4         # 수렴/주기 판정 허용 오차 (상대)
+DEFAULT_MAX_PERIOD = 8
+
+# 분류 코드
+CONVERGED = 0
+OSCILLATING = 1
+APERIODIC = 2
+DIVERGED = 3
+CLASS_NAMES = {CONVERGED: "수렴", OSCILLATING: "진동", APERIODIC: "비주기", DIVERGED: "발산"}
+
+
+def params_from_settings(settings, bank_num):
+    """튜닝 설정 -> (X0, A, B, C, D) float32 (create_bank_params_data와 동일한 기본값)"""
+    defaults = {"X0": 1.0, "A": 0.0, "B": 0.0, "C": 1.0, "D": 0.0}
+    return tuple(np.float32(float(settings.get(f"Bank{bank_num} {key}", defaults[key])))
+                 for key in BANK_PARAM_KEYS)
+
+
+def iterate(x0, a, b, c, d, length, keep=None, limit=DEFAULT_LIMIT):
+    """
+    수열 벡터 계산 (float32) - 인자는 스칼라 또는 같은 길이로 브로드캐스트되는 배열
+    keep: 보관할 마지막 샘플 수 (None이면 전체) - 대형 그리드의 메모리 절약용
+    반환: (수열 (N, keep), 발산 시작 인덱스 (N,), 미발산은 -1)
+    """
+    x, a, b, c, d = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=np.float32))
+                                          for v in (x0, a, b, c, d)))
+    x = x.copy()
+    count = x.shape[0]
+    keep = length if keep is None else min(keep, length)
+    out = np.empty((count, keep), dtype=np.float32)
+    diverged_at = np.full(count, -1, dtype=np.int64)
+    limit = np.float32(limit)
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        for n in range(length):
+            if n >= length - keep:
+                out[:, n - (length - keep)] = x
+            bad = (diverged_at < 0) & ~(np.abs(x) <= limit)
+            diverged_at[bad] = n
+            # 장비 연산 순서: A*X^3 + B*X^2 + C*X + D (각 단계 float32 반올림)
+            x2 = x * x
+            x = a * (x2 * x) + b * x2 + c * x + d
+    return out, diverged_at
+
+
+def classify(tail, diverged_at, tol=DEFAULT_TOL, max_period=DEFAULT_MAX_PERIOD):
+    """
+    수열 끝부분으로 분류
+    반환: (분류 코드 (N,), 주기 (N,) - 진동이 아니면 0)
+    """
+    count = tail.shape[0]
+    codes = np.full(count, APERIODIC, dtype=np.int8)
+    period = np.zeros(count, dtype=np.int64)
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        scale = np.maximum(np.abs(tail).max(axis=1), 1.0) * tol
+        spread = tail.max(axis=1) - tail.min(axis=1)
+        converged = spread <= scale
+        codes[converged] = CONVERGED
+
+        undecided = ~converged
+        for p in range(2, max_period + 1):
+            if tail.shape[1] <= 2 * p:
+                break
+            repeats = np.all(np.abs(tail[:, p:] - tail[:, :-p]) <= scale[:, None], axis=1)
+            hit = undecided & repeats
+            codes[hit] = OSCILLATING
+            period[hit] = p
+            undecided &= ~hit
+
+    codes[diverged_at >= 0] = DIVERGED
+    period[diverged_at >= 0] = 0
+    return codes, period
+
+
+def evaluate(x0, a, b, c, d, length=DEFAULT_LENGTH, limit=DEFAULT_LIMIT, tol=DEFAULT_TOL,
+             max_period=DEFAULT_MAX_PERIOD):
+    """
+    단일 파라미터 수열 평가 (미리보기용)
+    반환: {'sequence': float32 배열, 'class': 코드, 'period': 주기, 'diverged_at': 인덱스 또는 -1}
+    """
+    sequence, diverged_at = iterate(x0, a, b, c, d, length, limit=limit)
+    tail = sequence[:, -min(length, 4 * max_period):]
+    codes, period = classify(tail, diverged_at, tol, max_period)
+    return {
+        'sequence': sequence[0],
+        'class': int(codes[0]),
+        'period': int(period[0]),
+        'diverged_at': int(diverged_at[0]),
+    }
+
+
+def sweep(x0, a, b, c, d, length=DEFAULT_LENGTH, limit=DEFAULT_LIMIT, tol=DEFAULT_TOL,
+          max_period=DEFAULT_MAX_PERIOD):
+    """
+    파라미터 그리드 스윕 - 각 인자는 스칼라 또는 1차원 값 목록 (전체 조합 평가)
+    반환: {'shape': 그리드 형태, 'codes', 'period', 'diverged_at' (그리드 형태 배열), 'counts': {분류명: 개수}}
+    """
+    axes = [np.atleast_1d(np.asarray(v, dtype=np.float32)) for v in (x0, a, b, c, d)]
+    grids = np.meshgrid(*axes, indexing='ij')
+    shape = grids[0].shape
+
+    tail, diverged_at = iterate(*(g.ravel() for g in grids), length, keep=min(length, 4 * max_period),
+                                limit=limit)
+    codes, period = classify(tail, diverged_at, tol, max_period)
+    return {
+        'shape': shape,
+        'axes': axes,
+        'codes': codes.reshape(shape),
+        'period': period.reshape(shape),
+        'diverged_at': diverged_at.reshape(shape),
+        'counts': {name: int(np.count_nonzero(codes == code)) for code, name in CLASS_NAMES.items()},
+    }
+
+
+def describe(result):
+    """evaluate() 결과 요약 문자열"""
+    name = CLASS_NAMES[result['class']]
+    if result['class'] == DIVERGED:
+        return f"{name} (n={result['diverged_at']})"
+    if result['class'] == OSCILLATING:
+        return f"{name} (주기 {result['period']})"
+    return f"{name} (X={float(result['sequence'][-1]):.6g})"
+
+
+def parse_range(text):
+    """'값' 또는 '시작:끝:개수' -> float32 배열"""
+    parts = text.split(":")
+    if len(parts) == 1:
+        return np.array([float(parts[0])], dtype=np.float32)
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError(f"범위 형식 오류: {text} (시작:끝:개수)")
+    return np.linspace(float(parts[0]), float(parts[1]), int(parts[2]), dtype=np.float32)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bank 방정식 파라미터 스윕")
+    for key, default in (("x0", "1.0"), ("a", "0.0"), ("b", "0.0"), ("c", "1.0"), ("d", "0.0")):
+        parser.add_argument(f"--{key}", type=parse_range, default=parse_range(default),
+                            help="값 또는 시작:끝:개수")
+    parser.add_argument("--length", type=int, default=DEFAULT_LENGTH, help="수열 길이")
+    parser.add_argument("--limit", type=float, default=DEFAULT_LIMIT, help="발산 판정 |X| 한계")
+    parser.add_argument("--csv", help="조합별 결과 저장 경로")
+    args = parser.parse_args(argv)
+
+    result = sweep(args.x0, args.a, args.b, args.c, args.d, args.length, args.limit)
+    total = int(np.prod(result['shape']))
+    print(f"{total}개 조합, 길이 {args.length}")
+    for name, count in result['counts'].items():
+        print(f"  {name:<4} {count:>8} ({count * 100.0 / total:5.1f}%)")
+
+    if args.csv:
+        grids = np.meshgrid(*result['axes'], indexing='ij')
+        rows = np.column_stack([g.ravel() for g in grids] + [
+            result['codes'].ravel(), result['period'].ravel(), result['diverged_at'].ravel()])
+        np.savetxt(args.csv, rows, delimiter=",", fmt="%.7g",
+                   header="X0,A,B,C,D,class,period,diverged_at", comments="")
+        print(f"결과 저장: {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""
+Benchmark Common Module
+벤치마크 공용 - 통계 요약, 실행 환경 정보, 결과 JSON 저장, 기준선 비교
+"""
+
+import os
+import sys
+import json
+import platform
+import datetime
+import subprocess
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER_DIR = os.path.join(ROOT_DIR, "Server")
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 앱 모듈 import 경로 (benchmarks/ 밖의 평면 모듈)
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+DEFAULT_TOLERANCE = 0.2  # 기준선 대비 20% 초과 악화 시 회귀
+
+
+def summarize(values):
+    """값 목록 -> {count, mean, p50, p95, p99, max} (비어 있으면 count만)"""
+    values = np.asarray(values, dtype=np.float64)
+    if not len(values):
+        return {"count": 0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "count": int(len(values)),
+        "mean": float(values.mean()),
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "max": float(values.max()),
+    }
+
+
+def environment():
+    """실행 환경 정보 (결과 비교 시 참고)"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                                capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit,
+    }
+
+
+def save_results(path, results):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results, baseline, rules, tolerance=DEFAULT_TOLERANCE):
+    """
+    기준선 비교 - rules: {지표 이름: "higher" 또는 "lower"} (좋은 방향)
+    반환: (비교 행 목록, 회귀 행 목록) - 행: (케이스, 지표, 기준, 현재, 변화율)
+    """
+    rows, regressions = [], []
+    for case, metrics in results["cases"].items():
+        base_metrics = baseline.get("cases", {}).get(case)
+        if not base_metrics:
+            continue
+        for metric, direction in rules.items():
+            current, base = metrics.get(metric), base_metrics.get(metric)
+            if current is None or base is None or base == 0:
+                continue
+            change = (current - base) / abs(base)
+            row = (case, metric, base, current, change)
+            rows.append(row)
+            worse = -change if direction == "higher" else change
+            if worse > tolerance:
+                regressions.append(row)
+    return rows, regressions
+
+
+def format_comparison(rows, regressions):
+    regressed = {(case, metric) for case, metric, *_ in regressions}
+    lines = [f"{'케이스':<36} {'지표':<22} {'기준':>12} {'현재':>12} {'변화':>8}"]
+    for case, metric, base, current, change in rows:
+        mark = "  << 회귀" if (case, metric) in regressed else ""
+        lines.append(f"{case:<36} {metric:<22} {base:>12.4g} {current:>12.4g} {change * 100:>7.1f}%{mark}")
+    lines.append(f"회귀 {len(regressions)}건" if regressions else "회귀 없음")
+    return "\n".join(lines)
+
+
+def report_baseline(results, baseline_path, rules, tolerance):
+    """기준선 파일이 있으면 비교 출력 - 반환: 종료 코드 (회귀 시 1)"""
+    if not baseline_path or not os.path.exists(baseline_path):
+        if baseline_path:
+            print(f"기준선 없음: {baseline_path} (--save-baseline으로 생성)")
+        return 0
+    rows, regressions = compare(results, load_results(baseline_path), rules, tolerance)
+    print(format_comparison(rows, regressions))
+    return 1 if regressions else 0
@@ -0,0 +1,372 @@
+"""
+Pipeline Benchmark
+수집 파이프라인 종단 벤치마크 - 헤드리스 시뮬레이터 → HybridRFClientThread → DataProcessor → PlotManager/오실로스코프
+- 실제 MainWindow를 QT_QPA_PLATFORM=offscreen으로 실행 (플롯 구성/장비 주소만 변경)
+- 측정: 수신/처리 프레임률, 수신→화면 지연 (플롯 viewport Paint 이벤트 기준), GUI 이벤트 루프 지연, CPU, RSS
+- status_interval_ms × 플롯 구성 조합별 결과를 JSON으로 저장하고 기준선과 비교 (회귀 시 종료 코드 1)
+
+사용 예:
+    python benchmarks/bench_pipeline.py --intervals 20,50,100 --plots default,all,osc --duration 10
+    python benchmarks/bench_pipeline.py --save-baseline
+"""
+
+import os
+import sys
+import time
+import socket
+import struct
+import argparse
+import datetime
+import subprocess
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from bench_common import (
+    ROOT_DIR, SERVER_DIR, BENCH_DIR, DEFAULT_TOLERANCE, summarize, environment, save_results, report_baseline
+)
+
+import pyqtgraph as pg
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QObject, QEvent, QTimer, QEventLoop, Qt
+
+from rf_protocol import RFProtocol
+from main_window import MainWindow
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+DEVICE_PORT = 5000  # NetworkManager 고정 포트
+LAG_TIMER_MS = 10
+
+# 플롯 구성: (selected_plots, 오실로스코프 사용)
+DEFAULT_PLOTS = [True, True, True, False, False, False, False, False, True]
+PLOT_CONFIGS = {
+    "default": (DEFAULT_PLOTS, False),
+    "all": ([True] * 9, False),
+    "osc": (DEFAULT_PLOTS, True),
+}
+
+# 기준선 비교 지표 (좋은 방향)
+RULES = {
+    "processed_fps": "higher",
+    "latency_p50_ms": "lower",
+    "latency_p99_ms": "lower",
+    "loop_lag_p99_ms": "lower",
+    "cpu_percent": "lower",
+    "rss_mb": "lower",
+}
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline_pipeline.json")
+
+
+class BenchWindow(MainWindow):
+    """벤치마크용 MainWindow - 플롯 구성과 장비 주소만 변경 (설정 파일은 저장하지 않음)"""
+    selected = DEFAULT_PLOTS
+    host = "127.0.0.1"
+
+    def init_basic_settings(self):
+        super().init_basic_settings()
+        self.selected_plots = list(self.selected)
+
+    def init_managers(self):
+        super().init_managers()
+        self.tuning_settings["IP Address"] = self.host
+
+
+# ========================================
+# 시뮬레이터
+# ========================================
+def wait_for_port(host, port, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def start_simulator(host, seed):
+    """헤드리스 시뮬레이터 실행 (Server/rf_sim_core.py)"""
+    process = subprocess.Popen(
+        [sys.executable, "rf_sim_core.py", "--host", host, "--port", str(DEVICE_PORT),
+         "--seed", str(seed), "--stats-interval", "0"],
+        cwd=SERVER_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if not wait_for_port(host, DEVICE_PORT, 10.0):
+        process.terminate()
+        raise RuntimeError(f"시뮬레이터 시작 실패: {host}:{DEVICE_PORT}")
+    return process
+
+
+def prime_device(host, power):
+    """RF On + 출력 설정 (상태 값이 0이 아니도록)"""
+    with socket.create_connection((host, DEVICE_PORT), timeout=2.0) as sock:
+        for frame in (RFProtocol.create_frame(RFProtocol.CMD_RF_ON, RFProtocol.SUBCMD_RF_ON),
+                      RFProtocol.create_frame(RFProtocol.CMD_SET_POWER, RFProtocol.SUBCMD_SET_POWER,
+                                              struct.pack('<f', power))):
+            sock.sendall(frame)
+            sock.recv(64)
+
+
+# ========================================
+# 측정
+# ========================================
+def rss_mb():
+    """현재 프로세스 RSS (MB) - psutil 없으면 /proc, 둘 다 없으면 None"""
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss / 1048576
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1048576
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def run_events(ms):
+    """이벤트 루프를 ms 동안 실행"""
+    loop = QEventLoop()
+    QTimer.singleShot(int(ms), loop.quit)
+    loop.exec_()
+
+
+class PaintProbe(QObject):
+    """viewport Paint 이벤트 감시 - 화면 반영 대기 샘플의 지연 기록"""
+
+    def __init__(self, ready, latencies):
+        super().__init__()
+        self.ready = ready
+        self.latencies = latencies
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self.ready:
+            now = time.time()
+            self.latencies.extend((now - t) * 1000.0 for t in self.ready)
+            self.ready.clear()
+        return False
+
+
+class PipelineProbe:
+    """
+    파이프라인 계측
+    - 수신: client_thread.data_received (수신 시각 = 프레임 수신 완료 시각)
+    - 메인 플롯: update_plot_data로 들어온 샘플이 simple_plot_update 실제 갱신 후 첫 Paint에서 화면 반영
+    - 오실로스코프: update_data로 전달된 샘플이 다음 Paint에서 화면 반영
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.received = 0
+        self.plot_pending, self.plot_ready, self.latencies = [], [], []
+        self.osc_ready, self.osc_latencies = [], []
+        self.lags = []
+        self._last_tick = None
+        self._filters = []
+
+        window.network_manager.client_thread.data_received.connect(self.on_received)
+
+        processor = window.data_processor
+        original_update_plot_data = processor.update_plot_data
+
+        def update_plot_data(status, timestamp):
+            original_update_plot_data(status, timestamp)
+            self.plot_pending.append(timestamp)
+        processor.update_plot_data = update_plot_data
+
+        plot_manager = window.plot_manager
+        original_plot_update = plot_manager.simple_plot_update
+
+        def simple_plot_update():
+            original_plot_update()
+            if plot_manager.update_counter == 0:
+                self.plot_ready.extend(self.plot_pending)
+                self.plot_pending.clear()
+        plot_manager.simple_plot_update = simple_plot_update
+
+        for i, plot in enumerate(window.dock_manager.plot_widgets):
+            if window.selected_plots[i]:
+                self._watch(plot.viewport(), PaintProbe(self.plot_ready, self.latencies))
+
+        dialog = window.oscilloscope_dialog
+        if dialog:
+            original_osc_update = dialog.update_data
+
+            def osc_update_data(status):
+                original_osc_update(status)
+                self.osc_ready.append(time.time())
+            dialog.update_data = osc_update_data
+            osc_plot = dialog.oscilloscope_view.plot_widget.plot_widget
+            self._watch(osc_plot.viewport(), PaintProbe(self.osc_ready, self.osc_latencies))
+
+        self.lag_timer = QTimer()
+        self.lag_timer.setTimerType(Qt.PreciseTimer)
+        self.lag_timer.timeout.connect(self.on_tick)
+        self.lag_timer.start(LAG_TIMER_MS)
+
+    def _watch(self, widget, probe):
+        widget.installEventFilter(probe)
+        self._filters.append((widget, probe))
+
+    def on_received(self, data, timestamp):
+        if data:
+            self.received += 1
+
+    def on_tick(self):
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            self.lags.append(max((now - self._last_tick) * 1000.0 - LAG_TIMER_MS, 0.0))
+        self._last_tick = now
+
+    def reset(self):
+        """워밍업 이후 측정 시작"""
+        self.received = 0
+        for values in (self.plot_pending, self.plot_ready, self.latencies,
+                       self.osc_ready, self.osc_latencies, self.lags):
+            values.clear()
+        self._last_tick = None
+
+    def remove(self):
+        self.lag_timer.stop()
+        for widget, probe in self._filters:
+            widget.removeEventFilter(probe)
+        self._filters = []
+
+
+def configure_window(window, interval_ms, with_osc):
+    dc = dict(window.settings_manager.settings.get("data_collection", {}))
+    dc["status_interval_ms"] = interval_ms
+    window.apply_data_collection_settings({"data_collection": dc})
+    if with_osc:
+        window.show_oscilloscope()
+        if window.oscilloscope_dialog:
+            window.oscilloscope_dialog.oscilloscope_view.start_acquisition()
+
+
+def close_window(window):
+    """설정 저장 없이 정리 (closeEvent는 도킹/튜닝 설정을 저장하므로 사용하지 않음)"""
+    window.data_process_timer.stop()
+    if window.oscilloscope_dialog:
+        window.oscilloscope_dialog.close()
+    window.network_manager.stop_client()
+    window.network_manager.wait_for_client_thread_termination()
+    window.hide()
+    window.deleteLater()
+    run_events(200)
+
+
+def run_case(host, interval_ms, plot_name, warmup_s, duration_s):
+    selected, with_osc = PLOT_CONFIGS[plot_name]
+    BenchWindow.selected, BenchWindow.host = selected, host
+    window = BenchWindow()
+    window.show()
+    configure_window(window, interval_ms, with_osc)
+    probe = PipelineProbe(window)
+
+    run_events(warmup_s * 1000)
+    probe.reset()
+    samples_start = window.sample_count
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    run_events(duration_s * 1000)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    processed = window.sample_count - samples_start
+
+    latency = summarize(probe.latencies)
+    lag = summarize(probe.lags)
+    metrics = {
+        "status_interval_ms": interval_ms,
+        "plots": plot_name,
+        "duration_s": wall,
+        "received_fps": probe.received / wall,
+        "processed_fps": processed / wall,
+        "dropped": max(probe.received - processed - len(window.data_processor.data_queue), 0),
+        "latency_ms": latency,
+        "latency_p50_ms": latency.get("p50"),
+        "latency_p99_ms": latency.get("p99"),
+        "loop_lag_ms": lag,
+        "loop_lag_p99_ms": lag.get("p99"),
+        "cpu_percent": cpu / wall * 100.0,
+        "rss_mb": rss_mb(),
+    }
+    if with_osc:
+        metrics["osc_latency_ms"] = summarize(probe.osc_latencies)
+
+    probe.remove()
+    close_window(window)
+    return metrics
+
+
+def format_case(name, m):
+    def ms(value):
+        return f"{value:.1f}" if value is not None else "-"
+    rss = f"{m['rss_mb']:.0f}MB" if m["rss_mb"] is not None else "-"
+    return (f"{name:<16} 수신 {m['received_fps']:6.1f}/s 처리 {m['processed_fps']:6.1f}/s 누락 {m['dropped']:4d} | "
+            f"지연 p50 {ms(m['latency_p50_ms'])} p99 {ms(m['latency_p99_ms'])}ms | "
+            f"루프 p99 {ms(m['loop_lag_p99_ms'])}ms | CPU {m['cpu_percent']:5.1f}% RSS {rss}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="수집 파이프라인 종단 벤치마크")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--no-server", action="store_true", help="시뮬레이터를 실행하지 않고 host:5000 장비 사용")
+    parser.add_argument("--seed", type=int, default=1, help="시뮬레이터 난수 시드")
+    parser.add_argument("--power", type=float, default=500.0, help="측정 전 설정 출력 (W)")
+    parser.add_argument("--intervals", default="20,50,100", help="status_interval_ms 목록")
+    parser.add_argument("--plots", default="default,all,osc", help=f"플롯 구성 ({', '.join(PLOT_CONFIGS)})")
+    parser.add_argument("--warmup", type=float, default=2.0, help="케이스별 워밍업 (초)")
+    parser.add_argument("--duration", type=float, default=10.0, help="케이스별 측정 시간 (초)")
+    parser.add_argument("--opengl", action="store_true", help="pyqtgraph OpenGL 사용 (VHF_UI와 동일)")
+    parser.add_argument("--out", help="결과 JSON (기본: benchmarks/results/pipeline_<시각>.json)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="비교 기준선 JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준선으로 저장")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="회귀 판정 허용 비율")
+    args = parser.parse_args(argv)
+
+    intervals = [int(v) for v in args.intervals.split(",") if v.strip()]
+    plots = [p.strip() for p in args.plots.split(",") if p.strip()]
+    unknown = [p for p in plots if p not in PLOT_CONFIGS]
+    if unknown:
+        parser.error(f"알 수 없는 플롯 구성: {', '.join(unknown)}")
+
+    # VHF_UI와 같은 작업 디렉토리 (data/, resources/ 상대 경로)
+    os.chdir(ROOT_DIR)
+    pg.setConfigOption('useOpenGL', args.opengl)
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    simulator = None if args.no_server else start_simulator(args.host, args.seed)
+    results = {
+        "benchmark": "pipeline",
+        "meta": {**environment(), "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+                 "opengl": args.opengl, "warmup_s": args.warmup, "duration_s": args.duration,
+                 "seed": args.seed, "power": args.power, "psutil": PSUTIL_AVAILABLE},
+        "cases": {},
+    }
+    try:
+        prime_device(args.host, args.power)
+        for interval_ms in intervals:
+            for plot_name in plots:
+                name = f"{interval_ms}ms/{plot_name}"
+                metrics = run_case(args.host, interval_ms, plot_name, args.warmup, args.duration)
+                results["cases"][name] = metrics
+                print(format_case(name, metrics))
+    finally:
+        if simulator:
+            simulator.terminate()
+            simulator.wait(5)
+    app.processEvents()
+
+    out = args.out or os.path.join(BENCH_DIR, "results",
+                                   f"pipeline_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    save_results(out, results)
+    print(f"결과 저장: {out}")
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"기준선 저장: {args.baseline}")
+        return 0
+    return report_baseline(results, args.baseline, RULES, args.tolerance)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,212 @@
+"""
+Protocol Benchmark
+프로토콜/코덱 마이크로벤치마크 - 프레임 단위 핫패스의 ns/op와 메모리 할당
+- RFProtocol: create_frame, parse_response, validate_command_data, get_command_description
+- StatusParser.parse_device_status, HybridRFClientThread._format_hex_data
+- TuningSettingsManager / DeveloperDataManager / SystemDataManager의 모든 create_*_data, parse_*_data
+  (이름으로 자동 수집, parse 입력은 같은 이름의 create 출력 - 없으면 0으로 채운 버퍼)
+
+측정 지표:
+    ns_per_op          : timeit 자동 반복, 반복 중 최솟값 (호출 오버헤드 포함)
+    peak_bytes_per_op  : 1회 호출 중 최대 임시 할당 바이트 (tracemalloc peak)
+    result_blocks_per_op: 결과를 유지할 때 남는 메모리 블록 수 (sys.getallocatedblocks 차이 / 호출 수)
+    (CPython은 누적 할당 횟수를 제공하지 않으므로 임시 할당은 peak 바이트로 대신함)
+
+사용 예:
+    python benchmarks/bench_protocol.py
+    python benchmarks/bench_protocol.py -k Developer --quick
+    python benchmarks/bench_protocol.py --save-baseline
+"""
+
+import os
+import gc
+import sys
+import struct
+import inspect
+import argparse
+import datetime
+import timeit
+import tracemalloc
+
+from bench_common import (
+    BENCH_DIR, DEFAULT_TOLERANCE, environment, save_results, report_baseline
+)
+
+from rf_protocol import RFProtocol, HybridRFClientThread
+from data_manager import TuningSettingsManager, StatusParser
+from developer_data_manager import DeveloperDataManager
+from developer_widgets.system_widgets.system_data_manager import SystemDataManager
+
+RULES = {"ns_per_op": "lower", "peak_bytes_per_op": "lower", "result_blocks_per_op": "lower"}
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline_protocol.json")
+
+# create_* 인자 이름별 샘플 값 (settings는 관리자별로 지정)
+ARG_SAMPLES = {"value": 1.5, "config_type": 0, "dc_onoff": True, "bank_num": 1, "enable": True}
+FALLBACK_PAYLOAD = bytes(256)  # 대응 create가 없는 parse 입력
+
+# 대표 상태 응답 데이터 (56바이트, VHF 매뉴얼 기준)
+STATUS_PAYLOAD = struct.pack('<BBHHHffffffffffIf', 1, 2, 0, 0x0021, 0, 500.0, 498.7, 12.3, 486.4,
+                             13560000.0, 0.157, 0.11, 0.047, 12.5, 41.2, 0, 1.22)
+STATUS_FRAME = RFProtocol.create_frame(RFProtocol.CMD_DEVICE_STATUS_GET, RFProtocol.SUBCMD_DEVICE_STATUS,
+                                       STATUS_PAYLOAD)
+
+
+def payload_of(result):
+    """create 결과에서 바이트 추출 ((success, data, msg) 튜플 또는 bytes)"""
+    if isinstance(result, (bytes, bytearray)):
+        return bytes(result)
+    if isinstance(result, tuple):
+        for item in result:
+            if isinstance(item, (bytes, bytearray)):
+                return bytes(item)
+    return None
+
+
+def codec_cases(group, owner, settings):
+    """
+    관리자 객체/클래스의 create_*_data, parse_*_data (TuningSettingsManager는 _parse_*) 수집
+    반환: [(이름, 함수, 인자 튜플), ...]
+    """
+    creates, parses = {}, {}
+    for name, func in inspect.getmembers(owner, callable):
+        if name.startswith("create_") and name.endswith("_data"):
+            creates[name[len("create_"):-len("_data")]] = func
+        elif name.startswith("parse_") and name.endswith("_data"):
+            parses[name[len("parse_"):-len("_data")]] = (name, func)
+        elif name.startswith("_parse_") and group == "Tuning":
+            parses[name[len("_parse_"):]] = (name, func)
+
+    cases, create_args = [], {}
+    for key, func in sorted(creates.items()):
+        params = list(inspect.signature(func).parameters)
+        create_args[key] = tuple(settings if p == "settings" else ARG_SAMPLES.get(p) for p in params)
+        cases.append((f"{group}.create_{key}_data", func, create_args[key]))
+    for key, (name, func) in sorted(parses.items()):
+        payload = None
+        if key in creates:
+            try:
+                payload = payload_of(creates[key](*create_args[key]))
+            except Exception:
+                payload = None
+        cases.append((f"{group}.{name}", func, (payload if payload is not None else FALLBACK_PAYLOAD,)))
+    return cases
+
+
+def collect_cases():
+    tuning = TuningSettingsManager()
+    cases = [
+        ("RFProtocol.create_frame(status)", RFProtocol.create_frame,
+         (RFProtocol.CMD_DEVICE_STATUS_GET, RFProtocol.SUBCMD_DEVICE_STATUS)),
+        ("RFProtocol.create_frame(56B)", RFProtocol.create_frame,
+         (RFProtocol.CMD_DEVICE_STATUS_GET, RFProtocol.SUBCMD_DEVICE_STATUS, STATUS_PAYLOAD)),
+        ("RFProtocol.parse_response(status)", RFProtocol.parse_response, (STATUS_FRAME,)),
+        ("RFProtocol.validate_command_data", RFProtocol.validate_command_data,
+         (RFProtocol.CMD_SET_POWER, RFProtocol.SUBCMD_SET_POWER, struct.pack('<f', 500.0))),
+        ("RFProtocol.get_command_description", RFProtocol.get_command_description,
+         (RFProtocol.CMD_DEVICE_STATUS_GET, RFProtocol.SUBCMD_DEVICE_STATUS)),
+        ("StatusParser.parse_device_status", StatusParser.parse_device_status, (STATUS_PAYLOAD,)),
+        # self를 쓰지 않는 메서드 - 스레드 생성 없이 호출
+        ("HybridRFClientThread._format_hex_data", HybridRFClientThread._format_hex_data, (None, STATUS_FRAME)),
+    ]
+    cases += codec_cases("Tuning", tuning, tuning.default_settings.copy())
+    cases += codec_cases("Developer", DeveloperDataManager, {})
+    cases += codec_cases("System", SystemDataManager, {})
+    return cases
+
+
+# ========================================
+# 측정
+# ========================================
+def time_per_op(func, args, min_time, repeat):
+    """ns/op (자동 반복 횟수, repeat회 중 최솟값)"""
+    timer = timeit.Timer(lambda: func(*args))
+    number, elapsed = timer.autorange()
+    number = max(int(number * min_time / max(elapsed, 1e-9)), 1)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def allocations_per_op(func, args, calls):
+    """(1회 최대 임시 할당 바이트, 결과 유지 시 호출당 남는 블록 수)"""
+    func(*args)  # 캐시/지연 초기화 제외
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(min(calls, 50)):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            func(*args)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+
+    gc.collect()
+    gc.disable()
+    try:
+        results = [None] * calls
+        before = sys.getallocatedblocks()
+        for i in range(calls):
+            results[i] = func(*args)
+        blocks = (sys.getallocatedblocks() - before) / calls
+    finally:
+        del results
+        gc.enable()
+    peaks.sort()
+    return peaks[len(peaks) // 2], max(blocks, 0.0)
+
+
+def run_case(func, args, min_time, repeat, alloc_calls):
+    func(*args)  # 예외 여부 먼저 확인
+    ns = time_per_op(func, args, min_time, repeat)
+    peak, blocks = allocations_per_op(func, args, alloc_calls)
+    return {"ns_per_op": ns, "peak_bytes_per_op": peak, "result_blocks_per_op": blocks}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="프로토콜/코덱 마이크로벤치마크")
+    parser.add_argument("-k", "--filter", help="이름에 포함된 케이스만")
+    parser.add_argument("--quick", action="store_true", help="짧게 측정 (반복 3, 케이스당 약 0.05초)")
+    parser.add_argument("--list", action="store_true", help="케이스 목록만 출력")
+    parser.add_argument("--out", help="결과 JSON (기본: benchmarks/results/protocol_<시각>.json)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="비교 기준선 JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준선으로 저장")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="회귀 판정 허용 비율")
+    args = parser.parse_args(argv)
+
+    cases = [c for c in collect_cases() if not args.filter or args.filter in c[0]]
+    if args.list:
+        for name, _, _ in cases:
+            print(name)
+        return 0
+
+    min_time, repeat = (0.05, 3) if args.quick else (0.2, 5)
+    results = {
+        "benchmark": "protocol",
+        "meta": {**environment(), "min_time_s": min_time, "repeat": repeat},
+        "cases": {},
+    }
+    print(f"{'케이스':<56} {'ns/op':>10} {'peak B/op':>10} {'blocks/op':>10}")
+    for name, func, case_args in cases:
+        try:
+            metrics = run_case(func, case_args, min_time, repeat, alloc_calls=1000)
+        except Exception as e:
+            print(f"{name:<56} 실패: {e}")
+            results["cases"][name] = {"error": str(e)}
+            continue
+        results["cases"][name] = metrics
+        print(f"{name:<56} {metrics['ns_per_op']:>10.0f} {metrics['peak_bytes_per_op']:>10d} "
+              f"{metrics['result_blocks_per_op']:>10.1f}")
+
+    out = args.out or os.path.join(BENCH_DIR, "results",
+                                   f"protocol_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    save_results(out, results)
+    print(f"결과 저장: {out}")
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"기준선 저장: {args.baseline}")
+        return 0
+    return report_baseline(results, args.baseline, RULES, args.tolerance)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
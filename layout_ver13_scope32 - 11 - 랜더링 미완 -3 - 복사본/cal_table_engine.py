@@ -0,0 +1,316 @@
+"""
+Calibration Table Engine
+교정 테이블 오프라인 평가/검증 - 구간 선형 Target<->DAC 변환(벡터), 단조성/간격/기울기 검사,
+출력 트레이스의 DAC 공간 투영, fleet 일괄 검사
+
+사용 예:
+    python cal_table_engine.py unit1.vsnap unit2.vsnap --max-slope 40 --csv cal_issues.csv
+    python cal_table_engine.py unit1.vsnap --trace rf_data_20250101_120000.csv
+"""
+
+import os
+import csv
+import argparse
+import numpy as np
+
+from snapshot_file import DeviceSnapshot
+from cal_table_io import (CAL_TABLE_READ_COMMANDS, CAL_TABLE_POINTS, CAL_TABLE_NAMES, decode_column,
+                          load_table_csv, read_tables)
+
+DEFAULT_GAP_FACTOR = 3.0     # 중앙 간격 대비 배수 초과 시 간격 이상
+DEFAULT_SLOPE_FACTOR = 4.0   # 중앙 기울기 대비 배수 초과 시 기울기 이상
+DEFAULT_FLEET_TOL = 0.05     # fleet 중앙 곡선 대비 허용 편차 (DAC 전체 범위 대비)
+DEFAULT_TRACE_COLUMN = "Forward Power"
+
+
+class CalTable:
+    """
+    교정 테이블 1개 (Target 26개 + DAC/ADC 컬럼)
+    - 유효 구간: 마지막으로 Target이 0이 아닌 행까지 (뒤쪽 0 패딩 제외)
+    """
+
+    def __init__(self, name, columns):
+        self.name = name
+        self.columns = {column: np.asarray(values, dtype=float) for column, values in columns.items()}
+        target = self.columns.get("Target", np.zeros(CAL_TABLE_POINTS))
+        nonzero = np.flatnonzero(target)
+        self.count = int(nonzero[-1]) + 1 if len(nonzero) else 0
+
+    def __repr__(self):
+        return f"CalTable({self.name!r}, points={self.count})"
+
+    # ========================================
+    # 로드
+    # ========================================
+    @classmethod
+    def from_csv(cls, path, name):
+        """CalTableDialog.export_csv 형식 CSV"""
+        return cls(name, load_table_csv(path, name))
+
+    @classmethod
+    def from_snapshot(cls, snapshot, name):
+        """스냅샷의 cal.<테이블> 섹션 (컬럼이 없거나 길이 부족이면 None)"""
+        cmd_get, columns = CAL_TABLE_READ_COMMANDS[name]
+        values = {}
+        for subcmd, column in columns:
+            decoded = decode_column(column, snapshot.get(cmd_get, subcmd))
+            if decoded is None:
+                return None
+            values[column] = decoded
+        return cls(name, values)
+
+    @classmethod
+    def from_device(cls, client_thread, names=None, config_cache=None):
+        """장치에서 일괄 읽기 - 반환: ({테이블: CalTable}, 실패 목록)"""
+        ok, tables, failed = read_tables(client_thread, names, config_cache)
+        return {name: cls(name, columns) for name, columns in tables.items()}, failed
+
+    # ========================================
+    # 변환
+    # ========================================
+    @property
+    def target(self):
+        return self.columns["Target"][:self.count]
+
+    @property
+    def dac_columns(self):
+        return [column for column in self.columns if column != "Target"]
+
+    def dac(self, column=None):
+        return self.columns[column or self.dac_columns[0]][:self.count]
+
+    def to_dac(self, setpoints, column=None):
+        """
+        Target -> DAC (구간 선형, 배열 입력)
+        반환: (DAC 배열, 범위 밖 마스크) - 범위 밖은 양 끝 값으로 고정
+        """
+        setpoints = np.asarray(setpoints, dtype=float)
+        target, dac = self.target, self.dac(column)
+        if self.count < 2:
+            return np.full(setpoints.shape, np.nan), np.ones(setpoints.shape, dtype=bool)
+        order = np.argsort(target, kind='stable')
+        values = np.interp(setpoints, target[order], dac[order])
+        out_of_range = (setpoints < target.min()) | (setpoints > target.max())
+        return values, out_of_range
+
+    def to_target(self, dac_values, column=None):
+        """DAC -> Target (역변환, DAC가 단조 증가인 구간 기준)"""
+        dac_values = np.asarray(dac_values, dtype=float)
+        target, dac = self.target, self.dac(column)
+        if self.count < 2:
+            return np.full(dac_values.shape, np.nan)
+        order = np.argsort(dac, kind='stable')
+        return np.interp(dac_values, dac[order], target[order])
+
+    # ========================================
+    # 검증
+    # ========================================
+    def verify(self, max_slope=None, gap_factor=DEFAULT_GAP_FACTOR, slope_factor=DEFAULT_SLOPE_FACTOR):
+        """
+        테이블 검사 - 반환: [(검사 항목, 행, 메시지)]
+        - monotonic: Target 순증가, DAC 비감소
+        - gap: Target 간격이 중앙 간격의 gap_factor배 초과
+        - slope: |dDAC/dTarget|가 max_slope(절대) 또는 중앙 기울기의 slope_factor배 초과
+        - band: DAC Low <= DAC Center <= DAC High (RF Set DAC)
+        """
+        issues = []
+        if self.count < 2:
+            return [("points", 0, f"유효 포인트 부족 ({self.count})")]
+
+        target = self.target
+        steps = np.diff(target)
+        for row in np.flatnonzero(steps <= 0):
+            issues.append(("monotonic", int(row) + 1, f"Target 비증가 ({target[row]:g} -> {target[row + 1]:g})"))
+
+        positive = steps[steps > 0]
+        if len(positive):
+            median_step = np.median(positive)
+            for row in np.flatnonzero(steps > gap_factor * median_step):
+                issues.append(("gap", int(row) + 1,
+                               f"Target 간격 {steps[row]:g} (중앙값 {median_step:g}의 {steps[row] / median_step:.1f}배)"))
+
+        for column in self.dac_columns:
+            dac = self.dac(column)
+            dac_steps = np.diff(dac)
+            for row in np.flatnonzero(dac_steps < 0):
+                issues.append(("monotonic", int(row) + 1, f"{column} 감소 ({dac[row]:g} -> {dac[row + 1]:g})"))
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                slopes = np.where(steps > 0, np.abs(dac_steps) / steps, np.nan)
+            valid = np.isfinite(slopes)
+            if not valid.any():
+                continue
+            relative = slope_factor * np.median(slopes[valid])
+            limits = [limit for limit in (relative if relative > 0 else None, max_slope) if limit is not None]
+            if not limits:
+                continue
+            limit = min(limits)
+            for row in np.flatnonzero(valid & (slopes > limit)):
+                issues.append(("slope", int(row) + 1, f"{column} 기울기 {slopes[row]:.3g} (한도 {limit:.3g})"))
+
+        if {"DAC Low", "DAC Center", "DAC High"} <= set(self.columns):
+            low, center, high = self.dac("DAC Low"), self.dac("DAC Center"), self.dac("DAC High")
+            for row in np.flatnonzero((low > center) | (center > high)):
+                issues.append(("band", int(row) + 1,
+                               f"DAC 대역 역전 (Low {low[row]:g}, Center {center[row]:g}, High {high[row]:g})"))
+        return issues
+
+    # ========================================
+    # 트레이스 투영
+    # ========================================
+    def project_trace(self, trace, column=None):
+        """
+        출력 트레이스(예: Forward Power 기록)를 DAC 공간으로 투영
+        반환: {'dac', 'segment'(구간 번호), 'segment_counts', 'below', 'above', 'dac_min', 'dac_max'}
+        """
+        trace = np.asarray(trace, dtype=float)
+        trace = trace[np.isfinite(trace)]
+        dac, _ = self.to_dac(trace, column)
+        target = np.sort(self.target)
+        segment = np.clip(np.searchsorted(target, trace, side='right') - 1, 0, max(self.count - 2, 0))
+        return {
+            'dac': dac,
+            'segment': segment,
+            'segment_counts': np.bincount(segment, minlength=max(self.count - 1, 1)),
+            'below': int(np.count_nonzero(trace < target[0])) if self.count else len(trace),
+            'above': int(np.count_nonzero(trace > target[-1])) if self.count else len(trace),
+            'dac_min': float(np.nanmin(dac)) if len(dac) else float('nan'),
+            'dac_max': float(np.nanmax(dac)) if len(dac) else float('nan'),
+        }
+
+
+def load_power_trace(path, column=DEFAULT_TRACE_COLUMN):
+    """
+    출력 트레이스 로드
+    - .csv: 데이터 로그(save_excel) 또는 캡처 CSV - 컬럼명이 column으로 시작하는 열
+    - .npz/.json: 오실로스코프 캡처 (채널 이름 일치)
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".npz", ".json"):
+        from osc.capture_export import load_capture
+        _, data, header = load_capture(path, mmap=False)
+        names = [name.lower() for name in header["channel_names"]]
+        if column.lower() not in names:
+            raise ValueError(f"캡처에 '{column}' 채널이 없습니다: {header['channel_names']}")
+        return np.asarray(data[:, names.index(column.lower())], dtype=float)
+
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        matches = [i for i, name in enumerate(header) if name.strip().lower().startswith(column.lower())]
+        if not matches:
+            raise ValueError(f"CSV에 '{column}' 컬럼이 없습니다")
+        index = matches[0]
+        values = []
+        for row in reader:
+            try:
+                values.append(float(row[index]))
+            except (IndexError, ValueError):
+                continue
+    return np.asarray(values, dtype=float)
+
+
+# ========================================
+# Fleet 일괄 검사
+# ========================================
+def load_fleet(paths):
+    """스냅샷 파일 목록 -> {장비 이름: {테이블: CalTable}}"""
+    fleet = {}
+    for path in paths:
+        snapshot = DeviceSnapshot.load(path)
+        unit = os.path.splitext(os.path.basename(path))[0]
+        tables = {}
+        for name in CAL_TABLE_NAMES:
+            table = CalTable.from_snapshot(snapshot, name)
+            if table is not None:
+                tables[name] = table
+        fleet[unit] = tables
+    return fleet
+
+
+def screen_fleet(fleet, max_slope=None, fleet_tol=DEFAULT_FLEET_TOL, grid_points=101):
+    """
+    fleet 교정 품질 일괄 검사
+    - 장비별 verify() 결과
+    - 공통 Target 격자에서 DAC 곡선을 평가해 fleet 중앙 곡선 대비 편차 검사 (DAC 범위 대비 fleet_tol 초과)
+    반환: [(장비, 테이블, 검사 항목, 행, 메시지)]
+    """
+    rows = []
+    for unit, tables in fleet.items():
+        for name, table in tables.items():
+            for check, row, message in table.verify(max_slope=max_slope):
+                rows.append((unit, name, check, row, message))
+
+    for name in CAL_TABLE_NAMES:
+        members = [(unit, tables[name]) for unit, tables in fleet.items()
+                   if name in tables and tables[name].count >= 2]
+        if len(members) < 3:
+            continue
+        for column in members[0][1].dac_columns:
+            low = max(table.target.min() for _, table in members)
+            high = min(table.target.max() for _, table in members)
+            if high <= low:
+                continue
+            grid = np.linspace(low, high, grid_points)
+            curves = np.vstack([table.to_dac(grid, column)[0] for _, table in members])
+            median = np.median(curves, axis=0)
+            scale = max(np.ptp(median), 1.0)
+            deviation = np.abs(curves - median) / scale
+            for (unit, _), dev, worst in zip(members, deviation.max(axis=1), deviation.argmax(axis=1)):
+                if dev > fleet_tol:
+                    rows.append((unit, name, "fleet", 0,
+                                 f"{column} fleet 중앙 곡선 대비 편차 {dev * 100:.1f}% (Target {grid[worst]:g})"))
+    return rows
+
+
+def format_screen_report(rows):
+    """검사 결과 텍스트 보고서"""
+    if not rows:
+        return "이상 없음"
+    lines = [f"{'Unit':<16} {'Table':<16} {'Check':<10} {'Row':>4}  Message"]
+    for unit, name, check, row, message in rows:
+        lines.append(f"{unit:<16} {name:<16} {check:<10} {row:>4}  {message}")
+    return "\n".join(lines)
+
+
+def write_screen_csv(path, rows):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Unit", "Table", "Check", "Row", "Message"])
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="교정 테이블 검증")
+    parser.add_argument("snapshots", nargs="+", help="스냅샷 파일 (.vsnap)")
+    parser.add_argument("--max-slope", type=float, help="허용 최대 |dDAC/dTarget|")
+    parser.add_argument("--fleet-tol", type=float, default=DEFAULT_FLEET_TOL)
+    parser.add_argument("--trace", help="DAC 공간으로 투영할 출력 트레이스 (CSV/캡처)")
+    parser.add_argument("--trace-column", default=DEFAULT_TRACE_COLUMN)
+    parser.add_argument("--table", default="RF Set DAC", help="트레이스 투영 대상 테이블")
+    parser.add_argument("--csv", help="검사 결과 CSV 저장 경로")
+    args = parser.parse_args(argv)
+
+    fleet = load_fleet(args.snapshots)
+    rows = screen_fleet(fleet, max_slope=args.max_slope, fleet_tol=args.fleet_tol)
+    print(format_screen_report(rows))
+
+    if args.trace:
+        trace = load_power_trace(args.trace, args.trace_column)
+        for unit, tables in fleet.items():
+            if args.table not in tables:
+                continue
+            projection = tables[args.table].project_trace(trace)
+            print(f"\n[{unit}] {args.table} 투영: {len(trace)} 샘플, "
+                  f"DAC {projection['dac_min']:.0f}~{projection['dac_max']:.0f}, "
+                  f"범위 미만 {projection['below']}, 초과 {projection['above']}")
+            print("  구간별 샘플 수: " + " ".join(str(c) for c in projection['segment_counts']))
+
+    if args.csv:
+        write_screen_csv(args.csv, rows)
+        print(f"CSV 저장: {args.csv}")
+    return 0 if not rows else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,208 @@
+"""
+Calibration Table I/O Module
+교정 테이블 5종 공용 정의/인코딩 - GET/SET 명령어 구성, 26포인트 컬럼 변환, CSV 로드, 파이프라인 읽기/쓰기(CRC32 검증)
+- Qt 비의존 (오프라인 CLI, 개발자 위젯, 스냅샷에서 공용)
+- rf_protocol은 Qt를 불러오므로 장치 통신 함수 안에서만 import
+"""
+
+import csv
+import struct
+import zlib
+
+CAL_TABLE_POINTS = 26
+
+# 교정 테이블 GET 명령어: 테이블 이름 -> (GET CMD, [(SUBCMD, 컬럼명)]) (CalTableDialog.TABLE_TYPES와 동일 구성)
+# 값은 RFProtocol.CMD_CAL_*_TABLE_GET / SUBCMD_CAL_* 와 동일 (SET CMD = GET CMD & 0x7F)
+CAL_TABLE_READ_COMMANDS = {
+    "RF Set DAC": (0x8A, [
+        (0x01, "Target"),
+        (0x02, "DAC Center"),
+        (0x03, "DAC Low"),
+        (0x04, "DAC High"),
+    ]),
+    "User FWD/LOAD": (0x8B, [
+        (0x01, "Target"),
+        (0x02, "DAC"),
+    ]),
+    "User REF": (0x8C, [
+        (0x01, "Target"),
+        (0x02, "DAC"),
+    ]),
+    "User RF Set IN": (0x8D, [
+        (0x01, "Target"),
+        (0x03, "ADC"),
+    ]),
+    "User DC Bias": (0x93, [
+        (0x01, "Target"),
+        (0x02, "ADC"),
+    ]),
+}
+CAL_TABLE_NAMES = list(CAL_TABLE_READ_COMMANDS.keys())
+
+
+def column_format(column):
+    """컬럼별 struct 형식 - Target은 float, 나머지는 uint16"""
+    return f'<{CAL_TABLE_POINTS}f' if column == "Target" else f'<{CAL_TABLE_POINTS}H'
+
+
+def get_table_columns(table_name):
+    """테이블의 (SUBCMD, 컬럼명) 목록 - CalTableDialog 컬럼 순서와 동일"""
+    return CAL_TABLE_READ_COMMANDS[table_name][1]
+
+
+def encode_column(column, values):
+    """26개 값 -> 페이로드"""
+    if column == "Target":
+        values = [float(v) for v in values]
+    else:
+        values = [max(0, min(int(v), 0xFFFF)) for v in values]
+    return struct.pack(column_format(column), *values)
+
+
+def decode_column(column, payload):
+    """페이로드 -> 26개 값 (길이 부족 시 None)"""
+    size = struct.calcsize(column_format(column))
+    if payload is None or len(payload) < size:
+        return None
+    return struct.unpack(column_format(column), payload[:size])
+
+
+def build_read_commands(table_names=None):
+    """교정 테이블 GET 명령어 목록 - 각 항목에 'table', 'column' 포함"""
+    commands = []
+    for table_name in table_names or CAL_TABLE_NAMES:
+        cmd_get = CAL_TABLE_READ_COMMANDS[table_name][0]
+        for subcmd, column in get_table_columns(table_name):
+            commands.append({'cmd': cmd_get, 'subcmd': subcmd, 'data': None,
+                             'description': f'{table_name} {column} 조회',
+                             'table': table_name, 'column': column})
+    return commands
+
+
+def build_write_commands(tables):
+    """
+    교정 테이블 SET 명령어 목록
+    tables: {테이블 이름: {컬럼명: 26개 값}} - 없는 컬럼은 전송하지 않음
+    """
+    commands = []
+    for table_name, columns in tables.items():
+        cmd_set = CAL_TABLE_READ_COMMANDS[table_name][0] & 0x7F
+        for subcmd, column in get_table_columns(table_name):
+            if column not in columns:
+                continue
+            commands.append({'cmd': cmd_set, 'subcmd': subcmd,
+                             'data': encode_column(column, columns[column]),
+                             'description': f'{table_name} {column} 적용',
+                             'table': table_name, 'column': column})
+    return commands
+
+
+def cached_table(config_cache, table_name):
+    """설정 캐시에서 테이블 복원 - 컬럼이 하나라도 없으면 None"""
+    if config_cache is None:
+        return None
+    cmd_get = CAL_TABLE_READ_COMMANDS[table_name][0]
+    table = {}
+    for subcmd, column in get_table_columns(table_name):
+        values = decode_column(column, config_cache.get(cmd_get, subcmd))
+        if values is None:
+            return None
+        table[column] = values
+    return table
+
+
+def load_table_csv(path, table_name):
+    """CalTableDialog.export_csv 형식 CSV 로드 -> {컬럼: 26개 값}"""
+    columns = [column for _, column in get_table_columns(table_name)]
+    values = {column: [0] * CAL_TABLE_POINTS for column in columns}
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        next(reader)
+        for row_idx, row_data in enumerate(reader):
+            if row_idx >= CAL_TABLE_POINTS:
+                break
+            for col_idx, column in enumerate(columns):
+                if col_idx < len(row_data) and row_data[col_idx].strip():
+                    values[column][row_idx] = float(row_data[col_idx])
+    return values
+
+
+# ========================================
+# 장치 전송 (client_thread.send_pipelined)
+# ========================================
+def read_tables(client_thread, table_names=None, config_cache=None):
+    """
+    교정 테이블 일괄 읽기 (파이프라인 1회)
+    반환: (성공 여부, {테이블: {컬럼: 값}}, 실패 목록)
+    """
+    from rf_protocol import RFProtocol
+
+    commands = build_read_commands(table_names)
+    results = client_thread.send_pipelined(commands)
+
+    tables = {}
+    failed = []
+    for command, result in zip(commands, results):
+        parsed = RFProtocol.parse_response(result.response_data) if result.success and result.response_data else None
+        values = decode_column(command['column'], parsed['data']) if parsed else None
+        if values is None:
+            failed.append(f"{command['description']} ({result.message})")
+            continue
+        tables.setdefault(command['table'], {})[command['column']] = values
+        if config_cache is not None:
+            config_cache.record_read_back(parsed)
+    return not failed, tables, failed
+
+
+def write_tables(client_thread, tables, config_cache=None, verify=True, progress=None):
+    """
+    교정 테이블 일괄 쓰기 (파이프라인 1회) + 읽기 검증
+    - 검증: 전송 페이로드와 재읽기 페이로드의 CRC32 비교
+    반환: (성공 여부, 실패 목록, 메시지)
+    """
+    from rf_protocol import RFProtocol
+
+    commands = build_write_commands(tables)
+    if not commands:
+        return False, [], "전송할 테이블 데이터가 없습니다"
+
+    if progress:
+        progress(10, f"{len(commands)}개 컬럼 전송 중...")
+    results = client_thread.send_pipelined(commands)
+
+    failed = []
+    written = []
+    for command, result in zip(commands, results):
+        if result.success:
+            written.append(command)
+        else:
+            failed.append(f"{command['description']} - {result.message}")
+            if config_cache is not None:
+                config_cache.invalidate(command['cmd'], command['subcmd'])
+
+    if not verify:
+        if config_cache is not None:
+            for command in written:
+                config_cache.update(command['cmd'], command['subcmd'], command['data'])
+        return not failed, failed, f"교정 테이블 적용: {len(written)}/{len(commands)} 컬럼"
+
+    if progress:
+        progress(55, "읽기 검증 중...")
+    read_back = [{'cmd': c['cmd'] | 0x80, 'subcmd': c['subcmd'], 'data': None} for c in written]
+    verify_results = client_thread.send_pipelined(read_back)
+
+    verified = 0
+    for command, result in zip(written, verify_results):
+        parsed = RFProtocol.parse_response(result.response_data) if result.success and result.response_data else None
+        expected_crc = zlib.crc32(command['data'])
+        actual_crc = zlib.crc32(parsed['data'][:len(command['data'])]) if parsed else None
+        if actual_crc == expected_crc:
+            verified += 1
+            if config_cache is not None:
+                config_cache.update(command['cmd'], command['subcmd'], command['data'])
+        else:
+            failed.append(f"{command['description']} - 검증 실패 (CRC32 불일치)")
+            if config_cache is not None:
+                config_cache.invalidate(command['cmd'], command['subcmd'])
+
+    return not failed, failed, f"교정 테이블 적용/검증: {verified}/{len(commands)} 컬럼"
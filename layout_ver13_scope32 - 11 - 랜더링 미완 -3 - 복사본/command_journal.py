@@ -0,0 +1,236 @@
+"""
+Command Journal Module
+명령어 지연 기록 - 모든 명령어의 (시각, CMD, SUBCMD, 페이로드 크기, 연결 시간, 응답 시간, 결과 코드, 전송 방식)
+- 메모리: 고정 크기 NumPy 링 버퍼 (레코드당 24바이트)
+- 디스크: 주기적으로 새 레코드만 일별 CSV에 추가 (command_journal_YYYYMMDD.csv)
+- 리포트: 명령어/전송 방식별 응답 시간 백분위, 타임아웃/실패 수
+
+전송 방식:
+    single    : 비동기 대기열 (명령어마다 새 연결)
+    sync      : 동기 실행 (명령어마다 새 연결)
+    pipelined : 파이프라인 (연결 1회 공유, 첫 명령어에만 연결 시간)
+    poll      : 상태조회 (상시 연결, include_polls일 때만)
+"""
+
+import os
+import csv
+import time
+import datetime
+import threading
+import numpy as np
+
+JOURNAL_DTYPE = np.dtype([
+    ("time", "<f8"), ("cmd", "u1"), ("subcmd", "u1"), ("payload", "<u2"),
+    ("connect_ms", "<f4"), ("rtt_ms", "<f4"), ("result", "<i2"), ("mode", "u1"),
+])
+MODES = ["single", "sync", "pipelined", "poll"]
+CSV_COLUMNS = ["time", "cmd", "subcmd", "payload", "connect_ms", "rtt_ms", "result", "mode"]
+
+# 결과 코드: 0 성공, 1~4 장비 오류 코드, 음수는 통신 오류
+RESULT_OK = 0
+RESULT_TIMEOUT = -1
+RESULT_CONNECT_FAILED = -2
+RESULT_MISMATCH = -3
+RESULT_ERROR = -4
+RESULT_NAMES = {
+    RESULT_OK: "성공", 1: "범위 초과", 2: "잘못된 조건", 3: "정의되지 않음", 4: "명령어 오류",
+    RESULT_TIMEOUT: "타임아웃", RESULT_CONNECT_FAILED: "연결 실패", RESULT_MISMATCH: "응답 불일치",
+    RESULT_ERROR: "통신 오류",
+}
+
+DEFAULT_CAPACITY = 20000
+DEFAULT_FLUSH_INTERVAL = 10.0
+
+
+def result_code(result):
+    """CommandResult -> 결과 코드"""
+    if result.success:
+        return RESULT_OK
+    if result.error_code:
+        return int(result.error_code)
+    message = result.message or ""
+    if "타임아웃" in message or "timed out" in message:
+        return RESULT_TIMEOUT
+    if "연결 실패" in message:
+        return RESULT_CONNECT_FAILED
+    if "불일치" in message:
+        return RESULT_MISMATCH
+    return RESULT_ERROR
+
+
+class CommandJournal:
+    """명령어 지연 링 버퍼 (스레드 안전) + 주기적 디스크 저장"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.enabled = True
+        self.include_polls = False
+        self.directory = None
+        self.flush_interval = DEFAULT_FLUSH_INTERVAL
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._flush_thread = None
+        self._resize(capacity)
+
+    def _resize(self, capacity):
+        self.records = np.zeros(max(int(capacity), 1), dtype=JOURNAL_DTYPE)
+        self.count = 0      # 누적 기록 수
+        self.flushed = 0    # 디스크에 저장한 누적 수
+        self.lost = 0       # 저장 전에 덮어써진 수
+
+    def configure(self, directory=None, capacity=None, flush_interval=None, include_polls=None, enabled=None):
+        with self._lock:
+            if directory is not None:
+                self.directory = directory
+            if capacity is not None and int(capacity) != len(self.records):
+                self._resize(capacity)
+            if flush_interval is not None:
+                self.flush_interval = float(flush_interval)
+            if include_polls is not None:
+                self.include_polls = bool(include_polls)
+            if enabled is not None:
+                self.enabled = bool(enabled)
+
+    def record(self, cmd, subcmd, payload_size, connect_time, round_trip_time, result, mode, timestamp=None):
+        """명령어 1건 기록 (시간은 초)"""
+        if not self.enabled or (mode == "poll" and not self.include_polls):
+            return
+        with self._lock:
+            rec = self.records[self.count % len(self.records)]
+            rec["time"] = time.time() if timestamp is None else timestamp
+            rec["cmd"] = cmd
+            rec["subcmd"] = subcmd
+            rec["payload"] = min(payload_size, 0xFFFF)
+            rec["connect_ms"] = connect_time * 1000.0
+            rec["rtt_ms"] = round_trip_time * 1000.0
+            rec["result"] = result
+            rec["mode"] = MODES.index(mode)
+            self.count += 1
+
+    def rows(self, since=0):
+        """누적 번호 since 이후의 레코드 (시간순 복사본) - 반환: (레코드, 시작 번호)"""
+        with self._lock:
+            capacity = len(self.records)
+            start = max(since, self.count - capacity)
+            if start >= self.count:
+                return self.records[:0].copy(), start
+            indices = np.arange(start, self.count) % capacity
+            return self.records[indices], start
+
+    def clear(self):
+        with self._lock:
+            self.count = self.flushed = self.lost = 0
+
+    # ========================================
+    # 디스크 저장
+    # ========================================
+    def journal_path(self, day=None):
+        day = day or datetime.date.today()
+        return os.path.join(self.directory, f"command_journal_{day:%Y%m%d}.csv")
+
+    def flush(self):
+        """새 레코드를 일별 CSV에 추가 - 반환: (성공 여부, 저장 수, 메시지)"""
+        if not self.directory:
+            return False, 0, "저장 경로가 설정되지 않았습니다"
+        with self._flush_lock:
+            records, start = self.rows(self.flushed)
+            self.lost += start - self.flushed
+            if not len(records):
+                self.flushed = start
+                return True, 0, "저장할 기록 없음"
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                path = self.journal_path()
+                is_new = not os.path.exists(path)
+                with open(path, "a", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    if is_new:
+                        writer.writerow(CSV_COLUMNS)
+                    for rec in records:
+                        writer.writerow([f"{rec['time']:.6f}", int(rec["cmd"]), int(rec["subcmd"]), int(rec["payload"]),
+                                         f"{rec['connect_ms']:.3f}", f"{rec['rtt_ms']:.3f}", int(rec["result"]),
+                                         MODES[rec["mode"]]])
+            except OSError as e:
+                return False, 0, f"명령어 기록 저장 실패: {e}"
+            self.flushed = start + len(records)
+            return True, len(records), f"명령어 기록 {len(records)}건 저장: {path}"
+
+    def start_autoflush(self):
+        """백그라운드 주기 저장 시작"""
+        if self._flush_thread and self._flush_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._flush_thread = threading.Thread(target=self._autoflush_loop, name="CommandJournalFlush", daemon=True)
+        self._flush_thread.start()
+
+    def stop_autoflush(self):
+        """주기 저장 중지 + 남은 기록 저장"""
+        self._stop_event.set()
+        if self._flush_thread:
+            self._flush_thread.join(timeout=2.0)
+            self._flush_thread = None
+        return self.flush()
+
+    def _autoflush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            success, _, message = self.flush()
+            if not success:
+                print(f"[CommandJournal] {message}")
+
+
+# 전역 기록 (앱 전체 공유)
+journal = CommandJournal()
+
+
+# ========================================
+# 불러오기 / 리포트
+# ========================================
+def load_journal_csv(path):
+    """일별 CSV -> 레코드 배열"""
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    records = np.zeros(len(rows), dtype=JOURNAL_DTYPE)
+    for i, row in enumerate(rows):
+        rec = records[i]
+        for key in ("time", "cmd", "subcmd", "payload", "connect_ms", "rtt_ms", "result"):
+            rec[key] = float(row[key])
+        rec["mode"] = MODES.index(row["mode"]) if row["mode"] in MODES else 0
+    return records
+
+
+def latency_report(records):
+    """
+    명령어/전송 방식별 지연 통계 (응답 시간 p99 내림차순)
+    반환: [{'cmd', 'subcmd', 'mode', 'count', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms',
+            'connect_ms', 'timeouts', 'failures'}, ...]
+    """
+    if not len(records):
+        return []
+    keys = records[["cmd", "subcmd", "mode"]]
+    report = []
+    for key in np.unique(keys):
+        group = records[keys == key]
+        rtt = group["rtt_ms"].astype(np.float64)
+        p50, p90, p99 = np.percentile(rtt, [50, 90, 99])
+        report.append({
+            "cmd": int(key["cmd"]), "subcmd": int(key["subcmd"]), "mode": MODES[key["mode"]],
+            "count": int(len(group)),
+            "p50_ms": float(p50), "p90_ms": float(p90), "p99_ms": float(p99), "max_ms": float(rtt.max()),
+            "connect_ms": float(group["connect_ms"].mean()),
+            "timeouts": int(np.count_nonzero(group["result"] == RESULT_TIMEOUT)),
+            "failures": int(np.count_nonzero(group["result"] != RESULT_OK)),
+        })
+    report.sort(key=lambda row: row["p99_ms"], reverse=True)
+    return report
+
+
+def mode_summary(records):
+    """전송 방식별 명령어당 평균 시간 (연결 + 응답) - 연결 재사용/파이프라인 효과 비교"""
+    summary = {}
+    for index, mode in enumerate(MODES):
+        group = records[records["mode"] == index]
+        if len(group):
+            per_command = (group["connect_ms"].astype(np.float64) + group["rtt_ms"]).mean()
+            summary[mode] = {"count": int(len(group)), "per_command_ms": float(per_command),
+                             "connect_ms": float(group["connect_ms"].mean())}
+    return summary
@@ -0,0 +1,131 @@
+"""
+Command Journal Dialog Module
+명령어 지연 리포트 - 명령어/전송 방식별 응답 시간 백분위, 타임아웃 표시, 전송 방식 비교
+"""
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+from rf_protocol import RFProtocol
+from command_journal import journal, load_journal_csv, latency_report, mode_summary
+
+REPORT_COLUMNS = ["명령어", "CMD/SUB", "방식", "건수", "p50(ms)", "p90(ms)", "p99(ms)", "최대(ms)",
+                  "연결(ms)", "타임아웃", "실패"]
+MODE_NAMES = {"single": "개별", "sync": "동기", "pipelined": "파이프라인", "poll": "상태조회"}
+
+
+class CommandJournalDialog(QDialog):
+    """명령어 지연 리포트 다이얼로그"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parent_window = parent
+        self.source_name = "메모리"
+
+        self.setWindowTitle("Command Latency Report")
+        self.resize(1000, 560)
+        self.init_ui()
+        self.show_memory()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        control_layout = QHBoxLayout()
+        refresh_btn = QPushButton("새로고침 (메모리)")
+        refresh_btn.clicked.connect(self.show_memory)
+        control_layout.addWidget(refresh_btn)
+        load_btn = QPushButton("기록 파일 불러오기...")
+        load_btn.clicked.connect(self.load_file)
+        control_layout.addWidget(load_btn)
+        flush_btn = QPushButton("지금 저장")
+        flush_btn.clicked.connect(self.flush_now)
+        control_layout.addWidget(flush_btn)
+        control_layout.addStretch()
+        self.source_label = QLabel()
+        control_layout.addWidget(self.source_label)
+        layout.addLayout(control_layout)
+
+        self.table = QTableWidget(0, len(REPORT_COLUMNS))
+        self.table.setHorizontalHeaderLabels(REPORT_COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSortingEnabled(True)
+        layout.addWidget(self.table)
+
+        # 전송 방식 비교 (명령어당 평균 연결 + 응답 시간)
+        self.summary_label = QLabel()
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+
+    # ========================================
+    # 데이터 소스
+    # ========================================
+    def show_memory(self):
+        records, _ = journal.rows()
+        self.source_name = "메모리"
+        self.show_report(records)
+
+    def load_file(self):
+        directory = journal.directory or ""
+        path, _ = QFileDialog.getOpenFileName(self, "명령어 기록 불러오기", directory, "Command Journal (*.csv)")
+        if not path:
+            return
+        try:
+            records = load_journal_csv(path)
+        except (OSError, KeyError, ValueError) as e:
+            QMessageBox.warning(self, "오류", f"기록 파일을 읽을 수 없습니다:\n{e}")
+            return
+        self.source_name = path
+        self.show_report(records)
+
+    def flush_now(self):
+        success, _, message = journal.flush()
+        if self.parent_window:
+            self.parent_window.log_manager.write_log(f"[INFO] {message}" if success else f"[ERROR] {message}",
+                                                     "cyan" if success else "red")
+        if not success:
+            QMessageBox.warning(self, "오류", message)
+
+    # ========================================
+    # 표시
+    # ========================================
+    def show_report(self, records):
+        report = latency_report(records)
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(report))
+        for r, row in enumerate(report):
+            values = [
+                RFProtocol.get_command_description(row["cmd"], row["subcmd"]),
+                f"0x{row['cmd']:02X}/0x{row['subcmd']:02X}",
+                MODE_NAMES.get(row["mode"], row["mode"]),
+                row["count"], row["p50_ms"], row["p90_ms"], row["p99_ms"], row["max_ms"],
+                row["connect_ms"], row["timeouts"], row["failures"],
+            ]
+            for c, value in enumerate(values):
+                item = QTableWidgetItem()
+                if isinstance(value, float):
+                    item.setData(Qt.DisplayRole, round(value, 2))
+                elif isinstance(value, int):
+                    item.setData(Qt.DisplayRole, value)
+                else:
+                    item.setText(value)
+                if row["timeouts"]:
+                    item.setBackground(QColor("#5c1f1f"))
+                self.table.setItem(r, c, item)
+        self.table.setSortingEnabled(True)
+
+        timeouts = sum(row["timeouts"] for row in report)
+        self.source_label.setText(f"{self.source_name} - {len(records)}건, 타임아웃 {timeouts}건")
+        summary = mode_summary(records)
+        if summary:
+            parts = [f"{MODE_NAMES.get(mode, mode)}: 명령어당 {info['per_command_ms']:.1f}ms "
+                     f"(연결 {info['connect_ms']:.1f}ms, {info['count']}건)" for mode, info in summary.items()]
+            self.summary_label.setText("전송 방식 비교 - " + " | ".join(parts))
+        else:
+            self.summary_label.setText("기록 없음")
@@ -7,7 +7,6 @@ import os
 import json
 import gzip
 import datetime
-import pandas as pd
 import struct
 from rf_protocol import RFProtocol
 import sys
@@ -73,6 +72,7 @@ class DataManager:
             return False, "저장할 데이터가 없습니다."
         
         try:
+            import pandas as pd  # 첫 내보내기 시 로드 (시작 시간 단축)
             df = pd.DataFrame(self.data_log)
             file_path = os.path.join(
                 DATA_DIR, #data 디렉토리
@@ -1548,13 +1548,13 @@ class TuningSettingsManager:
                     elif subcmd == RFProtocol.SUBCMD_PULSE_DUTY:
                         pulse_data['duties'] = struct.unpack('<ffff', data) if len(data) >= 16 else (0, 0, 0, 0)
                     elif subcmd == RFProtocol.SUBCMD_PULSE_SYNC_OUT_DELAY:
-                        pulse_data['sync_out_delay'] = struct.unpack('<I', data)[0] if len(data) >= 4 else 0
+                        pulse_data['sync_out_delay'] = struct.unpack('<i', data)[0] if len(data) >= 4 else 0
                     elif subcmd == RFProtocol.SUBCMD_PULSE_SYNC_IN_DELAY:
-                        pulse_data['sync_in_delay'] = struct.unpack('<I', data)[0] if len(data) >= 4 else 0
+                        pulse_data['sync_in_delay'] = struct.unpack('<i', data)[0] if len(data) >= 4 else 0
                     elif subcmd == RFProtocol.SUBCMD_PULSE_WIDTH_CONTROL:
-                        pulse_data['width_control'] = struct.unpack('<I', data)[0] if len(data) >= 4 else 0
+                        pulse_data['width_control'] = struct.unpack('<i', data)[0] if len(data) >= 4 else 0
                     elif subcmd == RFProtocol.SUBCMD_PULSE_FREQ:
-                        pulse_data['frequency'] = struct.unpack('<I', data)[0] if len(data) >= 4 else 0
+                        pulse_data['frequency'] = struct.unpack('<i', data)[0] if len(data) >= 4 else 0
 
                 settings.update(self._convert_pulse_data_to_settings(pulse_data))
 
@@ -1615,6 +1615,21 @@ class TuningSettingsManager:
         except Exception as e:
             return False, {}, f"{tab_name} 탭 응답 파싱 실패: {str(e)}"
 
+    def get_tab_commands_from_responses(self, tab_name, responses):
+        """
+        GET 응답 -> 같은 항목의 SET 명령어 (parse_tab_responses -> get_tab_commands)
+        - 응답이 있는 항목만 반환 (GET/SET 형식이 다른 항목을 SET 형식으로 비교/복원)
+        """
+        success, settings, msg = self.parse_tab_responses(tab_name, responses)
+        if not success:
+            return False, [], msg
+        success, commands, msg = self.get_tab_commands(tab_name, settings)
+        if not success:
+            return False, [], msg
+        read_subcmds = {response['subcmd'] for response in responses}
+        commands = [command for command in commands if command['subcmd'] in read_subcmds]
+        return True, commands, f"{tab_name} 탭 응답 {len(responses)}개 -> SET 명령어 {len(commands)}개"
+
     # ========================================
     # === 개별 응답 파싱 헬퍼 함수들 ===
     # ========================================
@@ -1678,14 +1693,15 @@ class TuningSettingsManager:
     def _convert_pulse_data_to_settings(self, pulse_data):
         """펄스 원시 데이터를 설정 딕셔너리로 변환"""
         try:
-            type_map = {0: "Internal", 1: "External"}
-            mode_map = {0: "Fixed", 1: "Step"}
+            # create_pulsing_*_data / 튜닝 다이얼로그 콤보박스와 같은 표기
+            type_map = {0: "Amplitude", 1: "Phase"}
+            mode_map = {0: "Master", 1: "Slave"}
 
             settings = {
-                "Pulsing Type": type_map.get(pulse_data.get('type', 0), "Internal"),
-                "Pulsing Mode": mode_map.get(pulse_data.get('mode', 0), "Fixed"),
+                "Pulsing Type": type_map.get(pulse_data.get('type', 0), "Amplitude"),
+                "Pulsing Mode": mode_map.get(pulse_data.get('mode', 0), "Master"),
                 "Pulse On/Off": "On" if pulse_data.get('offon', 0) == 1 else "Off",
-                "Sync Output": "Enable" if pulse_data.get('sync_output', 0) == 1 else "Disable"
+                "Sync Output": "On" if pulse_data.get('sync_output', 0) == 1 else "Off"
             }
 
             levels = pulse_data.get('levels', (0, 0, 0, 0))
@@ -1709,13 +1725,13 @@ class TuningSettingsManager:
         """주파수 원시 데이터를 설정 딕셔너리로 변환"""
         try:
             retuning_map = {0: "Disable", 1: "Enable"}
-            mode_map = {0: "Auto", 1: "Manual"}
+            mode_map = {0: "Disable", 1: "preset", 2: "auto"}  # create_freq_tuning_setting_mode_data와 동일
 
             return {
                 "Set RF Frequency": f"{freq_data.get('rf_frequency', 0.0):.2f}",
                 "Freq Tuning": "Enable" if freq_data.get('tuning_enable', 0) == 1 else "Disable",
                 "Retuning Mode": retuning_map.get(freq_data.get('retuning', 0), "Disable"),
-                "Setting Mode": mode_map.get(freq_data.get('mode', 0), "Auto"),
+                "Setting Mode": mode_map.get(freq_data.get('mode', 0), "Disable"),
                 "Min Frequency": f"{freq_data.get('min_freq', 0.0):.2f}",
                 "Max Frequency": f"{freq_data.get('max_freq', 0.0):.2f}",
                 "Start Frequency": f"{freq_data.get('start_freq', 0.0):.2f}",
@@ -9,6 +9,9 @@ from collections import deque
 #from PyQt5.QtWidgets import QApplication
 from rf_protocol import RFProtocol
 from data_manager import StatusParser
+from perf_monitor import monitor
+from metrics_exporter import metrics
+from startup_profiler import profiler
 
 
 class DataProcessor:
@@ -23,6 +26,8 @@ class DataProcessor:
     
     def update_from_server(self, data, timestamp):
         """서버로부터 데이터 수신"""
+        if len(self.data_queue) == self.data_queue.maxlen:
+            metrics.inc("rf_frames_dropped_total", reason="queue_full")
         self.data_queue.append((data, timestamp))
     
     def process_data_queue(self):
@@ -33,6 +38,7 @@ class DataProcessor:
             if not data:
                 continue
                 
+            span = monitor.begin()
             parsed = RFProtocol.parse_response(data)
             if parsed and parsed["cmd"] == RFProtocol.CMD_DEVICE_STATUS_GET:
                 # 상태 조회 명령어는 로그 설정에 따라 표시
@@ -43,6 +49,12 @@ class DataProcessor:
                 try:
                     # 1. UI 업데이트 (테이블, 게이지) - 필수적
                     status = StatusParser.parse_device_status(parsed["data"])
+                    monitor.end("decode", span)
+                    metrics.record_status(status)
+                    if profiler.enabled:
+                        path = profiler.finish("첫 상태 프레임 처리")
+                        if path:
+                            self.parent.log_manager.write_log(f"[INFO] 시작 시간 프로파일 저장: {path}", "cyan")
                     self.parent.rf_enabled = bool(status["rf_on_off"]) #추가 251103 rf on/off 버튼 동기화
                     self.parent.ui_controller.update_rf_button_text(self.parent.rf_enabled)#추가 251103 rf on/off 버튼 동기화
                     
@@ -61,18 +73,26 @@ class DataProcessor:
                     #elapsed_time = self.parent.sample_count * self.parent.sample_interval
                     #self.parent.data_manager.add_data_entry(status, elapsed_time)
                         
+                    span = monitor.begin()
                     self.parent.ui_controller.update_status_table(status)
+                    monitor.end("table", span)
+                    span = monitor.begin()
                     self.parent.ui_controller.update_gauges(status)
+                    monitor.end("gauges", span)
                     
                     # 2. 데이터 저장
+                    span = monitor.begin()
                     self.parent.data_manager.add_data_entry(status)
                     
                     # 3. 플롯 데이터 업데이트 (단순히 데이터만 큐에 추가)
                     self.update_plot_data(status, timestamp)
+                    monitor.end("store", span)
                     
                     # 4. 오실로스코프 다이얼로그
                     if self.parent.oscilloscope_dialog and self.parent.oscilloscope_dialog.isVisible():
+                        span = monitor.begin()
                         self.parent.oscilloscope_dialog.update_data(status)
+                        monitor.end("scope", span)
                     
                     # 5. 자동 저장 체크
                     if self.parent.auto_save_enabled and self.parent.data_manager.get_data_count() >= 1200: #60초 마다 저장
@@ -90,9 +110,15 @@ class DataProcessor:
                 self.process_count_since_last_plot += processed_count
                 if self.process_count_since_last_plot >= self.PLOT_UPDATE_RATE:
                     # 그래프 업데이트 및 분석 매니저 호출은 여기서 제어
+                    span = monitor.begin()
                     self.parent.plot_manager.simple_plot_update()
+                    monitor.end("plot", span)
+                span = monitor.begin()
                 self._update_analysis_managers()
+                monitor.end("analysis", span)
                 self.process_count_since_last_plot = 0
+        
+        metrics.set("rf_queue_depth", len(self.data_queue), queue="data")
     
     def update_plot_data(self, status, timestamp):
         """플롯 데이터 업데이트 - 고정 간격 적용 및 안전한 처리"""
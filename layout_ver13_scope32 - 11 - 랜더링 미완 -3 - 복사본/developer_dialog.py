@@ -17,6 +17,7 @@ class DeveloperDialog(QDialog):
         super().__init__(parent)
         self.parent = parent
         self.network_manager = network_manager
+        self.data_loader = None
         
         self.apply_styles()  # 스타일 먼저 적용
         self.init_ui()
@@ -83,13 +84,62 @@ class DeveloperDialog(QDialog):
     def showEvent(self, event):
         """다이얼로그 표시 시 호출"""
         super().showEvent(event)
-        # device_info_widget -> device_config_widget로 변경
-        self.device_config_widget.load_device_info()
+        # Device Manager 정보도 일괄 로드에 포함 (GUI 스레드에서 동기 요청 없음)
+        self.device_config_widget.load_network_info()
+        self.load_all_developer_data()
+    
+    def load_all_developer_data(self, sections=None):
+        """개발자/시스템 설정 일괄 로드 (파이프라인 1회, 백그라운드) - sections 지정 시 해당 섹션만"""
+        from developer_widgets.developer_data_loader import DeveloperDataLoader
+        
+        client_thread = self.network_manager.client_thread
+        if not client_thread or not client_thread.isRunning():
+            return
+        if self.data_loader is not None and self.data_loader.isRunning():
+            return
+        
+        self.data_loader = DeveloperDataLoader(
+            client_thread, getattr(self.network_manager, 'config_cache', None), sections, parent=self
+        )
+        self.data_loader.section_loaded.connect(self.on_section_loaded)
+        self.data_loader.load_finished.connect(self.on_developer_data_loaded)
+        self.setWindowTitle("Developer Tools - 설정 로딩 중...")
+        self.data_loader.start()
+    
+    def on_section_loaded(self, section, data):
+        """섹션 디코딩 결과를 해당 위젯에 반영"""
+        advanced = self.advanced_widget
+        system = self.system_control_widget
+        handlers = {
+            "device_info": self.device_config_widget.populate_device_info,
+            "arc": self.arc_widget.populate_settings,
+            "agc": advanced.agc_widget.populate_settings,
+            "dds": advanced.dds_widget.populate_settings,
+            "sdd": advanced.sdd_widget.populate_settings,
+            "fast_acq": advanced.fast_acq_widget.populate_settings,
+            "gate_bias": advanced.gate_bias_widget.populate_settings,
+            "power_limits": system.power_limits_widget.populate_limits,
+            "va_limit": system.va_limit_widget.populate_settings,
+            "minmax": system.minmax_control_widget.populate_sections,
+            "cal_control": self.calibration_widget.populate_control,
+        }
+        handler = handlers.get(section)
+        if handler is None:
+            return
+        try:
+            handler(data)
+        except Exception as e:
+            print(f"[DeveloperDialog] {section} 위젯 갱신 오류: {e}")
+    
+    def on_developer_data_loaded(self, loaded, total, failed):
+        self.setWindowTitle("Developer Tools")
+        if failed:
+            print(f"[DeveloperDialog] 일괄 로드 {loaded}/{total} - 실패: {', '.join(failed)}")
 
     def on_tab_changed(self, index):
         """탭 변경 시 호출"""
         if index == 0:  # Device & Config 탭
-            self.device_config_widget.load_device_info()
+            self.load_all_developer_data(["device_info"])
     
     def apply_styles(self):
         """다이얼로그 스타일 적용"""
@@ -165,26 +165,7 @@ class AGCWidget(QGroupBox):
                 settings = self.dev_data_manager.parse_agc_setup_data(parsed['data'])
                 
                 if settings:
-                    # AGC On/Off
-                    if settings['agc_onoff']:
-                        self.agc_on.setChecked(True)
-                    else:
-                        self.agc_off.setChecked(True)
-                    
-                    # Ref Setup Time
-                    self.ref_setup_time_spin.setValue(settings['ref_setup_time'])
-                    
-                    # AGC Setup Time[4]
-                    for i in range(4):
-                        self.agc_setup_time_spins[i].setValue(settings[f'agc_setup_time_{i}'])
-                    
-                    # Sensor Gain Rates[4]
-                    for i in range(4):
-                        self.sensor_gain_rate_spins[i].setValue(settings[f'sensor_gain_rate_{i}'])
-                    
-                    # Init Power Gain
-                    self.init_power_gain_spin.setValue(settings['init_power_gain'])
-                    
+                    self.populate_settings(settings)
                     QMessageBox.information(self, "완료", "AGC Setup을 로드했습니다.")
                 else:
                     QMessageBox.warning(self, "오류", "AGC 데이터 파싱 실패")
@@ -193,6 +174,28 @@ class AGCWidget(QGroupBox):
         else:
             QMessageBox.warning(self, "오류", "설정 로드 실패")
     
+    def populate_settings(self, settings):
+        """파싱된 설정으로 UI 갱신 (일괄 로드에서도 사용)"""
+        # AGC On/Off
+        if settings['agc_onoff']:
+            self.agc_on.setChecked(True)
+        else:
+            self.agc_off.setChecked(True)
+        
+        # Ref Setup Time
+        self.ref_setup_time_spin.setValue(settings['ref_setup_time'])
+        
+        # AGC Setup Time[4]
+        for i in range(4):
+            self.agc_setup_time_spins[i].setValue(settings[f'agc_setup_time_{i}'])
+        
+        # Sensor Gain Rates[4]
+        for i in range(4):
+            self.sensor_gain_rate_spins[i].setValue(settings[f'sensor_gain_rate_{i}'])
+        
+        # Init Power Gain
+        self.init_power_gain_spin.setValue(settings['init_power_gain'])
+    
     def apply_settings(self):
         """설정 적용"""
         if not self.network_manager.client_thread:
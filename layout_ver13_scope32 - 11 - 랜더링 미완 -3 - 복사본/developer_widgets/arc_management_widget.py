@@ -222,26 +222,7 @@ class ArcManagementWidget(QGroupBox):
                 settings = self.dev_data_manager.parse_arc_management_data(parsed['data'])
                 
                 if settings:
-                    # UI 업데이트
-                    if settings['en_reflected_arc_det']:
-                        self.reflected_arc_enable.setChecked(True)
-                    else:
-                        self.reflected_arc_disable.setChecked(True)
-                    
-                    if settings['en_external_arc_input']:
-                        self.external_arc_enable.setChecked(True)
-                    else:
-                        self.external_arc_disable.setChecked(True)
-                    
-                    if settings['rfpower_latch_state']:
-                        self.latch_turn_on.setChecked(True)
-                    else:
-                        self.latch_turn_off.setChecked(True)
-                    
-                    if settings['en_arc_output_signal']:
-                        self.output_signal_enable.setChecked(True)
-                    else:
-                        self.output_signal_disable.setChecked(True)
+                    self.populate_settings(settings)
                     ##########
                     all_zero = all(v == 0 or v == False for k, v in settings.items() 
                     if k != 'reflected_arc_threshold')
@@ -254,12 +235,6 @@ class ArcManagementWidget(QGroupBox):
                             "이 설정은 유효하지 않을 수 있으니 값을 변경 후 Apply 하세요."
                         )
                     ##########
-                    self.suppression_time_spin.setValue(settings['suppression_time'])
-                    self.initial_delay_spin.setValue(settings['initial_delay_time'])
-                    self.setpoint_delay_spin.setValue(settings['setpoint_delay_time'])
-                    self.attempts_spin.setValue(settings['no_of_attempts'])
-                    self.reflected_threshold_spin.setValue(settings['reflected_arc_threshold'])
-                    
                     QMessageBox.information(self, "완료", "Arc Management 설정을 로드했습니다.")
                 else:
                     QMessageBox.warning(self, "오류", "데이터 파싱 실패")
@@ -268,6 +243,34 @@ class ArcManagementWidget(QGroupBox):
         else:
             QMessageBox.warning(self, "오류", "설정 로드 실패")
     
+    def populate_settings(self, settings):
+        """파싱된 설정으로 UI 갱신 (일괄 로드에서도 사용)"""
+        if settings['en_reflected_arc_det']:
+            self.reflected_arc_enable.setChecked(True)
+        else:
+            self.reflected_arc_disable.setChecked(True)
+        
+        if settings['en_external_arc_input']:
+            self.external_arc_enable.setChecked(True)
+        else:
+            self.external_arc_disable.setChecked(True)
+        
+        if settings['rfpower_latch_state']:
+            self.latch_turn_on.setChecked(True)
+        else:
+            self.latch_turn_off.setChecked(True)
+        
+        if settings['en_arc_output_signal']:
+            self.output_signal_enable.setChecked(True)
+        else:
+            self.output_signal_disable.setChecked(True)
+        
+        self.suppression_time_spin.setValue(settings['suppression_time'])
+        self.initial_delay_spin.setValue(settings['initial_delay_time'])
+        self.setpoint_delay_spin.setValue(settings['setpoint_delay_time'])
+        self.attempts_spin.setValue(settings['no_of_attempts'])
+        self.reflected_threshold_spin.setValue(settings['reflected_arc_threshold'])
+    
     def apply_settings(self):
         """설정 적용 (유효성 검사 추가)"""
         if not self.network_manager.client_thread:
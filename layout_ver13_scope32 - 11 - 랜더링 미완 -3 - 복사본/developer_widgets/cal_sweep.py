@@ -0,0 +1,270 @@
+"""
+Calibration Sweep
+교정 테이블 자동 측정 - Cal Control DAC 스텝, 상태 스트림 기반 안정화 감지, N 샘플 평균, 테이블 피팅
+"""
+
+import struct
+import time
+from collections import deque
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from rf_protocol import RFProtocol
+from cal_table_io import CAL_TABLE_POINTS
+from status_stream import StatusSampleStream
+
+# ========================================
+# 테이블별 스윕 프로파일
+# - stimulus_index: Cal Control 페이로드(6 x uint16) 중 구동할 DAC 위치 (1=FWD, 2=REF, 3=RF Set)
+# - measure: 측정할 상태 필드
+# - dac_column: DAC 값을 채울 컬럼, band_columns: 허용 대역(Low/High) 컬럼
+# ========================================
+SWEEP_PROFILES = {
+    "RF Set DAC": {'stimulus_index': 3, 'measure': 'forward_power',
+                   'dac_column': "DAC Center", 'band_columns': ("DAC Low", "DAC High")},
+    "User FWD/LOAD": {'stimulus_index': 1, 'measure': 'forward_power', 'dac_column': "DAC"},
+    "User REF": {'stimulus_index': 2, 'measure': 'reflect_power', 'dac_column': "DAC"},
+}
+
+DEFAULT_SWEEP_SETTINGS = {
+    'dac_start': 0,
+    'dac_stop': 4095,
+    'steps': CAL_TABLE_POINTS,
+    'samples': 10,            # 안정화 후 평균할 샘플 수
+    'window': 8,              # 안정화 판정 윈도우 (샘플)
+    'slope_tol': 0.02,        # 윈도우 구간 기울기 변화량 / 평균 (상대)
+    'std_tol': 0.01,          # 표준편차 / 평균 (상대)
+    'abs_floor': 1.0,         # 저출력 구간 상대 판정 하한 (W)
+    'settle_timeout': 5.0,    # 포인트당 안정화 대기 한도 (초)
+    'band': 0.02,             # DAC Low/High 대역 (타깃 대비 ±)
+}
+
+
+def sweep_supported(table_name):
+    """자동 스윕 지원 테이블 여부"""
+    return table_name in SWEEP_PROFILES
+
+
+class SettlingDetector:
+    """
+    안정화 감지 - 최근 window 샘플의 선형 기울기와 표준편차가 모두 임계값 이하이면 안정
+    (고정 대기 시간 대신 실제 응답 기준)
+    """
+
+    def __init__(self, window=8, slope_tol=0.02, std_tol=0.01, abs_floor=1.0):
+        self.window = window
+        self.slope_tol = slope_tol
+        self.std_tol = std_tol
+        self.abs_floor = abs_floor
+        self.times = deque(maxlen=window)
+        self.values = deque(maxlen=window)
+
+    def reset(self):
+        self.times.clear()
+        self.values.clear()
+
+    def feed(self, timestamp, value):
+        """샘플 추가 후 안정 여부 반환"""
+        self.times.append(timestamp)
+        self.values.append(value)
+        return self.is_settled()
+
+    def is_settled(self):
+        if len(self.values) < self.window:
+            return False
+        t = np.asarray(self.times, dtype=float)
+        v = np.asarray(self.values, dtype=float)
+        scale = max(abs(v.mean()), self.abs_floor)
+        span = t[-1] - t[0]
+        if span > 0:
+            slope = np.polyfit(t - t[0], v, 1)[0]
+            drift = abs(slope) * span / scale
+        else:
+            drift = 0.0
+        return drift <= self.slope_tol and v.std() / scale <= self.std_tol
+
+
+def fit_table(table_name, dac_codes, measured, targets=None, band=0.02):
+    """
+    측정 결과로 테이블 피팅 (구간 선형 역보간: 타깃 출력 -> DAC)
+    - 측정값은 단조 증가로 보정, targets 미지정/비정상이면 측정 범위를 26등분
+    반환: {컬럼: 26개 값}
+    """
+    profile = SWEEP_PROFILES[table_name]
+    order = np.argsort(dac_codes)
+    dac = np.asarray(dac_codes, dtype=float)[order]
+    power = np.maximum.accumulate(np.asarray(measured, dtype=float)[order])
+
+    # np.interp용 순증가 구간만 사용
+    keep = np.concatenate(([True], np.diff(power) > 0))
+    dac, power = dac[keep], power[keep]
+    if len(power) < 2:
+        raise ValueError("측정값 변화가 없어 테이블을 피팅할 수 없습니다")
+
+    targets = np.asarray(targets if targets is not None else [], dtype=float)
+    if len(targets) != CAL_TABLE_POINTS or np.any(np.diff(targets) <= 0):
+        targets = np.linspace(power[0], power[-1], CAL_TABLE_POINTS)
+
+    table = {
+        "Target": [float(v) for v in targets],
+        profile['dac_column']: [int(round(v)) for v in np.interp(targets, power, dac)],
+    }
+    if 'band_columns' in profile:
+        low_column, high_column = profile['band_columns']
+        table[low_column] = [int(round(v)) for v in np.interp(targets * (1 - band), power, dac)]
+        table[high_column] = [int(round(v)) for v in np.interp(targets * (1 + band), power, dac)]
+    return table
+
+
+class CalibrationSweep:
+    """
+    교정 스윕 엔진 (Qt 스레드와 무관하게 동작 - 시뮬레이터 대상 단독 실행 가능)
+    1. Cal Control 원래 값 백업, 상태 스트림 연결
+    2. DAC 코드마다: Cal Control 전송 -> 안정화 감지 -> N 샘플 평균
+    3. Cal Control 복원, 테이블 피팅
+    """
+
+    def __init__(self, client_thread, table_name, targets=None, settings=None):
+        if not sweep_supported(table_name):
+            raise ValueError(f"자동 스윕을 지원하지 않는 테이블: {table_name}")
+        self.client_thread = client_thread
+        self.table_name = table_name
+        self.profile = SWEEP_PROFILES[table_name]
+        self.targets = targets
+        self.settings = dict(DEFAULT_SWEEP_SETTINGS)
+        self.settings.update(settings or {})
+        self.stream = StatusSampleStream(client_thread)
+        self.points = []  # (dac, 평균, 표준편차, 안정화 여부, 소요 시간)
+        self._abort = False
+
+    def abort(self):
+        self._abort = True
+
+    def _read_cal_control(self):
+        result = self.client_thread.send_command(
+            RFProtocol.CMD_CAL_CTL_GET, RFProtocol.SUBCMD_CAL_CTL,
+            wait_response=True, sync=True
+        )
+        if not result.success or not result.response_data:
+            return None
+        parsed = RFProtocol.parse_response(result.response_data)
+        if not parsed or len(parsed['data']) < 12:
+            return None
+        return list(struct.unpack('<6H', parsed['data'][:12]))
+
+    def _write_cal_control(self, values):
+        result = self.client_thread.send_command(
+            RFProtocol.CMD_CAL_CTL_SET, RFProtocol.SUBCMD_CAL_CTL,
+            data=struct.pack('<6H', *values), wait_response=True, sync=True
+        )
+        return result.success, result.message
+
+    def measure_point(self, detector):
+        """안정화 대기 후 N 샘플 평균 - 반환: (평균, 표준편차, 안정화 여부)"""
+        s = self.settings
+        field = self.profile['measure']
+        deadline = time.time() + s['settle_timeout']
+        settled = False
+
+        while not self._abort and time.time() < deadline:
+            sample = self.stream.get(deadline - time.time())
+            if sample is None:
+                break
+            if detector.feed(sample[0], sample[1][field]):
+                settled = True
+                break
+
+        values = list(detector.values)[-s['samples']:] if not settled else []
+        while settled and not self._abort and len(values) < s['samples']:
+            sample = self.stream.get(s['settle_timeout'])
+            if sample is None:
+                break
+            values.append(sample[1][field])
+
+        if not values:
+            return None, None, False
+        return float(np.mean(values)), float(np.std(values)), settled
+
+    def run(self, progress=None, point_callback=None):
+        """
+        스윕 실행
+        반환: (성공 여부, 테이블 {컬럼: 값} 또는 None, 메시지)
+        """
+        s = self.settings
+        codes = np.linspace(s['dac_start'], s['dac_stop'], s['steps']).round().astype(int)
+        detector = SettlingDetector(s['window'], s['slope_tol'], s['std_tol'], s['abs_floor'])
+        started = time.time()
+
+        original = self._read_cal_control()
+        if original is None:
+            return False, None, "Cal Control 조회 실패"
+
+        self.stream.attach()
+        try:
+            first = self.stream.get(s['settle_timeout'])
+            if first is None:
+                return False, None, "상태 스트림 수신 없음 (상태 폴링 확인)"
+            if first[1]["rf_on_off"]:
+                return False, None, "캘리브레이션은 RF OFF 상태에서만 가능합니다"
+
+            drive = list(original)
+            drive[0] = 0  # Manual
+            for i, code in enumerate(codes):
+                if self._abort:
+                    return False, None, "사용자 중단"
+                if progress:
+                    progress(int(i * 100 / len(codes)), f"DAC {code} 측정 중 ({i + 1}/{len(codes)})")
+
+                point_start = time.time()
+                drive[self.profile['stimulus_index']] = int(code)
+                ok, message = self._write_cal_control(drive)
+                if not ok:
+                    return False, None, f"Cal Control 전송 실패 (DAC {code}): {message}"
+
+                self.stream.clear()
+                detector.reset()
+                mean, std, settled = self.measure_point(detector)
+                if mean is None:
+                    return False, None, f"DAC {code} 측정 실패 (샘플 없음)"
+                self.points.append((int(code), mean, std, settled, time.time() - point_start))
+                if point_callback:
+                    point_callback(int(code), mean, settled)
+        finally:
+            self.stream.detach()
+            self._write_cal_control(original)
+
+        try:
+            table = fit_table(self.table_name, [p[0] for p in self.points], [p[1] for p in self.points],
+                              self.targets, s['band'])
+        except ValueError as e:
+            return False, None, str(e)
+
+        unsettled = sum(1 for p in self.points if not p[3])
+        message = f"{self.table_name} 스윕 완료: {len(self.points)}포인트, {time.time() - started:.1f}초"
+        if unsettled:
+            message += f" (안정화 시간 초과 {unsettled}포인트)"
+        if progress:
+            progress(100, message)
+        return True, table, message
+
+
+class CalSweepThread(QThread):
+    """교정 스윕 백그라운드 스레드"""
+
+    progress = pyqtSignal(int, str)
+    point_measured = pyqtSignal(int, float, bool)  # DAC, 평균 측정값, 안정화 여부
+    sweep_finished = pyqtSignal(bool, str, object)  # 성공 여부, 메시지, 테이블 dict
+
+    def __init__(self, client_thread, table_name, targets=None, settings=None, parent=None):
+        super().__init__(parent)
+        self.sweep = CalibrationSweep(client_thread, table_name, targets, settings)
+
+    def abort(self):
+        self.sweep.abort()
+
+    def run(self):
+        try:
+            success, table, message = self.sweep.run(self.progress.emit, self.point_measured.emit)
+            self.sweep_finished.emit(success, message, table or {})
+        except Exception as e:
+            self.sweep_finished.emit(False, f"교정 스윕 오류: {e}", {})
@@ -5,14 +5,15 @@ Calibration Table Editor Dialog
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QPushButton, QLabel, QFileDialog, QMessageBox, QHeaderView, QGroupBox,
-    QProgressDialog
+    QPushButton, QLabel, QFileDialog, QMessageBox, QHeaderView, QGroupBox
 )
-from PyQt5.QtCore import Qt, QCoreApplication
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
-import struct
 import csv
 from rf_protocol import RFProtocol
+from developer_widgets.cal_transfer import CalTransferThread
+from cal_table_io import cached_table, get_table_columns
+from developer_widgets.cal_sweep import CalSweepThread, sweep_supported
 
 try:
     import matplotlib
@@ -71,6 +72,9 @@ class CalTableDialog(QDialog):
         self.network_manager = network_manager
         self.table_name = table_name
         self.table_info = self.TABLE_TYPES[table_name]
+        self.column_names = [column for _, column in get_table_columns(table_name)]
+        self.transfer_thread = None
+        self.sweep_thread = None
         
         self.setWindowTitle(f"Calibration Table Editor - {table_name}")
         self.setMinimumSize(900, 750)
@@ -86,6 +90,10 @@ class CalTableDialog(QDialog):
         info_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #87ceeb;")
         layout.addWidget(info_label)
         
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #aaaaaa;")
+        layout.addWidget(self.status_label)
+        
         table_group = QGroupBox("Calibration Data")
         table_layout = QVBoxLayout(table_group)
         
@@ -151,14 +159,25 @@ class CalTableDialog(QDialog):
         
         button_layout = QHBoxLayout()
         
-        load_btn = QPushButton("Load")
-        load_btn.clicked.connect(self.load_from_device)
-        button_layout.addWidget(load_btn)
+        self.load_btn = QPushButton("Load")
+        self.load_btn.clicked.connect(self.load_from_device)
+        button_layout.addWidget(self.load_btn)
+        
+        self.apply_btn = QPushButton("Apply")
+        self.apply_btn.setStyleSheet("background-color: #FF9800; color: white; font-weight: bold;")
+        self.apply_btn.clicked.connect(self.apply_to_device)
+        button_layout.addWidget(self.apply_btn)
+        
+        if sweep_supported(self.table_name):
+            self.sweep_btn = QPushButton("Auto Sweep")
+            self.sweep_btn.setToolTip("Cal Control DAC를 스텝하며 출력 측정 후 테이블 자동 생성")
+            self.sweep_btn.clicked.connect(self.toggle_auto_sweep)
+            button_layout.addWidget(self.sweep_btn)
         
-        apply_btn = QPushButton("Apply")
-        apply_btn.setStyleSheet("background-color: #FF9800; color: white; font-weight: bold;")
-        apply_btn.clicked.connect(self.apply_to_device)
-        button_layout.addWidget(apply_btn)
+        verify_btn = QPushButton("검사")
+        verify_btn.setToolTip("단조성/간격/기울기 검사")
+        verify_btn.clicked.connect(self.verify_table)
+        button_layout.addWidget(verify_btn)
         
         import_btn = QPushButton("CSV 가져오기")
         import_btn.clicked.connect(self.import_csv)
@@ -177,10 +196,14 @@ class CalTableDialog(QDialog):
         layout.addLayout(button_layout)
     
     def showEvent(self, event):
-        """다이얼로그 표시 시 로딩 시작"""
+        """다이얼로그 표시 시 캐시로 즉시 채우고, 캐시가 없으면 장치에서 로드"""
         super().showEvent(event)
-        QCoreApplication.processEvents()  # UI 표시 완료
-        self.load_from_device()
+        table = cached_table(getattr(self.network_manager, 'config_cache', None), self.table_name)
+        if table is not None:
+            self.set_table_values(table)
+            self.status_label.setText("캐시된 장치 값 표시 중 (Load로 새로 읽기)")
+        else:
+            self.load_from_device()
     
     def on_cell_changed(self, item):
         """셀 값 변경 시 호출"""
@@ -268,123 +291,72 @@ class CalTableDialog(QDialog):
         self.canvas.figure.tight_layout()
         self.canvas.draw()
     
-    def load_from_device(self):
-        """장치에서 데이터 로드"""
+    def get_table_values(self):
+        """현재 표 값 -> {컬럼명: 26개 값} (잘못된 값은 0)"""
+        values = {}
+        for col, column in enumerate(self.column_names):
+            column_values = []
+            for row in range(26):
+                try:
+                    text = self.table.item(row, col).text()
+                    column_values.append(float(text) if col == 0 else int(text))
+                except:
+                    column_values.append(0)
+            values[column] = column_values
+        return values
+    
+    def set_table_values(self, table):
+        """{컬럼명: 26개 값}을 표에 채움"""
+        self.table.blockSignals(True)
+        for col, column in enumerate(self.column_names):
+            if column not in table:
+                continue
+            for row, value in enumerate(table[column][:26]):
+                text = f"{value:.2f}" if col == 0 else str(int(value))
+                self.table.item(row, col).setText(text)
+        self.table.blockSignals(False)
+        self.update_graph()
+    
+    def _start_transfer(self, mode, tables=None):
+        """백그라운드 전송 시작 (진행 중이면 무시)"""
         if not self.network_manager.client_thread:
             QMessageBox.warning(self, "오류", "네트워크가 연결되지 않았습니다.")
-            return
-        
-        progress = QProgressDialog("데이터 로드 중...", "취소", 0, 100, self)
-        progress.setWindowTitle("로딩")
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.setValue(0)
-        
-        try:
-            steps = 2 if not self.table_info['has_3_dac'] else 4
-            step_value = 100 // steps
-            current_progress = 0
-            
-            result = self.network_manager.client_thread.send_command(
-                self.table_info['cmd_get'],
-                self.table_info['subcmd_target'],
-                wait_response=True,
-                sync=True
-            )
-            
-            if result.success and result.response_data:
-                parsed = RFProtocol.parse_response(result.response_data)
-                if parsed and len(parsed['data']) >= 104:
-                    targets = struct.unpack('<26f', parsed['data'][:104])
-                    for row in range(26):
-                        self.table.item(row, 0).setText(f"{targets[row]:.2f}")
-                else:
-                    raise Exception("Target 데이터 형식 오류")
-            else:
-                raise Exception("Target 데이터 로드 실패")
-            
-            current_progress += step_value
-            progress.setValue(current_progress)
-            QCoreApplication.processEvents()
-            
-            if self.table_info['has_3_dac']:
-                self.load_rf_set_dac_columns(progress, step_value)
-            else:
-                self.load_single_dac_column(progress, step_value)
-            
-            progress.setValue(100)
-            self.update_graph()
-            
-        except Exception as e:
-            progress.cancel()
-            QMessageBox.critical(self, "오류", f"로드 실패: {e}")
-        finally:
-            progress.close()
+            return False
+        if self.transfer_thread is not None and self.transfer_thread.isRunning():
+            return False
+        
+        self.transfer_thread = CalTransferThread(
+            self.network_manager.client_thread, mode,
+            tables=tables, table_names=[self.table_name],
+            config_cache=getattr(self.network_manager, 'config_cache', None),
+            parent=self
+        )
+        self.transfer_thread.progress.connect(self.on_transfer_progress)
+        self.transfer_thread.transfer_finished.connect(
+            self.on_load_finished if mode == "read" else self.on_apply_finished)
+        self.load_btn.setEnabled(False)
+        self.apply_btn.setEnabled(False)
+        self.transfer_thread.start()
+        return True
     
-    def load_rf_set_dac_columns(self, progress, step_value):
-        """RF Set DAC 3개 컬럼 로드"""
-        subcmds = [
-            RFProtocol.SUBCMD_CAL_RFSET_DACC,
-            RFProtocol.SUBCMD_CAL_RFSET_DACL,
-            RFProtocol.SUBCMD_CAL_RFSET_DACH
-        ]
-        
-        for col_idx, subcmd in enumerate(subcmds):
-            result = self.network_manager.client_thread.send_command(
-                self.table_info['cmd_get'],
-                subcmd,
-                wait_response=True,
-                sync=True
-            )
-            
-            if result.success and result.response_data:
-                parsed = RFProtocol.parse_response(result.response_data)
-                if parsed and len(parsed['data']) >= 52:
-                    dac_vals = struct.unpack('<26H', parsed['data'][:52])
-                    for row in range(26):
-                        self.table.item(row, col_idx + 1).setText(str(dac_vals[row]))
-                else:
-                    raise Exception(f"DAC 컬럼 {col_idx + 1} 데이터 형식 오류")
-            else:
-                raise Exception(f"DAC 컬럼 {col_idx + 1} 로드 실패")
-            
-            progress.setValue(progress.value() + step_value)
-            QCoreApplication.processEvents()
+    def on_transfer_progress(self, value, message):
+        self.status_label.setText(f"{message} ({value}%)")
     
-    def load_single_dac_column(self, progress, step_value):
-        """단일 DAC/ADC 컬럼 로드"""
-        subcmd_map = {
-            'User FWD/LOAD': RFProtocol.SUBCMD_CAL_FWDLOAD_DAC,
-            'User REF': RFProtocol.SUBCMD_CAL_REF_DAC,
-            'User RF Set IN': RFProtocol.SUBCMD_CAL_RFSETIN_ADC,
-            'User DC Bias': RFProtocol.SUBCMD_CAL_DCBIAS_ADC
-        }
-        
-        subcmd = subcmd_map[self.table_name]
-        
-        result = self.network_manager.client_thread.send_command(
-            self.table_info['cmd_get'],
-            subcmd,
-            wait_response=True,
-            sync=True
-        )
-        
-        if result.success and result.response_data:
-            parsed = RFProtocol.parse_response(result.response_data)
-            if parsed and len(parsed['data']) >= 52:
-                dac_vals = struct.unpack('<26H', parsed['data'][:52])
-                for row in range(26):
-                    self.table.item(row, 1).setText(str(dac_vals[row]))
-            else:
-                raise Exception("DAC/ADC 데이터 형식 오류")
-        else:
-            raise Exception("DAC/ADC 데이터 로드 실패")
-        
-        progress.setValue(progress.value() + step_value)
-        QCoreApplication.processEvents()
+    def load_from_device(self):
+        """장치에서 데이터 로드 (백그라운드, 파이프라인 1회)"""
+        self._start_transfer("read")
+    
+    def on_load_finished(self, success, message, tables):
+        self.load_btn.setEnabled(True)
+        self.apply_btn.setEnabled(True)
+        if self.table_name in tables:
+            self.set_table_values(tables[self.table_name])
+        self.status_label.setText("장치에서 로드 완료" if success else "로드 실패")
+        if not success:
+            QMessageBox.critical(self, "오류", f"로드 실패: {message}")
     
     def apply_to_device(self):
-        """장치에 적용"""
+        """장치에 적용 (백그라운드, 읽기 검증 포함)"""
         if not self.network_manager.client_thread:
             QMessageBox.warning(self, "오류", "네트워크가 연결되지 않았습니다.")
             return
@@ -398,96 +370,77 @@ class CalTableDialog(QDialog):
         if reply != QMessageBox.Yes:
             return
         
-        try:
-            targets = []
-            for row in range(26):
-                try:
-                    targets.append(float(self.table.item(row, 0).text()))
-                except:
-                    targets.append(0.0)
-            
-            target_data = struct.pack('<26f', *targets)
-            
-            result = self.network_manager.client_thread.send_command(
-                self.table_info['cmd_set'],
-                self.table_info['subcmd_target'],
-                data=target_data,
-                wait_response=True,
-                sync=True
-            )
-            
-            if not result.success:
-                raise Exception(f"Target 전송 실패: {result.message}")
-            
-            if self.table_info['has_3_dac']:
-                self.apply_rf_set_dac_columns()
-            else:
-                self.apply_single_dac_column()
-            
-            QMessageBox.information(self, "완료", "테이블이 장치에 적용되었습니다.")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"적용 실패: {e}")
+        self._start_transfer("write", {self.table_name: self.get_table_values()})
     
-    def apply_rf_set_dac_columns(self):
-        """RF Set DAC 3개 컬럼 적용"""
-        subcmds = [
-            RFProtocol.SUBCMD_CAL_RFSET_DACC,
-            RFProtocol.SUBCMD_CAL_RFSET_DACL,
-            RFProtocol.SUBCMD_CAL_RFSET_DACH
-        ]
-        
-        for col_idx, subcmd in enumerate(subcmds):
-            dac_vals = []
-            for row in range(26):
-                try:
-                    dac_vals.append(int(self.table.item(row, col_idx + 1).text()))
-                except:
-                    dac_vals.append(0)
-            
-            dac_data = struct.pack('<26H', *dac_vals)
-            
-            result = self.network_manager.client_thread.send_command(
-                self.table_info['cmd_set'],
-                subcmd,
-                data=dac_data,
-                wait_response=True,
-                sync=True
-            )
-            
-            if not result.success:
-                raise Exception(f"DAC 컬럼 {col_idx} 전송 실패")
+    def on_apply_finished(self, success, message, tables):
+        self.load_btn.setEnabled(True)
+        self.apply_btn.setEnabled(True)
+        self.status_label.setText("적용 및 검증 완료" if success else "적용 실패")
+        if success:
+            QMessageBox.information(self, "완료", f"테이블이 장치에 적용되었습니다.\n{message}")
+        else:
+            QMessageBox.critical(self, "오류", f"적용 실패: {message}")
     
-    def apply_single_dac_column(self):
-        """단일 DAC/ADC 컬럼 적용"""
-        subcmd_map = {
-            'User FWD/LOAD': RFProtocol.SUBCMD_CAL_FWDLOAD_DAC,
-            'User REF': RFProtocol.SUBCMD_CAL_REF_DAC,
-            'User RF Set IN': RFProtocol.SUBCMD_CAL_RFSETIN_ADC,
-            'User DC Bias': RFProtocol.SUBCMD_CAL_DCBIAS_ADC
-        }
-        
-        subcmd = subcmd_map[self.table_name]
+    def toggle_auto_sweep(self):
+        """자동 스윕 시작/중단 - 결과는 표에 채워지며 Apply로 장치 적용"""
+        if self.sweep_thread is not None and self.sweep_thread.isRunning():
+            self.sweep_thread.abort()
+            self.status_label.setText("스윕 중단 요청...")
+            return
         
-        dac_vals = []
-        for row in range(26):
-            try:
-                dac_vals.append(int(self.table.item(row, 1).text()))
-            except:
-                dac_vals.append(0)
+        if not self.network_manager.client_thread:
+            QMessageBox.warning(self, "오류", "네트워크가 연결되지 않았습니다.")
+            return
         
-        dac_data = struct.pack('<26H', *dac_vals)
+        reply = QMessageBox.question(
+            self, "확인",
+            f"{self.table_name} 자동 스윕을 시작하시겠습니까?\n"
+            "RF OFF 상태에서 Cal Control DAC로 출력이 구동됩니다.\n"
+            "현재 Target 열을 측정 타깃으로 사용합니다.",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
         
-        result = self.network_manager.client_thread.send_command(
-            self.table_info['cmd_set'],
-            subcmd,
-            data=dac_data,
-            wait_response=True,
-            sync=True
+        targets = self.get_table_values()["Target"]
+        self.sweep_thread = CalSweepThread(
+            self.network_manager.client_thread, self.table_name, targets=targets, parent=self
         )
+        self.sweep_thread.progress.connect(self.on_transfer_progress)
+        self.sweep_thread.point_measured.connect(self.on_sweep_point)
+        self.sweep_thread.sweep_finished.connect(self.on_sweep_finished)
+        self.load_btn.setEnabled(False)
+        self.apply_btn.setEnabled(False)
+        self.sweep_btn.setText("Stop Sweep")
+        self.sweep_thread.start()
+    
+    def on_sweep_point(self, dac, value, settled):
+        state = "" if settled else " (안정화 시간 초과)"
+        self.status_label.setText(f"DAC {dac}: {value:.2f}{state}")
+    
+    def on_sweep_finished(self, success, message, table):
+        self.load_btn.setEnabled(True)
+        self.apply_btn.setEnabled(True)
+        self.sweep_btn.setText("Auto Sweep")
+        if success:
+            self.set_table_values(table)
+            self.status_label.setText(f"{message} - Apply로 장치에 적용")
+        else:
+            self.status_label.setText("스윕 실패")
+            QMessageBox.critical(self, "오류", f"자동 스윕 실패: {message}")
+    
+    def verify_table(self):
+        """현재 표 값 검사 (cal_table_engine)"""
+        from cal_table_engine import CalTable
         
-        if not result.success:
-            raise Exception(f"DAC/ADC 전송 실패")
+        issues = CalTable(self.table_name, self.get_table_values()).verify()
+        if not issues:
+            QMessageBox.information(self, "검사", "이상 없음")
+            return
+        lines = [f"[{check}] Row {row}: {message}" for check, row, message in issues[:20]]
+        if len(issues) > 20:
+            lines.append(f"... 외 {len(issues) - 20}건")
+        QMessageBox.warning(self, "검사", "\n".join(lines))
     
     def import_csv(self):
         """CSV에서 가져오기"""
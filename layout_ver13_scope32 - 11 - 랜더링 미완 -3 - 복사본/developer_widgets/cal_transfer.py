@@ -0,0 +1,46 @@
+"""
+Calibration Transfer
+교정 테이블 5종 일괄 읽기/쓰기 백그라운드 스레드 (테이블 정의/전송 함수는 cal_table_io)
+"""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from cal_table_io import read_tables, write_tables
+
+
+class CalTransferThread(QThread):
+    """교정 테이블 전송 백그라운드 스레드 (mode: 'read' 또는 'write')"""
+
+    progress = pyqtSignal(int, str)
+    transfer_finished = pyqtSignal(bool, str, object)  # 성공 여부, 메시지, 테이블 dict
+
+    def __init__(self, client_thread, mode, tables=None, table_names=None,
+                 config_cache=None, verify=True, parent=None):
+        super().__init__(parent)
+        self.client_thread = client_thread
+        self.mode = mode
+        self.tables = tables or {}
+        self.table_names = table_names
+        self.config_cache = config_cache
+        self.verify = verify
+
+    def run(self):
+        try:
+            if self.mode == "read":
+                self.progress.emit(0, "교정 테이블 읽는 중...")
+                success, tables, failed = read_tables(self.client_thread, self.table_names, self.config_cache)
+                message = f"교정 테이블 {len(tables)}개 읽기 완료"
+                if failed:
+                    message += "\n실패:\n" + "\n".join(failed[:5])
+                self.progress.emit(100, "완료")
+                self.transfer_finished.emit(success, message, tables)
+            else:
+                success, failed, message = write_tables(
+                    self.client_thread, self.tables, self.config_cache, self.verify,
+                    progress=self.progress.emit)
+                if failed:
+                    message += "\n실패:\n" + "\n".join(failed[:5])
+                self.progress.emit(100, "완료")
+                self.transfer_finished.emit(success, message, self.tables)
+        except Exception as e:
+            self.transfer_finished.emit(False, f"교정 테이블 전송 오류: {e}", {})
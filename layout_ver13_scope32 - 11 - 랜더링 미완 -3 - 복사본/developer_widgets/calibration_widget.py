@@ -5,10 +5,11 @@ Calibration Widget
 
 from PyQt5.QtWidgets import (
     QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QSpinBox, QComboBox, QMessageBox, QGridLayout
+    QSpinBox, QComboBox, QMessageBox, QGridLayout, QFileDialog
 )
 from PyQt5.QtCore import Qt
 from rf_protocol import RFProtocol
+import os
 import struct
 from ui_widgets import SmartSpinBox, SmartDoubleSpinBox
 
@@ -19,6 +20,7 @@ class CalibrationWidget(QGroupBox):
         super().__init__("⚠️ Calibration (RF OFF Required)", parent)
         self.parent = parent
         self.network_manager = network_manager
+        self.transfer_thread = None
         
         self.setCheckable(True)
         self.setChecked(False)
@@ -130,6 +132,20 @@ class CalibrationWidget(QGroupBox):
         dcbias_table_btn.clicked.connect(lambda: self.open_table_editor("User DC Bias"))
         tables_layout.addWidget(dcbias_table_btn)
         
+        batch_layout = QHBoxLayout()
+        self.read_all_btn = QPushButton("Read All Tables")
+        self.read_all_btn.clicked.connect(self.read_all_tables)
+        batch_layout.addWidget(self.read_all_btn)
+        
+        self.write_all_btn = QPushButton("Write All from CSV Folder...")
+        self.write_all_btn.clicked.connect(self.write_all_tables_from_folder)
+        batch_layout.addWidget(self.write_all_btn)
+        tables_layout.addLayout(batch_layout)
+        
+        self.transfer_status_label = QLabel("")
+        self.transfer_status_label.setStyleSheet("color: #aaaaaa;")
+        tables_layout.addWidget(self.transfer_status_label)
+        
         self.main_layout.addWidget(tables_group)
     
     def on_toggle(self, checked):
@@ -160,10 +176,10 @@ class CalibrationWidget(QGroupBox):
                 ref_dac = struct.unpack('<H', parsed['data'][4:6])[0]
                 rfset_dac = struct.unpack('<H', parsed['data'][6:8])[0]
                 
-                self.cal_mode_combo.setCurrentIndex(cal_mode)
-                self.fwd_dac_spin.setValue(fwd_dac)
-                self.ref_dac_spin.setValue(ref_dac)
-                self.rfset_dac_spin.setValue(rfset_dac)
+                self.populate_control({
+                    'cal_mode': cal_mode, 'fwd_dac': fwd_dac,
+                    'ref_dac': ref_dac, 'rfset_dac': rfset_dac
+                })
                 
                 QMessageBox.information(self, "완료", "Calibration Control을 로드했습니다.")
             else:
@@ -171,6 +187,13 @@ class CalibrationWidget(QGroupBox):
         else:
             QMessageBox.warning(self, "오류", "설정 로드 실패")
     
+    def populate_control(self, control):
+        """Calibration Control 값으로 UI 갱신 (일괄 로드에서도 사용)"""
+        self.cal_mode_combo.setCurrentIndex(control['cal_mode'])
+        self.fwd_dac_spin.setValue(control['fwd_dac'])
+        self.ref_dac_spin.setValue(control['ref_dac'])
+        self.rfset_dac_spin.setValue(control['rfset_dac'])
+    
     def apply_control(self):
         """Calibration Control 적용"""
         if not self.network_manager.client_thread:
@@ -209,6 +232,72 @@ class CalibrationWidget(QGroupBox):
         else:
             QMessageBox.warning(self, "오류", f"설정 적용 실패: {result.message}")
     
+    def _start_table_transfer(self, mode, tables=None):
+        """교정 테이블 일괄 전송 시작 (백그라운드)"""
+        from developer_widgets.cal_transfer import CalTransferThread
+        
+        if not self.network_manager.client_thread:
+            QMessageBox.warning(self, "오류", "네트워크가 연결되지 않았습니다.")
+            return
+        if self.transfer_thread is not None and self.transfer_thread.isRunning():
+            QMessageBox.information(self, "알림", "교정 테이블 전송이 진행 중입니다.")
+            return
+        
+        self.transfer_thread = CalTransferThread(
+            self.network_manager.client_thread, mode, tables=tables,
+            config_cache=getattr(self.network_manager, 'config_cache', None),
+            parent=self
+        )
+        self.transfer_thread.progress.connect(
+            lambda value, message: self.transfer_status_label.setText(f"{message} ({value}%)"))
+        self.transfer_thread.transfer_finished.connect(self.on_table_transfer_finished)
+        self.read_all_btn.setEnabled(False)
+        self.write_all_btn.setEnabled(False)
+        self.transfer_thread.start()
+    
+    def read_all_tables(self):
+        """교정 테이블 5종 일괄 읽기 - 설정 캐시에 저장되어 편집기가 즉시 열림"""
+        self._start_table_transfer("read")
+    
+    def write_all_tables_from_folder(self):
+        """폴더의 CSV(테이블별 export 파일명)를 읽어 일괄 적용 + 읽기 검증"""
+        from cal_table_io import CAL_TABLE_NAMES, load_table_csv
+        
+        folder = QFileDialog.getExistingDirectory(self, "Select Calibration CSV Folder")
+        if not folder:
+            return
+        
+        tables = {}
+        try:
+            for table_name in CAL_TABLE_NAMES:
+                path = os.path.join(folder, f"{table_name.replace('/', '_')}.csv")
+                if os.path.exists(path):
+                    tables[table_name] = load_table_csv(path, table_name)
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"CSV 로드 실패: {e}")
+            return
+        
+        if not tables:
+            QMessageBox.warning(self, "오류", "폴더에 교정 테이블 CSV가 없습니다.")
+            return
+        
+        reply = QMessageBox.question(
+            self, "확인",
+            "다음 테이블을 장치에 적용하시겠습니까?\n" + "\n".join(tables.keys()),
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            self._start_table_transfer("write", tables)
+    
+    def on_table_transfer_finished(self, success, message, tables):
+        self.read_all_btn.setEnabled(True)
+        self.write_all_btn.setEnabled(True)
+        self.transfer_status_label.setText(message.split("\n")[0])
+        if success:
+            QMessageBox.information(self, "완료", message)
+        else:
+            QMessageBox.critical(self, "오류", message)
+    
     def open_table_editor(self, table_name):
         """테이블 편집기 열기"""
         from developer_widgets.cal_table_dialog import CalTableDialog
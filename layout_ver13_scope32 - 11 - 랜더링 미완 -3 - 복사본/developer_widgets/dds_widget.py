@@ -129,13 +129,7 @@ class DDSWidget(QGroupBox):
                 settings = self.dev_data_manager.parse_dds_control_data(parsed['data'])
                 
                 if settings:
-                    # UI 업데이트
-                    self.ch0_gain_spin.setValue(settings['dds_ch0_amp_gain'])
-                    self.ch1_gain_spin.setValue(settings['dds_ch1_amp_gain'])
-                    self.ch0_phase_spin.setValue(settings['dds_ch0_phase_offset'])
-                    self.ch1_phase_spin.setValue(settings['dds_ch1_phase_offset'])
-                    self.auto_offset_spin.setValue(settings['set_auto_rf_offset'])
-                    
+                    self.populate_settings(settings)
                     QMessageBox.information(self, "완료", "DDS Control을 로드했습니다.")
                 else:
                     QMessageBox.warning(self, "오류", "DDS 데이터 파싱 실패")
@@ -144,6 +138,14 @@ class DDSWidget(QGroupBox):
         else:
             QMessageBox.warning(self, "오류", "설정 로드 실패")
     
+    def populate_settings(self, settings):
+        """파싱된 설정으로 UI 갱신 (일괄 로드에서도 사용)"""
+        self.ch0_gain_spin.setValue(settings['dds_ch0_amp_gain'])
+        self.ch1_gain_spin.setValue(settings['dds_ch1_amp_gain'])
+        self.ch0_phase_spin.setValue(settings['dds_ch0_phase_offset'])
+        self.ch1_phase_spin.setValue(settings['dds_ch1_phase_offset'])
+        self.auto_offset_spin.setValue(settings['set_auto_rf_offset'])
+    
     def apply_settings(self):
         """설정 적용"""
         if not self.network_manager.client_thread:
@@ -0,0 +1,138 @@
+"""
+Developer Data Loader
+개발자/시스템 설정 일괄 로드 - 파이프라인 GET 1회, 워커에서 디코딩, 시그널로 위젯 채움
+"""
+
+import struct
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from rf_protocol import RFProtocol
+from device_snapshot import DEVELOPER_READ_COMMANDS, check_replies, reply_to_set_payload
+from developer_data_manager import DeveloperDataManager
+from developer_widgets.system_widgets.system_data_manager import SystemDataManager
+
+# 섹션 -> 단일 페이로드 파서
+SECTION_PARSERS = {
+    "device_info": DeveloperDataManager.parse_device_manager_data,
+    "arc": DeveloperDataManager.parse_arc_management_data,
+    "agc": DeveloperDataManager.parse_agc_setup_data,
+    "dds": DeveloperDataManager.parse_dds_control_data,
+    "sdd": DeveloperDataManager.parse_sdd_config_data,
+    "fast_acq": DeveloperDataManager.parse_fast_acq_data,
+    "va_limit": SystemDataManager.parse_va_limit_data,
+    "gate_bias": SystemDataManager.parse_gate_bias_data,
+}
+
+# Device Manager + 스냅샷 목록 + Calibration Control
+LOADER_READ_COMMANDS = [
+    ("device_info", RFProtocol.CMD_DEVICE_MANAGER_GET, RFProtocol.SUBCMD_DEVICE_MANAGER, "Device Manager"),
+] + DEVELOPER_READ_COMMANDS + [
+    ("cal_control", RFProtocol.CMD_CAL_CTL_GET, RFProtocol.SUBCMD_CAL_CTL, "Calibration Control"),
+]
+
+
+def build_loader_commands(sections=None):
+    """일괄 로드용 GET 명령어 목록 - 각 항목에 'section' 키 포함 (sections 지정 시 해당 섹션만)"""
+    return [{'cmd': cmd, 'subcmd': subcmd, 'data': None,
+             'description': f'{description} 조회', 'section': section}
+            for section, cmd, subcmd, description in LOADER_READ_COMMANDS
+            if sections is None or section in sections]
+
+
+def decode_section(section, entries):
+    """
+    섹션 응답 디코딩 - entries: [(cmd, subcmd, payload)]
+    반환 형식:
+    - device_info/arc/agc/dds/sdd/fast_acq/va_limit/gate_bias: 파서 결과 dict
+    - power_limits: {SUBCMD: float}
+    - minmax: {GET CMD: parse_ctlminmax_data 결과}
+    - cal_control: {'cal_mode', 'fwd_dac', 'ref_dac', 'rfset_dac'}
+    디코딩 실패 시 None
+    """
+    if section == "power_limits":
+        values = {subcmd: struct.unpack('<f', payload[:4])[0]
+                  for _, subcmd, payload in entries if len(payload) >= 4}
+        return values or None
+
+    if section == "minmax":
+        values = {}
+        for cmd, _, payload in entries:
+            if len(payload) >= 112:
+                parsed = SystemDataManager.parse_ctlminmax_data(payload)
+                if parsed:
+                    values[cmd] = parsed
+        return values or None
+
+    if section == "cal_control":
+        payload = entries[0][2]
+        if len(payload) < 12:
+            return None
+        cal_mode, fwd_dac, ref_dac, rfset_dac = struct.unpack('<4H', payload[:8])
+        return {'cal_mode': cal_mode, 'fwd_dac': fwd_dac, 'ref_dac': ref_dac, 'rfset_dac': rfset_dac}
+
+    parser = SECTION_PARSERS.get(section)
+    if parser is None or not entries[0][2]:
+        return None
+    return parser(entries[0][2])
+
+
+class DeveloperDataLoader(QThread):
+    """
+    개발자 설정 일괄 로드 스레드
+    - section_loaded(섹션, 디코딩 결과): 섹션마다 1회 (GUI 스레드에서 위젯 갱신)
+    - load_finished(성공 섹션 수, 전체 섹션 수, 실패 목록)
+    """
+
+    section_loaded = pyqtSignal(str, object)
+    load_finished = pyqtSignal(int, int, list)
+
+    def __init__(self, client_thread, config_cache=None, sections=None, parent=None):
+        super().__init__(parent)
+        self.client_thread = client_thread
+        self.config_cache = config_cache
+        self.sections = sections
+
+    def run(self):
+        commands = build_loader_commands(self.sections)
+        sections = list(dict.fromkeys(command['section'] for command in commands))
+        try:
+            results = self.client_thread.send_pipelined(commands)
+        except Exception as e:
+            self.load_finished.emit(0, len(sections), [f"일괄 로드 오류: {e}"])
+            return
+
+        payloads = []
+        for result in results:
+            parsed = RFProtocol.parse_response(result.response_data) if result.success and result.response_data else None
+            payloads.append(bytes(parsed['data']) if parsed else None)
+        errors = check_replies(commands, payloads)
+
+        entries = {section: [] for section in sections}
+        failed = []
+        for command, result, payload, error in zip(commands, results, payloads, errors):
+            if payload is None or error:
+                failed.append(f"{command['description']} ({error or result.message})")
+                continue
+            entries[command['section']].append((command['cmd'], command['subcmd'], payload))
+            # 캐시에는 SET 형식으로 기록 (코덱이 없는 항목은 기록하지 않음)
+            if self.config_cache is not None:
+                converted = reply_to_set_payload(command['cmd'], command['subcmd'], payload)
+                if converted is not None:
+                    self.config_cache.update(converted[0], command['subcmd'], converted[1])
+
+        loaded = 0
+        for section in sections:
+            if not entries[section]:
+                continue
+            try:
+                data = decode_section(section, entries[section])
+            except Exception as e:
+                print(f"[DeveloperLoader] {section} 디코딩 오류: {e}")
+                data = None
+            if data is None:
+                failed.append(f"{section} (파싱 실패)")
+                continue
+            loaded += 1
+            self.section_loaded.emit(section, data)
+
+        self.load_finished.emit(loaded, len(sections), failed)
@@ -159,19 +159,25 @@ class DeviceConfigWidget(QWidget):
             sync=True
         )
         
+        device_info = None
         if result.success and result.response_data:
             parsed = RFProtocol.parse_response(result.response_data)
             if parsed and parsed['data']:
                 device_info = self.dev_data_manager.parse_device_manager_data(parsed['data'])
-                if device_info:
-                    # 수신한 값만 색상 변경 (예: 밝은 파란색)
-                    model = device_info.get('model_name', '---')
-                    sn = device_info.get('serial_no', '---')
-                    fw = device_info.get('fw_version', '---')
-                    
-                    self.model_label.setText(f'Model: <span style="color: #00BFFF;">{model}</span>')
-                    self.sn_label.setText(f'S/N: <span style="color: #00BFFF;">{sn}</span>')
-                    self.fw_label.setText(f'FW: <span style="color: #00BFFF;">{fw}</span>')
+        
+        self.populate_device_info(device_info)
+    
+    def populate_device_info(self, device_info):
+        """Device Manager 파싱 결과 반영 (일괄 로드 section_loaded에서도 호출)"""
+        if device_info:
+            # 수신한 값만 색상 변경 (예: 밝은 파란색)
+            model = device_info.get('model_name', '---')
+            sn = device_info.get('serial_no', '---')
+            fw = device_info.get('fw_version', '---')
+            
+            self.model_label.setText(f'Model: <span style="color: #00BFFF;">{model}</span>')
+            self.sn_label.setText(f'S/N: <span style="color: #00BFFF;">{sn}</span>')
+            self.fw_label.setText(f'FW: <span style="color: #00BFFF;">{fw}</span>')
         
         self.load_network_info()
 
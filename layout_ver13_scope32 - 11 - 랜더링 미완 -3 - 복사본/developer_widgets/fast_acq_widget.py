@@ -121,12 +121,7 @@ class FastAcqWidget(QGroupBox):
                 settings = self.dev_data_manager.parse_fast_acq_data(parsed['data'])
                 
                 if settings:
-                    self.memory_type_combo.setCurrentIndex(settings['memory_type'])
-                    self.trigger_source_combo.setCurrentIndex(settings['trigger_source'])
-                    self.trigger_position_combo.setCurrentIndex(settings['trigger_position'])
-                    self.control_combo.setCurrentIndex(settings['control'])
-                    self.sample_rate_spin.setValue(settings['sample_rate'])
-                    
+                    self.populate_settings(settings)
                     QMessageBox.information(self, "완료", "Fast Acquisition 설정을 로드했습니다.")
                 else:
                     QMessageBox.warning(self, "오류", "Fast Acq 데이터 파싱 실패")
@@ -135,6 +130,14 @@ class FastAcqWidget(QGroupBox):
         else:
             QMessageBox.warning(self, "오류", "설정 로드 실패")
     
+    def populate_settings(self, settings):
+        """파싱된 설정으로 UI 갱신 (일괄 로드에서도 사용)"""
+        self.memory_type_combo.setCurrentIndex(settings['memory_type'])
+        self.trigger_source_combo.setCurrentIndex(settings['trigger_source'])
+        self.trigger_position_combo.setCurrentIndex(settings['trigger_position'])
+        self.control_combo.setCurrentIndex(settings['control'])
+        self.sample_rate_spin.setValue(settings['sample_rate'])
+    
     def apply_settings(self):
         """설정 적용"""
         if not self.network_manager.client_thread:
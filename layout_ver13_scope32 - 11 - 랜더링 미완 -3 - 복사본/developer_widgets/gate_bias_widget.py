@@ -143,8 +143,11 @@ class GateBiasWidget(QGroupBox):
                 bias_data = self.sys_data_manager.parse_gate_bias_data(parsed['data'])
                 
                 if bias_data:
-                    for i in range(4):
-                        self.module1_spins[i].setValue(bias_data[f'module1_bias_{i}'])
-                        self.module2_spins[i].setValue(bias_data[f'module2_bias_{i}'])
-                    
-                    QMessageBox.information(self, "완료", "Gate Bias를 로드했습니다.")
\ No newline at end of file
+                    self.populate_settings(bias_data)
+                    QMessageBox.information(self, "완료", "Gate Bias를 로드했습니다.")
+    
+    def populate_settings(self, bias_data):
+        """파싱된 설정으로 UI 갱신 (일괄 로드에서도 사용)"""
+        for i in range(4):
+            self.module1_spins[i].setValue(bias_data[f'module1_bias_{i}'])
+            self.module2_spins[i].setValue(bias_data[f'module2_bias_{i}'])
\ No newline at end of file
@@ -120,22 +120,15 @@ class SDDWidget(QGroupBox):
                 settings = self.dev_data_manager.parse_sdd_config_data(parsed['data'])
                 
                 if settings:
-                    # GUI Model 값으로 ComboBox 인덱스 찾기
-                    gui_model_value = settings['gui_model']
-                    index = self.gui_model_combo.findData(gui_model_value)
-                    if index >= 0:
-                        self.gui_model_combo.setCurrentIndex(index)
-                    else:
+                    if not self.populate_settings(settings):
                         # 매칭되는 값이 없으면 경고
                         QMessageBox.warning(
                             self, 
                             "경고", 
-                            f"알 수 없는 GUI Model 값: {gui_model_value}\n"
+                            f"알 수 없는 GUI Model 값: {settings['gui_model']}\n"
                             f"GUI_MODEL_MAP에 추가가 필요합니다."
                         )
                     
-                    self.pulsing_count_spin.setValue(settings['pulsing_count'])
-                    
                     QMessageBox.information(self, "완료", "SDD Config를 로드했습니다.")
                 else:
                     QMessageBox.warning(self, "오류", "SDD 데이터 파싱 실패")
@@ -144,6 +137,16 @@ class SDDWidget(QGroupBox):
         else:
             QMessageBox.warning(self, "오류", "설정 로드 실패")
     
+    def populate_settings(self, settings):
+        """파싱된 설정으로 UI 갱신 - 알 수 없는 GUI Model이면 False"""
+        # GUI Model 값으로 ComboBox 인덱스 찾기
+        index = self.gui_model_combo.findData(settings['gui_model'])
+        if index >= 0:
+            self.gui_model_combo.setCurrentIndex(index)
+        
+        self.pulsing_count_spin.setValue(settings['pulsing_count'])
+        return index >= 0
+    
     def apply_settings(self):
         """설정 적용"""
         if not self.network_manager.client_thread:
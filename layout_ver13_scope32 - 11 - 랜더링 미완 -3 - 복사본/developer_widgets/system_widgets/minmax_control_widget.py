@@ -15,6 +15,14 @@ from ui_widgets import SmartSpinBox, SmartDoubleSpinBox
 class MinMaxControlWidget(QGroupBox):
     """Min/Max Control 위젯"""
     
+    # 섹션별 GET CMD 매핑
+    SECTION_COMMANDS = {
+        'Maximum Values': (RFProtocol.CMD_DCC_GATE_MAX_GET, RFProtocol.SUBCMD_DCC_GATE_MAX),
+        'Minimum Values': (RFProtocol.CMD_DCC_GATE_MIN_GET, RFProtocol.SUBCMD_DCC_GATE_MIN),
+        'Factor A': (RFProtocol.CMD_DCC_FACTOR_A_GET, RFProtocol.SUBCMD_DCC_FACTOR_A),
+        'Factor B': (RFProtocol.CMD_DCC_FACTOR_B_GET, RFProtocol.SUBCMD_DCC_FACTOR_B)
+    }
+    
     def __init__(self, parent, network_manager):
         super().__init__("Min/Max Control Limits", parent)
         self.parent = parent
@@ -293,18 +301,11 @@ class MinMaxControlWidget(QGroupBox):
         # ========================================
         # 1단계: 섹션별 GET CMD 매핑
         # ========================================
-        cmd_map = {
-            'Maximum Values': (RFProtocol.CMD_DCC_GATE_MAX_GET, RFProtocol.SUBCMD_DCC_GATE_MAX),
-            'Minimum Values': (RFProtocol.CMD_DCC_GATE_MIN_GET, RFProtocol.SUBCMD_DCC_GATE_MIN),
-            'Factor A': (RFProtocol.CMD_DCC_FACTOR_A_GET, RFProtocol.SUBCMD_DCC_FACTOR_A),
-            'Factor B': (RFProtocol.CMD_DCC_FACTOR_B_GET, RFProtocol.SUBCMD_DCC_FACTOR_B)
-        }
-        
-        if section_name not in cmd_map:
+        if section_name not in self.SECTION_COMMANDS:
             QMessageBox.critical(self, "오류", f"알 수 없는 섹션: {section_name}")
             return
         
-        cmd, subcmd = cmd_map[section_name]
+        cmd, subcmd = self.SECTION_COMMANDS[section_name]
         
         # ========================================
         # 2단계: GET 명령어 전송
@@ -488,29 +489,18 @@ class MinMaxControlWidget(QGroupBox):
             QMessageBox.warning(self, "오류", "네트워크가 연결되지 않았습니다.")
             return
         
-        # 🔧 NEW: 4개 섹션 모두 로드
+        # 🔧 NEW: 4개 섹션 모두 로드 (파이프라인 1회)
         success_count = 0
         failed_sections = []
         
-        section_names = ["Maximum Values", "Minimum Values", "Factor A", "Factor B"]
-        cmd_map = {
-            'Maximum Values': (RFProtocol.CMD_DCC_GATE_MAX_GET, RFProtocol.SUBCMD_DCC_GATE_MAX),
-            'Minimum Values': (RFProtocol.CMD_DCC_GATE_MIN_GET, RFProtocol.SUBCMD_DCC_GATE_MIN),
-            'Factor A': (RFProtocol.CMD_DCC_FACTOR_A_GET, RFProtocol.SUBCMD_DCC_FACTOR_A),
-            'Factor B': (RFProtocol.CMD_DCC_FACTOR_B_GET, RFProtocol.SUBCMD_DCC_FACTOR_B)
-        }
+        section_names = list(self.SECTION_COMMANDS.keys())
+        commands = [
+            {'cmd': cmd, 'subcmd': subcmd, 'data': None}
+            for cmd, subcmd in self.SECTION_COMMANDS.values()
+        ]
+        results = self.network_manager.client_thread.send_pipelined(commands)
         
-        for section_name in section_names:
-            cmd, subcmd = cmd_map[section_name]
-            
-            # GET 명령어 전송
-            result = self.network_manager.client_thread.send_command(
-                cmd,
-                subcmd,
-                wait_response=True,
-                sync=True
-            )
-            
+        for section_name, result in zip(section_names, results):
             if result.success and result.response_data:
                 parsed = RFProtocol.parse_response(result.response_data)
                 if parsed and len(parsed['data']) >= 112:
@@ -518,19 +508,7 @@ class MinMaxControlWidget(QGroupBox):
                     data_dict = self.sys_data_manager.parse_ctlminmax_data(parsed['data'])
                     
                     if data_dict:
-                        # UI 업데이트 - 해당 섹션 찾기
-                        target_spinboxes = None
-                        for section_type, section, spinboxes, contents in self.sections:
-                            if section.title() == section_name:
-                                target_spinboxes = spinboxes
-                                break
-                        
-                        if target_spinboxes:
-                            # 스핀박스 값 업데이트
-                            for key, spin in target_spinboxes.items():
-                                if key in data_dict:
-                                    spin.setValue(float(data_dict[key]))
-                            
+                        if self.populate_section(section_name, data_dict):
                             success_count += 1
                         else:
                             failed_sections.append(section_name + " (위젯 찾기 실패)")
@@ -570,6 +548,22 @@ class MinMaxControlWidget(QGroupBox):
             )
     #############
     
+    def populate_section(self, section_name, data_dict):
+        """파싱된 섹션 값으로 스핀박스 갱신 - 섹션을 찾지 못하면 False"""
+        for section_type, section, spinboxes, contents in self.sections:
+            if section.title() == section_name:
+                for key, spin in spinboxes.items():
+                    if key in data_dict:
+                        spin.setValue(float(data_dict[key]))
+                return True
+        return False
+    
+    def populate_sections(self, data_by_cmd):
+        """{GET CMD: 파싱 결과}로 전체 섹션 갱신 (일괄 로드에서 사용)"""
+        for section_name, (cmd, subcmd) in self.SECTION_COMMANDS.items():
+            if cmd in data_by_cmd:
+                self.populate_section(section_name, data_by_cmd[cmd])
+    
     def reset_all_settings(self):
         """전체 설정 리셋"""
         reply = QMessageBox.question(
@@ -236,14 +236,9 @@ class PowerLimitsWidget(QGroupBox):
     # ==================================================
     # load_settings 함수 완전 구현
     # ==================================================
-    def load_settings(self):
-        """설정 로드 - 각 필드를 개별 조회"""
-        if not self.network_manager.client_thread:
-            QMessageBox.warning(self, "오류", "네트워크가 연결되지 않았습니다.")
-            return
-        
-        # 각 필드와 SUBCMD, SpinBox 매핑
-        power_limits = [
+    def get_limit_fields(self):
+        """각 필드와 SUBCMD, SpinBox 매핑"""
+        return [
             ('User Power Limit', RFProtocol.SUBCMD_USER_POWER_LIMIT, self.user_power_limit_spin),
             ('Low Power Limit', RFProtocol.SUBCMD_LOW_POWER_LIMIT, self.low_power_limit_spin),
             ('Max Power Limit', RFProtocol.SUBCMD_MAX_POWER_LIMIT, self.max_power_limit_spin),
@@ -253,6 +248,20 @@ class PowerLimitsWidget(QGroupBox):
             ('Max Ext Value', RFProtocol.SUBCMD_MAX_EXT_VALUE, self.max_ext_value_spin),
             ('Min Ext Value', RFProtocol.SUBCMD_MIN_EXT_VALUE, self.min_ext_value_spin)
         ]
+    
+    def populate_limits(self, values):
+        """{SUBCMD: 값}으로 UI 갱신 (일괄 로드에서 사용)"""
+        for name, subcmd, spin in self.get_limit_fields():
+            if subcmd in values:
+                spin.setValue(values[subcmd])
+    
+    def load_settings(self):
+        """설정 로드 - 각 필드를 개별 조회"""
+        if not self.network_manager.client_thread:
+            QMessageBox.warning(self, "오류", "네트워크가 연결되지 않았습니다.")
+            return
+        
+        power_limits = self.get_limit_fields()
         
         success_count = 0
         failed_items = []
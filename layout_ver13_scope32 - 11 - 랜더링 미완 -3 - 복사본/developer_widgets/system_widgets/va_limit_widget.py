@@ -173,6 +173,10 @@ class VALimitWidget(QGroupBox):
                 va_limits = self.sys_data_manager.parse_va_limit_data(parsed['data'])
                 
                 if va_limits:
-                    self.va_limit_1_spin.setValue(va_limits['va_limit_1'])
-                    self.va_limit_2_spin.setValue(va_limits['va_limit_2'])
-                    QMessageBox.information(self, "완료", "VA Limit을 로드했습니다.")
\ No newline at end of file
+                    self.populate_settings(va_limits)
+                    QMessageBox.information(self, "완료", "VA Limit을 로드했습니다.")
+    
+    def populate_settings(self, va_limits):
+        """파싱된 설정으로 UI 갱신 (일괄 로드에서도 사용)"""
+        self.va_limit_1_spin.setValue(va_limits['va_limit_1'])
+        self.va_limit_2_spin.setValue(va_limits['va_limit_2'])
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Device Config Cache Module
+장비 설정 캐시 - (CMD, SUBCMD)별 마지막으로 확인된 페이로드 보관 (변경분만 전송)
+"""
+
+import threading
+
+
+def _normalize_key(cmd, subcmd):
+    """GET 명령어(0x80 이상)는 대응하는 SET 명령어 키로 변환"""
+    return (cmd & 0x7F, subcmd)
+
+
+class DeviceConfigCache:
+    """
+    장비 설정 캐시
+    - SET 성공 응답(ACK) 또는 GET 읽기 응답으로 확인된 페이로드만 저장
+    - 재연결/장비 변경 시 invalidate()로 전체 무효화
+    """
+
+    def __init__(self):
+        self._entries = {}  # (cmd, subcmd) -> bytes
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, cmd, subcmd):
+        """캐시된 페이로드 반환 (없으면 None)"""
+        with self._lock:
+            return self._entries.get(_normalize_key(cmd, subcmd))
+
+    def update(self, cmd, subcmd, payload):
+        """SET 성공 시 전송한 페이로드 기록"""
+        if payload is None:
+            return
+        with self._lock:
+            self._entries[_normalize_key(cmd, subcmd)] = bytes(payload)
+
+    def record_read_back(self, parsed):
+        """GET 응답(parse_response 결과) 기록"""
+        if not parsed or parsed.get('data') is None:
+            return
+        self.update(parsed['cmd'], parsed['subcmd'], parsed['data'])
+
+    def invalidate(self, cmd=None, subcmd=None):
+        """캐시 무효화 - 인자 없으면 전체, cmd만 주면 해당 CMD 전체"""
+        with self._lock:
+            if cmd is None:
+                self._entries.clear()
+                return
+            if subcmd is not None:
+                self._entries.pop(_normalize_key(cmd, subcmd), None)
+                return
+            base = cmd & 0x7F
+            for key in [k for k in self._entries if k[0] == base]:
+                del self._entries[key]
+
+    def is_current(self, command):
+        """명령어 페이로드가 캐시 값과 같은지 확인"""
+        cached = self.get(command['cmd'], command['subcmd'])
+        data = command.get('data')
+        return cached is not None and data is not None and cached == bytes(data)
+
+    def filter_changed(self, commands, force_full=False):
+        """
+        변경된 명령어만 선별
+        반환: (전송할 명령어 목록, 생략된 명령어 목록)
+        """
+        if force_full:
+            return list(commands), []
+        changed, skipped = [], []
+        for command in commands:
+            (skipped if self.is_current(command) else changed).append(command)
+        return changed, skipped
@@ -0,0 +1,400 @@
+"""
+Device Snapshot Module
+장비 전체 설정 스냅샷 - 파이프라인 GET 일괄 읽기, 버전 관리되는 바이너리 파일 저장, 최소 SET 복원
+- 스냅샷에는 GET 응답 페이로드를 그대로 저장 (길이 불일치/에러 응답은 읽기 실패로 기록)
+- 복원 시 GET 페이로드를 parse_* 로 해석한 뒤 create_*_data 로 SET 페이로드를 다시 생성
+  (주파수 '<f' MHz -> '<I' Hz, Bank Enable '<H' -> '<I' 등 GET/SET 형식이 다른 항목 대응)
+"""
+
+import time
+import struct
+import datetime
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from rf_protocol import RFProtocol, SOCKET_TIMEOUT
+from developer_data_manager import DeveloperDataManager
+from cal_table_io import CAL_TABLE_READ_COMMANDS, CAL_TABLE_POINTS, decode_column, encode_column
+from snapshot_file import DeviceSnapshot
+
+# 스냅샷에 포함되는 튜닝 탭 (network 탭은 클라이언트 설정이므로 제외)
+TUNING_SNAPSHOT_TABS = ["control", "ramp", "cex", "pulse", "frequency", "bank"]
+
+# 개발자/시스템 설정 GET 명령어: (섹션, CMD, SUBCMD, 설명)
+DEVELOPER_READ_COMMANDS = [
+    ("arc", RFProtocol.CMD_ARC_MANAGEMENT_GET, RFProtocol.SUBCMD_ARC_MANAGEMENT, "Arc Management"),
+    ("agc", RFProtocol.CMD_AGC_SETUP_GET, RFProtocol.SUBCMD_AGC_SETUP, "AGC Setup"),
+    ("dds", RFProtocol.CMD_DDS_CTL_GET, RFProtocol.SUBCMD_DDS_CTL, "DDS Control"),
+    ("sdd", RFProtocol.CMD_SDD_CONFIG_GET, RFProtocol.SUBCMD_SDD_CONFIG, "SDD Config"),
+    ("fast_acq", RFProtocol.CMD_FAST_ACQ_GET, RFProtocol.SUBCMD_FAST_ACQ, "Fast Acquisition"),
+    ("minmax", RFProtocol.CMD_DCC_GATE_MAX_GET, RFProtocol.SUBCMD_DCC_GATE_MAX, "MinMax Maximum Values"),
+    ("minmax", RFProtocol.CMD_DCC_GATE_MIN_GET, RFProtocol.SUBCMD_DCC_GATE_MIN, "MinMax Minimum Values"),
+    ("minmax", RFProtocol.CMD_DCC_FACTOR_A_GET, RFProtocol.SUBCMD_DCC_FACTOR_A, "MinMax Factor A"),
+    ("minmax", RFProtocol.CMD_DCC_FACTOR_B_GET, RFProtocol.SUBCMD_DCC_FACTOR_B, "MinMax Factor B"),
+    ("power_limits", RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_USER_POWER_LIMIT, "User Power Limit"),
+    ("power_limits", RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_LOW_POWER_LIMIT, "Low Power Limit"),
+    ("power_limits", RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_MAX_POWER_LIMIT, "Max Power Limit"),
+    ("power_limits", RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_USER_REFLECTED_LIMIT, "User Reflected Limit"),
+    ("power_limits", RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_MAX_REFLECTED_LIMIT, "Max Reflected Limit"),
+    ("power_limits", RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_USER_EXT_LIMIT, "User Ext Limit"),
+    ("power_limits", RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_MAX_EXT_VALUE, "Max Ext Value"),
+    ("power_limits", RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_MIN_EXT_VALUE, "Min Ext Value"),
+    ("va_limit", RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_VA_LIMIT, "VA Limit"),
+    ("gate_bias", RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_GATE_BIAS, "Gate Bias"),
+]
+
+# 튜닝 항목 GET 응답 길이 (parse_tab_responses 의 struct 형식과 동일)
+TUNING_REPLY_SIZES = {
+    (RFProtocol.CMD_CONTROL_MODE_GET, RFProtocol.SUBCMD_CONTROL_MODE_GET): 2,
+    (RFProtocol.CMD_REGULATION_MODE_GET, RFProtocol.SUBCMD_REGULATION_MODE_GET): 2,
+    (RFProtocol.CMD_RAMP_CONFIG_GET, RFProtocol.SUBCMD_RAMP_CONFIG_GET): 20,
+    (RFProtocol.CMD_CEX_CONFIG_GET, RFProtocol.SUBCMD_CEX_CONFIG_GET): 12,
+    (RFProtocol.CMD_PULSE_GET, RFProtocol.SUBCMD_PULSE_TYPE): 1,
+    (RFProtocol.CMD_PULSE_GET, RFProtocol.SUBCMD_PULSE_MODE): 1,
+    (RFProtocol.CMD_PULSE_GET, RFProtocol.SUBCMD_PULSE_OFFON): 1,
+    (RFProtocol.CMD_PULSE_GET, RFProtocol.SUBCMD_PULSE_SYNC_OUTPUT): 1,
+    (RFProtocol.CMD_PULSE_GET, RFProtocol.SUBCMD_PULSE_LEVEL): 16,
+    (RFProtocol.CMD_PULSE_GET, RFProtocol.SUBCMD_PULSE_DUTY): 16,
+    (RFProtocol.CMD_PULSE_GET, RFProtocol.SUBCMD_PULSE_SYNC_OUT_DELAY): 4,
+    (RFProtocol.CMD_PULSE_GET, RFProtocol.SUBCMD_PULSE_SYNC_IN_DELAY): 4,
+    (RFProtocol.CMD_PULSE_GET, RFProtocol.SUBCMD_PULSE_WIDTH_CONTROL): 4,
+    (RFProtocol.CMD_PULSE_GET, RFProtocol.SUBCMD_PULSE_FREQ): 4,
+    (RFProtocol.CMD_GET_FREQUENCY, RFProtocol.SUBCMD_GET_FREQUENCY): 4,
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_ENABLE): 1,
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_RETUNING): 1,
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_MODE): 1,
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_MIN_FREQ): 4,
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_MAX_FREQ): 4,
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_START_FREQ): 4,
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_MIN_STEP): 4,
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_MAX_STEP): 4,
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_STOP_GAMMA): 4,
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_RETURN_GAMMA): 4,
+    (RFProtocol.CMD_BANK_GET, RFProtocol.SUBCMD_BANK1_ENABLE): 2,
+    (RFProtocol.CMD_BANK_GET, RFProtocol.SUBCMD_BANK1_EQUATION_ENABLE): 2,
+    (RFProtocol.CMD_BANK_GET, RFProtocol.SUBCMD_BANK1_PARAMS): 20,
+    (RFProtocol.CMD_BANK_GET, RFProtocol.SUBCMD_BANK2_ENABLE): 2,
+    (RFProtocol.CMD_BANK_GET, RFProtocol.SUBCMD_BANK2_EQUATION_ENABLE): 2,
+    (RFProtocol.CMD_BANK_GET, RFProtocol.SUBCMD_BANK2_PARAMS): 20,
+}
+
+# 읽기 전용 항목 (대응하는 SET 없음 - 복원에서 제외)
+READ_ONLY_FIELDS = {
+    (RFProtocol.CMD_FREQUENCY_TUNING_GET, RFProtocol.SUBCMD_FREQ_TUNING_ENABLE),
+}
+
+
+# ========================================
+# 항목 코덱 (GET 응답 -> SET 페이로드)
+# ========================================
+def _parse_float_value(data):
+    """단일 float 파싱 (Power Limits 개별 항목)"""
+    return {'value': struct.unpack('<f', data[:4])[0]}
+
+
+def _create_float_value(settings):
+    """단일 float 생성 (PowerLimitsWidget 전송 형식과 동일)"""
+    try:
+        return True, struct.pack('<f', float(settings['value'])), "float 데이터 생성 완료"
+    except Exception as e:
+        return False, None, f"float 데이터 생성 실패: {str(e)}"
+
+
+_field_codecs = None
+
+
+def get_field_codecs():
+    """
+    개발자/시스템/교정 항목 코덱: (GET CMD, SUBCMD) -> (SET CMD, 응답 길이, parse, create)
+    - SystemDataManager는 developer_widgets 패키지(Qt 위젯)를 불러오므로 첫 사용 시 로드
+    """
+    global _field_codecs
+    if _field_codecs is not None:
+        return _field_codecs
+
+    from developer_widgets.system_widgets.system_data_manager import SystemDataManager
+
+    ddm = DeveloperDataManager
+    sdm = SystemDataManager
+    codecs = {
+        (RFProtocol.CMD_ARC_MANAGEMENT_GET, RFProtocol.SUBCMD_ARC_MANAGEMENT):
+            (RFProtocol.CMD_ARC_MANAGEMENT_SET, 16, ddm.parse_arc_management_data, ddm.create_arc_management_data),
+        (RFProtocol.CMD_AGC_SETUP_GET, RFProtocol.SUBCMD_AGC_SETUP):
+            (RFProtocol.CMD_AGC_SETUP_SET, 32, ddm.parse_agc_setup_data, ddm.create_agc_setup_data),
+        (RFProtocol.CMD_DDS_CTL_GET, RFProtocol.SUBCMD_DDS_CTL):
+            (RFProtocol.CMD_DDS_CTL_SET, 24, ddm.parse_dds_control_data, ddm.create_dds_control_data),
+        (RFProtocol.CMD_SDD_CONFIG_GET, RFProtocol.SUBCMD_SDD_CONFIG):
+            (RFProtocol.CMD_SDD_CONFIG_SET, 4, ddm.parse_sdd_config_data, ddm.create_sdd_config_data),
+        (RFProtocol.CMD_FAST_ACQ_GET, RFProtocol.SUBCMD_FAST_ACQ):
+            (RFProtocol.CMD_FAST_ACQ_SET, 8, ddm.parse_fast_acq_data, ddm.create_fast_acq_data),
+        (RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_VA_LIMIT):
+            (RFProtocol.CMD_GLOBAL_CONFIG_SET, 8, sdm.parse_va_limit_data, sdm.create_va_limit_data),
+        (RFProtocol.CMD_GLOBAL_CONFIG_GET, RFProtocol.SUBCMD_GATE_BIAS):
+            (RFProtocol.CMD_GLOBAL_CONFIG_SET, 32, sdm.parse_gate_bias_data, sdm.create_gate_bias_data),
+    }
+
+    # MinMax (Ctlminmax_t 112바이트 - MinMaxControlWidget 전송 형식과 동일)
+    for section, cmd_get, subcmd, _ in DEVELOPER_READ_COMMANDS:
+        if section == "minmax":
+            codecs[(cmd_get, subcmd)] = (cmd_get & 0x7F, 112, sdm.parse_ctlminmax_data, sdm.create_ctlminmax_data)
+        elif section == "power_limits":
+            codecs[(cmd_get, subcmd)] = (cmd_get & 0x7F, 4, _parse_float_value, _create_float_value)
+
+    # 교정 테이블 (GET/SET 형식 동일, 컬럼별 26포인트)
+    for table_name, (cmd_get, columns) in CAL_TABLE_READ_COMMANDS.items():
+        for subcmd, column in columns:
+            size = CAL_TABLE_POINTS * (4 if column == "Target" else 2)
+            codecs[(cmd_get, subcmd)] = (
+                cmd_get & 0x7F, size,
+                lambda data, column=column: {'values': decode_column(column, data)},
+                lambda settings, column=column: (True, encode_column(column, settings['values']), "교정 컬럼 생성 완료"),
+            )
+
+    _field_codecs = codecs
+    return codecs
+
+
+def reply_to_set_payload(cmd, subcmd, payload):
+    """
+    검사를 통과한 GET 응답 -> (SET CMD, SET 페이로드)
+    코덱이 없거나 변환 실패 시 None (캐시에는 SET 형식만 기록)
+    """
+    codec = get_field_codecs().get((cmd, subcmd))
+    if codec is None:
+        return None
+    set_cmd, _, parse, create = codec
+    settings = parse(payload)
+    if not settings:
+        return None
+    success, data, _ = create(settings)
+    return (set_cmd, bytes(data)) if success else None
+
+
+def expected_reply_size(cmd, subcmd):
+    """항목별 GET 응답 길이 (알 수 없으면 None)"""
+    size = TUNING_REPLY_SIZES.get((cmd, subcmd))
+    if size is None:
+        codec = get_field_codecs().get((cmd, subcmd))
+        size = codec[1] if codec else None
+    return size
+
+
+def check_replies(commands, payloads):
+    """
+    GET 응답 길이 검사 - 반환: 항목별 오류 메시지 목록 (정상이면 None)
+    - 에러 응답은 1바이트(0x01)라 1바이트 항목 값과 구분되지 않으므로,
+      같은 CMD의 다른 항목이 1바이트 에러 응답을 받았으면 1바이트 항목도 실패로 처리
+    """
+    sizes = [expected_reply_size(c['cmd'], c['subcmd']) for c in commands]
+    errors = [None] * len(commands)
+    unsupported = set()
+    for i, (command, payload, size) in enumerate(zip(commands, payloads, sizes)):
+        if payload is None or size is None:
+            continue
+        if len(payload) != size:
+            errors[i] = "에러 응답" if len(payload) == 1 else f"응답 길이 불일치 ({len(payload)}/{size}바이트)"
+            if len(payload) == 1:
+                unsupported.add(command['cmd'])
+    for i, (command, payload, size) in enumerate(zip(commands, payloads, sizes)):
+        if errors[i] is None and size == 1 and command['cmd'] in unsupported:
+            errors[i] = "에러 응답 (같은 CMD 항목 미지원)"
+    return errors
+
+
+def get_snapshot_read_commands(tuning_manager):
+    """스냅샷용 GET 명령어 전체 목록 - 각 항목에 'section' 키 포함"""
+    commands = []
+    for tab_name in TUNING_SNAPSHOT_TABS:
+        success, tab_commands, msg = tuning_manager.get_tab_read_commands(tab_name)
+        if not success:
+            raise ValueError(msg)
+        for command in tab_commands:
+            commands.append(dict(command, section=f"tuning.{tab_name}"))
+
+    for section, cmd, subcmd, description in DEVELOPER_READ_COMMANDS:
+        commands.append({'cmd': cmd, 'subcmd': subcmd, 'data': None,
+                         'description': f'{description} 조회', 'section': f"developer.{section}"})
+
+    for table_name, (cmd, columns) in CAL_TABLE_READ_COMMANDS.items():
+        for subcmd, column in columns:
+            commands.append({'cmd': cmd, 'subcmd': subcmd, 'data': None,
+                             'description': f'{table_name} {column} 조회', 'section': f"cal.{table_name}"})
+    return commands
+
+
+class SnapshotEngine:
+    """스냅샷 읽기/복원 엔진 (HybridRFClientThread.send_pipelined 사용)"""
+
+    def __init__(self, client_thread, tuning_manager, config_cache=None):
+        self.client_thread = client_thread
+        self.tuning_manager = tuning_manager
+        self.config_cache = config_cache
+
+    def capture(self, timeout=SOCKET_TIMEOUT):
+        """
+        장비 전체 설정 읽기 - 반환: (성공 여부, DeviceSnapshot, 메시지)
+        일부 항목 실패 시에도 읽은 항목으로 스냅샷 생성 (실패 항목은 header['failed'])
+        """
+        try:
+            commands = get_snapshot_read_commands(self.tuning_manager)
+        except Exception as e:
+            return False, None, f"스냅샷 명령어 생성 실패: {e}"
+
+        start_time = time.time()
+        results = self.client_thread.send_pipelined(commands, timeout=timeout)
+
+        payloads = []
+        for result in results:
+            parsed = RFProtocol.parse_response(result.response_data) if result.success and result.response_data else None
+            payloads.append(bytes(parsed['data']) if parsed else None)
+        errors = check_replies(commands, payloads)
+
+        entries = {}
+        sections = {}
+        failed = []
+        for command, result, payload, error in zip(commands, results, payloads, errors):
+            if payload is None or error:
+                failed.append(f"{command['description']} ({error or result.message})")
+                continue
+            key = (command['cmd'], command['subcmd'])
+            entries[key] = payload
+            sections.setdefault(command['section'], []).append(key)
+
+        elapsed = time.time() - start_time
+        header = {
+            "created": datetime.datetime.now().isoformat(timespec='seconds'),
+            "host": getattr(self.client_thread, 'host', ""),
+            "read_time": round(elapsed, 4),
+            "failed": failed,
+        }
+        snapshot = DeviceSnapshot(entries, sections, header)
+
+        # 캐시에는 SET 형식으로 기록 (변경분 비교가 항상 SET 페이로드끼리 이루어지도록)
+        if self.config_cache is not None:
+            for command in self.build_restore_commands(snapshot)[0]:
+                self.config_cache.update(command['cmd'], command['subcmd'], command['data'])
+
+        message = f"스냅샷 읽기 완료: {len(entries)}/{len(commands)} 항목 ({elapsed:.3f}s)"
+        return len(entries) > 0, snapshot, message
+
+    def _tuning_restore_commands(self, tab_name, snapshot, keys):
+        """튜닝 탭 항목 -> get_tab_commands_from_responses (읽은 항목만)"""
+        responses = [{'cmd': cmd, 'subcmd': subcmd, 'data': snapshot.entries[(cmd, subcmd)]}
+                     for cmd, subcmd in keys]
+        success, tab_commands, msg = self.tuning_manager.get_tab_commands_from_responses(tab_name, responses)
+        if not success:
+            raise ValueError(msg)
+        return {(command['cmd'] | 0x80, command['subcmd']): command for command in tab_commands}
+
+    def build_restore_commands(self, snapshot):
+        """
+        복원용 SET 명령어 생성 (스냅샷 섹션 순서)
+        반환: (명령어 목록, 실패 목록) - 읽기 전용 항목은 제외
+        """
+        codecs = get_field_codecs()
+        commands = []
+        failed = []
+        for section, keys in snapshot.sections.items():
+            keys = [key for key in keys if key in snapshot.entries and key not in READ_ONLY_FIELDS]
+            if section.startswith("tuning."):
+                try:
+                    built = self._tuning_restore_commands(section.split(".", 1)[1], snapshot, keys)
+                except Exception as e:
+                    failed.append(f"{section} - 복원 명령어 생성 실패: {e}")
+                    continue
+            else:
+                built = {}
+                for key in keys:
+                    codec = codecs.get(key)
+                    if codec is None:
+                        continue
+                    set_cmd, size, parse, create = codec
+                    settings = parse(snapshot.entries[key])
+                    success, data, msg = create(settings) if settings else (False, None, "파싱 실패")
+                    if success:
+                        built[key] = {'cmd': set_cmd, 'subcmd': key[1], 'data': data}
+                    else:
+                        failed.append(f"{section} 0x{key[0]:02X}/0x{key[1]:02X} - {msg}")
+
+            for key in keys:
+                command = built.get(key)
+                if command is None:
+                    if section.startswith("tuning."):
+                        failed.append(f"{section} 0x{key[0]:02X}/0x{key[1]:02X} - 복원 명령어 생성 실패")
+                    continue
+                commands.append({
+                    'cmd': command['cmd'],
+                    'subcmd': command['subcmd'],
+                    'data': bytes(command['data']),
+                    'description': RFProtocol.get_command_description(command['cmd'], command['subcmd']),
+                    'section': section,
+                })
+        return commands, failed
+
+    def restore(self, snapshot, force_full=False, timeout=SOCKET_TIMEOUT):
+        """
+        스냅샷 복원 - 반환: (성공 여부, 실패 목록, 메시지)
+        force_full이 아니면 장비 현재 값(캐시, 없으면 파이프라인 읽기)과 SET 형식으로 비교해 다른 항목만 전송
+        """
+        commands, failed = self.build_restore_commands(snapshot)
+        total = len(commands)
+
+        if not force_full and commands:
+            cached = self.config_cache
+            covered = cached is not None and all(
+                cached.get(c['cmd'], c['subcmd']) is not None for c in commands)
+            if covered:
+                current = {(c['cmd'], c['subcmd']): cached.get(c['cmd'], c['subcmd']) for c in commands}
+            else:
+                success, device_snapshot, msg = self.capture(timeout)
+                current = {}
+                if success:
+                    current = {(c['cmd'], c['subcmd']): c['data']
+                               for c in self.build_restore_commands(device_snapshot)[0]}
+            commands = [c for c in commands if current.get((c['cmd'], c['subcmd'])) != c['data']]
+
+        if not commands:
+            message = "장비 설정이 스냅샷과 동일하여 전송할 명령어가 없습니다"
+            return not failed, failed, message
+
+        start_time = time.time()
+        results = self.client_thread.send_pipelined(commands, timeout=timeout)
+        for command, result in zip(commands, results):
+            if result.success:
+                if self.config_cache is not None:
+                    self.config_cache.update(command['cmd'], command['subcmd'], command['data'])
+            else:
+                failed.append(f"{command['description']} - {result.message}")
+                if self.config_cache is not None:
+                    self.config_cache.invalidate(command['cmd'], command['subcmd'])
+
+        elapsed = time.time() - start_time
+        sent_failed = sum(1 for result in results if not result.success)
+        message = (f"스냅샷 복원: {len(commands) - sent_failed}/{len(commands)} 명령어 적용 "
+                   f"({total - len(commands)}개 동일 항목 생략, "
+                   f"{len(snapshot) - total}개 읽기 전용/미복원 항목 제외, {elapsed:.3f}s)")
+        return not failed, failed, message
+
+
+class SnapshotThread(QThread):
+    """스냅샷 읽기/복원 백그라운드 스레드 (mode: 'capture' 또는 'restore')"""
+
+    snapshot_finished = pyqtSignal(bool, str, object)  # 성공 여부, 메시지, DeviceSnapshot(capture) 또는 실패 목록(restore)
+
+    def __init__(self, engine, mode, snapshot=None, force_full=False, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.mode = mode
+        self.snapshot = snapshot
+        self.force_full = force_full
+
+    def run(self):
+        try:
+            if self.mode == "capture":
+                success, snapshot, message = self.engine.capture()
+                self.snapshot_finished.emit(success, message, snapshot)
+            else:
+                success, failed, message = self.engine.restore(self.snapshot, force_full=self.force_full)
+                self.snapshot_finished.emit(success, message, failed)
+        except Exception as e:
+            self.snapshot_finished.emit(False, f"스냅샷 처리 오류: {e}", None if self.mode == "capture" else [])
@@ -6,6 +6,7 @@ Log Manager Module
 import datetime
 from PyQt5.QtWidgets import QTextEdit
 from PyQt5.QtGui import QTextCursor
+from perf_monitor import monitor
 
 
 class LogManager:
@@ -41,6 +42,7 @@ class LogManager:
     
     def write_log(self, message, color="white"):
         """로그 메시지 작성 - 시인성 개선"""
+        span = monitor.begin()
         timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
         
         # 메시지 타입별 포맷팅
@@ -67,6 +69,7 @@ class LogManager:
             self.log.moveCursor(QTextCursor.End)
         except Exception as e:
             print(f"[LOG_ERROR] {timestamp} {message} (Error: {e})")
+        monitor.end("log", span)
     
     def _format_send_message(self, timestamp, message):
         """전송 메시지 포맷팅 - 정렬 개선"""
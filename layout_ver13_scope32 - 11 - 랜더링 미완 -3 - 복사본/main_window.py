@@ -6,7 +6,6 @@ Refactored Main Window Module
 import sys
 import datetime
 import time
-import webbrowser
 import os
 
 from collections import deque
@@ -23,12 +22,15 @@ from plot_manager import PlotManager
 from tuning_controller import TuningController
 from log_manager import LogManager
 #from oscilloscope_dialog import OscilloscopeDialog
-from osc import OscilloscopeDialog
+# 오실로스코프/개발자/튜닝 트레이스/명령어 리포트 다이얼로그는 첫 사용 시 import (시작 시간 단축)
 from status_monitor_dialog import StatusMonitorDialog  
-from settings_dialog import SettingsDialog, SettingsManager # 새로 추가
+from perf_monitor_dialog import PerfMonitorDialog
+import metrics_exporter
+from command_journal import journal
+from settings_dialog import SettingsDialog, get_settings_manager # 공용 SettingsManager
+from startup_profiler import profiler
 # 기존 모듈들
-from data_manager import DataManager, TuningSettingsManager, ConfigManager
-from developer_dialog import DeveloperDialog
+from data_manager import DataManager, TuningSettingsManager, ConfigManager, DATA_DIR
 
 class MainWindow(QMainWindow):
     """메인 윈도우 클래스 - 컴포넌트 조립자"""
@@ -37,19 +39,24 @@ class MainWindow(QMainWindow):
         super().__init__()
         
         # 1단계: 기본 설정
-        self.init_basic_settings()
+        with profiler.span("MainWindow.init_basic_settings"):
+            self.init_basic_settings()
         
         # 2단계: 데이터 관리자들 초기화
-        self.init_managers()
+        with profiler.span("MainWindow.init_managers"):
+            self.init_managers()
         
         # 3단계: 컴포넌트들 초기화
-        self.init_components()
+        with profiler.span("MainWindow.init_components"):
+            self.init_components()
         
         # 4단계: UI 생성
-        self.init_ui()
+        with profiler.span("MainWindow.init_ui"):
+            self.init_ui()
         
         # 5단계: 통신 및 타이머 시작
-        self.init_communication()
+        with profiler.span("MainWindow.init_communication"):
+            self.init_communication()
         
         # 6단계: 설정 매니저 초기화 (init_managers 메서드에 추가)
         #self.settings_manager = SettingsManager()
@@ -94,6 +101,10 @@ class MainWindow(QMainWindow):
         self.applying_power = False  #251103✅ 추가
         self.oscilloscope_dialog = None
         self.status_monitor_dialog = None  # 새로 추가
+        self.tuning_trace_dialog = None
+        self.perf_monitor_dialog = None
+        self.metrics_server = None
+        self.command_journal_dialog = None
         
         # 플롯 설정
         self.selected_plots = [
@@ -123,7 +134,7 @@ class MainWindow(QMainWindow):
         self.data_manager = DataManager()
         self.tuning_manager = TuningSettingsManager()
         self.config_manager = ConfigManager()
-        self.settings_manager = SettingsManager() # yuri 추가
+        self.settings_manager = get_settings_manager() # yuri 추가 (공용 인스턴스)
         
         # 튜닝 설정 로드
         success, self.tuning_settings, msg = self.tuning_manager.load_settings()
@@ -448,6 +459,20 @@ class MainWindow(QMainWindow):
         self.data_process_timer = QTimer(self)
         self.data_process_timer.timeout.connect(self.data_processor.process_data_queue)
         self.data_process_timer.start(interval_ms)
+        
+        # 메트릭 HTTP 엔드포인트 (설정에서 켠 경우만)
+        self.metrics_server, msg = metrics_exporter.start_from_settings(self.settings_manager.settings)
+        if msg:
+            self.log_manager.write_log(f"[INFO] {msg}" if self.metrics_server else f"[WARNING] {msg}",
+                                       "cyan" if self.metrics_server else "yellow")
+        
+        # 명령어 지연 기록 (주기적 디스크 저장)
+        jc = self.settings_manager.settings.get("command_journal", {})
+        journal.configure(directory=DATA_DIR, capacity=jc.get("capacity", 20000),
+                          flush_interval=jc.get("flush_interval_s", 10),
+                          include_polls=jc.get("include_status_polls", False), enabled=jc.get("enabled", True))
+        if journal.enabled:
+            journal.start_autoflush()
     
     def apply_styles(self):
         """스타일 적용 - 상태 테이블 색상 강화"""
@@ -675,10 +700,23 @@ class MainWindow(QMainWindow):
         """튜닝 설정 다이얼로그 표시"""
         self.tuning_controller.show_tuning_dialog()
     
+    def save_device_snapshot(self):
+        """장비 설정 스냅샷 저장"""
+        self.tuning_controller.save_device_snapshot()
+    
+    def restore_device_snapshot(self):
+        """장비 설정 스냅샷 복원"""
+        self.tuning_controller.restore_device_snapshot()
+    
+    def run_recipe(self):
+        """레시피 실행/중단"""
+        self.tuning_controller.run_recipe()
+    
     def show_oscilloscope(self):
         """오실로스코프 다이얼로그 표시"""
         try:
             if self.oscilloscope_dialog is None or not self.oscilloscope_dialog.isVisible():
+                from osc import OscilloscopeDialog
                 self.oscilloscope_dialog = OscilloscopeDialog(self)
                 
                 # OSC 열린 직후 설정 적용
@@ -722,6 +760,47 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.log_manager.write_log(f"[ERROR] 상태 모니터 다이얼로그 열기 실패: {e}", "red")
     
+    def show_tuning_trace(self):
+        """주파수 튜닝 트레이스 다이얼로그 표시"""
+        try:
+            if self.tuning_trace_dialog is None or not self.tuning_trace_dialog.isVisible():
+                from tuning_trace_dialog import TuningTraceDialog
+                self.tuning_trace_dialog = TuningTraceDialog(self)
+                self.tuning_trace_dialog.show()
+                self.log_manager.write_log("[INFO] 튜닝 트레이스 다이얼로그 열림", "cyan")
+            else:
+                self.tuning_trace_dialog.raise_()
+                self.tuning_trace_dialog.activateWindow()
+        except Exception as e:
+            self.log_manager.write_log(f"[ERROR] 튜닝 트레이스 다이얼로그 열기 실패: {e}", "red")
+    
+    def show_command_journal(self):
+        """명령어 지연 리포트 다이얼로그 표시"""
+        try:
+            if self.command_journal_dialog is None or not self.command_journal_dialog.isVisible():
+                from command_journal_dialog import CommandJournalDialog
+                self.command_journal_dialog = CommandJournalDialog(self)
+                self.command_journal_dialog.show()
+                self.log_manager.write_log("[INFO] 명령어 지연 리포트 열림", "cyan")
+            else:
+                self.command_journal_dialog.raise_()
+                self.command_journal_dialog.activateWindow()
+        except Exception as e:
+            self.log_manager.write_log(f"[ERROR] 명령어 지연 리포트 열기 실패: {e}", "red")
+    
+    def show_perf_monitor(self):
+        """성능 모니터 다이얼로그 표시 (단계별 지연/처리량)"""
+        try:
+            if self.perf_monitor_dialog is None or not self.perf_monitor_dialog.isVisible():
+                self.perf_monitor_dialog = PerfMonitorDialog(self)
+                self.perf_monitor_dialog.show()
+                self.log_manager.write_log("[INFO] 성능 모니터 다이얼로그 열림", "cyan")
+            else:
+                self.perf_monitor_dialog.raise_()
+                self.perf_monitor_dialog.activateWindow()
+        except Exception as e:
+            self.log_manager.write_log(f"[ERROR] 성능 모니터 다이얼로그 열기 실패: {e}", "red")
+    
     def save_excel(self):
         """엑셀 저장"""
         success, msg = self.data_manager.save_excel()
@@ -771,6 +850,7 @@ class MainWindow(QMainWindow):
             if os.path.exists(manual_path):
                 # 파일을 절대 경로로 변환하고 브라우저로 열기
                 manual_url = 'file:///' + os.path.abspath(manual_path).replace('\\', '/')
+                import webbrowser
                 webbrowser.open(manual_url)
                 self.log_manager.write_log("[INFO] 웹 매뉴얼 열기 성공", "cyan")
             else:
@@ -863,10 +943,7 @@ class MainWindow(QMainWindow):
                     try:
                         osc_view = self.oscilloscope_dialog.oscilloscope_view
                         osc_view.plot_widget.sample_interval = osc_sample
-                        osc_view.status_update_interval = osc_timer
-                        
-                        if osc_view.status_timer.isActive():
-                            osc_view.status_timer.setInterval(osc_timer)
+                        osc_view.set_ingest_interval(osc_timer)
                     except Exception as e:
                         self.log_manager.write_log(f"[WARNING] OSC 설정 적용 실패: {e}", "yellow")
             
@@ -924,6 +1001,8 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'status_monitor_dialog') and self.status_monitor_dialog:
                 if hasattr(self.status_monitor_dialog, 'stop_timer'):
                     self.status_monitor_dialog.stop_timer()
+            if self.perf_monitor_dialog:
+                self.perf_monitor_dialog.stop_timer()
             
             # 2. 네트워크 통신 스레드 안전 종료 요청 및 대기
             self.log_manager.write_log("[INFO] 네트워크 통신 스레드 종료 요청...", "red")
@@ -935,6 +1014,13 @@ class MainWindow(QMainWindow):
             self.network_manager.wait_for_client_thread_termination() 
             self.log_manager.write_log("[INFO] 네트워크 스레드 종료 완료.", "red")
             
+            if self.metrics_server:
+                self.metrics_server.stop()
+            if journal.enabled:
+                success, _, msg = journal.stop_autoflush()
+                if not success:
+                    self.log_manager.write_log(f"[WARNING] {msg}", "yellow")
+            
             # 3. 도킹 상태 저장
             self.dock_manager.save_state()
             
@@ -966,7 +1052,7 @@ class MainWindow(QMainWindow):
             
     def show_developer_dialog(self):
         """Developer Tools 다이얼로그 표시"""
-        #from developer_dialog import DeveloperDialog
+        from developer_dialog import DeveloperDialog
         
         # 다이얼로그가 없거나 닫혔으면 새로 생성
         if not hasattr(self, 'developer_dialog') or self.developer_dialog is None:
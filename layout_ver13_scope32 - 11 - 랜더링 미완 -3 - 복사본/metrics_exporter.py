@@ -0,0 +1,285 @@
+"""
+Metrics Exporter Module
+로컬 메트릭 HTTP 엔드포인트 (Prometheus 텍스트 형식) - 운영 스테이션 모니터링용
+- 수집: 각 스레드가 미리 집계된 카운터/게이지/히스토그램을 갱신 (꺼져 있으면 바로 반환)
+- 제공: 백그라운드 스레드 HTTP 서버가 집계값만 읽음 (GUI 스레드 접근 없음)
+
+설정 (gui_settings.json):
+    "metrics_exporter": {"enabled": true, "host": "127.0.0.1", "port": 9464}
+
+사용 예:
+    from metrics_exporter import metrics
+    metrics.inc("rf_frames_received_total")
+    metrics.observe("rf_poll_rtt_seconds", rtt)
+    curl http://127.0.0.1:9464/metrics
+"""
+
+import time
+import bisect
+import threading
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 9464
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 메트릭 정의: 이름 -> (유형, 설명, 히스토그램 구간)
+METRICS = {
+    "rf_frames_received_total": ("counter", "상태 응답 프레임 수신 수", None),
+    "rf_frames_dropped_total": ("counter", "상태 응답 프레임 손실 수 (reason: timeout/socket_error/queue_full)", None),
+    "rf_poll_rtt_seconds": ("histogram", "상태 요청 전송부터 응답 프레임 수신까지 시간", LATENCY_BUCKETS),
+    "rf_command_latency_seconds": ("histogram", "명령어 실행 시간 (연결~응답, CMD별)", LATENCY_BUCKETS),
+    "rf_commands_total": ("counter", "명령어 실행 수 (CMD, 결과별)", None),
+    "rf_reconnect_attempts_total": ("counter", "상태조회 소켓 재연결 시도 (result: success/failure)", None),
+    "rf_reconnect_exhausted_total": ("counter", "재연결 최대 시도 횟수 초과 수", None),
+    "rf_connected": ("gauge", "상태조회 연결 상태 (1=정상)", None),
+    "rf_queue_depth": ("gauge", "큐 길이 (command/data/scope_pending/scope_buffer)", None),
+    "rf_render_frames_total": ("counter", "렌더링 프레임 수 (view별)", None),
+    "rf_render_fps": ("gauge", "직전 1초 렌더링 프레임 수 (view별)", None),
+    "rf_telemetry_value": ("gauge", "최근 상태값 (field별, 장비 단위)", None),
+    "rf_telemetry_timestamp_seconds": ("gauge", "최근 상태값 수신 시각 (Unix)", None),
+}
+
+TELEMETRY_FIELDS = [
+    "rf_on_off", "set_power", "forward_power", "reflect_power", "delivery_power", "frequency",
+    "gamma", "real_gamma", "image_gamma", "rf_phase", "temperature", "alarm_state",
+]
+
+
+class BucketHistogram:
+    """고정 구간 누적 히스토그램 (Prometheus le 구간)"""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def copy(self):
+        other = BucketHistogram(self.bounds)
+        other.counts = list(self.counts)
+        other.sum, other.count = self.sum, self.count
+        return other
+
+
+class RateMeter:
+    """초당 발생 수 (직전 1초 구간)"""
+
+    def __init__(self):
+        self.second = 0
+        self.second_count = 0
+        self.rate = 0
+
+    def tick(self, second):
+        if second != self.second:
+            self.rate = self.second_count if second == self.second + 1 else 0
+            self.second = second
+            self.second_count = 0
+        self.second_count += 1
+
+    def current(self, second):
+        if second == self.second:
+            return self.rate
+        if second == self.second + 1:
+            return self.second_count
+        return 0
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels, extra=None):
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    text = ",".join(f'{key}="{_escape(value)}"' for key, value in items)
+    return "{" + text + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """미리 집계된 메트릭 저장소 - enabled가 False면 갱신하지 않음"""
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._values = {}      # (이름, 레이블) -> 값 (counter/gauge)
+            self._histograms = {}  # (이름, 레이블) -> BucketHistogram
+            self._meters = {}      # 레이블 -> RateMeter (rf_render_fps)
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_many(self, name, values, label):
+        """같은 메트릭의 여러 레이블 값을 한 번에 (예: field별 상태값)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            for label_value, value in values.items():
+                self._values[(name, ((label, label_value),))] = value
+
+    def observe(self, name, value, **labels):
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = BucketHistogram(METRICS[name][2] or LATENCY_BUCKETS)
+            histogram.observe(value)
+
+    def tick_render(self, view):
+        """렌더링 1프레임 (rf_render_frames_total + rf_render_fps)"""
+        if not self.enabled:
+            return
+        labels = (("view", view),)
+        with self._lock:
+            meter = self._meters.get(labels)
+            if meter is None:
+                meter = self._meters[labels] = RateMeter()
+            meter.tick(int(time.monotonic()))
+            key = ("rf_render_frames_total", labels)
+            self._values[key] = self._values.get(key, 0) + 1
+
+    def record_status(self, status):
+        """최근 상태값 갱신 (상태 응답 파싱 결과)"""
+        if not self.enabled:
+            return
+        self.set_many("rf_telemetry_value", {field: status[field] for field in TELEMETRY_FIELDS if field in status},
+                      "field")
+        self.set("rf_telemetry_timestamp_seconds", time.time())
+
+    def render(self):
+        """Prometheus 텍스트 형식 (잠금 안에서는 복사만)"""
+        second = int(time.monotonic())
+        with self._lock:
+            values = dict(self._values)
+            histograms = {key: h.copy() for key, h in self._histograms.items()}
+            for labels, meter in self._meters.items():
+                values[("rf_render_fps", labels)] = meter.current(second)
+
+        lines = []
+        for name, (kind, help_text, _) in METRICS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "histogram":
+                for (metric, labels), h in sorted(histograms.items()):
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, n in zip(list(h.bounds) + [float("inf")], h.counts):
+                        cumulative += n
+                        lines.append(f"{name}_bucket{_format_labels(labels, ('le', _format_value(float(bound))))} "
+                                     f"{cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(h.sum)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+            else:
+                for (metric, labels), value in sorted(values.items(), key=lambda item: repr(item[0])):
+                    if metric == name:
+                        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+# 전역 레지스트리 (앱 전체 공유)
+metrics = MetricsRegistry()
+
+
+# ========================================
+# HTTP 서버
+# ========================================
+def _make_handler(registry):
+    """요청 핸들러 클래스 (http.server는 서버를 켤 때만 로드)"""
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 스크랩마다 콘솔 출력 안 함
+
+    return MetricsHandler
+
+
+class MetricsServer:
+    """백그라운드 스레드 메트릭 서버"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, registry=metrics):
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self.httpd = None
+        self.thread = None
+
+    def start(self):
+        """서버 시작 - 반환: (성공 여부, 메시지)"""
+        if self.httpd:
+            return True, f"메트릭 서버 실행 중: http://{self.host}:{self.port}/metrics"
+        from http.server import ThreadingHTTPServer
+        try:
+            self.httpd = ThreadingHTTPServer((self.host, self.port), _make_handler(self.registry))
+        except OSError as e:
+            return False, f"메트릭 서버 시작 실패 ({self.host}:{self.port}): {e}"
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self.registry.enabled = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="MetricsServer", daemon=True)
+        self.thread.start()
+        return True, f"메트릭 서버 시작: http://{self.host}:{self.port}/metrics"
+
+    def stop(self):
+        if not self.httpd:
+            return
+        self.registry.enabled = False
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.httpd = None
+        self.thread = None
+
+
+def start_from_settings(settings):
+    """설정의 metrics_exporter 항목으로 서버 시작 - 반환: (서버 또는 None, 메시지)"""
+    config = settings.get("metrics_exporter", {})
+    if not config.get("enabled", False):
+        return None, ""
+    server = MetricsServer(config.get("host", DEFAULT_HOST), int(config.get("port", DEFAULT_PORT)))
+    success, message = server.start()
+    return (server if success else None), message
@@ -6,6 +6,7 @@ Network Manager Module
 import struct
 import time
 from rf_protocol import RFClientThread, RFProtocol
+from device_config_cache import DeviceConfigCache
 
 
 class NetworkManager:
@@ -14,6 +15,7 @@ class NetworkManager:
     def __init__(self, parent):
         self.parent = parent
         self.client_thread = None
+        self.config_cache = DeviceConfigCache()  # 장비 설정 캐시 (변경분 적용용)
         
     def init_communication(self):
         """통신 스레드 및 타이머 초기화"""
@@ -39,6 +41,7 @@ class NetworkManager:
             ip = self.parent.tuning_settings["IP Address"]
             port = 5000
             self.stop_client()
+            self.config_cache.invalidate()
             
             self.client_thread = RFClientThread(host=ip, port=port)
             self.client_thread.parent = self.parent
@@ -135,6 +138,8 @@ class NetworkManager:
         """연결 성공 이벤트"""
         self.parent.sample_count = 0
         self.parent.start_time = time.time()
+        # 다른 장비이거나 재부팅되었을 수 있으므로 설정 캐시 무효화
+        self.config_cache.invalidate()
         self.parent.log_manager.write_log("[INFO] 서버 연결 성공 - 타이머 리셋", "cyan")
     
     def on_connection_failed(self, message):
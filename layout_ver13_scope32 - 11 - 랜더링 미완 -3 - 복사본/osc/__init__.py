@@ -5,9 +5,29 @@ Oscilloscope Module
 
 from .oscilloscope_dialog import OscilloscopeDialog
 from .adc_dac_data_source import AdcDacDataSource, StatusDataSource
+from .spectrum_analyzer import SpectrumAnalyzer
+from .math_channels import MathChannelEngine
+from .lod_pyramid import MinMaxPyramid
+from .sample_ring import SampleRing
+from .capture_export import load_capture, write_capture
+from .data_sources import (
+    ScopeDataSource, StatusScopeSource, AdcDacScopeSource,
+    ReplayScopeSource, SimulatedScopeSource
+)
 
 __all__ = [
     'OscilloscopeDialog',
     'AdcDacDataSource',
     'StatusDataSource',
+    'SpectrumAnalyzer',
+    'MathChannelEngine',
+    'MinMaxPyramid',
+    'SampleRing',
+    'load_capture',
+    'write_capture',
+    'ScopeDataSource',
+    'StatusScopeSource',
+    'AdcDacScopeSource',
+    'ReplayScopeSource',
+    'SimulatedScopeSource',
 ]
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+Capture Export Module
+오실로스코프 캡처 저장/불러오기 - NPZ, raw(JSON 헤더 + memmap 가능 바이너리), CSV
+"""
+
+import os
+import json
+import datetime
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+CAPTURE_FORMAT_VERSION = 1
+EXPORT_FORMATS = ["npz", "raw"]
+
+
+def snapshot_capture(plot_widget):
+    """
+    UnifiedPlotWidget의 현재 레코드를 배열로 복사 (GUI 스레드에서 호출)
+    반환: (time, data, header)
+    - 비트리거 모드: float64 원시 버퍼(history)의 최근 total_time 구간
+      (LOD 이력은 float32 표시용 사본이므로 저장에 사용하지 않음)
+    - 트리거 모드: 현재 표시 중인 pre/post 스윕
+    """
+    if plot_widget.trigger_settings is None and len(plot_widget.history) > 0:
+        time_array = plot_widget.history.times.copy()
+        data = plot_widget.history.data.T.copy()
+    else:
+        time_array = np.asarray(plot_widget.display_time, dtype=np.float64)
+        columns = [
+            np.asarray(plot_widget.display_channel_data[i], dtype=np.float64)
+            for i in range(plot_widget.num_channels)
+        ]
+        if any(len(col) != len(time_array) for col in columns):
+            columns = [np.zeros(len(time_array)) for _ in columns]
+        data = np.column_stack(columns) if len(time_array) else np.empty((0, plot_widget.num_channels))
+
+    header = {
+        "version": CAPTURE_FORMAT_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec='seconds'),
+        "samples": int(len(time_array)),
+        "channels": int(plot_widget.num_channels),
+        "channel_names": list(plot_widget.channel_names),
+        "channel_units": list(plot_widget.channel_units),
+        "active_channels": [bool(a) for a in plot_widget.active_channels],
+        "sample_interval": float(plot_widget.sample_interval),
+        "timebase": {
+            "total_time": float(plot_widget.total_time),
+            "pre_time": float(plot_widget.pre_time),
+            "post_time": float(plot_widget.post_time),
+        },
+        "trigger": {
+            "mode": plot_widget.trigger_mode,
+            "settings": plot_widget.trigger_settings,
+            "triggered": bool(plot_widget.triggered),
+        },
+    }
+    return time_array, data, header
+
+
+def write_capture(path, time_array, data, header, fmt="npz", write_csv=False):
+    """
+    캡처 파일 저장 - 반환: 생성된 파일 목록
+    npz: time, data, header(JSON 문자열)
+    raw: <base>.json 헤더 + <base>.bin (float64, [time, ch...] 행 단위)
+    """
+    base, _ = os.path.splitext(path)
+    files = []
+
+    if fmt == "npz":
+        npz_path = base + ".npz"
+        np.savez(npz_path, time=time_array, data=data, header=np.array(json.dumps(header)))
+        files.append(npz_path)
+    elif fmt == "raw":
+        bin_path = base + ".bin"
+        json_path = base + ".json"
+        matrix = np.empty((len(time_array), data.shape[1] + 1), dtype='<f8')
+        matrix[:, 0] = time_array
+        matrix[:, 1:] = data
+        matrix.tofile(bin_path)
+        raw_header = dict(header)
+        raw_header.update({
+            "data_file": os.path.basename(bin_path),
+            "dtype": "<f8",
+            "shape": list(matrix.shape),
+            "columns": ["time"] + list(header["channel_names"]),
+        })
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(raw_header, f, ensure_ascii=False, indent=2)
+        files.extend([json_path, bin_path])
+    else:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+
+    if write_csv:
+        csv_path = base + ".csv"
+        names = ["Time(s)"] + [
+            f"{name} ({unit})" if unit else name
+            for name, unit in zip(header["channel_names"], header["channel_units"])
+        ]
+        with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+            f.write(",".join(names) + "\n")
+            np.savetxt(f, np.column_stack((time_array, data)), delimiter=",", fmt="%.6g")
+        files.append(csv_path)
+
+    return files
+
+
+def load_capture(path, mmap=True):
+    """캡처 파일 로드 - 반환: (time, data, header), raw는 memmap으로 열기 가능"""
+    base, ext = os.path.splitext(path)
+    if ext == ".npz":
+        with np.load(path, allow_pickle=False) as npz:
+            header = json.loads(str(npz["header"]))
+            return npz["time"], npz["data"], header
+
+    json_path = base + ".json"
+    with open(json_path, 'r', encoding='utf-8') as f:
+        header = json.load(f)
+    bin_path = os.path.join(os.path.dirname(json_path), header["data_file"])
+    shape = tuple(header["shape"])
+    if mmap:
+        matrix = np.memmap(bin_path, dtype=header["dtype"], mode='r', shape=shape)
+    else:
+        matrix = np.fromfile(bin_path, dtype=header["dtype"]).reshape(shape)
+    return matrix[:, 0], matrix[:, 1:], header
+
+
+class CaptureExportThread(QThread):
+    """캡처 저장 백그라운드 스레드"""
+
+    export_finished = pyqtSignal(bool, str)
+
+    def __init__(self, path, time_array, data, header, fmt="npz", write_csv=False, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.time_array = time_array
+        self.data = data
+        self.header = header
+        self.fmt = fmt
+        self.write_csv = write_csv
+
+    def run(self):
+        try:
+            files = write_capture(self.path, self.time_array, self.data, self.header,
+                                  self.fmt, self.write_csv)
+            self.export_finished.emit(True, f"캡처 저장 완료 ({self.header['samples']} samples): {', '.join(files)}")
+        except Exception as e:
+            self.export_finished.emit(False, f"캡처 저장 실패: {e}")
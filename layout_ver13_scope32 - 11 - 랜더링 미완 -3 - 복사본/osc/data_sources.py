@@ -0,0 +1,241 @@
+"""
+Scope Data Sources Module
+오실로스코프 데이터 소스 플러그인 - 모든 소스는 (timestamps, values) NumPy 블록을 전달
+"""
+
+import time
+import numpy as np
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from .adc_dac_data_source import AdcDacDataSource
+from .capture_export import load_capture
+from metrics_exporter import metrics
+
+RAW_CHANNEL_COUNT = 9  # 스코프 원시 채널 수 (부족한 채널은 0으로 채움)
+PENDING_INITIAL_SIZE = 256  # 샘플 적재 배열 초기 크기 (필요 시 2배씩 증가)
+
+# Status 딕셔너리 → 채널 순서
+STATUS_CHANNEL_KEYS = [
+    "forward_power", "reflect_power", "delivery_power", "frequency",
+    "gamma", "real_gamma", "image_gamma", "rf_phase", "temperature"
+]
+
+
+class ScopeDataSource(QObject):
+    """
+    데이터 소스 기본 클래스
+    - block_ready(timestamps (n,), values (n x 9)) 로 블록 단위 전달
+    - 샘플 단위 생산자는 push_sample()로 미리 할당한 배열에 쌓고 flush 타이머가 블록으로 묶어 전달
+    """
+
+    block_ready = pyqtSignal(object, object)
+
+    name = "Base"
+    short_names = [f"CH {i+1}" for i in range(RAW_CHANNEL_COUNT)]
+    channel_names = [f"Channel {i+1}" for i in range(RAW_CHANNEL_COUNT)]
+    channel_units = [""] * RAW_CHANNEL_COUNT
+
+    def __init__(self, flush_interval_ms=50):
+        super().__init__()
+        self.flush_interval_ms = flush_interval_ms
+        self.is_running = False
+        self._pending_times = np.empty(PENDING_INITIAL_SIZE, dtype=np.float64)
+        self._pending_rows = np.zeros((PENDING_INITIAL_SIZE, RAW_CHANNEL_COUNT), dtype=np.float64)
+        self._pending_count = 0
+        self._flush_timer = QTimer()
+        self._flush_timer.timeout.connect(self.flush)
+
+    def start(self):
+        """데이터 수집 시작 - 성공 여부 반환"""
+        self._pending_count = 0
+        self.is_running = True
+        self._flush_timer.start(self.flush_interval_ms)
+        return True
+
+    def stop(self):
+        """데이터 수집 중지"""
+        self.is_running = False
+        self._flush_timer.stop()
+        self._pending_count = 0
+
+    def set_interval(self, interval_ms):
+        """블록 전달 주기 변경"""
+        self.flush_interval_ms = interval_ms
+        if self.is_running:
+            self._flush_timer.start(interval_ms)
+
+    def push_sample(self, values, timestamp=None):
+        """샘플 하나 적재 (다음 flush 때 블록으로 전달)"""
+        if not self.is_running:
+            return
+        index = self._pending_count
+        if index == self._pending_times.shape[0]:
+            self._pending_times = np.concatenate((self._pending_times, np.empty(index)))
+            self._pending_rows = np.vstack((self._pending_rows, np.zeros((index, RAW_CHANNEL_COUNT))))
+        n = min(len(values), RAW_CHANNEL_COUNT)
+        self._pending_times[index] = time.time() if timestamp is None else timestamp
+        self._pending_rows[index, :n] = values[:n]
+        self._pending_rows[index, n:] = 0
+        self._pending_count = index + 1
+
+    def push_block(self, timestamps, values):
+        """블록 즉시 전달 - 채널 수가 부족하면 0으로 채움"""
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2 or values.shape[0] == 0:
+            return
+        if values.shape[1] < RAW_CHANNEL_COUNT:
+            pad = np.zeros((values.shape[0], RAW_CHANNEL_COUNT - values.shape[1]))
+            values = np.hstack((values, pad))
+        elif values.shape[1] > RAW_CHANNEL_COUNT:
+            values = values[:, :RAW_CHANNEL_COUNT]
+        self.block_ready.emit(np.asarray(timestamps, dtype=np.float64), values)
+
+    def flush(self):
+        """적재된 샘플을 블록으로 전달"""
+        count = self._pending_count
+        metrics.set("rf_queue_depth", count, queue="scope_pending")
+        if not count:
+            return
+        self._pending_count = 0
+        self.push_block(self._pending_times[:count].copy(), self._pending_rows[:count].copy())
+
+
+class StatusScopeSource(ScopeDataSource):
+    """Status 데이터 소스 (메인 윈도우 상태 수신)"""
+
+    name = "Status Data"
+    short_names = ["Fwd Pwr", "Ref Pwr", "Del Pwr", "Frequency",
+                   "Gamma", "R Gamma", "I Gamma", "RF Phase", "Temp"]
+    channel_names = ["Forward Power", "Reflect Power", "Delivery Power", "Frequency",
+                     "Gamma", "Real Gamma", "Image Gamma", "RF Phase", "Temperature"]
+    channel_units = ["W", "W", "W", "MHz", "", "", "", "°", "°C"]
+
+    def update_data(self, status_data):
+        """외부에서 호출되는 Status 데이터"""
+        self.push_sample([status_data.get(key, 0) for key in STATUS_CHANNEL_KEYS])
+
+
+class AdcDacScopeSource(ScopeDataSource):
+    """ADC/DAC Raw 데이터 소스 (장비 폴링)"""
+
+    name = "ADC Raw"
+    short_names = ["ADC 0", "ADC 1", "ADC 2", "ADC 3",
+                   "ADC 4", "ADC 5", "ADC 6", "ADC 7", "Reserved"]
+    channel_names = ["ADC Channel 0", "ADC Channel 1", "ADC Channel 2", "ADC Channel 3",
+                     "ADC Channel 4", "ADC Channel 5", "ADC Channel 6", "ADC Channel 7",
+                     "Reserved"]
+    channel_units = ["LSB"] * 8 + ["-"]
+
+    def __init__(self, network_manager, poll_interval_ms=100, flush_interval_ms=100):
+        super().__init__(flush_interval_ms)
+        self.poller = AdcDacDataSource(network_manager, interval_ms=poll_interval_ms)
+        self.poller.data_ready.connect(self.push_sample)
+
+    def start(self):
+        super().start()
+        if not self.poller.start():
+            super().stop()
+            return False
+        return True
+
+    def stop(self):
+        self.poller.stop()
+        super().stop()
+
+
+class ReplayScopeSource(ScopeDataSource):
+    """캡처 파일 재생 소스 (원래 타이밍 또는 배속)"""
+
+    name = "Replay File"
+
+    def __init__(self, path, speed=1.0, flush_interval_ms=50):
+        super().__init__(flush_interval_ms)
+        self.path = path
+        self.speed = speed
+        time_array, data, header = load_capture(path)
+        self._time = np.asarray(time_array, dtype=np.float64)
+        self._time = self._time - self._time[0] if len(self._time) else self._time
+        self._data = data
+        self._position = 0
+        self._start_clock = None
+
+        names = header.get("channel_names", [])[:RAW_CHANNEL_COUNT]
+        units = header.get("channel_units", [])[:RAW_CHANNEL_COUNT]
+        if len(names) == RAW_CHANNEL_COUNT:
+            self.channel_names = list(names)
+            self.short_names = [name[:9] for name in names]
+        if len(units) == RAW_CHANNEL_COUNT:
+            self.channel_units = list(units)
+
+    def start(self):
+        super().start()
+        self._position = 0
+        self._start_clock = time.monotonic()
+        return len(self._time) > 0
+
+    def flush(self):
+        """경과 시간까지의 샘플을 한 블록으로 전달"""
+        if not self.is_running or self._start_clock is None:
+            return
+        elapsed = (time.monotonic() - self._start_clock) * self.speed
+        end = int(np.searchsorted(self._time, elapsed, side='right'))
+        if end > self._position:
+            block = self._data[self._position:end]
+            self.push_block(self._time[self._position:end], block)
+            self._position = end
+        if self._position >= len(self._time):
+            self.stop()
+
+
+class SimulatedScopeSource(ScopeDataSource):
+    """시뮬레이션 소스 - 재현 가능한 RNG로 Status 형태 블록 생성"""
+
+    name = "Simulated"
+    short_names = StatusScopeSource.short_names
+    channel_names = StatusScopeSource.channel_names
+    channel_units = StatusScopeSource.channel_units
+
+    def __init__(self, sample_interval=0.05, flush_interval_ms=50, seed=0,
+                 set_power=1000.0, ripple_hz=0.5):
+        super().__init__(flush_interval_ms)
+        self.sample_interval = sample_interval
+        self.seed = seed
+        self.set_power = set_power
+        self.ripple_hz = ripple_hz
+        self._rng = np.random.default_rng(seed)
+        self._sample_index = 0
+        self._start_clock = None
+
+    def start(self):
+        super().start()
+        self._rng = np.random.default_rng(self.seed)
+        self._sample_index = 0
+        self._start_clock = time.monotonic()
+        return True
+
+    def flush(self):
+        """경과 시간만큼의 샘플을 벡터 연산으로 생성"""
+        if not self.is_running or self._start_clock is None:
+            return
+        target = int((time.monotonic() - self._start_clock) / self.sample_interval)
+        n = target - self._sample_index
+        if n <= 0:
+            return
+
+        t = (self._sample_index + np.arange(n)) * self.sample_interval
+        self._sample_index = target
+        noise = self._rng.standard_normal((n, 5))
+
+        forward = self.set_power * (1 + 0.01 * np.sin(2 * np.pi * self.ripple_hz * t)) + 2.0 * noise[:, 0]
+        real_gamma = 0.05 + 0.005 * noise[:, 1]
+        image_gamma = 0.02 + 0.005 * noise[:, 2]
+        gamma = np.hypot(real_gamma, image_gamma)
+        reflect = forward * gamma ** 2
+        delivery = forward - reflect
+        frequency = np.full(n, 13.56) + 0.0005 * noise[:, 3]
+        phase = np.degrees(np.arctan2(image_gamma, real_gamma))
+        temperature = 35.0 + 0.001 * t + 0.05 * noise[:, 4]
+
+        values = np.column_stack((forward, reflect, delivery, frequency,
+                                  gamma, real_gamma, image_gamma, phase, temperature))
+        self.push_block(t, values)
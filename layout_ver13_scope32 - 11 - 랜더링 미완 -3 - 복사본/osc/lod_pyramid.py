@@ -0,0 +1,203 @@
+"""
+LOD Pyramid Module
+긴 타임베이스용 다해상도 min/max 피라미드 - 화면 픽셀당 약 2포인트만 렌더링
+"""
+
+import numpy as np
+
+LOD_FACTOR = 8          # 레벨 간 축소 배율 (1x, 8x, 64x, ...)
+LOD_INITIAL_SIZE = 1024  # 배열 초기 크기 (필요 시 2배씩 증가)
+
+
+def _grow(array, needed):
+    """needed 행 이상을 담을 수 있도록 배열 확장 (기존 데이터 유지)"""
+    if needed <= array.shape[0]:
+        return array
+    size = max(needed, array.shape[0] * 2)
+    grown = np.empty((size,) + array.shape[1:], dtype=array.dtype)
+    grown[:array.shape[0]] = array
+    return grown
+
+
+class _LodLevel:
+    """피라미드 한 레벨 (버킷 시작 시간, 채널별 min/max)"""
+
+    def __init__(self, channel_count):
+        self.count = 0
+        self.time = np.empty(LOD_INITIAL_SIZE, dtype=np.float64)
+        self.min = np.empty((LOD_INITIAL_SIZE, channel_count), dtype=np.float32)
+        self.max = np.empty((LOD_INITIAL_SIZE, channel_count), dtype=np.float32)
+
+    def extend(self, times, mins, maxs):
+        n = self.count + len(times)
+        if n > self.time.shape[0]:
+            self.time = _grow(self.time, n)
+            self.min = _grow(self.min, n)
+            self.max = _grow(self.max, n)
+        self.time[self.count:n] = times
+        self.min[self.count:n] = mins
+        self.max[self.count:n] = maxs
+        self.count = n
+
+    def drop_front(self, count):
+        keep = self.count - count
+        self.time = self.time[count:count + max(keep, LOD_INITIAL_SIZE)].copy()
+        self.min = self.min[count:count + max(keep, LOD_INITIAL_SIZE)].copy()
+        self.max = self.max[count:count + max(keep, LOD_INITIAL_SIZE)].copy()
+        self.count = keep
+
+
+class MinMaxPyramid:
+    """
+    채널 공용 min/max LOD 피라미드
+    - 샘플 추가 시 완성된 버킷만 상위 레벨로 점진적 축소 (재계산 없음)
+    - capacity는 늘어나기만 하므로 타임베이스를 줄여도 기존 이력은 유지
+    """
+
+    def __init__(self, channel_count, capacity=12001):
+        self.channel_count = channel_count
+        self.capacity = capacity
+        self.clear()
+
+    @property
+    def count(self):
+        return self._count
+
+    def clear(self):
+        """전체 이력 삭제"""
+        self._count = 0
+        self._time = np.empty(LOD_INITIAL_SIZE, dtype=np.float64)
+        self._data = np.empty((LOD_INITIAL_SIZE, self.channel_count), dtype=np.float32)
+        self._levels = []  # index 0 -> 8x, 1 -> 64x, ...
+
+    def ensure_capacity(self, capacity):
+        """보관 샘플 수 확장 (축소하지 않음)"""
+        if capacity > self.capacity:
+            self.capacity = capacity
+
+    def _max_levels(self):
+        # 최상위 버킷이 capacity/16 이하가 되도록 제한 (trim 정렬 단위 확보)
+        levels = 0
+        factor = LOD_FACTOR
+        while factor * 16 <= self.capacity:
+            levels += 1
+            factor *= LOD_FACTOR
+        return max(levels, 1)
+
+    def append(self, t, values):
+        """샘플 하나 추가"""
+        self.append_block(np.asarray([t], dtype=np.float64), np.asarray([values], dtype=np.float32))
+
+    def append_block(self, times, block):
+        """샘플 블록 추가 (n,), (n x 채널) - 시간이 되돌아가면(수집 재시작) 이력 초기화"""
+        m = len(times)
+        if m == 0:
+            return
+        if self._count and times[0] < self._time[self._count - 1]:
+            self.clear()
+
+        n = self._count + m
+        if n > self._time.shape[0]:
+            self._time = _grow(self._time, n)
+            self._data = _grow(self._data, n)
+        self._time[self._count:n] = times
+        self._data[self._count:n] = block
+        self._count = n
+
+        self._cascade()
+        while self._count > self.capacity + self.capacity // 4:
+            if not self._trim():
+                break
+
+    def _cascade(self):
+        """완성된 버킷을 상위 레벨로 축소"""
+        max_levels = self._max_levels()
+        lower_count = self._count
+        for k in range(max_levels):
+            if k >= len(self._levels):
+                if lower_count < LOD_FACTOR:
+                    return
+                self._levels.append(_LodLevel(self.channel_count))
+            level = self._levels[k]
+            groups = lower_count // LOD_FACTOR - level.count
+            if groups > 0:
+                # 완성된 버킷들을 reshape 한 번으로 축소
+                start = level.count * LOD_FACTOR
+                stop = start + groups * LOD_FACTOR
+                shape = (groups, LOD_FACTOR, self.channel_count)
+                if k == 0:
+                    block = self._data[start:stop].reshape(shape)
+                    level.extend(self._time[start:stop:LOD_FACTOR], block.min(axis=1), block.max(axis=1))
+                else:
+                    lower = self._levels[k - 1]
+                    level.extend(lower.time[start:stop:LOD_FACTOR],
+                                 lower.min[start:stop].reshape(shape).min(axis=1),
+                                 lower.max[start:stop].reshape(shape).max(axis=1))
+            lower_count = level.count
+
+    def _trim(self):
+        """capacity 초과분을 최상위 버킷 단위로 정렬하여 앞에서 제거"""
+        top_factor = LOD_FACTOR ** len(self._levels) if self._levels else 1
+        drop = (self._count - self.capacity) // top_factor * top_factor
+        if drop <= 0:
+            return False
+        keep = self._count - drop
+        self._time = self._time[drop:drop + max(keep, LOD_INITIAL_SIZE)].copy()
+        self._data = self._data[drop:drop + max(keep, LOD_INITIAL_SIZE)].copy()
+        self._count = keep
+        factor = 1
+        for level in self._levels:
+            factor *= LOD_FACTOR
+            level.drop_front(drop // factor)
+        return True
+
+    def get_raw(self):
+        """원시(1x) 이력 복사본 반환 - (time, data)"""
+        return self._time[:self._count].copy(), self._data[:self._count].copy()
+
+    def query(self, t0, t1, max_points):
+        """
+        [t0, t1] 구간을 max_points 이하로 축소하여 반환
+        반환: (x, y) - y는 (포인트 수 x 채널 수), 축소 시 버킷마다 min/max 2포인트
+        """
+        n0 = self._count
+        if n0 == 0:
+            return np.empty(0), np.empty((0, self.channel_count), dtype=np.float32)
+
+        times = self._time[:n0]
+        i0 = max(int(np.searchsorted(times, t0, side='left')) - 1, 0)
+        i1 = min(int(np.searchsorted(times, t1, side='right')) + 1, n0)
+        count = i1 - i0
+        if count <= max_points or not self._levels:
+            return times[i0:i1], self._data[i0:i1]
+
+        # 버킷 수가 max_points/2 이하가 되는 가장 낮은 레벨 선택
+        buckets = max(max_points // 2, 1)
+        k = 0
+        factor = 1
+        while k < len(self._levels) and count / factor > buckets:
+            k += 1
+            factor *= LOD_FACTOR
+        if k == 0:
+            return times[i0:i1], self._data[i0:i1]
+
+        level = self._levels[k - 1]
+        b0 = i0 // factor
+        b1 = min(-(-i1 // factor), level.count)
+        t = level.time[b0:b1]
+        mins = level.min[b0:b1]
+        maxs = level.max[b0:b1]
+
+        # 아직 상위 레벨로 축소되지 않은 꼬리 구간은 원시 데이터에서 직접 계산
+        tail_start = max(b1 * factor, i0)
+        if tail_start < i1:
+            tail = self._data[tail_start:i1]
+            t = np.append(t, times[tail_start])
+            mins = np.vstack((mins, tail.min(axis=0)))
+            maxs = np.vstack((maxs, tail.max(axis=0)))
+
+        x = np.repeat(t, 2)
+        y = np.empty((len(t) * 2, self.channel_count), dtype=np.float32)
+        y[0::2] = mins
+        y[1::2] = maxs
+        return x, y
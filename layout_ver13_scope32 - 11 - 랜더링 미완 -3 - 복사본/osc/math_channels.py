@@ -0,0 +1,260 @@
+"""
+Math Channels Module
+오실로스코프 수식 채널 - 원시 채널 배치를 NumPy 수식으로 한 번에 계산
+"""
+
+import numpy as np
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QGridLayout, QHBoxLayout, QLabel, QComboBox,
+    QLineEdit, QCheckBox, QPushButton, QMessageBox
+)
+
+MATH_CHANNEL_COUNT = 3  # 수식 채널 슬롯 수 (M1 ~ M3)
+HISTORY_LENGTH = 256    # 미분/이동평균 연속성을 위해 유지하는 이전 샘플 수
+
+# 수식에서 사용하는 원시 채널 변수명 (Status 모드 채널 순서)
+RAW_CHANNEL_VARS = ["fwd", "ref", "dlv", "freq", "gamma", "re_g", "im_g", "phase", "temp"]
+
+# 프리셋: 이름 -> (수식, 단위)
+MATH_PRESETS = {
+    "VSWR": ("(1 + abs(gamma)) / maximum(1 - abs(gamma), 1e-6)", ""),
+    "|Γ|": ("hypot(re_g, im_g)", ""),
+    "∠Γ": ("degrees(arctan2(im_g, re_g))", "°"),
+    "Efficiency": ("100 * dlv / maximum(fwd, 1e-6)", "%"),
+    "dTemp/dt": ("ddt(temp)", "°C/s"),
+    "Fwd MA(20)": ("movavg(fwd, 20)", "W"),
+    "Gamma MA(20)": ("movavg(gamma, 20)", ""),
+}
+
+
+def _moving_average(x, n):
+    """인과(causal) 이동평균 - 앞쪽은 가용 샘플 수로 나눔"""
+    n = int(max(1, min(n, HISTORY_LENGTH)))
+    csum = np.cumsum(np.insert(x, 0, 0.0))
+    idx = np.arange(1, len(x) + 1)
+    lo = np.maximum(idx - n, 0)
+    return (csum[idx] - csum[lo]) / (idx - lo)
+
+
+def _time_steps(t, sample_interval):
+    """샘플별 실제 시간 간격 - 첫 샘플/중복·역행 시각은 유효 간격 중앙값(없으면 공칭 간격)으로 대체"""
+    steps = np.diff(t, prepend=t[:1])
+    valid = steps > 0
+    fill = np.median(steps[valid]) if valid.any() else sample_interval
+    return np.where(valid, steps, fill)
+
+
+# 수식에서 허용되는 함수/상수
+_MATH_FUNCTIONS = {
+    "abs": np.abs, "sqrt": np.sqrt, "hypot": np.hypot, "arctan2": np.arctan2,
+    "degrees": np.degrees, "radians": np.radians, "log10": np.log10, "exp": np.exp,
+    "minimum": np.minimum, "maximum": np.maximum, "clip": np.clip, "where": np.where,
+    "sin": np.sin, "cos": np.cos, "pi": np.pi,
+    "movavg": _moving_average,
+}
+
+
+class MathChannel:
+    """컴파일된 수식 채널"""
+
+    def __init__(self, name, expression, unit=""):
+        self.name = name
+        self.expression = expression
+        self.unit = unit
+        self.code = compile(expression, f"<math:{name}>", "eval")
+
+        allowed = set(_MATH_FUNCTIONS) | set(RAW_CHANNEL_VARS) | {"ddt", "t", "dt"}
+        allowed |= {f"ch{i+1}" for i in range(len(RAW_CHANNEL_VARS))}
+        unknown = [n for n in self.code.co_names if n not in allowed]
+        if unknown:
+            raise ValueError(f"알 수 없는 이름: {', '.join(unknown)}")
+
+
+class MathChannelEngine:
+    """수식 채널 배치 계산 엔진"""
+
+    def __init__(self, slot_count=MATH_CHANNEL_COUNT):
+        self.slot_count = slot_count
+        self.slots = [None] * slot_count  # MathChannel 또는 None
+        self._history = None               # 최근 원시 샘플 (HISTORY_LENGTH x 9)
+        self._history_time = None          # 최근 원시 샘플 시각 (HISTORY_LENGTH,)
+        self._time_origin = None           # t 기준 시각 (reset 후 첫 샘플)
+
+    def set_channel(self, slot, name, expression, unit=""):
+        """슬롯에 수식 설정 - (성공 여부, 메시지) 반환"""
+        try:
+            channel = MathChannel(name, expression, unit)
+            # 더미 데이터로 한 번 평가하여 런타임 오류 확인
+            self._evaluate_channel(channel, np.zeros((4, len(RAW_CHANNEL_VARS))), np.arange(4) * 0.05, 0.05)
+        except Exception as e:
+            return False, f"M{slot+1} 수식 오류: {e}"
+        self.slots[slot] = channel
+        return True, f"M{slot+1} = {expression}"
+
+    def clear_channel(self, slot):
+        self.slots[slot] = None
+
+    def reset(self):
+        """이력 초기화 (데이터 클리어/수집 재시작 시)"""
+        self._history = None
+        self._history_time = None
+        self._time_origin = None
+
+    def _evaluate_channel(self, channel, block, t, sample_interval):
+        """t: 샘플 시각 (초) - dt/ddt는 공칭 간격이 아닌 실제 시각 간격 사용"""
+        n = block.shape[0]
+        namespace = dict(_MATH_FUNCTIONS)
+        for i, var in enumerate(RAW_CHANNEL_VARS):
+            column = block[:, i]
+            namespace[var] = column
+            namespace[f"ch{i+1}"] = column
+        dt = _time_steps(t, sample_interval)
+        namespace["dt"] = dt
+        namespace["t"] = t
+        namespace["ddt"] = lambda x: np.diff(x, prepend=x[:1]) / dt
+
+        with np.errstate(all='ignore'):
+            result = eval(channel.code, {"__builtins__": {}}, namespace)
+        result = np.broadcast_to(np.asarray(result, dtype=np.float64), (n,))
+        return np.nan_to_num(result, nan=0.0, posinf=0.0, neginf=0.0)
+
+    def evaluate(self, raw_block, timestamps, sample_interval):
+        """
+        원시 채널 배치(n x 9)에 대해 모든 수식 채널 계산
+        timestamps: 블록의 샘플 시각 (n,) - sample_interval은 간격을 알 수 없을 때의 대체값
+        반환: (n x slot_count) 배열, 비활성 슬롯은 0
+        """
+        raw_block = np.asarray(raw_block, dtype=np.float64)
+        times = np.asarray(timestamps, dtype=np.float64)
+        n = raw_block.shape[0]
+        output = np.zeros((n, self.slot_count))
+        if n == 0 or not any(self.slots):
+            return output
+
+        if self._time_origin is None:
+            self._time_origin = times[0]
+        times = times - self._time_origin
+
+        # 이전 샘플을 앞에 붙여 미분/이동평균이 배치 경계에서 끊기지 않도록 함
+        if self._history is not None:
+            block = np.vstack((self._history, raw_block))
+            t = np.concatenate((self._history_time, times))
+        else:
+            block = raw_block
+            t = times
+        self._history = block[-HISTORY_LENGTH:].copy()
+        self._history_time = t[-HISTORY_LENGTH:].copy()
+
+        for slot, channel in enumerate(self.slots):
+            if channel is None:
+                continue
+            try:
+                output[:, slot] = self._evaluate_channel(channel, block, t, sample_interval)[-n:]
+            except Exception as e:
+                print(f"[Math] M{slot+1} evaluate error: {e}")
+        return output
+
+
+class MathChannelDialog(QDialog):
+    """수식 채널 설정 다이얼로그"""
+
+    def __init__(self, engine, enabled, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.enabled = list(enabled)
+        self.setWindowTitle("Math Channels")
+        self.setMinimumWidth(640)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        grid = QGridLayout()
+        for col, title in enumerate(["", "Preset", "Expression", "Unit"]):
+            grid.addWidget(QLabel(title), 0, col)
+
+        self.enable_checks = []
+        self.preset_combos = []
+        self.expr_edits = []
+        self.unit_edits = []
+        for slot in range(self.engine.slot_count):
+            channel = self.engine.slots[slot]
+
+            check = QCheckBox(f"M{slot+1}")
+            check.setChecked(self.enabled[slot] and channel is not None)
+
+            combo = QComboBox()
+            combo.addItems(list(MATH_PRESETS.keys()) + ["Custom"])
+
+            expr_edit = QLineEdit()
+            unit_edit = QLineEdit()
+            unit_edit.setFixedWidth(60)
+
+            if channel is not None:
+                combo.setCurrentText(channel.name if channel.name in MATH_PRESETS else "Custom")
+                expr_edit.setText(channel.expression)
+                unit_edit.setText(channel.unit)
+            else:
+                preset = list(MATH_PRESETS.keys())[slot % len(MATH_PRESETS)]
+                combo.setCurrentText(preset)
+                expr_edit.setText(MATH_PRESETS[preset][0])
+                unit_edit.setText(MATH_PRESETS[preset][1])
+
+            combo.currentTextChanged.connect(lambda text, idx=slot: self.on_preset_changed(idx, text))
+
+            grid.addWidget(check, slot + 1, 0)
+            grid.addWidget(combo, slot + 1, 1)
+            grid.addWidget(expr_edit, slot + 1, 2)
+            grid.addWidget(unit_edit, slot + 1, 3)
+
+            self.enable_checks.append(check)
+            self.preset_combos.append(combo)
+            self.expr_edits.append(expr_edit)
+            self.unit_edits.append(unit_edit)
+        layout.addLayout(grid)
+
+        help_label = QLabel(
+            "변수: " + ", ".join(RAW_CHANNEL_VARS) + " (또는 ch1~ch9), t, dt\n"
+            "함수: ddt(x), movavg(x, n), abs, sqrt, hypot, arctan2, degrees, minimum, maximum, where ..."
+        )
+        help_label.setWordWrap(True)
+        layout.addWidget(help_label)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        apply_btn = QPushButton("Apply")
+        apply_btn.clicked.connect(self.on_apply)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(apply_btn)
+        button_layout.addWidget(cancel_btn)
+        layout.addLayout(button_layout)
+
+    def on_preset_changed(self, slot, text):
+        if text in MATH_PRESETS:
+            expression, unit = MATH_PRESETS[text]
+            self.expr_edits[slot].setText(expression)
+            self.unit_edits[slot].setText(unit)
+
+    def on_apply(self):
+        """수식 컴파일 및 적용"""
+        errors = []
+        for slot in range(self.engine.slot_count):
+            expression = self.expr_edits[slot].text().strip()
+            if not self.enable_checks[slot].isChecked() or not expression:
+                self.engine.clear_channel(slot)
+                self.enabled[slot] = False
+                continue
+
+            preset = self.preset_combos[slot].currentText()
+            name = preset if preset in MATH_PRESETS and MATH_PRESETS[preset][0] == expression else expression
+            success, message = self.engine.set_channel(slot, name, expression, self.unit_edits[slot].text().strip())
+            if success:
+                self.enabled[slot] = True
+            else:
+                errors.append(message)
+
+        if errors:
+            QMessageBox.warning(self, "Math Channels", "\n".join(errors))
+            return
+        self.accept()
@@ -3,21 +3,29 @@ Oscilloscope View Module
 오실로스코프 스타일 9채널 통합 뷰 - 트리거 포인트 드래그 및 0점 동기화, Single 모드에서 pre/post 유지
 """
 
+import os
 import time
-from collections import deque
+import datetime
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, 
     QLabel, QGroupBox, QButtonGroup, QSizePolicy, QComboBox, QDoubleSpinBox, 
-    QFrame  #선큰 추가
+    QFrame, QFileDialog, QMessageBox  #선큰 추가
 )
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QRectF, QPointF
 from PyQt5.QtGui import QFont
 import pyqtgraph as pg
 import numpy as np
 
-from .adc_dac_data_source import AdcDacDataSource, StatusDataSource
+from .data_sources import StatusScopeSource, AdcDacScopeSource, ReplayScopeSource, SimulatedScopeSource
+from .spectrum_analyzer import SpectrumWidget
+from .math_channels import MathChannelEngine, MathChannelDialog, MATH_CHANNEL_COUNT
+from .lod_pyramid import MinMaxPyramid
+from .sample_ring import SampleRing
+from .capture_export import snapshot_capture, CaptureExportThread
 from ui_widgets import SmartSpinBox, SmartDoubleSpinBox 
-from settings_dialog import SettingsDialog, SettingsManager # 새로 추가
+from settings_dialog import get_settings_manager # 공용 SettingsManager
+from perf_monitor import monitor
+from metrics_exporter import metrics
 
 # pyqtgraph 성능 최적화 설정 (안정성 우선)
 # antialias=False: 렌더링 속도 향상
@@ -182,6 +190,11 @@ COLORS = {
         '#8800ff', # CH8: 바이올렛 - RF Phase
         '#ffffff'  # CH9: 화이트 - Temperature
     ],
+    'MATH_CHANNELS': [               # 수식 채널 색상 (M1 ~ M3)
+        '#ff5555', # M1: 코랄 레드
+        '#55aaff', # M2: 스카이 블루
+        '#ffcc66'  # M3: 샌드 옐로우
+    ],
     # UI 컴포넌트 크기 상수
     'MAX_LEFT_PENEL_WIDTH': 280,     # 좌측 패널 최대 너비
     'RF_CONTROL_WIDTH': 280,         # RF 컨트롤 패널 너비
@@ -195,10 +208,16 @@ COLORS = {
     'MEASUREMENT_WIDTH': 280,        # 측정 컨트롤 너비
     'MEASUREMENT_HEIGHT': 120,       # 측정 컨트롤 높이
     'CONTROLS_WIDTH': 280,           # 컨트롤 패널 너비
-    'CONTROLS_HEIGHT': 70,          # 컨트롤 패널 높이 (확장됨)
+    'CONTROLS_HEIGHT': 110,          # 컨트롤 패널 높이 (FFT/Math 줄 추가)
     'MEASUREMENT_FONT_SIZE': 12,     # 측정값 폰트 크기
 }
 
+# 원시 9채널 + 수식 채널 색상 (플롯/측정/스펙트럼 공용)
+ALL_CHANNEL_COLORS = COLORS['CHANNELS'] + COLORS['MATH_CHANNELS']
+
+# data_source_combo 순서와 동일
+DATA_SOURCE_MODES = ["status", "adc_dac", "replay", "simulated"]
+
 class ChannelGridWidget(QWidget):
     """9채널 선택 그리드 위젯"""
     
@@ -588,8 +607,7 @@ class MeasurementControlWidget(QWidget):
             all_x = []
             all_y = []
 
-            for i in range(9):
-                line = parent.plot_widget.plot_lines[i]
+            for line in parent.plot_widget.plot_lines:
                 if not line.isVisible():
                     continue
                 data = line.getData()
@@ -632,16 +650,21 @@ class UnifiedPlotWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         #self.active_channels = [True, True] + [False] * 7
-        self.active_channels = [False] * 9
+        self.num_channels = 9 + MATH_CHANNEL_COUNT  # 원시 9채널 + 수식 채널
+        self.active_channels = [False] * self.num_channels
         self.display_mode = 'multi'
         #self.buffer_size = 500  # 줄여서 부하 감소
         self.buffer_size = 12001  # 10 그리드 그리드당 1분 600초에대한 버퍼
-        self.time_data = deque(maxlen=self.buffer_size)
-        self.channel_data = [deque(maxlen=self.buffer_size) for _ in range(9)]
-        self.pre_time_data = deque(maxlen=self.buffer_size)
-        self.pre_channel_data = [deque(maxlen=self.buffer_size) for _ in range(9)]
-        self.display_time = []
-        self.display_channel_data = [[] for _ in range(9)]
+        # 원시 버퍼 (블록 단위 추가, 표시는 복사 없는 배열 뷰)
+        self.history = SampleRing(self.num_channels, self.buffer_size)      # 비트리거 모드 최근 total_time 구간
+        self.pre_history = SampleRing(self.num_channels, self.buffer_size)  # 트리거 모드 최근 pre_time 구간
+        self.sweep = SampleRing(self.num_channels, self.buffer_size)        # 트리거 스윕 (트리거 시점 = 0초)
+        self.display_time = self.history.times
+        self.display_channel_data = self.history.data
+        self.time_origin = None   # 첫 블록 timestamp (상대 시간 0)
+        self.trigger_time = None  # 현재 스윕의 트리거 시점 (상대 시간)
+        # 비트리거 모드 장기 이력 (min/max LOD 피라미드) - 타임베이스 변경 시에도 유지
+        self.lod_history = MinMaxPyramid(self.num_channels, self.buffer_size)
         self.trigger_settings = None
         self.trigger_mode = "auto"
         self.acquiring = False
@@ -657,7 +680,7 @@ class UnifiedPlotWidget(QWidget):
         
         #############
         # 데이터 처리 타이머 설정
-        self.settings_manager = SettingsManager() # yuri 추가
+        self.settings_manager = get_settings_manager() # yuri 추가 (공용 인스턴스)
         #############
         
         # 고정 간격 적용을 위한 변수 추가 (1번 해결 방법)
@@ -665,8 +688,7 @@ class UnifiedPlotWidget(QWidget):
         #self.sample_interval = 0.05  # 기본값
         self.sample_interval = 0.05  # 기본값
         self.sample_count = 0  # 샘플 카운터
-        self.pre_sample_count = 0  # pre 버퍼용 카운터
-        
+
         # ✅ 마우스 범위 조정 관련 플래그
         self.manual_range_mode = False  # 수동 범위 설정 모드
         self.auto_follow_time = True    # 자동 따라가기
@@ -675,15 +697,19 @@ class UnifiedPlotWidget(QWidget):
         self.channel_names = [
             "Forward Power", "Reflect Power", "Delivery Power", "Frequency", 
             "Gamma", "Real Gamma", "Image Gamma", "RF Phase", "Temperature"
-        ]
+        ] + [f"Math {i+1}" for i in range(MATH_CHANNEL_COUNT)]
         self.channel_units = [
             "W", "W", "W", "MHz", "", "", "", "°", "°C"
-        ]
+        ] + [""] * MATH_CHANNEL_COUNT
         
         # X축 단위 동적 변경을 위한 변수
         self.current_x_unit = 's'  # 현재 X축 단위 (ms, s, min, h)
         self.x_scale_factor = 1.0  # X축 스케일 팩터
         
+        # FFT 스펙트럼 표시 상태 (렌더 주기마다 새 샘플이 있을 때만 갱신)
+        self.spectrum_enabled = False
+        self._spectrum_sample_count = -1
+        
         self.init_ui()
         
     def init_ui(self):
@@ -738,10 +764,11 @@ class UnifiedPlotWidget(QWidget):
         viewBox.setMouseMode(viewBox.PanMode)
         
         self.plot_lines = []
-        for i in range(9):
+        for i in range(self.num_channels):
             line = self.plot_widget.plot(
-                pen=pg.mkPen(color=COLORS['CHANNELS'][i], width=1),
-                name=f"CH{i+1}: {self.channel_names[i]}",
+                pen=pg.mkPen(color=ALL_CHANNEL_COLORS[i], width=1,
+                             style=Qt.SolidLine if i < 9 else Qt.DashLine),
+                name=f"{self.channel_label(i)}: {self.channel_names[i]}",
                 downsample=True,  # 다운샘플링 활성화
                 downsampleMethod='peak'
             )
@@ -749,13 +776,19 @@ class UnifiedPlotWidget(QWidget):
             self.plot_lines.append(line)
         
         frame_layout.addWidget(self.plot_widget)  # 선큰 프레임에 추가
-        layout.addWidget(plot_frame)
+        layout.addWidget(plot_frame, 2)
+        
+        # FFT 스펙트럼 패널 (기본 숨김)
+        self.spectrum_widget = SpectrumWidget(ALL_CHANNEL_COLORS)
+        self.spectrum_widget.plot_widget.setBackground(COLORS['PLOT_BG'])
+        self.spectrum_widget.setVisible(False)
+        layout.addWidget(self.spectrum_widget, 1)
         #layout.addWidget(self.plot_widget)
         
         self.legend = self.plot_widget.addLegend()
-        for i in range(9):
+        for i in range(self.num_channels):
             if self.active_channels[i]:
-                self.legend.addItem(self.plot_lines[i], f"CH{i+1}: {self.channel_names[i]}")
+                self.legend.addItem(self.plot_lines[i], f"{self.channel_label(i)}: {self.channel_names[i]}")
         
         # ✅ ViewBox 범위 변경 감지 신호 연결
         viewBox = self.plot_widget.getViewBox()
@@ -767,6 +800,7 @@ class UnifiedPlotWidget(QWidget):
         self.region = pg.LinearRegionItem([-1, 1])
         self.plot_widget.addItem(self.region)
         self.region.sigRegionChangeFinished.connect(self.update_measurements)
+        self.region.sigRegionChangeFinished.connect(lambda: self.update_spectrum(force=True))
         
         self.trigger_level_line = pg.InfiniteLine(pos=0, angle=0, movable=True, pen=pg.mkPen('y', style=Qt.DashLine))
         self.plot_widget.addItem(self.trigger_level_line)
@@ -814,14 +848,14 @@ class UnifiedPlotWidget(QWidget):
         #measure_layout.setContentsMargins(3, 3, 3, 3)  # 마진 설정
         
         self.measure_labels = []
-        for i in range(9):
+        for i in range(self.num_channels):
             lbl = QLabel()
             lbl.setWordWrap(True)
             lbl.setVisible(self.active_channels[i])
             #lbl.setMinimumHeight(16)  # ✅ 최소 높이 설정
             lbl.setStyleSheet(f"""
                 QLabel {{
-                    color: {COLORS['CHANNELS'][i]};
+                    color: {ALL_CHANNEL_COLORS[i]};
                     font-size: {COLORS['MEASUREMENT_FONT_SIZE']}px;
                     font-weight: normal;
                     padding: 0px;
@@ -849,6 +883,12 @@ class UnifiedPlotWidget(QWidget):
         # ✅ 마우스 위치 라벨 우상단 고정 (크기는 자동 조정)
         # render_plots에서 매 프레임마다 위치만 업데이트
     
+    def channel_label(self, channel_idx):
+        """채널 표시 이름 (CH1~CH9, 수식 채널은 M1~)"""
+        if channel_idx < 9:
+            return f"CH{channel_idx+1}"
+        return f"M{channel_idx-8}"
+    
     def on_trigger_level_dragged(self, line):
         new_level = line.value()
         self.trigger_level_changed.emit(new_level)
@@ -859,7 +899,11 @@ class UnifiedPlotWidget(QWidget):
         self._updating = True
         new_pos = line.value()
         shift = new_pos
-        self.display_time = [t - shift for t in self.display_time]
+        if self.trigger_settings is not None and len(self.display_time):
+            # 스윕 시간축을 제자리에서 이동 (이후 post 샘플도 같은 기준)
+            self.display_time -= shift
+            if self.trigger_time is not None:
+                self.trigger_time += shift
         current_min, current_max = self.plot_widget.getAxis('bottom').range
         self.plot_widget.setXRange(current_min - shift, current_max - shift, padding=0)
         line.setValue(0)
@@ -885,17 +929,16 @@ class UnifiedPlotWidget(QWidget):
         if self.triggered:
             self.trigger_pos_line.setValue(0)
             self.trigger_pos_line.setVisible(True)
-            if self.display_time:
-                min_time = min(self.display_time)
-                max_time = max(self.display_time)
-                self.trigger_pos_line.setBounds([min_time, max_time])
+            if len(self.display_time):
+                self.trigger_pos_line.setBounds([self.display_time[0], self.display_time[-1]])
         else:
             self.trigger_pos_line.setVisible(False)
-        text = f"Trigger: {trig_type.upper()} at {level:.2f} on CH{source+1}"
+        text = f"Trigger: {trig_type.upper()} at {level:.2f} on {self.channel_label(source)}"
         self.trigger_text.setText(text)
+        source_data = self.display_channel_data[source]
         self.trigger_text.setPos(0, 
-                               level + 0.1 * (max(self.display_channel_data[source]) - min(self.display_channel_data[source])) 
-                               if self.display_channel_data[source] else 0)
+                               level + 0.1 * float(np.ptp(source_data)) 
+                               if len(source_data) else 0)
         self.trigger_text.setVisible(True)
     
     def set_measurement_mode(self, mode):
@@ -930,17 +973,16 @@ class UnifiedPlotWidget(QWidget):
     
     def snap_to_peak(self, channel_idx):
         if (not self.active_channels[channel_idx] or 
-            not self.display_channel_data[channel_idx] or
             len(self.display_channel_data[channel_idx]) == 0):
             return
         try:
-            data = np.asarray(self.display_channel_data[channel_idx])  # np.array -> np.asarray
-            time = np.asarray(self.display_time)  # np.array -> np.asarray
+            data = self.display_channel_data[channel_idx]
+            time = self.display_time
             if len(data) == 0 or len(time) == 0:
                 return
             peak_idx = np.argmax(data)
             peak_time = time[peak_idx]
-            time_span = max(time) - min(time)
+            time_span = time[-1] - time[0]
             half_width = max(time_span * 0.05, 0.1)
             new_range = [peak_time - half_width, peak_time + half_width]
             self.region.setRegion(new_range)
@@ -950,10 +992,10 @@ class UnifiedPlotWidget(QWidget):
             print(f"Error in snap_to_peak: {e}")
     
     def adjust_measurement_region(self):
-        if not self.display_time or len(self.display_time) == 0:
+        if len(self.display_time) == 0:
             return
         try:
-            current_time_range = [min(self.display_time), max(self.display_time)]
+            current_time_range = [float(self.display_time[0]), float(self.display_time[-1])]
             if self.measurement_mode == "floating":
                 if self.last_time_range is None:
                     time_span = current_time_range[1] - current_time_range[0]
@@ -976,118 +1018,160 @@ class UnifiedPlotWidget(QWidget):
             print(f"Error in adjust_measurement_region: {e}")
     
     def update_channels(self, data_array, timestamp):
-        """채널 데이터 업데이트 - 고정 간격 적용"""
+        """채널 데이터 한 샘플 업데이트 (블록 경로로 전달)"""
+        self.update_channel_block(
+            [time.time() if timestamp is None else timestamp],
+            np.asarray([data_array], dtype=np.float64)
+        )
+    
+    def update_channel_block(self, timestamps, block):
+        """
+        채널 데이터 블록 업데이트 - timestamps (n,), block (n x num_channels)
+        블록의 timestamp를 첫 블록 기준 상대 시간으로 사용, 버퍼에는 배열 슬라이스로 추가
+        """
         try:
-            # 고정 간격으로 relative_time 계산 (timestamp 무시)
-            relative_time = self.sample_count * self.sample_interval
-            self.sample_count += 1
-
+            n = block.shape[0]
+            if n == 0:
+                return
+            times = np.asarray(timestamps, dtype=np.float64)
+            if self.time_origin is None:
+                self.time_origin = times[0]
+            times = times - self.time_origin
+            self.sample_count += n
+            
             if self.trigger_settings is None:
-                # 비트리거 모드: 기본 버퍼 관리
-                while self.time_data and relative_time - self.time_data[0] > self.total_time:
-                    self.time_data.popleft()
-                    for i in range(9):
-                        if len(self.channel_data[i]) > 0:
-                            self.channel_data[i].popleft()
-                self.time_data.append(relative_time)
-                for i in range(9):
-                    self.channel_data[i].append(data_array[i])
-                self.display_time = list(self.time_data)
-                for i in range(9):
-                    self.display_channel_data[i] = list(self.channel_data[i])
-                # ✅ 자동 추적일 때만 측정 region 조정
-                if self.auto_follow_time:
-                    self.adjust_measurement_region()
-                self.update_trigger_display()
-                if self.display_time:
-                    max_time = max(self.display_time)
-                    # ✅ 자동 추적 활성화되어 있을 때만 범위 설정
-                    if self.auto_follow_time:
-                        self.plot_widget.setXRange(max_time - self.total_time, max_time, padding=0)
-                        #display_end = max_time + self.sample_interval  # 9.95 + 0.05 = 10.00
-                        #self.plot_widget.setXRange(display_end - self.total_time, display_end, padding=0)
+                self._append_free_run(times, block)
             else:
-                # 트리거 모드: pre/post 버퍼에 고정 간격 적용
-                if not self.acquiring:
-                    return
-                
-                # pre 버퍼: 고정 간격 pre_relative_time
-                pre_relative_time = self.pre_sample_count * self.sample_interval
-                self.pre_sample_count += 1
-                
-                while self.pre_time_data and pre_relative_time - self.pre_time_data[0] > self.pre_time:
-                    self.pre_time_data.popleft()
-                    for i in range(9):
-                        if len(self.pre_channel_data[i]) > 0:
-                            self.pre_channel_data[i].popleft()
-                self.pre_time_data.append(pre_relative_time)
-                for i in range(9):
-                    self.pre_channel_data[i].append(data_array[i])
-                
-                trig_type = self.trigger_settings["type"]
-                level = self.trigger_settings["level"]
-                
-                if self.trigger_mode == "auto" and pre_relative_time - self.last_sweep_time > 0.05 and not self.triggered:
-                    self.triggered = True
-                    self.display_time = list(self.pre_time_data)
-                    for i in range(9):
-                        self.display_channel_data[i] = list(self.pre_channel_data[i])
-                    self.last_sweep_time = pre_relative_time
-                    print(f"Auto trigger occurred at time: {pre_relative_time}, value: {data_array[self.trigger_settings['source']]}")
-                
-                if not self.triggered:
-                    if len(self.pre_time_data) < 2:
-                        return
-                    source = self.trigger_settings["source"]
-                    if len(self.pre_channel_data[source]) >= 2:
-                        value = self.pre_channel_data[source][-1]
-                        prev_value = self.pre_channel_data[source][-2]
-                        triggered = False
-                        if trig_type == "rising" and prev_value <= level and value > level:
-                            triggered = True
-                        elif trig_type == "falling" and prev_value >= level and value < level:
-                            triggered = True
-                        elif trig_type == "level" and value > level:
-                            triggered = True
-                        if triggered:
-                            self.triggered = True
-                            self.display_time = list(self.pre_time_data)
-                            for i in range(9):
-                                self.display_channel_data[i] = list(self.pre_channel_data[i])
-                            print(f"Trigger occurred at time: {pre_relative_time}, value: {value}, type: {trig_type}")
-                
-                if self.triggered:
-                    # post 버퍼: 트리거 후에도 고정 간격 추가
-                    post_relative_time = self.sample_count * self.sample_interval  # 전체 카운터 사용
-                    self.display_time.append(post_relative_time)
-                    for i in range(9):
-                        self.display_channel_data[i].append(data_array[i])
-                    if post_relative_time >= self.post_time:
-                        self.render_plots()
-                        self.plot_widget.setXRange(-self.pre_time, self.post_time, padding=0)
-                        self.last_sweep_time = post_relative_time
-                        if self.trigger_mode == "single":
-                            self.acquiring = False
-                            self.stop_acquisition_signal.emit()
-                            print(f"Single mode stopped, maintaining pre_time: {self.pre_time}, post_time: {self.post_time}")
-                        self.triggered = False
-            
-            active_count = sum(self.active_channels)
-            self.info_label.setText(
-                f"Active Channels: {active_count}/9 | "
-                f"Buffer: {len(self.time_data)}/{self.buffer_size} | "
-                f"Mode: {self.display_mode.upper()} | "
-                f"Measure: {self.measurement_mode.upper()} | "
-                f"Pre/Post: {self.pre_time:.2f}/{self.post_time:.2f}s"
-            )
+                self._append_triggered(times, block)
+            self.update_info_label()
         except Exception as e:
-            print(f"Error in update_channels: {e}")
+            print(f"Error in update_channel_block: {e}")
+    
+    def _append_free_run(self, times, block):
+        """비트리거 모드: 최근 total_time 구간 유지 + LOD 이력 반영"""
+        last_time = times[-1]
+        self.history.append_block(times, block)
+        self.history.drop_before(last_time - self.total_time)
+        self.lod_history.append_block(times, block)
+        
+        self.display_time = self.history.times
+        self.display_channel_data = self.history.data
+        # ✅ 자동 추적일 때만 측정 region 조정
+        if self.auto_follow_time:
+            self.adjust_measurement_region()
+        self.update_trigger_display()
+        # ✅ 자동 추적 활성화되어 있을 때만 범위 설정
+        if self.auto_follow_time:
+            self.plot_widget.setXRange(last_time - self.total_time, last_time, padding=0)
+    
+    def _append_triggered(self, times, block):
+        """트리거 모드: 블록 안에서 트리거 탐색 → pre 구간 + post 샘플로 스윕 구성"""
+        if not self.acquiring:
+            return
+        n = len(times)
+        i = 0
+        while i < n and self.acquiring:
+            if not self.triggered:
+                k = self._find_trigger(times, block, i)
+                stop = n if k < 0 else k + 1
+                self._append_pre(times[i:stop], block[i:stop])
+                if k < 0:
+                    break
+                # 트리거 샘플까지의 pre 구간을 스윕 시작으로 복사 (트리거 시점 = 0)
+                self.triggered = True
+                self.trigger_time = times[k]
+                self.sweep.clear()
+                self.sweep.append_block(self.pre_history.times - self.trigger_time, self.pre_history.data.T)
+                print(f"Trigger occurred at time: {times[k]:.3f}, "
+                      f"value: {block[k, self.trigger_settings['source']]}, type: {self.trigger_settings['type']}")
+                i = stop
+            else:
+                # post 샘플: post_time에 도달한 샘플까지 추가 후 스윕 완료
+                relative = times[i:] - self.trigger_time
+                reached = int(np.searchsorted(relative, self.post_time, side='left'))
+                stop = i + min(reached + 1, n - i)
+                self._append_pre(times[i:stop], block[i:stop])
+                self.sweep.append_block(relative[:stop - i], block[i:stop])
+                i = stop
+                if reached < len(relative):
+                    self._finish_sweep(times[stop - 1])
+        
+        if self.triggered or len(self.sweep):
+            self.display_time = self.sweep.times
+            self.display_channel_data = self.sweep.data
+    
+    def _append_pre(self, times, block):
+        """pre 버퍼에 추가하고 pre_time 이전 샘플 제거"""
+        if len(times) == 0:
+            return
+        self.pre_history.append_block(times, block)
+        self.pre_history.drop_before(times[-1] - self.pre_time)
+    
+    def _find_trigger(self, times, block, start):
+        """start 이후 첫 트리거 샘플 인덱스 (없으면 -1) - 직전 샘플과 비교하는 벡터 판정"""
+        source = self.trigger_settings["source"]
+        level = self.trigger_settings["level"]
+        trig_type = self.trigger_settings["type"]
+        values = block[start:, source]
+        prev = np.empty(len(values), dtype=np.float64)
+        prev[1:] = values[:-1]
+        prev[0] = self.pre_history.data[source][-1] if len(self.pre_history) else np.nan
+        has_prev = ~np.isnan(prev)
+        
+        if trig_type == "rising":
+            hits = (prev <= level) & (values > level)
+        elif trig_type == "falling":
+            hits = (prev >= level) & (values < level)
+        elif trig_type == "level":
+            hits = has_prev & (values > level)
+        else:
+            hits = np.zeros(len(values), dtype=bool)
+        if self.trigger_mode == "auto":
+            hits |= has_prev & (times[start:] - self.last_sweep_time > 0.05)
+        found = np.flatnonzero(hits)
+        return start + int(found[0]) if len(found) else -1
+    
+    def _finish_sweep(self, end_time):
+        """스윕 완료 - 렌더링 후 다음 트리거 대기 (single 모드는 정지)"""
+        self.display_time = self.sweep.times
+        self.display_channel_data = self.sweep.data
+        self.render_plots()
+        self.plot_widget.setXRange(-self.pre_time, self.post_time, padding=0)
+        self.last_sweep_time = end_time
+        if self.trigger_mode == "single":
+            self.acquiring = False
+            self.stop_acquisition_signal.emit()
+            print(f"Single mode stopped, maintaining pre_time: {self.pre_time}, post_time: {self.post_time}")
+        self.triggered = False
+    
+    def update_info_label(self):
+        active_count = sum(self.active_channels)
+        self.info_label.setText(
+            f"Active Channels: {active_count}/{self.num_channels} | "
+            f"Buffer: {len(self.history)}/{self.buffer_size} | "
+            f"Mode: {self.display_mode.upper()} | "
+            f"Measure: {self.measurement_mode.upper()} | "
+            f"Pre/Post: {self.pre_time:.2f}/{self.post_time:.2f}s"
+        )
     
     def update_plots(self):
         """플롯 업데이트"""
         try:
-            for i in range(9):
-                if self.active_channels[i] and self.display_time and len(self.display_time) > 0:
+            # 비트리거 모드: 현재 보이는 범위만 LOD 피라미드에서 픽셀당 ~2포인트로 렌더링
+            if self.trigger_settings is None and self.lod_history.count > 0:
+                viewBox = self.plot_widget.getViewBox()
+                x_min, x_max = viewBox.viewRange()[0]
+                pixels = max(int(viewBox.width()), 100)
+                x, y = self.lod_history.query(x_min, x_max, pixels * 2)
+                for i in range(self.num_channels):
+                    if self.active_channels[i] and len(x) > 0:
+                        self.plot_lines[i].setData(x, y[:, i])
+                    else:
+                        self.plot_lines[i].setData([], [])
+                return
+            
+            for i in range(self.num_channels):
+                if self.active_channels[i] and len(self.display_time) > 0:
                     if len(self.display_channel_data[i]) == len(self.display_time):
                         self.plot_lines[i].setData(self.display_time, self.display_channel_data[i])
                     else:
@@ -1101,26 +1185,25 @@ class UnifiedPlotWidget(QWidget):
         """측정값 업데이트"""
         try:
             minX, maxX = self.region.getRegion()
-            if not self.display_time or len(self.display_time) == 0:
+            if len(self.display_time) == 0:
                 return
-            time_array = np.asarray(self.display_time)
-            for i in range(9):
+            time_array = self.display_time
+            for i in range(self.num_channels):
                 if not self.active_channels[i]:
                     continue
-                if (not self.display_channel_data[i] or 
-                    len(self.display_channel_data[i]) == 0 or
+                if (len(self.display_channel_data[i]) == 0 or
                     len(self.display_channel_data[i]) != len(time_array)):
-                    self.measure_labels[i].setText(f"CH{i+1}: No data")
+                    self.measure_labels[i].setText(f"{self.channel_label(i)}: No data")
                     continue
-                data_array = np.asarray(self.display_channel_data[i])
+                data_array = self.display_channel_data[i]
                 mask = (time_array >= minX) & (time_array <= maxX)
                 if np.sum(mask) < 1:
-                    self.measure_labels[i].setText(f"CH{i+1}: No data in range")
+                    self.measure_labels[i].setText(f"{self.channel_label(i)}: No data in range")
                     continue
                 selected_time = time_array[mask]
                 selected_data = data_array[mask]
                 if len(selected_data) == 0:
-                    self.measure_labels[i].setText(f"CH{i+1}: No data in range")
+                    self.measure_labels[i].setText(f"{self.channel_label(i)}: No data in range")
                     continue
                 min_val = np.min(selected_data)
                 max_val = np.max(selected_data)
@@ -1143,16 +1226,49 @@ class UnifiedPlotWidget(QWidget):
                 #############
                 
                 n_points = len(selected_time)
-                text = f"CH{i+1}: Min={min_val:9.3f}  Max={max_val:9.3f}  Mean={mean_val:9.3f}  P-P={p2p:9.3f}  RMS={rms:9.3f} {self.channel_units[i]}  Δt={delta_t:5.2f}s, ΔPoints={n_points}"
+                text = f"{self.channel_label(i)}: Min={min_val:9.3f}  Max={max_val:9.3f}  Mean={mean_val:9.3f}  P-P={p2p:9.3f}  RMS={rms:9.3f} {self.channel_units[i]}  Δt={delta_t:5.2f}s, ΔPoints={n_points}"
                 self.measure_labels[i].setText(text)
         except Exception as e:
             print(f"Error in update_measurements: {e}")
     
+    def set_spectrum_enabled(self, enabled):
+        """FFT 스펙트럼 패널 표시/숨김"""
+        self.spectrum_enabled = enabled
+        self.spectrum_widget.setVisible(enabled)
+        if enabled:
+            self.spectrum_widget.reset()
+            self.update_spectrum(force=True)
+    
+    def update_spectrum(self, force=False):
+        """스펙트럼 갱신 - 새 샘플이 들어온 경우에만 FFT 수행"""
+        if not self.spectrum_enabled:
+            return
+        if not force and self._spectrum_sample_count == self.sample_count:
+            return
+        self._spectrum_sample_count = self.sample_count
+        try:
+            if len(self.display_time) < 8:
+                return
+            time_array = self.display_time
+            channel_arrays = [
+                self.display_channel_data[i] if self.active_channels[i] else None
+                for i in range(self.num_channels)
+            ]
+            visible = tuple(self.plot_widget.getViewBox().viewRange()[0])
+            self.spectrum_widget.update_spectrum(
+                time_array, channel_arrays, self.active_channels,
+                region=self.region.getRegion(), visible=visible
+            )
+        except Exception as e:
+            print(f"Error in update_spectrum: {e}")
+    
     def render_plots(self):
         """플롯과 측정값 렌더링"""
+        span = monitor.begin()
         try:
             self.update_plots()
             self.update_measurements()
+            self.update_spectrum()
             
             # ✅ X축 단위 자동 업데이트
             self.update_x_axis_unit()
@@ -1170,6 +1286,9 @@ class UnifiedPlotWidget(QWidget):
             self.mouse_position_label.setGeometry(x_pos, y_pos, label_width + 10, label_height + 5)
         except Exception as e:
             print(f"Error in render_plots: {e}")
+        monitor.end("scope_render", span)
+        metrics.tick_render("scope")
+        metrics.set("rf_queue_depth", len(self.history), queue="scope_buffer")
     
     def set_channel_active(self, channel_idx, active):
         try:
@@ -1178,7 +1297,7 @@ class UnifiedPlotWidget(QWidget):
             self.measure_labels[channel_idx].setVisible(active)
             self.measure_labels[channel_idx].setStyleSheet(f"""
                 QLabel {{
-                    color: {COLORS['CHANNELS'][channel_idx]};
+                    color: {ALL_CHANNEL_COLORS[channel_idx]};
                     font-size: {COLORS['MEASUREMENT_FONT_SIZE']}px;
                     font-weight: normal;
                     padding: 0px;
@@ -1186,7 +1305,7 @@ class UnifiedPlotWidget(QWidget):
                     background-color: transparent;
                 }}
             """)
-            name = f"CH{channel_idx+1}: {self.channel_names[channel_idx]}"
+            name = f"{self.channel_label(channel_idx)}: {self.channel_names[channel_idx]}"
             if active:
                 self.legend.addItem(self.plot_lines[channel_idx], name)
             else:
@@ -1199,19 +1318,16 @@ class UnifiedPlotWidget(QWidget):
     
     def clear_data(self):
         try:
-            self.time_data.clear()
-            for channel in self.channel_data:
-                channel.clear()
-            self.pre_time_data.clear()
-            for channel in self.pre_channel_data:
-                channel.clear()
-            self.display_time = []
-            for i in range(9):
-                self.display_channel_data[i] = []
+            self.history.clear()
+            self.pre_history.clear()
+            self.sweep.clear()
+            self.display_time = self.history.times
+            self.display_channel_data = self.history.data
+            self.lod_history.clear()
             self.pre_time = self.total_time / 2
             self.post_time = self.total_time / 2
-            self.sample_count = 0
-            self.pre_sample_count = 0
+            self.reset_timeline()
+            self.spectrum_widget.reset()
             self.render_plots()
             self.region.setRegion([-1, 1])
             self.fixed_measurement_range = None
@@ -1220,6 +1336,22 @@ class UnifiedPlotWidget(QWidget):
         except Exception as e:
             print(f"Error in clear_data: {e}")
     
+    def resize_buffers(self, buffer_size):
+        """원시 버퍼 용량 변경 (타임베이스 변경 시)"""
+        self.buffer_size = buffer_size
+        self.lod_history.ensure_capacity(buffer_size)
+        for ring in (self.history, self.pre_history, self.sweep):
+            ring.resize(buffer_size)
+        source = self.history if self.trigger_settings is None or not len(self.sweep) else self.sweep
+        self.display_time = source.times
+        self.display_channel_data = source.data
+    
+    def reset_timeline(self):
+        """상대 시간 기준 초기화 (다음 블록이 0초)"""
+        self.sample_count = 0
+        self.time_origin = None
+        self.trigger_time = None
+    
     def update_x_axis_unit(self):
         """
         현재 X축 범위에 따라 자동으로 단위 변경
@@ -1289,9 +1421,8 @@ class UnifiedPlotWidget(QWidget):
                 
             xRange = vb.getState()['viewRange'][0]
             
-            if self.time_data:
-                max_time = self.time_data[-1]
-                expected_end = max_time
+            if len(self.history):
+                expected_end = self.history.last_time
                 
                 # 사용자가 범위를 수동으로 조정했으면
                 # 예상 범위와 1초 이상 차이 = 수동 조정
@@ -1317,13 +1448,13 @@ class UnifiedPlotWidget(QWidget):
             y_mouse = mouse_point.y()  # 마우스가 가리키는 Y좌표 (데이터 공간)
             
             # X, Y가 유효한 범위인지 확인
-            if not self.display_time or len(self.display_time) == 0:
+            if len(self.display_time) == 0:
                 self.mouse_position_label.setText("")
                 self.mouse_marker.clear()  # ✅ 마커 제거
                 return
             
-            time_min = min(self.display_time)
-            time_max = max(self.display_time)
+            time_min = self.display_time[0]
+            time_max = self.display_time[-1]
             
             # X범위 벗어나면 표시 안 함
             if x_time < time_min or x_time > time_max:
@@ -1334,14 +1465,7 @@ class UnifiedPlotWidget(QWidget):
             # ========================================
             # 마우스 시간과 가장 가까운 시간 찾기
             # ========================================
-            closest_time_idx = 0
-            min_time_diff = abs(self.display_time[0] - x_time)
-            
-            for time_idx, time_val in enumerate(self.display_time):
-                time_diff = abs(time_val - x_time)
-                if time_diff < min_time_diff:
-                    min_time_diff = time_diff
-                    closest_time_idx = time_idx
+            closest_time_idx = int(np.argmin(np.abs(self.display_time - x_time)))
             
             # ========================================
             # 가장 가까운 채널의 Y값 찾기
@@ -1352,11 +1476,11 @@ class UnifiedPlotWidget(QWidget):
             closest_actual_y = None  # 실제 데이터 포인트 Y값
             closest_time = None  # 찾은 포인트의 시간값
             
-            for ch_idx in range(9):
+            for ch_idx in range(self.num_channels):
                 if not self.active_channels[ch_idx]:
                     continue
                 
-                if not self.display_channel_data[ch_idx] or len(self.display_channel_data[ch_idx]) == 0:
+                if len(self.display_channel_data[ch_idx]) == 0:
                     continue
                 
                 # ========================================
@@ -1442,10 +1566,8 @@ class OscilloscopeView(QWidget):
         self.rf_running = False
         
         # ========================================
-        # ✅ Status용 변수들
+        # ✅ Status 블록 전달 주기
         # ========================================
-        self.status_data_queue = deque(maxlen=100)
-        self.status_batch_size = 10
         # 설정에서 가져오기 (없으면 기본값 50ms)
         self.status_update_interval = 50  # 기본값
         try:
@@ -1457,46 +1579,37 @@ class OscilloscopeView(QWidget):
         except:
             pass  # 설정 로드 실패 시 기본값 사용
         
-        # ========================================
-        # ✅ ADC/DAC용 변수들
-        # ========================================
-        self.adc_data_queue = deque(maxlen=50)
-        self.adc_batch_size = 5
         self.adc_update_interval = 100  # ms
         
         # ========================================
-        # 데이터 소스 모드
+        # 데이터 소스 플러그인 (모두 NumPy 블록을 block_ready로 전달)
         # ========================================
-        self.data_source_mode = "status"  # "status" or "adc_dac"
+        self.data_source_mode = "status"  # DATA_SOURCE_MODES 중 하나
+        self.sources = {
+            "status": StatusScopeSource(flush_interval_ms=self.status_update_interval),
+            "adc_dac": None,     # 네트워크 매니저가 필요하므로 선택 시 생성
+            "replay": None,      # 파일 선택 시 생성
+            "simulated": SimulatedScopeSource(flush_interval_ms=self.status_update_interval),
+        }
+        for source in self.sources.values():
+            if source is not None:
+                source.block_ready.connect(self.on_block_ready)
         
         # ========================================
-        # Status 데이터 소스
+        # 수식 채널 (M1 ~ M3) - 배치 단위 NumPy 계산
         # ========================================
-        self.status_source = StatusDataSource()
-        self.status_source.data_ready.connect(self.on_status_data_ready)
+        self.math_engine = MathChannelEngine()
+        self.math_enabled = [False] * MATH_CHANNEL_COUNT
         
-        # ========================================
-        # ADC/DAC 데이터 소스
-        # ========================================
-        self.adc_dac_source = None
+        # 캡처 저장 스레드
+        self._export_thread = None
         
         # ========================================
         # UI 및 타이머 초기화
         # ========================================
         self.init_ui()
         self.setup_connections()
-        
-        # ========================================
-        # ✅ Status용 타이머
-        # ========================================
-        self.status_timer = QTimer(self)
-        self.status_timer.timeout.connect(self.process_status_batch)
-        
-        # ========================================
-        # ✅ ADC/DAC용 타이머
-        # ========================================
-        self.adc_timer = QTimer(self)
-        self.adc_timer.timeout.connect(self.process_adc_batch)
+        self.apply_math_channel_names()
         
         # ========================================
         # ✅ Run 버튼 깜빡임 타이머
@@ -1505,18 +1618,9 @@ class OscilloscopeView(QWidget):
         self.run_blink_timer.timeout.connect(self._toggle_run_button_color)
         self.run_blink_state = False  # 깜빡임 상태
 
-    # ========================================
-    # ✅ Status 데이터 수신
-    # ========================================
-    def on_status_data_ready(self, status_data, timestamp):
-        """Status 데이터 수신"""
-        if not self.rf_running or self.data_source_mode != "status":
-            return
-        
-        self.status_data_queue.append(('status', status_data, timestamp))
-        
-        if len(self.status_data_queue) > 80:
-            print(f"[WARNING] Status queue high: {len(self.status_data_queue)}")
+    @property
+    def active_source(self):
+        return self.sources.get(self.data_source_mode)
 
     # ========================================
     # ✅ ADC/DAC 소스 초기화
@@ -1527,87 +1631,54 @@ class OscilloscopeView(QWidget):
             if hasattr(self.parent_window, 'parent_window'):
                 main_window = self.parent_window.parent_window
                 if hasattr(main_window, 'network_manager'):
-                    self.adc_dac_source = AdcDacDataSource(
+                    source = AdcDacScopeSource(
                         main_window.network_manager,
-                        interval_ms=100
+                        poll_interval_ms=100,
+                        flush_interval_ms=self.adc_update_interval
                     )
-                    self.adc_dac_source.data_ready.connect(self.on_adc_dac_data_ready)
-                    #print("[Oscilloscope] ADC/DAC source initialized with 100ms interval")
+                    source.block_ready.connect(self.on_block_ready)
+                    self.sources["adc_dac"] = source
         except Exception as e:
             print(f"[Oscilloscope] ADC/DAC source init failed: {e}")
     
-    # ========================================
-    # ✅ ADC/DAC 데이터 수신
-    # ========================================
-    def on_adc_dac_data_ready(self, adc_dac_values, timestamp):
-        """ADC/DAC 데이터 수신"""
-        if not self.rf_running or self.data_source_mode != "adc_dac":
-            return
-        
-        self.adc_data_queue.append(('adc_dac', adc_dac_values, timestamp))
-        
-        if len(self.adc_data_queue) > 40:
-            print(f"[WARNING] ADC queue high: {len(self.adc_data_queue)}")
-    
-    # ========================================
-    # ✅ Status 배치 처리
-    # ========================================
-    def process_status_batch(self):
-        """Status 데이터 배치 처리"""
-        if not self.status_data_queue:
-            return
-        
+    def initialize_replay_source(self):
+        """캡처 파일 재생 소스 초기화"""
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Replay Capture", "data",
+            "Scope Capture (*.npz *.json)"
+        )
+        if not filename:
+            return False
         try:
-            process_count = min(self.status_batch_size, len(self.status_data_queue))
-            
-            for _ in range(process_count):
-                data_item = self.status_data_queue.popleft()
-                
-                if len(data_item) == 3:
-                    data_type, status_data, timestamp = data_item
-                    
-                    channel_data = [
-                        status_data.get("forward_power", 0),
-                        status_data.get("reflect_power", 0),
-                        status_data.get("delivery_power", 0),
-                        status_data.get("frequency", 0),
-                        status_data.get("gamma", 0),
-                        status_data.get("real_gamma", 0),
-                        status_data.get("image_gamma", 0),
-                        status_data.get("rf_phase", 0),
-                        status_data.get("temperature", 0)
-                    ]
-                    
-                    self.plot_widget.update_channels(channel_data, timestamp)
-                    
+            source = ReplayScopeSource(filename, flush_interval_ms=self.status_update_interval)
+            source.block_ready.connect(self.on_block_ready)
+            self.sources["replay"] = source
+            return True
         except Exception as e:
-            print(f"[ERROR] process_status_batch: {e}")
-            import traceback
-            traceback.print_exc()
-            
+            QMessageBox.warning(self, "Replay", f"캡처 파일 로드 실패: {e}")
+            return False
+    
+    def set_ingest_interval(self, interval_ms):
+        """Status/시뮬레이션 블록 전달 주기 변경"""
+        self.status_update_interval = interval_ms
+        for mode in ("status", "simulated", "replay"):
+            source = self.sources.get(mode)
+            if source is not None:
+                source.set_interval(interval_ms)
+    
     # ========================================
-    # ✅ ADC/DAC 배치 처리
+    # ✅ 단일 수집 경로 - 모든 소스의 블록 처리
     # ========================================
-    def process_adc_batch(self):
-        """ADC/DAC 데이터 배치 처리"""
-        if not self.adc_data_queue:
+    def on_block_ready(self, timestamps, values):
+        """데이터 블록 수신 → 수식 채널 계산 → 플롯 반영"""
+        if not self.rf_running or self.sender() is not self.active_source:
             return
         
         try:
-            process_count = min(self.adc_batch_size, len(self.adc_data_queue))
-            
-            for _ in range(process_count):
-                data_item = self.adc_data_queue.popleft()
-                
-                if len(data_item) == 3:
-                    data_type, adc_values, timestamp = data_item
-                    
-                    channel_data = list(adc_values) + [0]
-                    
-                    self.plot_widget.update_channels(channel_data, timestamp)
-                    
+            math_block = self.math_engine.evaluate(values, timestamps, self.plot_widget.sample_interval)
+            self.plot_widget.update_channel_block(timestamps, np.hstack((values, math_block)))
         except Exception as e:
-            print(f"[ERROR] process_adc_batch: {e}")
+            print(f"[ERROR] on_block_ready: {e}")
             import traceback
             traceback.print_exc()
     
@@ -1643,7 +1714,7 @@ class OscilloscopeView(QWidget):
         source_layout.addWidget(QLabel("Data Source:"))
 
         self.data_source_combo = QComboBox()
-        self.data_source_combo.addItems(["Status Data", "ADC Raw"])
+        self.data_source_combo.addItems(["Status Data", "ADC Raw", "Replay File", "Simulated"])
         self.data_source_combo.currentIndexChanged.connect(self.on_data_source_changed)
 
         source_layout.addWidget(self.data_source_combo)
@@ -1696,6 +1767,24 @@ class OscilloscopeView(QWidget):
         button_layout.addWidget(auto_range_btn)
         controls_layout.addLayout(button_layout)
         
+        analysis_layout = QHBoxLayout()
+        analysis_layout.setSpacing(10)
+
+        self.fft_btn = QPushButton("FFT")
+        self.fft_btn.setCheckable(True)
+        self.fft_btn.toggled.connect(self.on_fft_toggled)
+
+        math_btn = QPushButton("Math")
+        math_btn.clicked.connect(self.open_math_channels)
+
+        export_btn = QPushButton("Export")
+        export_btn.clicked.connect(self.export_capture)
+
+        analysis_layout.addWidget(self.fft_btn)
+        analysis_layout.addWidget(math_btn)
+        analysis_layout.addWidget(export_btn)
+        controls_layout.addLayout(analysis_layout)
+        
         layout.addWidget(controls_group)
         
         layout.addStretch()
@@ -1708,24 +1797,19 @@ class OscilloscopeView(QWidget):
         if self.rf_running:
             self.stop_acquisition()
         
-        if index == 0:  # Status Data
-            self.data_source_mode = "status"
-            #print("[Oscilloscope] Switched to Status Data mode")
-            #print(f"  - Update interval: {self.status_update_interval}ms")
-            #print(f"  - Batch size: {self.status_batch_size}")
-            
-            self.update_channel_names_for_status()
-            
-        else:  # ADC/DAC Raw
-            self.data_source_mode = "adc_dac"
-            #print("[Oscilloscope] Switched to ADC/DAC mode")
-            #print(f"  - Update interval: {self.adc_update_interval}ms")
-            #print(f"  - Batch size: {self.adc_batch_size}")
-            
-            if self.adc_dac_source is None:
-                self.initialize_adc_dac_source()
-            
-            self.update_channel_names_for_adc()
+        self.data_source_mode = DATA_SOURCE_MODES[index]
+        
+        if self.data_source_mode == "adc_dac" and self.sources["adc_dac"] is None:
+            self.initialize_adc_dac_source()
+        elif self.data_source_mode == "replay":
+            # 재생은 선택할 때마다 파일을 새로 고름
+            if not self.initialize_replay_source() and self.sources["replay"] is None:
+                self.data_source_combo.setCurrentIndex(0)
+                return
+        
+        source = self.active_source
+        if source is not None:
+            self.update_channel_names(source)
         
         if was_running:
             self.start_acquisition()
@@ -1884,6 +1968,58 @@ class OscilloscopeView(QWidget):
     
     def on_channel_changed(self, channel_idx, enabled):
         self.plot_widget.set_channel_active(channel_idx, enabled)
+        self.plot_widget.update_spectrum(force=True)
+    
+    def on_fft_toggled(self, checked):
+        """FFT 스펙트럼 패널 토글"""
+        self.plot_widget.set_spectrum_enabled(checked)
+    
+    def open_math_channels(self):
+        """수식 채널 설정 다이얼로그"""
+        dialog = MathChannelDialog(self.math_engine, self.math_enabled, self)
+        if dialog.exec_():
+            self.math_enabled = dialog.enabled
+            self.math_engine.reset()
+            for slot in range(MATH_CHANNEL_COUNT):
+                self.plot_widget.set_channel_active(9 + slot, False)
+                if self.math_enabled[slot]:
+                    self.plot_widget.set_channel_active(9 + slot, True)
+            self.apply_math_channel_names()
+    
+    def apply_math_channel_names(self):
+        """수식 채널 이름/단위를 플롯, 트리거 소스, 측정 대상에 반영"""
+        math_names = []
+        math_units = []
+        for slot, channel in enumerate(self.math_engine.slots):
+            if channel is not None and self.math_enabled[slot]:
+                math_names.append(channel.name)
+                math_units.append(channel.unit)
+            else:
+                math_names.append(f"Math {slot+1}")
+                math_units.append("")
+        
+        self.plot_widget.channel_names = list(self.plot_widget.channel_names[:9]) + math_names
+        self.plot_widget.channel_units = list(self.plot_widget.channel_units[:9]) + math_units
+        
+        for slot in range(MATH_CHANNEL_COUNT):
+            idx = 9 + slot
+            self.plot_widget.legend.removeItem(self.plot_widget.plot_lines[idx])
+            if self.plot_widget.active_channels[idx]:
+                self.plot_widget.legend.addItem(
+                    self.plot_widget.plot_lines[idx],
+                    f"M{slot+1}: {math_names[slot]}"
+                )
+        
+        # 트리거 소스/피크 스냅 대상은 인덱스 9 이후에 M1~ 순서로 추가
+        trigger_combo = self.trigger_widget.source_combo
+        while trigger_combo.count() > 9:
+            trigger_combo.removeItem(trigger_combo.count() - 1)
+        trigger_combo.addItems([f"M{slot+1}" for slot in range(MATH_CHANNEL_COUNT)])
+        
+        snap_combo = self.measurement_control.snap_combo
+        while snap_combo.count() > 9:
+            snap_combo.removeItem(snap_combo.count() - 1)
+        snap_combo.addItems([f"M{slot+1}" for slot in range(MATH_CHANNEL_COUNT)])
     
     def on_timebase_changed(self, timebase):
         """버튼 선택시 호출"""
@@ -1929,34 +2065,13 @@ class OscilloscopeView(QWidget):
             # 3️⃣ 필요한 샘플 개수 계산
             required_samples = int((total_seconds / self.plot_widget.sample_interval) + 100)
             
-            # 4️⃣ 기존 데이터 백업
-            old_time_data = list(self.plot_widget.time_data)
-            old_channel_data = [list(self.plot_widget.channel_data[i]) for i in range(9)]
-            old_pre_time_data = list(self.plot_widget.pre_time_data)
-            old_pre_channel_data = [list(self.plot_widget.pre_channel_data[i]) for i in range(9)]
-            
-            # 5️⃣ 새로운 버퍼 크기로 deque 재생성
-            self.plot_widget.buffer_size = max(required_samples, 1000)
-            self.plot_widget.time_data = deque(maxlen=self.plot_widget.buffer_size)
-            self.plot_widget.channel_data = [deque(maxlen=self.plot_widget.buffer_size) for _ in range(9)]
-            self.plot_widget.pre_time_data = deque(maxlen=self.plot_widget.buffer_size)
-            self.plot_widget.pre_channel_data = [deque(maxlen=self.plot_widget.buffer_size) for _ in range(9)]
+            # 4️⃣ 새로운 버퍼 크기로 링 버퍼 재할당 (최근 데이터 유지)
+            # (LOD 이력은 용량만 늘리고 기존 데이터는 그대로 유지)
+            self.plot_widget.resize_buffers(max(required_samples, 1000))
             
-            # 6️⃣ 이전 데이터 복원
-            for t in old_time_data[-self.plot_widget.buffer_size:]:
-                self.plot_widget.time_data.append(t)
-            for i in range(9):
-                for val in old_channel_data[i][-self.plot_widget.buffer_size:]:
-                    self.plot_widget.channel_data[i].append(val)
-            for t in old_pre_time_data[-self.plot_widget.buffer_size:]:
-                self.plot_widget.pre_time_data.append(t)
-            for i in range(9):
-                for val in old_pre_channel_data[i][-self.plot_widget.buffer_size:]:
-                    self.plot_widget.pre_channel_data[i].append(val)
-            
-            # 7️⃣ 플롯 범위 업데이트
-            if len(self.plot_widget.time_data) > 0:
-                current_time = self.plot_widget.time_data[-1]
+            # 5️⃣ 플롯 범위 업데이트
+            if len(self.plot_widget.history) > 0:
+                current_time = self.plot_widget.history.last_time
                 self.plot_widget.plot_widget.setXRange(
                     current_time - self.plot_widget.total_time, 
                     current_time, 
@@ -1969,7 +2084,7 @@ class OscilloscopeView(QWidget):
                     padding=0
                 )
             
-            # 8️⃣ 디버그 로그
+            # 6️⃣ 디버그 로그
             # if is_custom:
                 # print(f"[Custom Timebase] {custom_minutes:.1f}min = {total_seconds:.0f}s, "
                       # f"Buffer: {self.plot_widget.buffer_size} samples, "
@@ -2030,25 +2145,14 @@ class OscilloscopeView(QWidget):
             # ✅ Run 버튼 깜빡임 시작
             self.start_run_button_blink()
             
-            self.plot_widget.sample_count = 0
-            self.plot_widget.pre_sample_count = 0
+            self.plot_widget.reset_timeline()
+            self.math_engine.reset()
             
-            if self.data_source_mode == "status":
-                self.status_data_queue.clear()
-                self.status_timer.start(self.status_update_interval)
-                #print(f"[Oscilloscope] Status acquisition started ({self.status_update_interval}ms)")
-                
-            else:  # adc_dac
-                self.adc_data_queue.clear()
-                
-                if self.adc_dac_source:
-                    self.adc_dac_source.start()
-                    self.adc_timer.start(self.adc_update_interval)
-                    #print(f"[Oscilloscope] ADC/DAC acquisition started ({self.adc_update_interval}ms)")
-                else:
-                    #print("[ERROR] ADC/DAC source not initialized!")
-                    self.stop_acquisition()
-                    return
+            source = self.active_source
+            if source is None or not source.start():
+                #print("[ERROR] Data source not available!")
+                self.stop_acquisition()
+                return
                     
         except Exception as e:
             print(f"[ERROR] start_acquisition: {e}")
@@ -2128,106 +2232,85 @@ class OscilloscopeView(QWidget):
             # ✅ Run 버튼 깜빡임 중지
             self.stop_run_button_blink()
             
-            if self.status_timer.isActive():
-                self.status_timer.stop()
-                self.status_data_queue.clear()
-                #print("[Oscilloscope] Status acquisition stopped")
-            
-            if self.adc_timer.isActive():
-                self.adc_timer.stop()
-                self.adc_data_queue.clear()
-                #print("[Oscilloscope] ADC/DAC acquisition stopped")
-            
-            if self.adc_dac_source:
-                self.adc_dac_source.stop()
+            for source in self.sources.values():
+                if source is not None and source.is_running:
+                    source.stop()
                 
         except Exception as e:
             print(f"[ERROR] stop_acquisition: {e}")
     
+    def export_capture(self):
+        """현재 캡처를 파일로 저장 (백그라운드 스레드)"""
+        if self._export_thread is not None and self._export_thread.isRunning():
+            QMessageBox.information(self, "Export", "이전 캡처 저장이 진행 중입니다.")
+            return
+        
+        time_array, data, header = snapshot_capture(self.plot_widget)
+        if len(time_array) == 0:
+            QMessageBox.information(self, "Export", "저장할 캡처 데이터가 없습니다.")
+            return
+        header["data_source"] = self.data_source_mode
+        
+        os.makedirs("data", exist_ok=True)
+        default_name = os.path.join("data", f"scope_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.npz")
+        filename, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export Capture", default_name,
+            "NumPy Archive (*.npz);;Raw Binary + JSON Header (*.bin)"
+        )
+        if not filename:
+            return
+        
+        fmt = "raw" if selected_filter.startswith("Raw") or filename.endswith(".bin") else "npz"
+        write_csv = QMessageBox.question(
+            self, "Export", "CSV 파일도 함께 저장하시겠습니까?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        ) == QMessageBox.Yes
+        
+        self._export_thread = CaptureExportThread(filename, time_array, data, header, fmt, write_csv, self)
+        self._export_thread.export_finished.connect(self.on_export_finished)
+        self._export_thread.start()
+    
+    def on_export_finished(self, success, message):
+        """캡처 저장 완료"""
+        print(f"[Oscilloscope] {message}")
+        if not success:
+            QMessageBox.warning(self, "Export", message)
+    
     def clear_data(self):
         """데이터 클리어"""
         self.plot_widget.clear_data()
-        self.status_data_queue.clear()
-        self.adc_data_queue.clear()
+        self.math_engine.reset()
         print("[Oscilloscope] All data cleared")
     
-    def update_channel_names_for_status(self):
-        """Status 모드 채널 이름으로 변경"""
-        status_names = [
-            "Fwd Pwr", "Ref Pwr", "Del Pwr", "Frequency", 
-            "Gamma", "R Gamma", "I Gamma", "RF Phase", "Temp"
-        ]
-        
-        status_full_names = [
-            "Forward Power", "Reflect Power", "Delivery Power", "Frequency", 
-            "Gamma", "Real Gamma", "Image Gamma", "RF Phase", "Temperature"
-        ]
-        
-        status_units = [
-            "W", "W", "W", "MHz", "", "", "", "°", "°C"
-        ]
+    def update_channel_names(self, source):
+        """데이터 소스의 채널 메타데이터(이름/단위)로 변경"""
+        short_names = list(source.short_names)
+        full_names = list(source.channel_names)
+        units = list(source.channel_units)
         
         for i, btn in enumerate(self.channel_grid.buttons):
-            btn.setText(f"CH{i+1}\n{status_names[i]}")
+            btn.setText(f"CH{i+1}\n{short_names[i]}")
         
-        self.plot_widget.channel_names = status_full_names
-        self.plot_widget.channel_units = status_units
+        self.plot_widget.channel_names = full_names
+        self.plot_widget.channel_units = units
         
         self.plot_widget.legend.clear()
         for i in range(9):
             if self.plot_widget.active_channels[i]:
                 self.plot_widget.legend.addItem(
                     self.plot_widget.plot_lines[i], 
-                    f"CH{i+1}: {status_full_names[i]}"
+                    f"CH{i+1}: {full_names[i]}"
                 )
         
         self.trigger_widget.source_combo.clear()
-        self.trigger_widget.source_combo.addItems(status_names)
+        self.trigger_widget.source_combo.addItems(short_names)
         
         self.measurement_control.snap_combo.clear()
         self.measurement_control.snap_combo.addItems([f"CH{i+1}" for i in range(9)])
         
-        print("[Oscilloscope] Channel names updated for Status mode")
-    
-    def update_channel_names_for_adc(self):
-        """ADC/DAC 모드 채널 이름으로 변경"""
-        adc_names = [
-            "ADC 0", "ADC 1", "ADC 2", "ADC 3", 
-            "ADC 4", "ADC 5", "ADC 6", "ADC 7", "Reserved"
-        ]
-        
-        adc_full_names = [
-            "ADC Channel 0", "ADC Channel 1", "ADC Channel 2", "ADC Channel 3", 
-            "ADC Channel 4", "ADC Channel 5", "ADC Channel 6", "ADC Channel 7", 
-            "Reserved"
-        ]
-        
-        adc_units = [
-            "LSB", "LSB", "LSB", "LSB", 
-            "LSB", "LSB", "LSB", "LSB", "-"
-        ]
-        
-        for i, btn in enumerate(self.channel_grid.buttons):
-            btn.setText(f"CH{i+1}\n{adc_names[i]}")
-        
-        self.plot_widget.channel_names = adc_full_names
-        self.plot_widget.channel_units = adc_units
-        
-        self.plot_widget.legend.clear()
-        for i in range(9):
-            if self.plot_widget.active_channels[i]:
-                self.plot_widget.legend.addItem(
-                    self.plot_widget.plot_lines[i], 
-                    f"CH{i+1}: {adc_full_names[i]}"
-                )
-        
-        self.trigger_widget.source_combo.clear()
-        self.trigger_widget.source_combo.addItems(adc_names)
-        
-        self.measurement_control.snap_combo.clear()
-        self.measurement_control.snap_combo.addItems([f"CH{i+1}" for i in range(9)])
+        self.apply_math_channel_names()
         
-        #print("[Oscilloscope] Channel names updated for ADC/DAC mode")
+        print(f"[Oscilloscope] Channel names updated for {source.name}")
     
     def update_data(self, status_data):
         """외부에서 호출되는 Status 데이터 업데이트"""
@@ -2235,7 +2318,6 @@ class OscilloscopeView(QWidget):
             return
         
         try:
-            timestamp = time.time()
-            self.status_data_queue.append(('status', status_data, timestamp))
+            self.sources["status"].update_data(status_data)
         except Exception as e:
             print(f"[ERROR] update_data: {e}")
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Sample Ring Module
+스코프 원시 버퍼 - 미리 할당한 NumPy 배열에 블록 단위로 추가, 복사 없는 연속 뷰로 렌더링
+"""
+
+import numpy as np
+
+
+class SampleRing:
+    """
+    시간 + 채널 링 버퍼 (capacity 샘플 보관)
+    - 배열을 capacity의 2배로 잡아 끝에 이어 쓰고, 꽉 차면 최근 capacity개만 앞으로 한 번 복사
+    - times / data는 항상 연속 구간 뷰 (data는 채널 우선: data[i]가 채널 i의 연속 배열)
+    """
+
+    def __init__(self, channel_count, capacity):
+        self.channel_count = channel_count
+        self.capacity = max(int(capacity), 1)
+        self._time = np.empty(self.capacity * 2, dtype=np.float64)
+        self._data = np.empty((channel_count, self.capacity * 2), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def times(self):
+        return self._time[self._start:self._end]
+
+    @property
+    def data(self):
+        return self._data[:, self._start:self._end]
+
+    @property
+    def last_time(self):
+        return self._time[self._end - 1] if self._end > self._start else None
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+
+    def append_block(self, times, block):
+        """블록 추가 - times (n,), block (n x 채널) - capacity 초과분은 앞에서 버림"""
+        n = len(times)
+        if n == 0:
+            return
+        if n >= self.capacity:
+            times = times[-self.capacity:]
+            block = block[-self.capacity:]
+            n = self.capacity
+            self.clear()
+        if self._end + n > self._time.shape[0]:
+            keep = min(len(self), self.capacity - n)
+            self._compact(keep)
+        end = self._end + n
+        self._time[self._end:end] = times
+        self._data[:, self._end:end] = np.asarray(block).T
+        self._end = end
+        if len(self) > self.capacity:
+            self._start = self._end - self.capacity
+
+    def drop_before(self, t_min):
+        """t_min보다 이전 샘플 제거 (시간은 단조 증가)"""
+        if self._end > self._start:
+            self._start += int(np.searchsorted(self.times, t_min, side='left'))
+
+    def resize(self, capacity):
+        """용량 변경 - 최근 샘플 유지"""
+        times, data = self.times.copy(), self.data.copy()
+        self.capacity = max(int(capacity), 1)
+        self._time = np.empty(self.capacity * 2, dtype=np.float64)
+        self._data = np.empty((self.channel_count, self.capacity * 2), dtype=np.float64)
+        self.clear()
+        self.append_block(times, data.T)
+
+    def _compact(self, keep):
+        """최근 keep개 샘플을 배열 앞으로 이동"""
+        src = self._end - keep
+        self._time[:keep] = self._time[src:self._end]
+        self._data[:, :keep] = self._data[:, src:self._end]
+        self._start = 0
+        self._end = keep
@@ -0,0 +1,297 @@
+"""
+Spectrum Analyzer Module
+오실로스코프 채널용 FFT 스펙트럼 분석 - 윈도우 함수, 평균 모드, 피크 마커
+"""
+
+import numpy as np
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QCheckBox, QSpinBox
+)
+import pyqtgraph as pg
+
+# ============================================
+# 윈도우 함수 (cosine-sum 계수, periodic)
+# ============================================
+WINDOW_COEFFS = {
+    "Hann": (0.5, 0.5),
+    "Blackman": (0.42, 0.5, 0.08),
+    "Flat-top": (0.21557895, 0.41663158, 0.277263158, 0.083578947, 0.006947368),
+    "Rectangular": (1.0,),
+}
+
+AVERAGING_MODES = ["None", "RMS", "Exponential", "Peak Hold"]
+
+SPECTRUM_RANGES = ["Region", "Visible"]
+
+
+def make_window(name, n):
+    """cosine-sum 윈도우 생성 (periodic)"""
+    coeffs = WINDOW_COEFFS.get(name, WINDOW_COEFFS["Hann"])
+    phase = np.arange(n) * (2.0 * np.pi / n)
+    window = np.full(n, coeffs[0], dtype=np.float64)
+    for k, a in enumerate(coeffs[1:], start=1):
+        window += ((-1) ** k) * a * np.cos(k * phase)
+    return window
+
+
+class SpectrumAnalyzer:
+    """채널별 FFT 계산 및 평균 상태 관리"""
+
+    def __init__(self, window="Hann", averaging="None", avg_count=8, remove_dc=True):
+        self.window = window
+        self.averaging = averaging
+        self.avg_count = avg_count
+        self.remove_dc = remove_dc
+        self._window_cache = {}  # (window, n) -> (window, coherent sum)
+        self._avg_state = {}     # channel_idx -> [count, power]
+
+    def set_window(self, window):
+        self.window = window
+        self.reset()
+
+    def set_averaging(self, averaging, avg_count=None):
+        self.averaging = averaging
+        if avg_count is not None:
+            self.avg_count = max(1, int(avg_count))
+        self.reset()
+
+    def reset(self):
+        """평균 상태 초기화"""
+        self._avg_state.clear()
+
+    def _get_window(self, n):
+        key = (self.window, n)
+        cached = self._window_cache.get(key)
+        if cached is None:
+            # 구간 길이가 계속 바뀌는 경우 캐시가 커지지 않도록 제한
+            if len(self._window_cache) > 16:
+                self._window_cache.clear()
+            window = make_window(self.window, n)
+            cached = (window, float(window.sum()))
+            self._window_cache[key] = cached
+        return cached
+
+    def compute(self, channel_idx, samples, sample_interval):
+        """
+        단측 진폭 스펙트럼 계산
+        samples: 1차원 배열 (슬라이스 뷰 그대로 사용)
+        반환: (freqs, magnitude_db) 또는 None
+        """
+        x = np.asarray(samples, dtype=np.float64)
+        n = len(x)
+        if n < 8 or sample_interval <= 0:
+            return None
+
+        window, window_sum = self._get_window(n)
+        if self.remove_dc:
+            x = x - x.mean()
+
+        spectrum = np.fft.rfft(x * window)
+        # 윈도우 coherent gain 보정 후 단측 진폭^2
+        power = np.abs(spectrum)
+        power *= 2.0 / window_sum
+        power *= power
+        power[0] *= 0.25
+        if n % 2 == 0:
+            power[-1] *= 0.25
+
+        power = self._apply_averaging(channel_idx, power)
+        freqs = np.fft.rfftfreq(n, d=sample_interval)
+        magnitude_db = 10.0 * np.log10(np.maximum(power, 1e-20))
+        return freqs, magnitude_db
+
+    def _apply_averaging(self, channel_idx, power):
+        if self.averaging == "None":
+            return power
+
+        state = self._avg_state.get(channel_idx)
+        if state is None or state[1].shape != power.shape:
+            # 구간 길이가 바뀌면 평균 재시작
+            self._avg_state[channel_idx] = [1, power.copy()]
+            return power
+
+        count, acc = state
+        if self.averaging == "RMS":
+            count = min(count + 1, self.avg_count)
+            acc += (power - acc) / count
+        elif self.averaging == "Exponential":
+            acc += (power - acc) / self.avg_count
+        elif self.averaging == "Peak Hold":
+            np.maximum(acc, power, out=acc)
+        state[0] = count
+        return acc
+
+    @staticmethod
+    def find_peaks(freqs, magnitude, count=3):
+        """국부 최대값 중 상위 count개 (DC 제외)"""
+        if len(magnitude) < 3:
+            return []
+        m = magnitude
+        idx = np.nonzero((m[1:-1] > m[:-2]) & (m[1:-1] >= m[2:]))[0] + 1
+        if len(idx) == 0:
+            return []
+        top = idx[np.argsort(m[idx])[::-1][:count]]
+        return [(float(freqs[i]), float(m[i])) for i in top]
+
+
+class SpectrumWidget(QWidget):
+    """FFT 스펙트럼 표시 위젯"""
+
+    def __init__(self, channel_colors, parent=None):
+        super().__init__(parent)
+        self.channel_colors = channel_colors
+        self.analyzer = SpectrumAnalyzer()
+        self.range_mode = "Region"
+        self.show_peaks = True
+        self.peak_count = 3
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(3)
+
+        control_layout = QHBoxLayout()
+        control_layout.setSpacing(5)
+
+        control_layout.addWidget(QLabel("Window:"))
+        self.window_combo = QComboBox()
+        self.window_combo.addItems(list(WINDOW_COEFFS.keys()))
+        self.window_combo.currentTextChanged.connect(self.analyzer.set_window)
+        control_layout.addWidget(self.window_combo)
+
+        control_layout.addWidget(QLabel("Avg:"))
+        self.avg_combo = QComboBox()
+        self.avg_combo.addItems(AVERAGING_MODES)
+        self.avg_combo.currentTextChanged.connect(self.on_averaging_changed)
+        control_layout.addWidget(self.avg_combo)
+
+        self.avg_spin = QSpinBox()
+        self.avg_spin.setRange(2, 64)
+        self.avg_spin.setValue(self.analyzer.avg_count)
+        self.avg_spin.valueChanged.connect(self.on_averaging_changed)
+        control_layout.addWidget(self.avg_spin)
+
+        control_layout.addWidget(QLabel("Range:"))
+        self.range_combo = QComboBox()
+        self.range_combo.addItems(SPECTRUM_RANGES)
+        self.range_combo.currentTextChanged.connect(self.on_range_mode_changed)
+        control_layout.addWidget(self.range_combo)
+
+        self.dc_check = QCheckBox("DC Remove")
+        self.dc_check.setChecked(self.analyzer.remove_dc)
+        self.dc_check.toggled.connect(self.on_dc_remove_toggled)
+        control_layout.addWidget(self.dc_check)
+
+        self.peak_check = QCheckBox("Peaks")
+        self.peak_check.setChecked(self.show_peaks)
+        self.peak_check.toggled.connect(self.on_peaks_toggled)
+        control_layout.addWidget(self.peak_check)
+
+        control_layout.addStretch()
+        layout.addLayout(control_layout)
+
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setLabel('bottom', 'Frequency', units='Hz')
+        self.plot_widget.setLabel('left', 'Magnitude', units='dB')
+        self.plot_widget.showGrid(x=True, y=True, alpha=0.2)
+        self.plot_widget.setMenuEnabled(False)
+        self.plot_widget.setClipToView(True)
+
+        self.spectrum_lines = []
+        for i in range(len(self.channel_colors)):
+            line = self.plot_widget.plot(pen=pg.mkPen(color=self.channel_colors[i], width=1))
+            line.setVisible(False)
+            self.spectrum_lines.append(line)
+
+        self.peak_marker = pg.ScatterPlotItem(size=8, symbol='t', pen=pg.mkPen('w', width=1))
+        self.plot_widget.addItem(self.peak_marker)
+        layout.addWidget(self.plot_widget, 1)
+
+        self.peak_label = QLabel("")
+        self.peak_label.setWordWrap(True)
+        layout.addWidget(self.peak_label)
+
+    def on_averaging_changed(self, *args):
+        self.analyzer.set_averaging(self.avg_combo.currentText(), self.avg_spin.value())
+
+    def on_range_mode_changed(self, mode):
+        self.range_mode = mode
+        self.analyzer.reset()
+
+    def on_dc_remove_toggled(self, checked):
+        self.analyzer.remove_dc = checked
+        self.analyzer.reset()
+
+    def on_peaks_toggled(self, checked):
+        self.show_peaks = checked
+        if not checked:
+            self.peak_marker.clear()
+            self.peak_label.setText("")
+
+    def reset(self):
+        """평균 상태 및 표시 초기화"""
+        self.analyzer.reset()
+        for line in self.spectrum_lines:
+            line.setData([], [])
+        self.peak_marker.clear()
+        self.peak_label.setText("")
+
+    def update_spectrum(self, time_array, channel_arrays, active_channels, region=None, visible=None):
+        """
+        활성 채널 스펙트럼 갱신
+        time_array: 정렬된 시간 배열 (np.ndarray)
+        channel_arrays: 채널별 np.ndarray (time_array와 같은 길이)
+        region / visible: (min, max) 시간 범위
+        """
+        try:
+            x_range = region if self.range_mode == "Region" else visible
+            if x_range is None or len(time_array) < 8:
+                return
+
+            # 정렬된 시간축이므로 searchsorted로 구간 슬라이스 (복사 없이 뷰)
+            start = int(np.searchsorted(time_array, x_range[0], side='left'))
+            stop = int(np.searchsorted(time_array, x_range[1], side='right'))
+            n = stop - start
+            if n < 8:
+                for line in self.spectrum_lines:
+                    line.setData([], [])
+                self.peak_marker.clear()
+                self.peak_label.setText("Spectrum: not enough samples in range")
+                return
+
+            sample_interval = (time_array[stop - 1] - time_array[start]) / (n - 1)
+
+            peak_spots = []
+            peak_texts = []
+            for i, line in enumerate(self.spectrum_lines):
+                data = channel_arrays[i] if i < len(channel_arrays) else None
+                if not active_channels[i] or data is None or len(data) != len(time_array):
+                    line.setVisible(False)
+                    continue
+
+                result = self.analyzer.compute(i, data[start:stop], sample_interval)
+                if result is None:
+                    line.setVisible(False)
+                    continue
+
+                freqs, magnitude = result
+                line.setData(freqs, magnitude)
+                line.setVisible(True)
+
+                if self.show_peaks:
+                    peaks = self.analyzer.find_peaks(freqs, magnitude, self.peak_count)
+                    for freq, mag in peaks:
+                        peak_spots.append({'pos': (freq, mag), 'brush': pg.mkBrush(self.channel_colors[i])})
+                    if peaks:
+                        peak_texts.append(
+                            f"CH{i+1}: " + ", ".join(f"{f:.3f}Hz {m:.1f}dB" for f, m in peaks)
+                        )
+
+            if self.show_peaks:
+                self.peak_marker.setData(peak_spots)
+                fs = 1.0 / sample_interval if sample_interval > 0 else 0
+                header = f"N={n}  Fs={fs:.2f}Hz  RBW={fs / n:.4f}Hz"
+                self.peak_label.setText(header + ("\n" + "\n".join(peak_texts) if peak_texts else ""))
+        except Exception as e:
+            print(f"Error in update_spectrum: {e}")
@@ -0,0 +1,165 @@
+"""
+Performance Monitor Module
+파이프라인 단계별 계측 - 수신/디코드/저장/테이블/게이지/플롯/분석/스코프/로그 구간 시간을 HDR 방식 히스토그램에 기록
+- 끄면 begin()이 0을 반환하고 end()는 바로 반환 (단계당 함수 호출 2회 비용)
+- Qt 비의존 (다이얼로그/메트릭 출력에서 공용)
+
+사용 예:
+    from perf_monitor import monitor
+    t = monitor.begin()
+    ...
+    monitor.end("decode", t)
+"""
+
+import time
+import threading
+
+# 단계 (표시 순서, 이름)
+STAGES = [
+    ("receive", "수신 (요청→프레임)"),
+    ("decode", "디코드"),
+    ("store", "저장"),
+    ("table", "상태 테이블"),
+    ("gauges", "게이지"),
+    ("plot", "메인 플롯"),
+    ("analysis", "분석 도크"),
+    ("scope", "스코프 입력"),
+    ("scope_render", "스코프 렌더"),
+    ("log", "로그 추가"),
+]
+
+SUB_BUCKET_BITS = 7  # 2^(7-1) = 64 하위 구간 -> 상대 오차 약 1.6%
+MAX_VALUE_BITS = 36  # 2^36 us (약 19시간)까지 기록
+
+
+class LatencyHistogram:
+    """
+    HDR 방식 로그-선형 히스토그램 (마이크로초 정수)
+    - 2^SUB_BUCKET_BITS 미만은 1us 단위, 이후 2의 거듭제곱 구간마다 같은 개수의 하위 구간
+    - 기록은 정수 연산 몇 번 + 리스트 증가 1회
+    """
+
+    def __init__(self):
+        self.counts = [0] * ((MAX_VALUE_BITS - SUB_BUCKET_BITS + 2) << (SUB_BUCKET_BITS - 1))
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        # 초당 처리량 (직전 1초 구간)
+        self.second = 0
+        self.second_count = 0
+        self.rate = 0
+
+    @staticmethod
+    def index_of(value):
+        bits = value.bit_length()
+        if bits <= SUB_BUCKET_BITS:
+            return value
+        shift = bits - SUB_BUCKET_BITS
+        return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def value_of(index):
+        """구간 상한값 (us)"""
+        if index < (1 << SUB_BUCKET_BITS):
+            return index
+        half = 1 << (SUB_BUCKET_BITS - 1)
+        shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+        return (((index & (half - 1)) + half + 1) << shift) - 1
+
+    def record(self, value_us, second):
+        index = self.index_of(value_us)
+        if index >= len(self.counts):
+            index = len(self.counts) - 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value_us
+        if value_us > self.max:
+            self.max = value_us
+        if second != self.second:
+            self.rate = self.second_count if second == self.second + 1 else 0
+            self.second = second
+            self.second_count = 0
+        self.second_count += 1
+
+    def percentile(self, q):
+        """q (0~100) 백분위 상한값 (us)"""
+        if not self.count:
+            return 0
+        target = max(int(self.count * q / 100.0 + 0.5), 1)
+        seen = 0
+        for index, n in enumerate(self.counts):
+            if n:
+                seen += n
+                if seen >= target:
+                    return min(self.value_of(index), self.max)
+        return self.max
+
+    def current_rate(self, second):
+        """직전 1초 처리량 (기록이 끊기면 0)"""
+        if second == self.second:
+            return self.rate
+        if second == self.second + 1:
+            return self.second_count
+        return 0
+
+
+class PerfMonitor:
+    """단계별 히스토그램 모음 - enabled가 False면 기록하지 않음"""
+
+    def __init__(self):
+        self.enabled = False
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def set_enabled(self, enabled):
+        self.enabled = bool(enabled)
+
+    def begin(self):
+        """구간 시작 (끄면 0)"""
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def end(self, stage, start):
+        """구간 종료 - begin() 결과가 0이면 무시"""
+        if start:
+            now = time.perf_counter_ns()
+            self._record(stage, (now - start) // 1000, now // 1000000000)
+
+    def record(self, stage, seconds):
+        """외부에서 잰 구간 기록 (초)"""
+        if self.enabled:
+            self._record(stage, int(seconds * 1000000), time.perf_counter_ns() // 1000000000)
+
+    def _record(self, stage, value_us, second):
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(stage, LatencyHistogram())
+        histogram.record(max(value_us, 0), second)
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+
+    def snapshot(self):
+        """
+        단계별 요약 (STAGES 순서, 기록 없는 단계 포함)
+        반환: [{'stage', 'label', 'count', 'rate', 'mean_ms', 'p50_ms', 'p99_ms', 'max_ms'}, ...]
+        """
+        second = time.perf_counter_ns() // 1000000000
+        labels = dict(STAGES)
+        names = [name for name, _ in STAGES] + sorted(set(self.histograms) - set(labels))
+        rows = []
+        for name in names:
+            h = self.histograms.get(name)
+            row = {"stage": name, "label": labels.get(name, name), "count": 0, "rate": 0,
+                   "mean_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+            if h and h.count:
+                row.update(count=h.count, rate=h.current_rate(second), mean_ms=h.total / h.count / 1000.0,
+                           p50_ms=h.percentile(50) / 1000.0, p99_ms=h.percentile(99) / 1000.0,
+                           max_ms=h.max / 1000.0)
+            rows.append(row)
+        return rows
+
+
+# 전역 모니터 (앱 전체 공유)
+monitor = PerfMonitor()
@@ -0,0 +1,89 @@
+"""
+Performance Monitor Dialog Module
+파이프라인 단계별 지연 오버레이 - 단계별 p50/p99/최대 지연과 초당 처리량 (1초 갱신)
+"""
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox,
+    QTableWidget, QTableWidgetItem, QHeaderView
+)
+from PyQt5.QtCore import Qt, QTimer
+
+from perf_monitor import monitor, STAGES
+
+COLUMNS = ["단계", "건/s", "p50(ms)", "p99(ms)", "최대(ms)", "평균(ms)", "누적"]
+ROW_KEYS = ["rate", "p50_ms", "p99_ms", "max_ms", "mean_ms", "count"]
+
+
+class PerfMonitorDialog(QDialog):
+    """성능 모니터 다이얼로그 (항상 위 도구 창)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parent_window = parent
+
+        self.setWindowTitle("Performance Monitor")
+        self.setWindowFlags(self.windowFlags() | Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(620, 380)
+        self.init_ui()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(1000)
+        self.refresh()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        control_layout = QHBoxLayout()
+        self.enable_check = QCheckBox("계측 활성화")
+        self.enable_check.setChecked(monitor.enabled)
+        self.enable_check.toggled.connect(self.set_enabled)
+        control_layout.addWidget(self.enable_check)
+        self.status_label = QLabel()
+        control_layout.addWidget(self.status_label)
+        control_layout.addStretch()
+        reset_btn = QPushButton("초기화")
+        reset_btn.clicked.connect(self.reset)
+        control_layout.addWidget(reset_btn)
+        layout.addLayout(control_layout)
+
+        self.table = QTableWidget(len(STAGES), len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+
+    def set_enabled(self, enabled):
+        monitor.set_enabled(enabled)
+        self.refresh()
+
+    def reset(self):
+        monitor.reset()
+        self.refresh()
+
+    def refresh(self):
+        """단계별 요약 갱신 (기록 중 추가된 단계는 행 추가)"""
+        rows = monitor.snapshot()
+        self.table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            values = [row["label"]] + [
+                str(row[key]) if key in ("rate", "count") else f"{row[key]:.3f}" for key in ROW_KEYS
+            ]
+            for c, text in enumerate(values):
+                item = self.table.item(r, c)
+                if item is None:
+                    item = QTableWidgetItem()
+                    item.setTextAlignment(Qt.AlignVCenter | (Qt.AlignLeft if c == 0 else Qt.AlignRight))
+                    self.table.setItem(r, c, item)
+                item.setText(text)
+        self.status_label.setText("기록 중" if monitor.enabled else "꺼짐 (계측 비용 없음)")
+
+    def stop_timer(self):
+        self.refresh_timer.stop()
+
+    def closeEvent(self, event):
+        # 창을 닫아도 계측 상태는 유지 (다시 열어 확인)
+        self.stop_timer()
+        super().closeEvent(event)
@@ -7,6 +7,8 @@ X축: 분:초 형식 표시 (MM:SS)
 import numpy as np
 from PyQt5.QtCore import QTimer, QObject, pyqtSignal
 
+from metrics_exporter import metrics
+
 #class PlotManager:
 class PlotManager(QObject):  # QObject 상속 추가 격자 테스트
     """플롯 관리자 - 초간단 버전"""
@@ -80,6 +82,7 @@ class PlotManager(QObject):  # QObject 상속 추가 격자 테스트
         time_deque = self.parent.plot_data['time']
         if len(time_deque) < 2:
             return
+        metrics.tick_render("main")
         
         # ========================================
         # ✅ 시간 축 포맷 초기화 (최초 1회만)
@@ -0,0 +1,400 @@
+"""
+Recipe Sequencer Module
+시간 기반 레시피 실행 - 파워 램프, 주파수 스텝, 펄스 전환, RF On/Off, 상태 조건 대기
+monotonic 시계 기준 스케줄링, 단계별 계획/실제 시각과 응답 트레이스 기록
+
+레시피 파일 (JSON):
+    {
+        "name": "etch_demo",
+        "on_error": "abort",            # abort | continue
+        "safe_stop": true,              # 중단/실패 시 RF Off 전송
+        "steps": [
+            {"at": 0.0, "action": "set_power", "value": 0},
+            {"at": 0.1, "action": "rf_on"},
+            {"at": 0.2, "action": "ramp_power", "from": 0, "to": 500, "duration": 2.0, "interval": 0.05},
+            {"action": "wait_status", "field": "forward_power", "op": ">=", "value": 450, "timeout": 5.0},
+            {"after": 1.0, "action": "set_frequency", "value": 13.56},
+            {"after": 0.5, "action": "pulse", "on": true},
+            {"after": 3.0, "action": "rf_off"}
+        ]
+    }
+    - at: 레시피 시작 기준 절대 시각(초), after: 이전 단계 완료 기준 지연(초), 둘 다 없으면 즉시
+
+사용 예 (시뮬레이터 대상, GUI 없이):
+    python recipe_sequencer.py recipe.json --host 127.0.0.1 --port 5000 --out run.json
+"""
+
+import json
+import time
+import bisect
+import struct
+import argparse
+import datetime
+import threading
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from rf_protocol import RFProtocol
+from status_stream import StatusSampleStream
+
+RECIPE_ACTIONS = ["rf_on", "rf_off", "set_power", "ramp_power", "set_frequency", "pulse", "wait", "wait_status"]
+STATUS_OPERATORS = {
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+    "==": lambda a, b: a == b,
+}
+TRACE_FIELDS = ["set_power", "forward_power", "reflect_power", "frequency", "rf_on_off"]
+
+SPIN_THRESHOLD = 0.002      # 마감 2ms 전부터 busy-wait
+SLEEP_SLICE = 0.05          # 장시간 대기 중 트레이스 수집 주기
+COMMAND_TIMEOUT = 5.0
+
+
+def load_recipe(path):
+    """레시피 파일 로드/검증 - 반환: (성공 여부, 레시피 dict, 메시지)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            recipe = json.load(f)
+    except Exception as e:
+        return False, None, f"레시피 파일 읽기 실패: {e}"
+    return validate_recipe(recipe)
+
+
+def validate_recipe(recipe):
+    """레시피 구조 검증 - 반환: (성공 여부, 레시피 dict, 메시지)"""
+    steps = recipe.get("steps") if isinstance(recipe, dict) else None
+    if not steps:
+        return False, None, "레시피에 steps가 없습니다"
+
+    for index, step in enumerate(steps):
+        action = step.get("action")
+        if action not in RECIPE_ACTIONS:
+            return False, None, f"단계 {index}: 알 수 없는 action '{action}'"
+        if "at" in step and "after" in step:
+            return False, None, f"단계 {index}: at과 after는 함께 쓸 수 없습니다"
+        if action in ("set_power", "set_frequency") and "value" not in step:
+            return False, None, f"단계 {index}: value가 필요합니다"
+        if action == "ramp_power" and not all(k in step for k in ("to", "duration")):
+            return False, None, f"단계 {index}: ramp_power에는 to, duration이 필요합니다"
+        if action == "wait" and "duration" not in step:
+            return False, None, f"단계 {index}: wait에는 duration이 필요합니다"
+        if action == "wait_status":
+            if step.get("op", ">=") not in STATUS_OPERATORS:
+                return False, None, f"단계 {index}: 지원하지 않는 op '{step.get('op')}'"
+            if "field" not in step or "value" not in step:
+                return False, None, f"단계 {index}: wait_status에는 field, value가 필요합니다"
+    return True, recipe, f"레시피 로드 완료: {len(steps)}단계"
+
+
+class RecipeSequencer:
+    """
+    레시피 실행기 (호출한 스레드에서 블로킹 실행)
+    - 스케줄: 마감 직전까지 sleep, 마지막 2ms는 busy-wait (monotonic 시계)
+    - 기록: 단계별 planned/started/lateness, 명령 지연, 결과, 상태 트레이스
+    """
+
+    def __init__(self, client_thread, recipe):
+        self.client_thread = client_thread
+        self.recipe = recipe
+        self.stream = StatusSampleStream(client_thread, maxsize=100000, clock=time.monotonic)
+        self.records = []
+        self.samples = []  # (상대 시각, {필드: 값})
+        self._stop = threading.Event()
+        self._t0 = 0.0
+        self._wall_t0 = 0.0  # 결과 'started' 표시용 - 트레이스/지연 계산은 모두 time.monotonic 기준
+        self._last_status = None
+
+    def stop(self):
+        self._stop.set()
+
+    # ========================================
+    # 시간/트레이스
+    # ========================================
+    def _now(self):
+        return time.monotonic() - self._t0
+
+    def _drain(self):
+        """상태 큐 비우기 -> 트레이스 누적, 마지막 상태 갱신"""
+        while True:
+            sample = self.stream.get(0)
+            if sample is None:
+                return
+            timestamp, status = sample
+            self._last_status = status
+            self.samples.append((timestamp - self._t0, {k: status[k] for k in TRACE_FIELDS}))
+
+    def _wait_until(self, deadline):
+        """deadline(상대 초)까지 대기 - 중단 시 False"""
+        while True:
+            if self._stop.is_set():
+                return False
+            remaining = deadline - self._now()
+            if remaining <= 0:
+                return True
+            if remaining > SPIN_THRESHOLD:
+                self._drain()
+                time.sleep(min(remaining - SPIN_THRESHOLD, SLEEP_SLICE))
+
+    # ========================================
+    # 명령
+    # ========================================
+    def _send(self, cmd, subcmd, data=None):
+        result = self.client_thread.send_command(
+            cmd, subcmd, data, wait_response=True, timeout=COMMAND_TIMEOUT, sync=True
+        )
+        return result.success, result.message
+
+    def _execute_action(self, step):
+        """단일 명령 단계 실행 - 반환: (성공 여부, 메시지)"""
+        action = step["action"]
+        if action == "rf_on":
+            return self._send(RFProtocol.CMD_RF_ON, RFProtocol.SUBCMD_RF_ON)
+        if action == "rf_off":
+            return self._send(RFProtocol.CMD_RF_OFF, RFProtocol.SUBCMD_RF_OFF)
+        if action == "set_power":
+            return self._send(RFProtocol.CMD_SET_POWER, RFProtocol.SUBCMD_SET_POWER,
+                              struct.pack('<f', float(step["value"])))
+        if action == "set_frequency":
+            hz = int(round(float(step["value"]) * 1_000_000))  # MHz -> Hz
+            return self._send(RFProtocol.CMD_SET_FREQUENCY, RFProtocol.SUBCMD_SET_FREQUENCY,
+                              struct.pack('<I', hz))
+        if action == "pulse":
+            if "mode" in step:
+                ok, message = self._send(RFProtocol.CMD_PULSE_SET, RFProtocol.SUBCMD_PULSE_MODE,
+                                         struct.pack('<B', int(step["mode"])))
+                if not ok:
+                    return ok, message
+            return self._send(RFProtocol.CMD_PULSE_SET, RFProtocol.SUBCMD_PULSE_OFFON,
+                              struct.pack('<B', 1 if step.get("on", True) else 0))
+        if action == "wait":
+            return (True, "대기 완료") if self._wait_until(self._now() + float(step["duration"])) else (False, "중단")
+        if action == "wait_status":
+            return self._wait_status(step)
+        return False, f"알 수 없는 action: {action}"
+
+    def _wait_status(self, step):
+        """상태 조건 대기 - hold초 동안 연속 만족해야 완료"""
+        field, value = step["field"], float(step["value"])
+        check = STATUS_OPERATORS[step.get("op", ">=")]
+        deadline = self._now() + float(step.get("timeout", 10.0))
+        hold = float(step.get("hold", 0.0))
+        satisfied_since = None
+
+        while not self._stop.is_set():
+            now = self._now()
+            if now > deadline:
+                last = self._last_status.get(field) if self._last_status else None
+                return False, f"상태 조건 시간 초과: {field} {step.get('op', '>=')} {value} (마지막 {last})"
+            sample = self.stream.get(min(SLEEP_SLICE, deadline - now))
+            if sample is None:
+                continue
+            timestamp, status = sample
+            self._last_status = status
+            self.samples.append((timestamp - self._t0, {k: status[k] for k in TRACE_FIELDS}))
+            if field not in status:
+                return False, f"알 수 없는 상태 필드: {field}"
+            if check(status[field], value):
+                satisfied_since = satisfied_since if satisfied_since is not None else self._now()
+                if self._now() - satisfied_since >= hold:
+                    return True, f"{field}={status[field]:.3f} 조건 만족"
+            else:
+                satisfied_since = None
+        return False, "중단"
+
+    def _record(self, index, step, planned, started, finished, success, message, sub_index=None):
+        record = {
+            'index': index,
+            'sub_index': sub_index,
+            'action': step["action"],
+            'params': {k: v for k, v in step.items() if k not in ("action", "at", "after")},
+            'planned_s': planned,
+            'started_s': started,
+            'lateness_ms': (started - planned) * 1000.0,
+            'duration_ms': (finished - started) * 1000.0,
+            'success': success,
+            'message': message,
+        }
+        self.records.append(record)
+        return record
+
+    # ========================================
+    # 실행
+    # ========================================
+    def run(self, step_callback=None):
+        """
+        레시피 실행
+        반환: (성공 여부, 결과 dict, 메시지)
+        """
+        continue_on_error = self.recipe.get("on_error", "abort") == "continue"
+        self.records = []
+        self.samples = []
+        self._stop.clear()
+        self.stream.attach()
+        self._wall_t0 = time.time()
+        self._t0 = time.monotonic()
+        failed = None
+        previous_end = 0.0
+
+        try:
+            for index, step in enumerate(self.recipe["steps"]):
+                if "at" in step:
+                    planned = float(step["at"])
+                else:
+                    planned = previous_end + float(step.get("after", 0.0))
+
+                if step["action"] == "ramp_power":
+                    ok, message = self._run_ramp(index, step, planned, step_callback)
+                else:
+                    if not self._wait_until(planned):
+                        failed = "사용자 중단"
+                        break
+                    started = self._now()
+                    ok, message = self._execute_action(step)
+                    record = self._record(index, step, planned, started, self._now(), ok, message)
+                    if step_callback:
+                        step_callback(record)
+
+                previous_end = self._now()
+                if self._stop.is_set():
+                    failed = "사용자 중단"
+                    break
+                if not ok and not continue_on_error:
+                    failed = f"단계 {index} ({step['action']}) 실패: {message}"
+                    break
+        finally:
+            if failed and self.recipe.get("safe_stop", True):
+                self._send(RFProtocol.CMD_RF_OFF, RFProtocol.SUBCMD_RF_OFF)
+            self._drain()
+            self.stream.detach()
+
+        result = self.build_result()
+        if failed:
+            return False, result, failed
+        summary = result['summary']
+        return True, result, (f"레시피 완료: {summary['steps']}단계, 지연 평균 {summary['mean_lateness_ms']:.2f}ms, "
+                              f"최대 {summary['max_lateness_ms']:.2f}ms")
+
+    def _run_ramp(self, index, step, planned, step_callback):
+        """파워 램프 - interval마다 절대 시각 기준으로 set_power 전송"""
+        duration = float(step["duration"])
+        interval = max(float(step.get("interval", 0.05)), 0.001)
+        start_value = float(step.get("from", self._last_status["set_power"] if self._last_status else 0.0))
+        end_value = float(step["to"])
+        count = max(int(round(duration / interval)), 1)
+
+        for k in range(count + 1):
+            deadline = planned + k * duration / count
+            if not self._wait_until(deadline):
+                return False, "중단"
+            value = start_value + (end_value - start_value) * k / count
+            started = self._now()
+            ok, message = self._send(RFProtocol.CMD_SET_POWER, RFProtocol.SUBCMD_SET_POWER,
+                                     struct.pack('<f', value))
+            record = self._record(index, dict(step, value=value), deadline, started, self._now(),
+                                  ok, message, sub_index=k)
+            if step_callback:
+                step_callback(record)
+            if not ok:
+                return False, message
+        return True, f"램프 완료 ({count + 1}포인트)"
+
+    def build_result(self):
+        """실행 결과 - 단계 기록 + 단계별 트레이스 + 타이밍 요약"""
+        starts = [record['started_s'] for record in self.records]
+        traces = [[] for _ in self.records]
+        for t, values in self.samples:
+            position = bisect.bisect_right(starts, t) - 1
+            if position >= 0:
+                traces[position].append(dict(values, t=t))
+
+        steps = [dict(record, trace=trace) for record, trace in zip(self.records, traces)]
+        lateness = sorted(abs(record['lateness_ms']) for record in self.records)
+        summary = {
+            'steps': len(self.records),
+            'failed': sum(1 for record in self.records if not record['success']),
+            'mean_lateness_ms': sum(lateness) / len(lateness) if lateness else 0.0,
+            'max_lateness_ms': lateness[-1] if lateness else 0.0,
+            'p99_lateness_ms': lateness[min(int(len(lateness) * 0.99), len(lateness) - 1)] if lateness else 0.0,
+            'samples': len(self.samples),
+        }
+        return {
+            'name': self.recipe.get("name", ""),
+            'started': datetime.datetime.fromtimestamp(self._wall_t0).isoformat(timespec='milliseconds'),
+            'summary': summary,
+            'steps': steps,
+        }
+
+
+def save_run_result(path, result):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+class RecipeThread(QThread):
+    """레시피 실행 백그라운드 스레드"""
+
+    step_finished = pyqtSignal(object)               # 단계 기록 dict
+    recipe_finished = pyqtSignal(bool, str, object)  # 성공 여부, 메시지, 결과 dict
+
+    def __init__(self, client_thread, recipe, parent=None):
+        super().__init__(parent)
+        self.sequencer = RecipeSequencer(client_thread, recipe)
+
+    def stop(self):
+        self.sequencer.stop()
+
+    def run(self):
+        try:
+            success, result, message = self.sequencer.run(self.step_finished.emit)
+            self.recipe_finished.emit(success, message, result)
+        except Exception as e:
+            self.recipe_finished.emit(False, f"레시피 실행 오류: {e}", {})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="레시피 실행 (GUI 없이)")
+    parser.add_argument("recipe", help="레시피 파일 (JSON)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--out", help="실행 결과 저장 경로 (JSON)")
+    args = parser.parse_args(argv)
+
+    ok, recipe, message = load_recipe(args.recipe)
+    print(message)
+    if not ok:
+        return 2
+
+    from PyQt5.QtCore import QCoreApplication
+    from rf_protocol import HybridRFClientThread
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    client_thread = HybridRFClientThread(args.host, args.port)
+    client_thread.start()
+    try:
+        deadline = time.monotonic() + 5.0
+        while client_thread.connection_state != "connected" and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.05)
+        if client_thread.connection_state != "connected":
+            print(f"서버 연결 실패: {args.host}:{args.port}")
+            return 1
+
+        sequencer = RecipeSequencer(client_thread, recipe)
+        success, result, message = sequencer.run(
+            lambda r: print(f"[{r['started_s']:8.3f}s] #{r['index']} {r['action']:<14} "
+                            f"late {r['lateness_ms']:6.2f}ms  {r['duration_ms']:7.2f}ms  {r['message']}")
+        )
+    finally:
+        client_thread.stop()
+        client_thread.wait(3000)
+
+    print(message)
+    if args.out:
+        save_run_result(args.out, result)
+        print(f"결과 저장: {args.out}")
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
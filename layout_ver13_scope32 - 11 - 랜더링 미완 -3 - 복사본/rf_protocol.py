@@ -11,7 +11,10 @@ import queue
 from dataclasses import dataclass
 from typing import Optional, Tuple, Union
 from PyQt5.QtCore import QThread, pyqtSignal
-from settings_dialog import SettingsDialog, SettingsManager # 새로 추가
+from settings_dialog import get_settings_manager # 공용 SettingsManager
+from perf_monitor import monitor
+from metrics_exporter import metrics
+from command_journal import journal, result_code, RESULT_OK, RESULT_TIMEOUT, RESULT_ERROR
 
 # 상수 설정
 RECONNECT_MAX_ATTEMPTS = 10
@@ -19,6 +22,7 @@ RECONNECT_MAX_ATTEMPTS = 10
 #RECONNECT_BASE_DELAY = 0.2 # 속도 최적화 테스트 
 RECONNECT_BASE_DELAY = 0.1 # 속도 최적화 테스트 
 SOCKET_TIMEOUT = 5.0
+PIPELINE_WINDOW = 16  # 파이프라인 전송 시 응답 대기 없이 보낼 수 있는 최대 명령어 수
 
 
 @dataclass
@@ -29,6 +33,8 @@ class CommandResult:
     response_data: Optional[bytes] = None
     error_code: Optional[int] = None
     execution_time: float = 0.0
+    connect_time: float = 0.0      # 소켓 연결 시간
+    round_trip_time: float = 0.0   # 전송 ~ 응답 수신 시간
 
 
 class RFProtocol:
@@ -789,7 +795,7 @@ class HybridRFClientThread(QThread):
         self.is_status_paused = False
         self.parent = None
         
-        self.settings_manager = SettingsManager() # yuri 추가
+        self.settings_manager = get_settings_manager() # yuri 추가 (공용 인스턴스)
         #############
         # 데이터 처리 타이머 설정
         interval_ms = 50  # 기본값
@@ -817,6 +823,7 @@ class HybridRFClientThread(QThread):
             old_state = self.connection_state
             self.connection_state = new_state
             
+            metrics.set("rf_connected", 1 if new_state == "connected" else 0)
             if new_state == "connected" and old_state != "connected":
                 self.write_log("[INFO] 서버 연결 상태: 정상", "green")
             elif new_state == "disconnected" and old_state != "disconnected":
@@ -932,6 +939,8 @@ class HybridRFClientThread(QThread):
                 try:
                     if not self.is_status_paused:
                         with self.status_lock:
+                            span = monitor.begin()
+                            sent_at = time.perf_counter()
                             self.status_socket.send(RFProtocol.create_frame(
                                 RFProtocol.CMD_DEVICE_STATUS_GET, 
                                 RFProtocol.SUBCMD_DEVICE_STATUS
@@ -940,6 +949,11 @@ class HybridRFClientThread(QThread):
                             received_data, timestamp, log_msg = self._receive_full_frame(self.status_socket, timeout=2.0)
                             
                             if received_data:
+                                monitor.end("receive", span)
+                                metrics.inc("rf_frames_received_total")
+                                metrics.observe("rf_poll_rtt_seconds", time.perf_counter() - sent_at)
+                                journal.record(RFProtocol.CMD_DEVICE_STATUS_GET, RFProtocol.SUBCMD_DEVICE_STATUS, 0,
+                                               0.0, time.perf_counter() - sent_at, RESULT_OK, "poll")
                                 self._set_connection_state("connected")
                                 try:
                                     if hasattr(self.parent, 'show_status_logs') and self.parent.show_status_logs:
@@ -954,6 +968,10 @@ class HybridRFClientThread(QThread):
                                     raise e # 다른 RuntimeError는 다시 발생
                             else:
                                 self._set_connection_state("disconnected")
+                                metrics.inc("rf_frames_dropped_total", reason="timeout")
+                                journal.record(RFProtocol.CMD_DEVICE_STATUS_GET, RFProtocol.SUBCMD_DEVICE_STATUS, 0,
+                                               0.0, time.perf_counter() - sent_at,
+                                               RESULT_TIMEOUT if "타임아웃" in log_msg else RESULT_ERROR, "poll")
                                 
                                 self.data_received.emit(b"", timestamp)
                                 if "타임아웃" in log_msg or "파싱 실패" in log_msg:
@@ -961,6 +979,7 @@ class HybridRFClientThread(QThread):
                                     
                 except (socket.timeout, socket.error) as e:
                     self._set_connection_state("disconnected")
+                    metrics.inc("rf_frames_dropped_total", reason="socket_error")
                     
                     self.data_received.emit(b"", time.time())
                     if isinstance(e, socket.error) and hasattr(e, 'errno') and e.errno == 10054:##############
@@ -978,8 +997,10 @@ class HybridRFClientThread(QThread):
                     break
                 
                 command_id, cmd, subcmd, data, timeout, wait_response, is_sync = command_item
+                metrics.set("rf_queue_depth", self.command_queue.qsize(), queue="command")
                 
                 result = self._execute_command(cmd, subcmd, data, timeout, wait_response)
+                self._record_command(cmd, subcmd, data, result, "single")
                 
                 if is_sync:
                     pass
@@ -996,6 +1017,15 @@ class HybridRFClientThread(QThread):
             except Exception as e:
                 self.write_log(f"[ERROR] 명령어 워커 오류: {e}")
 
+    def _record_command(self, cmd, subcmd, data, result, mode):
+        """명령어 실행 시간/결과 집계 (메트릭 + 명령어 기록)"""
+        label = f"0x{cmd:02X}"
+        latency = (result.connect_time + result.round_trip_time) or result.execution_time
+        metrics.observe("rf_command_latency_seconds", latency, cmd=label)
+        metrics.inc("rf_commands_total", cmd=label, result="success" if result.success else "failure")
+        journal.record(cmd, subcmd, len(data) if data else 0, result.connect_time, result.round_trip_time,
+                       result_code(result), mode)
+
     def _execute_command(self, cmd, subcmd, data, timeout, wait_response):
         """단일 명령어 실행"""
         command_socket = None
@@ -1009,14 +1039,18 @@ class HybridRFClientThread(QThread):
                 command_socket = self._create_optimized_socket()
                 command_socket.settimeout(timeout)
                 
+                connect_start = time.time()
                 try:
                     command_socket.connect((self.host, self.port))
                 except Exception as connect_error:
-                    return CommandResult(False, f"연결 실패: {connect_error}", execution_time=time.time() - start_time)
+                    return CommandResult(False, f"연결 실패: {connect_error}", execution_time=time.time() - start_time,
+                                         connect_time=time.time() - connect_start)
+                connect_time = time.time() - connect_start
                 
                 cmd_desc = RFProtocol.get_command_description(cmd, subcmd)
                 frame = RFProtocol.create_frame(cmd, subcmd, data)
                 
+                send_start = time.time()
                 command_socket.sendall(frame)
                 
                 if wait_response:
@@ -1047,18 +1081,24 @@ class HybridRFClientThread(QThread):
                                    RFProtocol.CMD_DCC_FACTOR_B_SET, RFProtocol.CMD_DCC_FACTOR_B_GET]:
                             self.write_log(recv_log_msg, "magenta")
                         
-                        return self._parse_command_result(received_data, cmd_desc, start_time)
+                        result = self._parse_command_result(received_data, cmd_desc, start_time)
+                        result.connect_time, result.round_trip_time = connect_time, time.time() - send_start
+                        return result
                     else:
                         return CommandResult(
                             False,
                             f"{cmd_desc} 응답 수신 실패: {recv_log_msg}",
-                            execution_time=time.time() - start_time
+                            execution_time=time.time() - start_time,
+                            connect_time=connect_time,
+                            round_trip_time=time.time() - send_start
                         )
                 else:
                     return CommandResult(
                         True,
                         f"{cmd_desc} 전송 완료",
-                        execution_time=time.time() - start_time
+                        execution_time=time.time() - start_time,
+                        connect_time=connect_time,
+                        round_trip_time=time.time() - send_start
                     )
                     
         except Exception as e:
@@ -1196,6 +1236,7 @@ class HybridRFClientThread(QThread):
             self.write_log(send_log, "cyan")
             
             result = self._execute_command(cmd, subcmd, data, timeout, wait_response)
+            self._record_command(cmd, subcmd, data, result, "sync")
             
             if result.success:
                 self.write_log(f"[SUCCESS] {cmd_desc} 동기 실행 완료 ({result.execution_time:.2f}s)", "green")
@@ -1224,6 +1265,7 @@ class HybridRFClientThread(QThread):
         try:
             command_item = (command_id, cmd, subcmd, data, timeout, wait_response, False)
             self.command_queue.put(command_item, block=False)
+            metrics.set("rf_queue_depth", self.command_queue.qsize(), queue="command")
             
             cmd_desc = RFProtocol.get_command_description(cmd, subcmd)
             return f"[QUEUE] {cmd_desc} 대기열 추가: {command_id}", None
@@ -1257,6 +1299,112 @@ class HybridRFClientThread(QThread):
         
         return True, f"{success_count}/{len(commands_list)}개 명령어가 대기열에 추가되었습니다"
 
+    @staticmethod
+    def _pop_frame(buffer):
+        """버퍼에서 완전한 프레임 하나 추출 (없으면 None) - SOM 이전 바이트는 버림"""
+        while len(buffer) >= 2 and (buffer[0] != RFProtocol._SOM_ or buffer[1] != RFProtocol._SOM_):
+            del buffer[0]
+        if len(buffer) < 6:
+            return None
+        expected_size = 6 + buffer[4] + 1
+        if len(buffer) < expected_size:
+            return None
+        frame = bytes(buffer[:expected_size])
+        del buffer[:expected_size]
+        return frame
+
+    def send_pipelined(self, commands, timeout=SOCKET_TIMEOUT, window=PIPELINE_WINDOW):
+        """
+        파이프라인 전송 - 단일 소켓으로 응답을 기다리지 않고 연속 전송
+        - 최대 window개까지 미응답 상태로 전송, 응답은 전송 순서대로 매칭
+        - commands: [{'cmd', 'subcmd', 'data'}, ...]
+        반환: commands와 같은 순서의 CommandResult 목록
+        """
+        results = [None] * len(commands)
+        frames = []
+        for index, command in enumerate(commands):
+            is_valid, msg = RFProtocol.validate_command_data(command['cmd'], command['subcmd'], command.get('data'))
+            if is_valid:
+                frames.append((index, RFProtocol.create_frame(command['cmd'], command['subcmd'], command.get('data'))))
+            else:
+                results[index] = CommandResult(False, f"명령어 검증 실패: {msg}")
+        if not frames:
+            return results
+
+        start_time = time.time()
+        command_socket = None
+        received = 0
+        connect_time = 0.0
+        sent_times, done_times = {}, {}
+        try:
+            self.pause_status_polling()
+            with self.command_lock:
+                if not self.running:
+                    raise ConnectionError("클라이언트가 종료 중입니다")
+
+                command_socket = self._create_optimized_socket()
+                command_socket.settimeout(timeout)
+                connect_start = time.time()
+                command_socket.connect((self.host, self.port))
+                connect_time = time.time() - connect_start
+
+                buffer = bytearray()
+                sent = 0
+                while received < len(frames):
+                    # 응답 대기 중인 명령어가 window 미만이면 계속 전송
+                    while sent < len(frames) and sent - received < window:
+                        command_socket.sendall(frames[sent][1])
+                        sent_times[frames[sent][0]] = time.time()
+                        sent += 1
+
+                    frame = self._pop_frame(buffer)
+                    if frame is None:
+                        chunk = command_socket.recv(4096)
+                        if not chunk:
+                            raise ConnectionError("서버에 의해 연결 종료")
+                        buffer.extend(chunk)
+                        continue
+
+                    index = frames[received][0]
+                    command = commands[index]
+                    cmd_desc = RFProtocol.get_command_description(command['cmd'], command['subcmd'])
+                    parsed = RFProtocol.parse_response(frame)
+                    if not parsed or parsed['cmd'] != command['cmd'] or parsed['subcmd'] != command['subcmd']:
+                        results[index] = CommandResult(False, f"{cmd_desc} 응답 불일치",
+                                                       response_data=frame,
+                                                       execution_time=time.time() - start_time)
+                    else:
+                        results[index] = self._parse_command_result(frame, cmd_desc, start_time)
+                    done_times[index] = time.time()
+                    received += 1
+
+        except Exception as e:
+            for index, _ in frames[received:]:
+                results[index] = CommandResult(False, f"파이프라인 실행 오류: {e}",
+                                               execution_time=time.time() - start_time)
+        finally:
+            if command_socket:
+                try:
+                    command_socket.shutdown(socket.SHUT_RDWR)
+                    command_socket.close()
+                except:
+                    pass
+            self.resume_status_polling()
+
+        # 명령어별 기록 - 연결은 첫 명령어만, 응답 시간은 각 명령어 전송부터
+        for position, (index, _) in enumerate(frames):
+            result = results[index]
+            result.connect_time = connect_time if position == 0 else 0.0
+            if index in sent_times:
+                result.round_trip_time = done_times.get(index, time.time()) - sent_times[index]
+            command = commands[index]
+            self._record_command(command['cmd'], command['subcmd'], command.get('data'), result, "pipelined")
+
+        success_count = sum(1 for r in results if r is not None and r.success)
+        self.write_log(f"[PIPELINE] {success_count}/{len(commands)} 명령어 완료 ({time.time() - start_time:.3f}s)",
+                       "green" if success_count == len(commands) else "yellow")
+        return results
+
     def pause_status_polling(self):
         """상태조회 일시 중단"""
         self.is_status_paused = True
@@ -1274,14 +1422,17 @@ class HybridRFClientThread(QThread):
                 self.status_socket.connect((self.host, self.port))
                 self.connection_established.emit()
                 self.connection_attempts = 0
+                metrics.inc("rf_reconnect_attempts_total", result="success")
 
             except (socket.timeout, ConnectionRefusedError, socket.error) as e:
+                metrics.inc("rf_reconnect_attempts_total", result="failure")
                 self._close_status_socket()
                 time.sleep(RECONNECT_BASE_DELAY * (2 ** min(self.connection_attempts, 5)))
         else:
             # 최대 시도 횟수 초과 시 한 번만 실패 메시지 출력
             if self.connection_attempts == RECONNECT_MAX_ATTEMPTS:
                 failure_msg = "상태조회 최대 연결 시도 횟수 초과"
+                metrics.inc("rf_reconnect_exhausted_total")
                 self.connection_failed.emit(failure_msg)
                 self.write_log(f"[ERROR] {failure_msg}")
 
@@ -75,8 +75,9 @@ class SettingsDialog(QDialog):
         self.init_ui()
         self.load_values_to_ui()
     
-    def load_default_settings(self):
-        """기본 설정값 로드"""
+    @staticmethod
+    def load_default_settings():
+        """기본 설정값 로드 (다이얼로그 생성 없이 호출 가능)"""
         return {
             # 색상 설정
             "colors": {
@@ -156,6 +157,21 @@ class SettingsDialog(QDialog):
                 "advanced_mode": False,             # 고급 모드
                 "osc_render_interval_ms": 33,       # OSC 렌더링 주기 (ms)
                 "main_graph_update_count": 4        # 메인 그래프 업데이트
+            },
+            
+            # 메트릭 HTTP 엔드포인트 (Prometheus 텍스트 형식)
+            "metrics_exporter": {
+                "enabled": False,                   # 사용 여부
+                "host": "127.0.0.1",                # 바인드 주소 (로컬 전용)
+                "port": 9464                        # 포트
+            },
+            
+            # 명령어 지연 기록 (data/command_journal_YYYYMMDD.csv)
+            "command_journal": {
+                "enabled": True,                    # 사용 여부
+                "capacity": 20000,                  # 메모리 보관 건수
+                "flush_interval_s": 10,             # 디스크 저장 주기 (초)
+                "include_status_polls": False       # 상태조회 포함 (주기당 1건)
             }
         }
     
@@ -1185,9 +1201,8 @@ class SettingsManager:
             config_dir = os.path.join(base_path,'resources', 'config')
             os.makedirs(config_dir, exist_ok=True)  # 폴더 자동 생성
 
-            # 1. 기본 설정 로드
-            default_dialog = SettingsDialog()  # 임시 인스턴스
-            self.settings = default_dialog.load_default_settings()
+            # 1. 기본 설정 로드 (임시 다이얼로그 생성 없이)
+            self.settings = SettingsDialog.load_default_settings()
 
             # 2. 파일 존재하면 병합
             if os.path.exists(settings_file):
@@ -1200,8 +1215,7 @@ class SettingsManager:
 
         except Exception as e:
             print(f"[SettingsManager] 설정 로드 실패: {e}")
-            default_dialog = SettingsDialog()
-            self.settings = default_dialog.load_default_settings()
+            self.settings = SettingsDialog.load_default_settings()
             return False
 
     def _merge_settings(self, loaded_settings):
@@ -1335,4 +1349,15 @@ class SettingsManager:
             # (status_monitor_dialog.py의 StatusThresholds 클래스를 업데이트)
             pass
         except Exception as e:
-            print(f"상태 모니터 설정 적용 오류: {e}")
\ No newline at end of file
+            print(f"상태 모니터 설정 적용 오류: {e}")
+
+
+_shared_settings_manager = None
+
+
+def get_settings_manager():
+    """앱 공용 SettingsManager (처음 호출 시 한 번만 로드)"""
+    global _shared_settings_manager
+    if _shared_settings_manager is None:
+        _shared_settings_manager = SettingsManager()
+    return _shared_settings_manager
@@ -0,0 +1,331 @@
+"""
+Snapshot Compare Module
+장비 스냅샷 필드 단위 비교 - 두 대 또는 여러 대(fleet) 비교, GUI 없이 스크립트에서 사용 가능
+
+사용 예:
+    python snapshot_compare.py ref.vsnap unit1.vsnap unit2.vsnap --reference ref --csv diff.csv
+"""
+
+import os
+import csv
+import struct
+import argparse
+import warnings
+import numpy as np
+
+from rf_protocol import RFProtocol
+from snapshot_file import DeviceSnapshot, SNAPSHOT_EXTENSION
+from cal_table_io import CAL_TABLE_READ_COMMANDS, CAL_TABLE_POINTS, decode_column
+from developer_data_manager import DeveloperDataManager
+from developer_widgets.system_widgets.system_data_manager import SystemDataManager
+
+DEFAULT_RTOL = 1e-6
+DEFAULT_ATOL = 1e-6
+
+# 개발자 섹션 -> 단일 페이로드 파서 (parse_*는 dict 또는 None 반환)
+_DEVELOPER_PARSERS = {
+    "developer.arc": DeveloperDataManager.parse_arc_management_data,
+    "developer.agc": DeveloperDataManager.parse_agc_setup_data,
+    "developer.dds": DeveloperDataManager.parse_dds_control_data,
+    "developer.sdd": DeveloperDataManager.parse_sdd_config_data,
+    "developer.fast_acq": DeveloperDataManager.parse_fast_acq_data,
+    "developer.va_limit": SystemDataManager.parse_va_limit_data,
+    "developer.gate_bias": SystemDataManager.parse_gate_bias_data,
+}
+
+# Power Limits는 필드별 개별 GET (float 1개) - SUBCMD -> parse_power_limits_data 필드명
+_POWER_LIMIT_FIELDS = {
+    RFProtocol.SUBCMD_USER_POWER_LIMIT: 'user_power_limit',
+    RFProtocol.SUBCMD_LOW_POWER_LIMIT: 'low_power_limit',
+    RFProtocol.SUBCMD_MAX_POWER_LIMIT: 'max_power_limit',
+    RFProtocol.SUBCMD_USER_REFLECTED_LIMIT: 'user_reflected_power_limit',
+    RFProtocol.SUBCMD_MAX_REFLECTED_LIMIT: 'max_reflected_power_limit',
+    RFProtocol.SUBCMD_USER_EXT_LIMIT: 'user_ext_feedback_limit',
+    RFProtocol.SUBCMD_MAX_EXT_VALUE: 'max_ext_feedback_value',
+    RFProtocol.SUBCMD_MIN_EXT_VALUE: 'min_ext_feedback_value',
+}
+
+# MinMax 섹션 GET CMD -> 접두어
+_MINMAX_PREFIX = {
+    RFProtocol.CMD_DCC_GATE_MAX_GET: 'max',
+    RFProtocol.CMD_DCC_GATE_MIN_GET: 'min',
+    RFProtocol.CMD_DCC_FACTOR_A_GET: 'factor_a',
+    RFProtocol.CMD_DCC_FACTOR_B_GET: 'factor_b',
+}
+
+_tuning_manager = None
+
+
+def _get_tuning_manager():
+    """parse_tab_responses용 TuningSettingsManager (최초 1회 생성)"""
+    global _tuning_manager
+    if _tuning_manager is None:
+        from data_manager import TuningSettingsManager
+        _tuning_manager = TuningSettingsManager()
+    return _tuning_manager
+
+
+def _decode_cal_table(snapshot, section):
+    """교정 테이블 섹션 -> {컬럼명: (26,) 배열}"""
+    table_name = section.split(".", 1)[1]
+    names = dict(CAL_TABLE_READ_COMMANDS.get(table_name, (None, []))[1])
+    tables = {}
+    for get_cmd, subcmd, payload in snapshot.section_entries(section):
+        column = names.get(subcmd, f"0x{subcmd:02X}")
+        decoded = decode_column(column, payload)  # 길이 부족 시 None -> 전체 NaN
+        values = np.full(CAL_TABLE_POINTS, np.nan)
+        if decoded is not None:
+            values[:] = decoded
+        tables[f"{section}/{column}"] = values
+    return tables
+
+
+def decode_snapshot(snapshot, tuning_manager=None):
+    """
+    스냅샷을 기존 파서로 디코딩
+    반환: (scalars, tables)
+    - scalars: {"섹션/필드": 값} (숫자 또는 문자열)
+    - tables: {"cal.<테이블>/<컬럼>": (26,) float 배열}
+    """
+    tuning_manager = tuning_manager or _get_tuning_manager()
+    scalars = {}
+    tables = {}
+
+    for section in snapshot.sections:
+        entries = snapshot.section_entries(section)
+        if not entries:
+            continue
+
+        if section.startswith("tuning."):
+            tab_name = section.split(".", 1)[1]
+            responses = [{'subcmd': subcmd, 'data': payload} for _, subcmd, payload in entries]
+            success, settings, msg = tuning_manager.parse_tab_responses(tab_name, responses)
+            if success:
+                for key, value in settings.items():
+                    scalars[f"{section}/{key}"] = value
+            else:
+                print(f"[Compare] {msg}")
+
+        elif section.startswith("cal."):
+            tables.update(_decode_cal_table(snapshot, section))
+
+        elif section == "developer.power_limits":
+            for _, subcmd, payload in entries:
+                if len(payload) >= 4:
+                    name = _POWER_LIMIT_FIELDS.get(subcmd, f"0x{subcmd:02X}")
+                    scalars[f"{section}/{name}"] = struct.unpack('<f', payload[:4])[0]
+
+        elif section == "developer.minmax":
+            for get_cmd, _, payload in entries:
+                prefix = _MINMAX_PREFIX.get(get_cmd, f"0x{get_cmd:02X}")
+                parsed = SystemDataManager.parse_ctlminmax_data(payload)
+                if parsed is None:
+                    # 단일 float 응답 장비 (DCC Gate Bias 형식)
+                    parsed = {'value': DeveloperDataManager.parse_dcc_gate_bias_data(payload)}
+                for key, value in parsed.items():
+                    if value is not None:
+                        scalars[f"{section}/{prefix}.{key}"] = value
+
+        else:
+            parser = _DEVELOPER_PARSERS.get(section)
+            for _, _, payload in entries:
+                try:
+                    parsed = parser(payload) if parser else None
+                except Exception as e:
+                    print(f"[Compare] {section} 파싱 오류: {e}")
+                    parsed = None
+                if parsed is None:
+                    scalars[f"{section}/raw"] = payload.hex()
+                else:
+                    for key, value in parsed.items():
+                        scalars[f"{section}/{key}"] = value
+
+    return scalars, tables
+
+
+def _to_number(value):
+    """숫자로 해석 가능한 값(bool, 숫자 문자열 포함)은 float, 아니면 None"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class FleetComparison:
+    """
+    여러 장비 스냅샷 비교
+    - 숫자 필드: (장비 수 x 필드 수) 행렬로 한 번에 비교
+    - 교정 테이블: 컬럼별 (장비 수 x 26) 배열로 한 번에 비교
+    - 기준: 지정 장비 또는 필드별 중앙값(숫자)/최빈값(문자열)
+    """
+
+    def __init__(self, snapshots, tuning_manager=None):
+        """snapshots: {장비 이름: DeviceSnapshot}"""
+        self.units = list(snapshots.keys())
+        decoded = [decode_snapshot(snapshots[unit], tuning_manager) for unit in self.units]
+
+        # 필드 합집합 (첫 등장 순서 유지)
+        fields = {}
+        for scalars, _ in decoded:
+            for key in scalars:
+                fields.setdefault(key, None)
+        self.fields = list(fields)
+
+        table_keys = {}
+        for _, tables in decoded:
+            for key in tables:
+                table_keys.setdefault(key, None)
+        self.table_keys = list(table_keys)
+
+        n_units = len(self.units)
+        self.numeric = np.full((n_units, len(self.fields)), np.nan)
+        self.text = np.full((n_units, len(self.fields)), None, dtype=object)
+        for u, (scalars, _) in enumerate(decoded):
+            for f, key in enumerate(self.fields):
+                if key not in scalars:
+                    continue
+                value = scalars[key]
+                number = _to_number(value)
+                if number is None:
+                    self.text[u, f] = str(value)
+                else:
+                    self.numeric[u, f] = number
+        self.is_numeric = ~np.isnan(self.numeric).all(axis=0)
+
+        self.tables = {
+            key: np.vstack([tables.get(key, np.full(CAL_TABLE_POINTS, np.nan)) for _, tables in decoded])
+            for key in self.table_keys
+        }
+
+    @classmethod
+    def from_files(cls, paths, tuning_manager=None):
+        """파일 목록으로 생성 - 장비 이름은 파일명(확장자 제외)"""
+        snapshots = {os.path.splitext(os.path.basename(p))[0]: DeviceSnapshot.load(p) for p in paths}
+        return cls(snapshots, tuning_manager)
+
+    def _reference_rows(self, reference):
+        """기준 행 (숫자 벡터, 문자열 벡터, 테이블 dict)"""
+        if reference is not None:
+            r = self.units.index(reference)
+            return self.numeric[r], self.text[r], {k: v[r] for k, v in self.tables.items()}
+
+        # 전부 NaN인 필드는 경고 없이 NaN 기준값
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            numeric_ref = np.nanmedian(self.numeric, axis=0)
+            table_ref = {k: np.nanmedian(v, axis=0) for k, v in self.tables.items()}
+
+        text_ref = np.full(len(self.fields), None, dtype=object)
+        for f in np.flatnonzero(~self.is_numeric):
+            values = [v for v in self.text[:, f] if v is not None]
+            if values:
+                text_ref[f] = max(set(values), key=values.count)
+        return numeric_ref, text_ref, table_ref
+
+    def diff(self, reference=None, rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL):
+        """
+        기준과 다른 필드 목록
+        반환: [(장비, 필드, 값, 기준값), ...] - 교정 테이블은 "필드[점번호]"
+        """
+        numeric_ref, text_ref, table_ref = self._reference_rows(reference)
+        rows = []
+
+        # 숫자 필드 - 허용오차 비교를 행렬 전체에 한 번에 적용
+        ref = np.broadcast_to(numeric_ref, self.numeric.shape)
+        missing = np.isnan(self.numeric) != np.isnan(ref)
+        with np.errstate(invalid='ignore'):
+            differs = ~np.isclose(self.numeric, ref, rtol=rtol, atol=atol, equal_nan=True)
+        mask = (differs | missing) & self.is_numeric
+        for u, f in zip(*np.nonzero(mask)):
+            rows.append((self.units[u], self.fields[f], self.numeric[u, f], numeric_ref[f]))
+
+        # 문자열 필드
+        for f in np.flatnonzero(~self.is_numeric):
+            for u in range(len(self.units)):
+                if self.text[u, f] != text_ref[f]:
+                    rows.append((self.units[u], self.fields[f], self.text[u, f], text_ref[f]))
+
+        # 교정 테이블 - (장비 x 26) 배열 단위 비교
+        for key in self.table_keys:
+            values = self.tables[key]
+            ref = table_ref[key]
+            with np.errstate(invalid='ignore'):
+                differs = ~np.isclose(values, ref, rtol=rtol, atol=atol, equal_nan=True)
+            for u, p in zip(*np.nonzero(differs)):
+                rows.append((self.units[u], f"{key}[{p}]", values[u, p], ref[p]))
+
+        return rows
+
+    def spread(self):
+        """숫자 필드/테이블 점별 편차 요약 - [(필드, min, max, std)] (편차 큰 순)"""
+        rows = []
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            columns = np.flatnonzero(self.is_numeric)
+            sub = self.numeric[:, columns]
+            lo, hi, sd = np.nanmin(sub, axis=0), np.nanmax(sub, axis=0), np.nanstd(sub, axis=0)
+            for i, f in enumerate(columns):
+                rows.append((self.fields[f], lo[i], hi[i], sd[i]))
+            for key, values in self.tables.items():
+                lo, hi, sd = np.nanmin(values, axis=0), np.nanmax(values, axis=0), np.nanstd(values, axis=0)
+                for p in range(values.shape[1]):
+                    rows.append((f"{key}[{p}]", lo[p], hi[p], sd[p]))
+        rows.sort(key=lambda row: -(row[2] - row[1]) if np.isfinite(row[2] - row[1]) else 0)
+        return rows
+
+
+def diff_snapshots(snapshot_a, snapshot_b, name_a="A", name_b="B", **kwargs):
+    """두 스냅샷 비교 - A를 기준으로 B의 다른 필드 반환 [(필드, B 값, A 값)]"""
+    comparison = FleetComparison({name_a: snapshot_a, name_b: snapshot_b})
+    return [(field, value, ref) for unit, field, value, ref in comparison.diff(reference=name_a, **kwargs)
+            if unit == name_b]
+
+
+def format_diff_report(rows):
+    """diff() 결과를 텍스트 표로 변환"""
+    if not rows:
+        return "차이 없음"
+    lines = [f"{'Unit':<20} {'Field':<48} {'Value':>16} {'Reference':>16}"]
+    for unit, field, value, ref in rows:
+        lines.append(f"{unit:<20} {field:<48} {_format_value(value):>16} {_format_value(ref):>16}")
+    lines.append(f"총 {len(rows)}개 차이")
+    return "\n".join(lines)
+
+
+def _format_value(value):
+    if value is None:
+        return "-"
+    if isinstance(value, (float, np.floating)):
+        return "-" if np.isnan(value) else f"{value:.6g}"
+    return str(value)
+
+
+def write_diff_csv(path, rows):
+    """diff() 결과 CSV 저장"""
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["unit", "field", "value", "reference"])
+        for unit, field, value, ref in rows:
+            writer.writerow([unit, field, _format_value(value), _format_value(ref)])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="장비 스냅샷 비교")
+    parser.add_argument("snapshots", nargs="+", help=f"스냅샷 파일 ({SNAPSHOT_EXTENSION})")
+    parser.add_argument("--reference", help="기준 장비 이름 (파일명, 생략 시 필드별 중앙값)")
+    parser.add_argument("--rtol", type=float, default=DEFAULT_RTOL)
+    parser.add_argument("--atol", type=float, default=DEFAULT_ATOL)
+    parser.add_argument("--csv", help="차이 목록 CSV 저장 경로")
+    args = parser.parse_args(argv)
+
+    comparison = FleetComparison.from_files(args.snapshots)
+    rows = comparison.diff(reference=args.reference, rtol=args.rtol, atol=args.atol)
+    print(format_diff_report(rows))
+    if args.csv:
+        write_diff_csv(args.csv, rows)
+        print(f"CSV 저장: {args.csv}")
+    return 0 if not rows else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""
+Snapshot File Module
+장비 설정 스냅샷 컨테이너와 버전 관리되는 바이너리 파일 형식 (Qt 비의존 - 오프라인 비교/검증 도구에서 공용)
+"""
+
+import json
+import struct
+import zlib
+
+SNAPSHOT_MAGIC = b"VHFSNAP\x00"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_EXTENSION = ".vsnap"
+
+
+class DeviceSnapshot:
+    """
+    장비 설정 스냅샷
+    - entries: (GET CMD, SUBCMD) -> 응답 페이로드 (읽은 순서 유지)
+    - sections: 섹션 이름 -> [(GET CMD, SUBCMD), ...]
+
+    파일 형식 (리틀 엔디언):
+        MAGIC(8) | version(u16) | header_len(u32) | header(JSON, UTF-8)
+        | count(u32) | [cmd(u8) subcmd(u8) len(u16) payload] * count | crc32(u32)
+    """
+
+    def __init__(self, entries=None, sections=None, header=None):
+        self.entries = dict(entries or {})
+        self.sections = {name: list(keys) for name, keys in (sections or {}).items()}
+        self.header = dict(header or {})
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, cmd, subcmd):
+        return self.entries.get((cmd, subcmd))
+
+    def section_entries(self, section):
+        """섹션에 속한 (cmd, subcmd, payload) 목록"""
+        return [(cmd, subcmd, self.entries[(cmd, subcmd)])
+                for cmd, subcmd in self.sections.get(section, []) if (cmd, subcmd) in self.entries]
+
+    def to_bytes(self):
+        header = dict(self.header)
+        header["sections"] = {name: [list(key) for key in keys] for name, keys in self.sections.items()}
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+
+        body = bytearray(SNAPSHOT_MAGIC)
+        body += struct.pack('<HI', SNAPSHOT_VERSION, len(header_bytes))
+        body += header_bytes
+        body += struct.pack('<I', len(self.entries))
+        for (cmd, subcmd), payload in self.entries.items():
+            body += struct.pack('<BBH', cmd, subcmd, len(payload))
+            body += payload
+        body += struct.pack('<I', zlib.crc32(body) & 0xFFFFFFFF)
+        return bytes(body)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < len(SNAPSHOT_MAGIC) + 10 or not data.startswith(SNAPSHOT_MAGIC):
+            raise ValueError("스냅샷 파일 형식이 아닙니다")
+        (crc,) = struct.unpack_from('<I', data, len(data) - 4)
+        if zlib.crc32(data[:-4]) & 0xFFFFFFFF != crc:
+            raise ValueError("스냅샷 체크섬 불일치")
+
+        offset = len(SNAPSHOT_MAGIC)
+        version, header_len = struct.unpack_from('<HI', data, offset)
+        if version > SNAPSHOT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전: {version}")
+        offset += 6
+        header = json.loads(data[offset:offset + header_len].decode('utf-8'))
+        offset += header_len
+
+        (count,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        entries = {}
+        for _ in range(count):
+            cmd, subcmd, length = struct.unpack_from('<BBH', data, offset)
+            offset += 4
+            entries[(cmd, subcmd)] = bytes(data[offset:offset + length])
+            offset += length
+
+        sections = {name: [tuple(key) for key in keys] for name, keys in header.pop("sections", {}).items()}
+        header["version"] = version
+        return cls(entries, sections, header)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
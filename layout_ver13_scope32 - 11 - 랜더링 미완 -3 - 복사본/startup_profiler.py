@@ -0,0 +1,159 @@
+"""
+Startup Profiler Module
+시작 시간 측정 모드 - 모듈별 import 시간 (누적/자체), 초기화 단계별 시간, 창 표시/첫 상태 프레임까지 시간
+- 켜기: python VHF_UI.py --profile-startup  (또는 환경 변수 VHF_PROFILE_STARTUP=1)
+- 첫 상태 프레임 처리(또는 제한 시간) 시 리포트를 콘솔에 출력하고 data/startup_profile_*.txt로 저장
+- 꺼져 있으면 import 훅을 설치하지 않음 (span/mark는 플래그 확인만)
+"""
+
+import os
+import sys
+import time
+import builtins
+import datetime
+import threading
+import importlib.util
+from contextlib import contextmanager
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_ENV = "VHF_PROFILE_STARTUP"
+REPORT_TOP_IMPORTS = 30
+
+
+class StartupProfiler:
+    """시작 시간 측정기 (전역 1개)"""
+
+    def __init__(self):
+        self.enabled = False
+        self.start = time.perf_counter()
+        self.imports = []   # (모듈, 누적 초, 자체 초, 깊이)
+        self.spans = []     # (이름, 시작 오프셋 초, 소요 초, 깊이)
+        self.marks = []     # (이름, 오프셋 초)
+        self._local = threading.local()  # 스레드별 import 스택 (다른 스레드의 import가 부모를 바꾸지 않도록)
+        self._span_depth = 0
+        self._original_import = None
+
+    # ========================================
+    # 시작 / 종료
+    # ========================================
+    def install(self):
+        """측정 시작 - import 훅 설치"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.start = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def install_from_argv(self, argv):
+        """명령행 플래그/환경 변수로 켜기 (플래그는 argv에서 제거)"""
+        if PROFILE_FLAG in argv:
+            argv.remove(PROFILE_FLAG)
+            self.install()
+        elif os.environ.get(PROFILE_ENV, "") not in ("", "0"):
+            self.install()
+        return self.enabled
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        self.enabled = False
+
+    def finish(self, reason, directory="data"):
+        """리포트 출력/저장 후 측정 종료 - 반환: 저장 경로 (실패 시 None)"""
+        if not self.enabled:
+            return None
+        self.mark(reason)
+        self.uninstall()
+        report = self.report()
+        print(report)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"startup_profile_{datetime.datetime.now():%Y%m%d_%H%M%S}.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(report)
+            return path
+        except OSError as e:
+            print(f"[StartupProfiler] 리포트 저장 실패: {e}")
+            return None
+
+    # ========================================
+    # 측정
+    # ========================================
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if level:
+            try:
+                module_name = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+            except (ImportError, ValueError):
+                return original(name, globals, locals, fromlist, level)
+        else:
+            module_name = name
+        if module_name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        # 처음 로드되는 모듈만 측정 (자체 시간 = 누적 - 하위 import)
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame = [0.0]
+        stack.append(frame)
+        started = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+            self.imports.append((module_name, elapsed, elapsed - frame[0], len(stack)))
+
+    @contextmanager
+    def span(self, name):
+        """초기화 구간 측정"""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        depth = self._span_depth
+        self._span_depth += 1
+        try:
+            yield
+        finally:
+            self._span_depth -= 1
+            self.spans.append((name, started - self.start, time.perf_counter() - started, depth))
+
+    def mark(self, name):
+        """시점 기록 (시작부터 경과 시간)"""
+        if self.enabled:
+            self.marks.append((name, time.perf_counter() - self.start))
+
+    # ========================================
+    # 리포트
+    # ========================================
+    def report(self):
+        lines = ["", "=" * 60, "시작 시간 프로파일", "=" * 60]
+        top_level = [item for item in self.imports if item[3] == 0]
+        lines.append(f"[import] 최상위 {len(top_level)}개, 전체 {len(self.imports)}개 모듈, "
+                     f"합계 {sum(item[1] for item in top_level) * 1000:.0f}ms")
+        lines.append(f"  {'모듈':<44} {'누적(ms)':>10} {'자체(ms)':>10}")
+        for module_name, total, own, depth in sorted(self.imports, key=lambda item: item[1],
+                                                     reverse=True)[:REPORT_TOP_IMPORTS]:
+            lines.append(f"  {'  ' * min(depth, 4) + module_name:<44} {total * 1000:>10.1f} {own * 1000:>10.1f}")
+
+        lines.append("")
+        lines.append(f"[초기화] {'구간':<40} {'시작(ms)':>10} {'소요(ms)':>10}")
+        for name, offset, elapsed, depth in sorted(self.spans, key=lambda item: item[1]):
+            lines.append(f"  {'  ' * depth + name:<46} {offset * 1000:>10.1f} {elapsed * 1000:>10.1f}")
+
+        lines.append("")
+        lines.append("[시점]")
+        for name, offset in self.marks:
+            lines.append(f"  {name:<46} {offset * 1000:>10.1f}ms")
+        lines.append("=" * 60)
+        return "\n".join(lines) + "\n"
+
+
+# 전역 프로파일러
+profiler = StartupProfiler()
@@ -0,0 +1,66 @@
+"""
+Status Stream Module
+상태 폴링 응답 샘플 큐 - 교정 스윕, 튜닝 트레이스, 레시피 시퀀서 공용 (위젯 비의존)
+"""
+
+import queue
+from PyQt5.QtCore import Qt
+
+from rf_protocol import RFProtocol
+from data_manager import StatusParser
+
+
+class StatusSampleStream:
+    """
+    상태 스트림 샘플 큐
+    - client_thread.data_received(상태 폴링)를 직접 연결로 받아 (timestamp, status) 큐에 저장
+    - clock 지정 시 수신 시각을 clock()으로 기록 (예: time.monotonic - 벽시계 변경에 영향 없음)
+    """
+
+    def __init__(self, client_thread, maxsize=1000, clock=None):
+        self.client_thread = client_thread
+        self.samples = queue.Queue(maxsize=maxsize)
+        self.clock = clock
+        self.attached = False
+
+    def attach(self):
+        if not self.attached:
+            self.client_thread.data_received.connect(self.on_data, Qt.DirectConnection)
+            self.attached = True
+
+    def detach(self):
+        if self.attached:
+            try:
+                self.client_thread.data_received.disconnect(self.on_data)
+            except (TypeError, RuntimeError):
+                pass
+            self.attached = False
+
+    def on_data(self, data, timestamp):
+        if not data:
+            return
+        parsed = RFProtocol.parse_response(data)
+        if not parsed or parsed["cmd"] != RFProtocol.CMD_DEVICE_STATUS_GET:
+            return
+        try:
+            status = StatusParser.parse_device_status(parsed["data"])
+        except Exception:
+            return
+        try:
+            self.samples.put_nowait((self.clock() if self.clock else timestamp, status))
+        except queue.Full:
+            pass
+
+    def clear(self):
+        while True:
+            try:
+                self.samples.get_nowait()
+            except queue.Empty:
+                return
+
+    def get(self, timeout):
+        """다음 샘플 (timeout 내 없으면 None)"""
+        try:
+            return self.samples.get(timeout=max(timeout, 0.0))
+        except queue.Empty:
+            return None
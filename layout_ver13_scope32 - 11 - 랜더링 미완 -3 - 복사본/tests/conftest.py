@@ -0,0 +1,14 @@
+"""
+테스트 공용 - 앱 모듈(패키지 루트 평면 모듈)과 시뮬레이터 코어(Server/) import 경로 설정
+- Qt가 필요한 테스트는 pytest.importorskip("PyQt5")로 건너뜀 (헤드리스 환경)
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER_DIR = os.path.join(ROOT_DIR, "Server")
+
+for path in (ROOT_DIR, SERVER_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
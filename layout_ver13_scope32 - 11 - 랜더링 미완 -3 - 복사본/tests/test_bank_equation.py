@@ -0,0 +1,78 @@
+"""Bank 방정식 수열 평가/분류 검사"""
+
+import numpy as np
+
+import bank_equation as be
+
+
+def logistic(r, x0=0.2, length=400):
+    """X(n+1) = r*X*(1-X) = -r*X^2 + r*X"""
+    return be.evaluate(x0, 0.0, -r, r, 0.0, length=length)
+
+
+def test_identity_converges():
+    result = be.evaluate(1.5, 0.0, 0.0, 1.0, 0.0)
+    assert result['class'] == be.CONVERGED
+    assert result['diverged_at'] == -1
+    assert np.all(result['sequence'] == np.float32(1.5))
+
+
+def test_sequence_matches_device_float32_order():
+    x0, a, b, c, d = (np.float32(v) for v in (0.3, 0.1, -0.2, 0.9, 0.05))
+    expected = [x0]
+    for _ in range(19):
+        x = expected[-1]
+        x2 = x * x
+        expected.append(a * (x2 * x) + b * x2 + c * x + d)
+
+    sequence, diverged_at = be.iterate(x0, a, b, c, d, 20)
+    assert sequence.dtype == np.float32
+    assert np.array_equal(sequence[0], np.array(expected, dtype=np.float32))
+    assert diverged_at[0] == -1
+
+
+def test_keep_returns_tail():
+    full, _ = be.iterate(0.2, 0.0, -3.7, 3.7, 0.0, 50)
+    tail, _ = be.iterate(0.2, 0.0, -3.7, 3.7, 0.0, 50, keep=8)
+    assert tail.shape == (1, 8)
+    assert np.array_equal(tail, full[:, -8:])
+
+
+def test_sign_flip_oscillates_with_period_two():
+    result = be.evaluate(1.0, 0.0, 0.0, -1.0, 0.0)
+    assert result['class'] == be.OSCILLATING
+    assert result['period'] == 2
+
+
+def test_doubling_diverges_at_limit_crossing():
+    result = be.evaluate(1.0, 0.0, 0.0, 2.0, 0.0, length=40)
+    assert result['class'] == be.DIVERGED
+    assert result['diverged_at'] == 20  # 2^20 > 1e6
+    assert result['period'] == 0
+
+
+def test_logistic_map_regimes():
+    assert logistic(2.5)['class'] == be.CONVERGED
+    period_two = logistic(3.2)
+    assert (period_two['class'], period_two['period']) == (be.OSCILLATING, 2)
+    period_four = logistic(3.5)
+    assert (period_four['class'], period_four['period']) == (be.OSCILLATING, 4)
+    assert logistic(3.9)['class'] == be.APERIODIC
+
+
+def test_sweep_matches_pointwise_evaluation():
+    c_values = np.array([0.5, 1.0, -1.0, 2.0], dtype=np.float32)
+    result = be.sweep(1.0, 0.0, 0.0, c_values, 0.0, length=40)
+
+    assert result['shape'] == (1, 1, 1, 4, 1)
+    codes = result['codes'].ravel()
+    for c, code in zip(c_values, codes):
+        assert code == be.evaluate(1.0, 0.0, 0.0, c, 0.0, length=40)['class']
+    assert sum(result['counts'].values()) == 4
+    assert result['counts'][be.CLASS_NAMES[be.DIVERGED]] == 1
+
+
+def test_params_from_settings_defaults():
+    params = be.params_from_settings({"Bank2 B": "0.25"}, 2)
+    assert params == (1.0, 0.0, 0.25, 1.0, 0.0)
+    assert all(isinstance(value, np.float32) for value in params)
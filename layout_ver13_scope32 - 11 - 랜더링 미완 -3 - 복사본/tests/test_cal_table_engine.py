@@ -0,0 +1,138 @@
+"""교정 테이블 변환/검증/fleet 검사"""
+
+import numpy as np
+
+from cal_table_io import CAL_TABLE_POINTS, CAL_TABLE_READ_COMMANDS, encode_column
+from cal_table_engine import CalTable, load_fleet, screen_fleet
+from snapshot_file import DeviceSnapshot
+
+
+def padded(values):
+    """유효 포인트 뒤를 0으로 채운 26포인트 컬럼"""
+    column = np.zeros(CAL_TABLE_POINTS)
+    column[:len(values)] = values
+    return column
+
+
+def fwd_table(target=None, dac=None):
+    target = np.arange(10.0, 110.0, 10.0) if target is None else np.asarray(target, dtype=float)
+    dac = 400.0 + 30.0 * target if dac is None else np.asarray(dac, dtype=float)
+    return CalTable("User FWD/LOAD", {"Target": padded(target), "DAC": padded(dac)})
+
+
+def checks(issues):
+    return sorted({check for check, _, _ in issues})
+
+
+# ========================================
+# 변환
+# ========================================
+def test_count_ignores_zero_padding():
+    table = fwd_table()
+    assert table.count == 10
+    assert len(table.target) == len(table.dac()) == 10
+
+
+def test_to_dac_interpolates_and_clamps():
+    table = fwd_table()
+    values, out_of_range = table.to_dac([10.0, 15.0, 100.0, 5.0, 200.0])
+    assert np.allclose(values, [700.0, 850.0, 3400.0, 700.0, 3400.0])
+    assert out_of_range.tolist() == [False, False, False, True, True]
+
+
+def test_to_target_inverts_to_dac():
+    table = fwd_table()
+    setpoints = np.linspace(10.0, 100.0, 37)
+    dac, _ = table.to_dac(setpoints)
+    assert np.allclose(table.to_target(dac), setpoints)
+
+
+def test_single_point_table_is_not_convertible():
+    table = fwd_table([50.0], [1000.0])
+    values, out_of_range = table.to_dac([50.0])
+    assert np.isnan(values).all() and out_of_range.all()
+    assert checks(table.verify()) == ["points"]
+
+
+# ========================================
+# 검증
+# ========================================
+def test_clean_table_has_no_issues():
+    assert fwd_table().verify() == []
+
+
+def test_detects_non_monotonic_rows():
+    target = np.arange(10.0, 110.0, 10.0)
+    target[4] = target[3]
+    dac = 400.0 + 30.0 * np.arange(10.0, 110.0, 10.0)
+    dac[7] = dac[6] - 5
+    issues = fwd_table(target, dac).verify()
+    monotonic = [(check, row) for check, row, _ in issues if check == "monotonic"]
+    assert ("monotonic", 4) in monotonic  # Target 비증가 (행 3 -> 4)
+    assert ("monotonic", 7) in monotonic  # DAC 감소 (행 6 -> 7)
+
+
+def test_detects_gap_and_slope():
+    target = [10, 20, 30, 40, 50, 100, 110, 120, 130, 140]
+    dac = [400 + 30 * t for t in target]
+    dac[8] += 2000  # 129->130 구간 급경사
+    dac[9] += 2000
+    issues = fwd_table(target, dac).verify()
+    assert ("gap", 5) in [(check, row) for check, row, _ in issues]
+    assert ("slope", 8) in [(check, row) for check, row, _ in issues]
+
+
+def test_absolute_slope_limit():
+    assert checks(fwd_table().verify(max_slope=10.0)) == ["slope"]
+    assert fwd_table().verify(max_slope=31.0) == []
+
+
+def test_detects_band_inversion():
+    target = padded(np.arange(10.0, 110.0, 10.0))
+    center = padded(1000.0 + 200.0 * np.arange(10))
+    low, high = center - 50, center + 50
+    low[3] = center[3] + 1
+    table = CalTable("RF Set DAC", {"Target": target, "DAC Center": center, "DAC Low": low, "DAC High": high})
+    issues = table.verify()
+    assert [(check, row) for check, row, _ in issues] == [("band", 4)]
+
+
+def test_project_trace_counts_segments():
+    table = fwd_table()
+    projection = table.project_trace([5.0, 12.0, 18.0, 55.0, 150.0, np.nan])
+    assert projection['below'] == 1 and projection['above'] == 1
+    assert projection['segment_counts'].sum() == 5
+    assert projection['segment_counts'][0] == 3  # 5(범위 미만, 첫 구간 고정), 12, 18
+    assert projection['dac_min'] == 700.0 and projection['dac_max'] == 3400.0
+
+
+# ========================================
+# 스냅샷 / fleet
+# ========================================
+def save_unit(path, dac_offset=0.0):
+    cmd_get, columns = CAL_TABLE_READ_COMMANDS["User FWD/LOAD"]
+    target = padded(np.arange(10.0, 110.0, 10.0))
+    values = {"Target": target, "DAC": padded(400.0 + 30.0 * target[:10] + dac_offset)}
+    entries = {(cmd_get, subcmd): encode_column(column, values[column]) for subcmd, column in columns}
+    DeviceSnapshot(entries, {"cal.User FWD/LOAD": list(entries)}).save(str(path))
+
+
+def test_from_snapshot_round_trip(tmp_path):
+    save_unit(tmp_path / "unit.vsnap")
+    snapshot = DeviceSnapshot.load(str(tmp_path / "unit.vsnap"))
+    table = CalTable.from_snapshot(snapshot, "User FWD/LOAD")
+    assert table.count == 10
+    assert np.allclose(table.dac(), fwd_table().dac())
+    assert CalTable.from_snapshot(snapshot, "User REF") is None
+
+
+def test_screen_fleet_flags_outlier(tmp_path):
+    paths = []
+    for unit, offset in (("unit1", 0.0), ("unit2", 10.0), ("unit3", -10.0), ("unit4", 600.0)):
+        save_unit(tmp_path / f"{unit}.vsnap", offset)
+        paths.append(str(tmp_path / f"{unit}.vsnap"))
+
+    fleet = load_fleet(paths)
+    assert sorted(fleet) == ["unit1", "unit2", "unit3", "unit4"]
+    rows = screen_fleet(fleet)
+    assert [(unit, check) for unit, _, check, _, _ in rows] == [("unit4", "fleet")]
@@ -0,0 +1,133 @@
+"""상태 스트림 기록 파일 / 재생 위치 계산"""
+
+import datetime
+
+import numpy as np
+import pytest
+
+import capture_replay as cr
+
+
+def make_records(count=10, interval=0.1, start=1735700000.0):
+    records = np.zeros(count, dtype=cr.RECORD_DTYPE)
+    records["time"] = start + np.arange(count) * interval
+    records["forward_power"] = np.arange(count) * 10.0
+    records["frequency"] = 13560000.0
+    records["rf_on_off"] = 1
+    return records
+
+
+# ========================================
+# 파일
+# ========================================
+def test_record_layout_matches_status_response():
+    assert cr.RECORD_DTYPE.itemsize == 8 + cr.STATUS_SIZE
+
+
+def test_rfcap_round_trip(tmp_path):
+    records = make_records()
+    path = str(tmp_path / "field.rfcap")
+    cr.save_capture(records, path)
+    loaded = cr.load_capture(path)
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(np.asarray(loaded), records)
+
+
+def test_rejects_foreign_and_empty_files(tmp_path):
+    foreign = tmp_path / "foreign.rfcap"
+    foreign.write_bytes(b"NOTRFCAP" + bytes(200))
+    with pytest.raises(ValueError):
+        cr.open_capture(str(foreign))
+
+    empty = tmp_path / "empty.rfcap"
+    cr.save_capture(make_records()[:0], str(empty))
+    with pytest.raises(ValueError):
+        cr.open_capture(str(empty))
+
+
+def test_load_csv_spreads_rows_within_second(tmp_path):
+    path = tmp_path / "rf_data.csv"
+    path.write_text(
+        "Time,RF Status,Control Mode,System State,LED State,Alarm State,Frequency,Forward Power\n"
+        "2025-01-01 12:00:00,On,Ethernet,0x0021,None,Alarm 0x0004,13.56,100\n"
+        "2025-01-01 12:00:00,On,Ethernet,0x0021,None,None,13.56,101\n"
+        "2025-01-01 12:00:00,On,Ethernet,0x0021,None,None,13.56,102\n"
+        "2025-01-01 12:00:01,Off,Serial,0x0000,None,None,27.12,0\n",
+        encoding="utf-8")
+    records = cr.load_capture(str(path))
+
+    base = datetime.datetime(2025, 1, 1, 12, 0, 0).timestamp()
+    assert np.allclose(records["time"] - base, [0.0, 1 / 3, 2 / 3, 1.0])
+    assert records["rf_on_off"].tolist() == [1, 1, 1, 0]
+    assert records["control_mode"].tolist() == [2, 2, 2, 1]
+    assert records["system_state"][0] == 0x21
+    assert records["alarm_state"].tolist() == [4, 0, 0, 0]
+    assert np.allclose(records["frequency"], [13.56e6, 13.56e6, 13.56e6, 27.12e6])
+    assert records["forward_power"].tolist() == [100.0, 101.0, 102.0, 0.0]
+
+
+# ========================================
+# 재생 위치
+# ========================================
+def test_realtime_index_follows_elapsed_time():
+    replay = cr.CaptureReplay(make_records(), speed=1.0)
+    state = {}
+    assert replay.index_at(state, 100.0) == 0  # 첫 요청 시각이 재생 시작
+    assert replay.index_at(state, 100.05) == 0
+    assert replay.index_at(state, 100.15) == 1
+    assert replay.index_at(state, 100.25) == 2
+    assert replay.index_at(state, 100.95) == 9
+
+
+def test_speed_scales_position():
+    replay = cr.CaptureReplay(make_records(), speed=4.0)
+    state = {}
+    replay.index_at(state, 0.0)
+    assert replay.index_at(state, 0.1125) == 4  # 0.45초 위치
+
+
+def test_loop_wraps_after_period():
+    replay = cr.CaptureReplay(make_records(), speed=1.0, loop=True)
+    assert replay.period == pytest.approx(1.0)  # 0.9초 기록 + 평균 간격 0.1초
+    state = {}
+    replay.index_at(state, 0.0)
+    assert replay.index_at(state, 1.05) == 0
+    assert replay.index_at(state, 1.35) == 3
+
+
+def test_no_loop_holds_last_record():
+    replay = cr.CaptureReplay(make_records(), speed=1.0, loop=False)
+    state = {}
+    replay.index_at(state, 0.0)
+    assert replay.index_at(state, 50.0) == 9
+
+
+def test_max_speed_steps_per_request():
+    looping = cr.CaptureReplay(make_records(3), speed=0)
+    state = {}
+    assert [looping.index_at(state, 0.0) for _ in range(5)] == [0, 1, 2, 0, 1]
+
+    holding = cr.CaptureReplay(make_records(3), speed=0, loop=False)
+    state = {}
+    assert [holding.index_at(state, 0.0) for _ in range(5)] == [0, 1, 2, 2, 2]
+
+
+def test_clients_have_independent_positions():
+    replay = cr.CaptureReplay(make_records(), speed=0)
+    first, second = {}, {}
+    replay.index_at(first, 0.0)
+    replay.index_at(first, 0.0)
+    assert replay.index_at(second, 0.0) == 0
+
+
+def test_status_at_packs_into_simulator_response():
+    import rf_sim_core
+
+    records = make_records()
+    replay = cr.CaptureReplay(records, speed=0)
+    status = replay.status_at({}, 0.0)
+    assert set(status) == set(cr.STATUS_FIELDS)
+    assert all(isinstance(value, (int, float)) for value in status.values())
+
+    packed = rf_sim_core.RFServer(seed=1).create_status_response(status)
+    assert packed == records[0].tobytes()[8:]
@@ -0,0 +1,116 @@
+"""명령어 지연 기록 - 링 버퍼, 일별 CSV, 지연 리포트 통계"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import command_journal as cj
+
+
+def fill(journal, rtts_ms, cmd=0x04, subcmd=0x09, mode="single", result=cj.RESULT_OK, connect_ms=0.0, start=0.0):
+    for i, rtt in enumerate(rtts_ms):
+        journal.record(cmd, subcmd, 4, connect_ms / 1000.0, rtt / 1000.0, result, mode, timestamp=start + i)
+
+
+def test_result_code_mapping():
+    def result(success=False, error_code=None, message=""):
+        return SimpleNamespace(success=success, error_code=error_code, message=message)
+
+    assert cj.result_code(result(success=True)) == cj.RESULT_OK
+    assert cj.result_code(result(error_code=2, message="잘못된 조건")) == 2
+    assert cj.result_code(result(message="응답 타임아웃")) == cj.RESULT_TIMEOUT
+    assert cj.result_code(result(message="timed out")) == cj.RESULT_TIMEOUT
+    assert cj.result_code(result(message="연결 실패: refused")) == cj.RESULT_CONNECT_FAILED
+    assert cj.result_code(result(message="CMD 불일치")) == cj.RESULT_MISMATCH
+    assert cj.result_code(result(message="socket error")) == cj.RESULT_ERROR
+
+
+# ========================================
+# 링 버퍼
+# ========================================
+def test_ring_keeps_latest_records_in_order():
+    journal = cj.CommandJournal(capacity=5)
+    fill(journal, range(8))
+    records, start = journal.rows()
+    assert start == 3
+    assert records["time"].tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert journal.rows(6)[0]["time"].tolist() == [6.0, 7.0]
+    assert len(journal.rows(8)[0]) == 0
+
+
+def test_polls_and_disabled_journal_are_skipped():
+    journal = cj.CommandJournal(capacity=10)
+    fill(journal, [1.0], mode="poll")
+    assert journal.count == 0
+    journal.configure(include_polls=True)
+    fill(journal, [1.0], mode="poll")
+    assert journal.count == 1
+    journal.configure(enabled=False)
+    fill(journal, [1.0])
+    assert journal.count == 1
+
+
+def test_record_clamps_payload_and_converts_units():
+    journal = cj.CommandJournal(capacity=2)
+    journal.record(0x01, 0x02, 70000, 0.0015, 0.0125, cj.RESULT_OK, "pipelined", timestamp=1.0)
+    rec = journal.rows()[0][0]
+    assert rec["payload"] == 0xFFFF
+    assert rec["connect_ms"] == pytest.approx(1.5)
+    assert rec["rtt_ms"] == pytest.approx(12.5)
+    assert cj.MODES[rec["mode"]] == "pipelined"
+
+
+# ========================================
+# 디스크 저장
+# ========================================
+def test_flush_appends_only_new_records_and_counts_overwrites(tmp_path):
+    journal = cj.CommandJournal(capacity=4)
+    assert journal.flush()[0] is False  # 저장 경로 없음
+    journal.configure(directory=str(tmp_path))
+
+    fill(journal, [1.0, 2.0, 3.0])
+    success, saved, _ = journal.flush()
+    assert (success, saved) == (True, 3)
+
+    fill(journal, [4.0, 5.0, 6.0, 7.0, 8.0, 9.0], start=3.0)  # 6건 중 2건은 저장 전에 덮어써짐
+    success, saved, _ = journal.flush()
+    assert (success, saved, journal.lost) == (True, 4, 2)
+    assert journal.flush()[1] == 0
+
+    loaded = cj.load_journal_csv(journal.journal_path())
+    assert loaded["rtt_ms"].tolist() == [1.0, 2.0, 3.0, 6.0, 7.0, 8.0, 9.0]
+    assert loaded.dtype == cj.JOURNAL_DTYPE
+
+
+# ========================================
+# 리포트
+# ========================================
+def test_latency_report_percentiles_and_failures():
+    journal = cj.CommandJournal(capacity=1000)
+    fill(journal, np.arange(1.0, 101.0))
+    fill(journal, [500.0], result=cj.RESULT_TIMEOUT)
+    fill(journal, [2.0, 2.0], cmd=0x10, subcmd=0x01, mode="sync", result=1)
+    report = cj.latency_report(journal.rows()[0])
+
+    assert [(row["cmd"], row["mode"]) for row in report] == [(0x04, "single"), (0x10, "sync")]
+    slow = report[0]
+    expected = np.percentile(np.append(np.arange(1.0, 101.0), 500.0), [50, 90, 99])
+    assert slow["count"] == 101
+    assert [slow["p50_ms"], slow["p90_ms"], slow["p99_ms"]] == pytest.approx(expected.tolist())
+    assert slow["max_ms"] == 500.0
+    assert (slow["timeouts"], slow["failures"]) == (1, 1)
+    assert (report[1]["timeouts"], report[1]["failures"]) == (0, 2)
+    assert cj.latency_report(journal.rows(journal.count)[0]) == []
+
+
+def test_mode_summary_adds_connect_time():
+    journal = cj.CommandJournal(capacity=100)
+    fill(journal, [2.0, 4.0], mode="single", connect_ms=1.0)
+    fill(journal, [1.0, 1.0, 1.0, 1.0], mode="pipelined")
+    summary = cj.mode_summary(journal.rows()[0])
+
+    assert set(summary) == {"single", "pipelined"}
+    assert summary["single"]["per_command_ms"] == pytest.approx(4.0)
+    assert summary["single"]["connect_ms"] == pytest.approx(1.0)
+    assert summary["pipelined"] == {"count": 4, "per_command_ms": pytest.approx(1.0), "connect_ms": 0.0}
@@ -0,0 +1,104 @@
+"""스냅샷 파일 형식 왕복 / 항목 코덱 (GET 응답 -> SET 페이로드) 검사"""
+
+import struct
+import zlib
+
+import pytest
+
+from snapshot_file import DeviceSnapshot, SNAPSHOT_MAGIC, SNAPSHOT_VERSION
+
+
+def make_snapshot():
+    entries = {
+        (0x84, 0x09): struct.pack('<I', 13560000),
+        (0x8A, 0x01): struct.pack('<26f', *range(26)),
+        (0x8A, 0x02): struct.pack('<26H', *range(0, 2600, 100)),
+    }
+    sections = {"tuning.frequency": [(0x84, 0x09)], "cal.RF Set DAC": [(0x8A, 0x01), (0x8A, 0x02)]}
+    header = {"created": "2025-01-01T12:00:00", "device": "127.0.0.1:5000", "failed": ["Gate Bias 조회 (타임아웃)"]}
+    return DeviceSnapshot(entries, sections, header)
+
+
+# ========================================
+# 파일 형식
+# ========================================
+def test_bytes_round_trip():
+    snapshot = make_snapshot()
+    loaded = DeviceSnapshot.from_bytes(snapshot.to_bytes())
+
+    assert loaded.entries == snapshot.entries
+    assert list(loaded.entries) == list(snapshot.entries)  # 읽은 순서 유지
+    assert loaded.sections == snapshot.sections
+    assert loaded.header["failed"] == snapshot.header["failed"]
+    assert loaded.header["version"] == SNAPSHOT_VERSION
+    assert loaded.section_entries("cal.RF Set DAC")[1] == (0x8A, 0x02, snapshot.entries[(0x8A, 0x02)])
+
+
+def test_file_round_trip(tmp_path):
+    snapshot = make_snapshot()
+    path = tmp_path / "unit1.vsnap"
+    snapshot.save(str(path))
+    loaded = DeviceSnapshot.load(str(path))
+    assert loaded.entries == snapshot.entries
+    assert loaded.to_bytes() == DeviceSnapshot.from_bytes(snapshot.to_bytes()).to_bytes()
+
+
+def test_empty_snapshot_round_trip():
+    loaded = DeviceSnapshot.from_bytes(DeviceSnapshot().to_bytes())
+    assert len(loaded) == 0
+    assert loaded.sections == {}
+
+
+def test_rejects_corrupted_payload():
+    data = bytearray(make_snapshot().to_bytes())
+    data[len(data) // 2] ^= 0xFF
+    with pytest.raises(ValueError):
+        DeviceSnapshot.from_bytes(bytes(data))
+
+
+def test_rejects_foreign_file():
+    with pytest.raises(ValueError):
+        DeviceSnapshot.from_bytes(b"PK\x03\x04" + bytes(32))
+
+
+def test_rejects_newer_version():
+    data = bytearray(make_snapshot().to_bytes()[:-4])
+    struct.pack_into('<H', data, len(SNAPSHOT_MAGIC), SNAPSHOT_VERSION + 1)
+    data += struct.pack('<I', zlib.crc32(data) & 0xFFFFFFFF)
+    with pytest.raises(ValueError):
+        DeviceSnapshot.from_bytes(bytes(data))
+
+
+# ========================================
+# 항목 코덱 (Qt 필요)
+# ========================================
+def test_field_codecs_round_trip():
+    pytest.importorskip("PyQt5")
+    from device_snapshot import get_field_codecs
+
+    for (cmd_get, subcmd), (cmd_set, size, parse, create) in get_field_codecs().items():
+        assert cmd_set == cmd_get & 0x7F
+        payload = bytes(size)
+        success, data, message = create(parse(payload))
+        assert success, f"0x{cmd_get:02X}/0x{subcmd:02X}: {message}"
+        assert data == payload, f"0x{cmd_get:02X}/0x{subcmd:02X}"
+
+
+def test_check_replies_flags_error_and_short_replies():
+    pytest.importorskip("PyQt5")
+    from rf_protocol import RFProtocol
+    from device_snapshot import check_replies
+
+    commands = [
+        {'cmd': RFProtocol.CMD_PULSE_GET, 'subcmd': RFProtocol.SUBCMD_PULSE_TYPE},
+        {'cmd': RFProtocol.CMD_PULSE_GET, 'subcmd': RFProtocol.SUBCMD_PULSE_LEVEL},
+        {'cmd': RFProtocol.CMD_RAMP_CONFIG_GET, 'subcmd': RFProtocol.SUBCMD_RAMP_CONFIG_GET},
+        {'cmd': RFProtocol.CMD_GET_FREQUENCY, 'subcmd': RFProtocol.SUBCMD_GET_FREQUENCY},
+    ]
+    payloads = [b"\x01", b"\x01", bytes(12), struct.pack('<I', 13560000)]
+    errors = check_replies(commands, payloads)
+
+    assert errors[0] is not None  # 같은 CMD 항목이 에러 응답 -> 1바이트 항목도 실패
+    assert errors[1] == "에러 응답"
+    assert errors[2].startswith("응답 길이 불일치")
+    assert errors[3] is None
@@ -0,0 +1,110 @@
+"""시뮬레이터 네트워크 장애 주입 - 전송 계획 순서/재현성/장애 동작"""
+
+import json
+import math
+import random
+
+import pytest
+
+import net_impairment as ni
+
+RESPONSE = bytes(range(40))
+
+
+def plan(impairment, count=200, link_key=("127.0.0.1", 50000), step=0.001, scenario=0):
+    link = impairment.new_link(link_key)
+    return [impairment.schedule(link, 0x10, 0x01, RESPONSE, scenario, i * step) for i in range(count)], link
+
+
+def test_send_times_never_reorder_within_link():
+    impairment = ni.NetworkImpairment(ni.PRESETS["lossy"], seed=3)
+    plans, _ = plan(impairment, count=2000)
+    times = [t for action, chunks in plans if action == ni.SEND for t, _ in chunks]
+    assert times == sorted(times)
+
+
+def test_stall_delays_following_responses():
+    config = {"default": {"latency_ms": 1.0, "stall": {"probability": 1.0, "duration_ms": 500}}}
+    impairment = ni.NetworkImpairment(config, seed=1)
+    link = impairment.new_link("a")
+    _, first = impairment.schedule(link, 0x10, 0x01, RESPONSE, 0, 0.0)
+    impairment.default["stall"] = None
+    _, second = impairment.schedule(link, 0x10, 0x01, RESPONSE, 0, 0.01)
+    assert first[0][0] == pytest.approx(0.501)
+    assert second[0][0] >= first[-1][0]
+    assert link.stats["stalled"] == 1
+
+
+def test_same_seed_and_link_reproduce_plan():
+    first, _ = plan(ni.NetworkImpairment(ni.PRESETS["lossy"], seed=7))
+    second, _ = plan(ni.NetworkImpairment(ni.PRESETS["lossy"], seed=7))
+    other_link, _ = plan(ni.NetworkImpairment(ni.PRESETS["lossy"], seed=7), link_key=("127.0.0.1", 50001))
+    assert first == second
+    assert first != other_link
+
+
+def test_fragments_reassemble_in_order():
+    config = {"default": {"fragment": {"probability": 1.0, "max_chunks": 5, "gap_ms": 2.0}}}
+    plans, link = plan(ni.NetworkImpairment(config, seed=5), count=50)
+    for action, chunks in plans:
+        assert action == ni.SEND
+        assert 2 <= len(chunks) <= 5
+        assert b"".join(data for _, data in chunks) == RESPONSE
+        gaps = [b[0] - a[0] for a, b in zip(chunks, chunks[1:])]
+        assert all(gap == pytest.approx(0.002) for gap in gaps)
+    assert link.stats["fragmented"] == 50
+
+
+def test_coalesce_rounds_up_to_window():
+    config = {"default": {"latency_ms": 1.0, "coalesce_ms": 5.0}}
+    plans, _ = plan(ni.NetworkImpairment(config, seed=2), count=20, step=0.0013)
+    for action, chunks in plans:
+        due = chunks[0][0]
+        assert math.isclose(due / 0.005, round(due / 0.005), abs_tol=1e-9)
+
+
+def test_reset_and_drop():
+    reset = ni.NetworkImpairment({"default": {"reset_probability": 1.0}}, seed=1)
+    plans, link = plan(reset, count=3)
+    assert plans == [(ni.RESET, [])] * 3 and link.stats[ni.RESET] == 3
+
+    drop = ni.NetworkImpairment({"default": {"drop_probability": 1.0}}, seed=1)
+    plans, link = plan(drop, count=3)
+    assert plans == [(ni.DROP, [])] * 3 and link.stats[ni.DROP] == 3
+
+
+def test_command_latency_and_scenario_override():
+    config = {
+        "default": {"latency_ms": 1.0, "command_latency_ms": {"0x04/0x09": 50.0}},
+        "scenarios": {"2": {"latency_ms": 10.0}},
+    }
+    impairment = ni.NetworkImpairment(config, seed=1)
+    link = impairment.new_link("a")
+    assert impairment.schedule(link, 0x10, 0x01, RESPONSE, 0, 0.0)[1][0][0] == pytest.approx(0.001)
+    assert impairment.schedule(link, 0x04, 0x09, RESPONSE, 0, 1.0)[1][0][0] == pytest.approx(1.050)
+    assert impairment.schedule(link, 0x10, 0x01, RESPONSE, 2, 2.0)[1][0][0] == pytest.approx(2.010)
+    assert impairment.profile(2)["command_latency_ms"] == {"0x04/0x09": 50.0}
+
+
+def test_sample_ms_distributions():
+    rng = random.Random(0)
+    assert ni.sample_ms(rng, None) == 0.0
+    assert ni.sample_ms(rng, -3) == 0.0
+    assert ni.sample_ms(rng, {"dist": "fixed", "value": 4.0}) == 4.0
+    for spec in ({"dist": "uniform", "min": 1, "max": 2}, {"dist": "normal", "mean": 0.0, "std": 5.0},
+                 {"dist": "lognormal", "median": 2.0, "sigma": 0.5}, {"dist": "exponential", "mean": 3.0}):
+        assert all(ni.sample_ms(rng, spec) >= 0.0 for _ in range(200))
+    with pytest.raises(ValueError):
+        ni.sample_ms(rng, {"dist": "pareto"})
+
+
+def test_load_impairment(tmp_path):
+    assert ni.load_impairment(None) is None
+    assert ni.load_impairment("none") is None
+    assert ni.load_impairment("lan", seed=1).default == ni.PRESETS["lan"]["default"]
+
+    path = tmp_path / "profile.json"
+    path.write_text(json.dumps({"default": {"jitter_ms": 1.0}}), encoding="utf-8")
+    assert ni.load_impairment(str(path)).default == {"jitter_ms": 1.0}
+    with pytest.raises(ValueError):
+        ni.load_impairment(str(tmp_path / "missing.json"))
@@ -3,10 +3,15 @@ Tuning Controller Module
 튜닝 설정 관리 전담 모듈
 """
 
+import os
 import time
-from PyQt5.QtWidgets import QMessageBox, QProgressDialog, QApplication
+import datetime
+from PyQt5.QtWidgets import QMessageBox, QProgressDialog, QApplication, QFileDialog
 from PyQt5.QtCore import Qt, QTimer
-from tuning_dialog import ImprovedTuningDialog
+from data_manager import DATA_DIR
+from device_snapshot import SnapshotEngine, SnapshotThread
+from snapshot_file import DeviceSnapshot, SNAPSHOT_EXTENSION
+from recipe_sequencer import RecipeThread, load_recipe, save_run_result
 
 
 class TuningController:
@@ -15,13 +20,20 @@ class TuningController:
     def __init__(self, parent):
         self.parent = parent
         self.progress_dialog = None
+        self.force_full_apply = False  # True: 캐시와 무관하게 모든 명령어 전송
+        self.recipe_thread = None
+        self.snapshot_thread = None
+        self.snapshot_path = None
     
     def show_tuning_dialog(self):
         """튜닝 설정 다이얼로그 표시 - 탭별 적용 지원"""
+        from tuning_dialog import ImprovedTuningDialog  # 첫 사용 시 로드
         dialog = ImprovedTuningDialog(self.parent.tuning_settings, self.parent)
         
         # 탭별 적용 시그널 연결
         dialog.tab_applied.connect(self.apply_tab_tuning)
+        dialog.force_full_check.setChecked(self.force_full_apply)
+        dialog.force_full_check.toggled.connect(self.set_force_full_apply)
         
         if dialog.exec_() == dialog.Accepted:
             old_settings = self.parent.tuning_settings.copy()
@@ -37,8 +49,44 @@ class TuningController:
                 self.parent.log_manager.write_log(f"[ERROR] 튜닝 설정 적용 실패: {e}", "red")
                 QMessageBox.warning(self.parent, "설정 적용 실패", f"장비에 설정을 적용하는 중 오류가 발생했습니다:\n{e}")
     
-    def apply_tab_tuning(self, tab_name, tab_settings):
-        """탭별 튜닝 설정 적용 - 최적화된 버전"""
+    def set_force_full_apply(self, enabled):
+        """전체 강제 적용 여부 설정"""
+        self.force_full_apply = bool(enabled)
+
+    @property
+    def config_cache(self):
+        return self.parent.network_manager.config_cache
+
+    def _select_changed_commands(self, commands, force_full=None):
+        """캐시와 비교하여 전송할 명령어만 선별 - (전송 목록, 생략 목록)"""
+        if force_full is None:
+            force_full = self.force_full_apply
+        to_send, skipped = self.config_cache.filter_changed(commands, force_full)
+        if skipped:
+            self.parent.log_manager.write_log(
+                f"[CONFIG] 장비 값과 동일한 {len(skipped)}개 명령어 생략 "
+                f"(전송 {len(to_send)}/{len(commands)})", "cyan")
+        return to_send, skipped
+
+    def _send_tuning_command(self, command, timeout=5.0):
+        """동기 모드로 명령어 전송 - 성공 시 캐시에 전송 페이로드 기록"""
+        result = self.parent.network_manager.client_thread.send_command(
+            command['cmd'],
+            command['subcmd'],
+            command['data'],
+            wait_response=True,
+            timeout=timeout,
+            sync=True
+        )
+        if result is not None and getattr(result, 'success', False):
+            self.config_cache.update(command['cmd'], command['subcmd'], command['data'])
+        else:
+            # 실패한 명령어는 장비 값을 알 수 없으므로 캐시에서 제거
+            self.config_cache.invalidate(command['cmd'], command['subcmd'])
+        return result
+
+    def apply_tab_tuning(self, tab_name, tab_settings, force_full=None):
+        """탭별 튜닝 설정 적용 - 캐시 대비 변경된 명령어만 전송"""
         try:
             # 진행 상황 표시 시작
             self.show_progress_start(tab_name)
@@ -87,6 +135,10 @@ class TuningController:
                     self.hide_progress()
                     return
             
+            commands, skipped = self._select_changed_commands(commands, force_full)
+            if not commands:
+                self.parent.log_manager.write_log(f"[INFO] {tab_name.upper()} 탭 설정이 장비 값과 동일하여 전송을 생략합니다.", "cyan")
+
             self.parent.log_manager.write_log(f"[CONFIG] {tab_name.upper()} 탭 설정 적용 시작 ({len(commands)}개 명령어)", "yellow")
             
             # 각 명령어를 순차적으로 전송 (최적화된 버전)
@@ -99,15 +151,8 @@ class TuningController:
                     progress = int((i / len(commands)) * 100)
                     self.update_progress(progress, f"적용 중: {command['description']}")
                     
-                    # 최적화된 동기 모드로 명령어 실행
-                    result = self.parent.network_manager.client_thread.send_command(
-                        command['cmd'],
-                        command['subcmd'], 
-                        command['data'],
-                        wait_response=True,
-                        timeout=5.0,  # 20초 -> 5초로 단축
-                        sync=True
-                    )
+                    # 최적화된 동기 모드로 명령어 실행 (20초 -> 5초로 단축)
+                    result = self._send_tuning_command(command, timeout=5.0)
                     
                     # 결과 처리
                     if result is None:
@@ -156,16 +201,18 @@ class TuningController:
             # 진행 상황 표시 숨기기
             self.hide_progress()
     
-    def apply_tuning_to_device(self):
-        """장비에 튜닝 설정 적용 - 개별 명령어로 분리 전송"""
+    def apply_tuning_to_device(self, force_full=None):
+        """장비에 튜닝 설정 적용 - 캐시 대비 변경된 명령어만 개별 전송"""
         try:
             # 개별 명령어 목록 생성
             success, commands, msg = self.parent.tuning_manager.get_tuning_commands(self.parent.tuning_settings)
             if not success:
                 raise Exception(msg)
             
+            commands, skipped = self._select_changed_commands(commands, force_full)
+            
             self.parent.log_manager.write_log("═══════════════════════════════════════════════════════", "white")
-            self.parent.log_manager.write_log(f"[CONFIG] 전체 튜닝 설정 적용 시작 ({len(commands)}개 명령어)", "yellow")
+            self.parent.log_manager.write_log(f"[CONFIG] 전체 튜닝 설정 적용 시작 ({len(commands)}개 명령어, {len(skipped)}개 생략)", "yellow")
             self.parent.log_manager.write_log("═══════════════════════════════════════════════════════", "white")
             
             # 각 명령어를 순차적으로 전송
@@ -176,47 +223,19 @@ class TuningController:
                 try:
                     self.parent.log_manager.write_log(f"[SEND] {i+1}/{len(commands)} - {command['description']}", "cyan")
                     
-                    # 명령어 전송
-                    send_msg, recv_msg = self.parent.network_manager.client_thread.send_command(
-                        command['cmd'],
-                        command['subcmd'],
-                        command['data'],
-                        wait_response=True
-                    )
+                    # 명령어 전송 (동기 모드 - 에러 코드는 CommandResult에서 확인)
+                    result = self._send_tuning_command(command, timeout=5.0)
                     
-                    if recv_msg:
-                        # 응답 파싱하여 에러 코드 확인
-                        if "hex=" in recv_msg:
-                            response_data = recv_msg.split("hex=")[1].split(",")[0]
-                            try:
-                                response_bytes = bytes.fromhex(response_data)
-                                from rf_protocol import RFProtocol
-                                parsed = RFProtocol.parse_response(response_bytes)
-                                if parsed and len(parsed['data']) >= 1:
-                                    error_code = parsed['data'][0]
-                                    if error_code == 0:
-                                        self.parent.log_manager.write_log(f"[SUCCESS] {command['description']} 적용 완료", "green")
-                                        success_count += 1
-                                    else:
-                                        error_msgs = {
-                                            1: "범위 초과", 2: "잘못된 조건", 
-                                            3: "정의되지 않음", 4: "명령어 오류"
-                                        }
-                                        error_msg = error_msgs.get(error_code, f"알 수 없는 오류 ({error_code})")
-                                        self.parent.log_manager.write_log(f"[ERROR] {command['description']} 실패: {error_msg}", "red")
-                                        failed_commands.append(f"{command['description']} - {error_msg}")
-                                else:
-                                    self.parent.log_manager.write_log(f"[WARNING] {command['description']}: 응답 데이터 파싱 실패", "yellow")
-                                    success_count += 1
-                            except Exception:
-                                self.parent.log_manager.write_log(f"[WARNING] {command['description']}: 응답 파싱 오류", "yellow")
-                                success_count += 1
-                        else:
-                            self.parent.log_manager.write_log(f"[WARNING] {command['description']}: 응답 형식 인식 실패", "yellow")
-                            success_count += 1
-                    else:
+                    if result is None:
                         raise Exception(f"{command['description']}: 장비로부터 응답을 받지 못했습니다.")
                     
+                    if result.success:
+                        self.parent.log_manager.write_log(f"[SUCCESS] {command['description']} 적용 완료", "green")
+                        success_count += 1
+                    else:
+                        self.parent.log_manager.write_log(f"[ERROR] {command['description']} 실패: {result.message}", "red")
+                        failed_commands.append(f"{command['description']} - {result.message}")
+                    
                     # 명령어 간 짧은 지연 (장비 처리 시간 확보)
                     time.sleep(0.1)
                     
@@ -257,6 +276,159 @@ class TuningController:
             self.parent.log_manager.write_log(f"[ERROR] 튜닝 설정 적용 중 오류: {str(e)}", "red")
             raise e
     
+    def _create_snapshot_engine(self):
+        """현재 연결로 스냅샷 엔진 생성 (연결 없거나 스냅샷 작업 중이면 None)"""
+        if self.snapshot_thread and self.snapshot_thread.isRunning():
+            QMessageBox.information(self.parent, "스냅샷", "이전 스냅샷 작업이 진행 중입니다.")
+            return None
+        client_thread = self.parent.network_manager.client_thread
+        if not client_thread:
+            QMessageBox.warning(self.parent, "오류", "네트워크가 연결되지 않았습니다.")
+            return None
+        return SnapshotEngine(client_thread, self.parent.tuning_manager, self.config_cache)
+
+    def _start_snapshot_thread(self, engine, mode, on_finished, snapshot=None):
+        """스냅샷 읽기/복원을 백그라운드 스레드로 실행"""
+        self.snapshot_thread = SnapshotThread(engine, mode, snapshot, self.force_full_apply, self.parent)
+        self.snapshot_thread.snapshot_finished.connect(on_finished)
+        self.snapshot_thread.start()
+
+    def save_device_snapshot(self):
+        """장비 전체 설정을 읽어 스냅샷 파일로 저장"""
+        engine = self._create_snapshot_engine()
+        if engine is None:
+            return
+
+        default_name = f"snapshot_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}{SNAPSHOT_EXTENSION}"
+        path, _ = QFileDialog.getSaveFileName(
+            self.parent, "장비 스냅샷 저장", os.path.join(DATA_DIR, default_name),
+            f"Device Snapshot (*{SNAPSHOT_EXTENSION})"
+        )
+        if not path:
+            return
+
+        self.snapshot_path = path
+        self.parent.log_manager.write_log("[SNAPSHOT] 장비 설정 읽는 중...", "cyan")
+        self._start_snapshot_thread(engine, "capture", self.on_snapshot_captured)
+
+    def on_snapshot_captured(self, success, msg, snapshot):
+        """스냅샷 읽기 완료 - 파일 저장"""
+        path = self.snapshot_path
+        if not success or snapshot is None:
+            self.parent.log_manager.write_log(f"[ERROR] {msg}", "red")
+            QMessageBox.warning(self.parent, "스냅샷 실패", msg)
+            return
+
+        try:
+            snapshot.save(path)
+        except Exception as e:
+            self.parent.log_manager.write_log(f"[ERROR] 스냅샷 저장 실패: {e}", "red")
+            QMessageBox.warning(self.parent, "스냅샷 실패", f"파일 저장 중 오류가 발생했습니다:\n{e}")
+            return
+
+        failed = snapshot.header.get("failed", [])
+        self.parent.log_manager.write_log(f"[SNAPSHOT] {msg} → {path}", "green" if not failed else "yellow")
+        for item in failed:
+            self.parent.log_manager.write_log(f"[WARNING] 스냅샷 읽기 실패: {item}", "yellow")
+
+    def restore_device_snapshot(self):
+        """스냅샷 파일을 장비에 복원 (변경된 항목만 전송)"""
+        engine = self._create_snapshot_engine()
+        if engine is None:
+            return
+
+        path, _ = QFileDialog.getOpenFileName(
+            self.parent, "장비 스냅샷 복원", DATA_DIR, f"Device Snapshot (*{SNAPSHOT_EXTENSION})"
+        )
+        if not path:
+            return
+
+        try:
+            snapshot = DeviceSnapshot.load(path)
+        except Exception as e:
+            self.parent.log_manager.write_log(f"[ERROR] 스냅샷 로드 실패: {e}", "red")
+            QMessageBox.warning(self.parent, "복원 실패", f"스냅샷 파일을 읽을 수 없습니다:\n{e}")
+            return
+
+        reply = QMessageBox.question(
+            self.parent, "스냅샷 복원",
+            f"{os.path.basename(path)} ({len(snapshot)}개 항목, {snapshot.header.get('created', '-')})\n\n"
+            f"장비 설정을 스냅샷으로 복원하시겠습니까?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        self.parent.log_manager.write_log("[SNAPSHOT] 스냅샷 복원 중...", "cyan")
+        self._start_snapshot_thread(engine, "restore", self.on_snapshot_restored, snapshot)
+
+    def on_snapshot_restored(self, success, msg, failed):
+        """스냅샷 복원 완료 - 결과 기록"""
+        failed = failed or []
+        self.parent.log_manager.write_log(f"[SNAPSHOT] {msg}", "green" if success else "yellow")
+        for item in failed:
+            self.parent.log_manager.write_log(f"[ERROR] 복원 실패: {item}", "red")
+        if not success:
+            QMessageBox.warning(self.parent, "부분 복원", f"{msg}\n\n실패한 설정:\n" + "\n".join(failed[:5]))
+
+    def run_recipe(self):
+        """레시피 파일 실행 (실행 중이면 중단)"""
+        if self.recipe_thread and self.recipe_thread.isRunning():
+            reply = QMessageBox.question(
+                self.parent, "레시피 실행 중", "실행 중인 레시피를 중단하시겠습니까?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply == QMessageBox.Yes:
+                self.recipe_thread.stop()
+            return
+
+        client_thread = self.parent.network_manager.client_thread
+        if not client_thread:
+            QMessageBox.warning(self.parent, "오류", "네트워크가 연결되지 않았습니다.")
+            return
+
+        path, _ = QFileDialog.getOpenFileName(self.parent, "레시피 실행", DATA_DIR, "Recipe (*.json)")
+        if not path:
+            return
+
+        success, recipe, msg = load_recipe(path)
+        if not success:
+            self.parent.log_manager.write_log(f"[ERROR] {msg}", "red")
+            QMessageBox.warning(self.parent, "레시피 오류", msg)
+            return
+
+        self.recipe_path = path
+        self.parent.log_manager.write_log(f"[RECIPE] {os.path.basename(path)} 시작 - {msg}", "cyan")
+        self.recipe_thread = RecipeThread(client_thread, recipe)
+        self.recipe_thread.step_finished.connect(self.on_recipe_step)
+        self.recipe_thread.recipe_finished.connect(self.on_recipe_finished)
+        self.recipe_thread.start()
+
+    def on_recipe_step(self, record):
+        """레시피 단계 완료 로그"""
+        step = f"#{record['index']}" if record['sub_index'] is None else f"#{record['index']}.{record['sub_index']}"
+        self.parent.log_manager.write_log(
+            f"[RECIPE] {record['started_s']:.3f}s {step} {record['action']} "
+            f"(지연 {record['lateness_ms']:.1f}ms, {record['duration_ms']:.1f}ms) {record['message']}",
+            "white" if record['success'] else "red"
+        )
+
+    def on_recipe_finished(self, success, message, result):
+        """레시피 종료 - 실행 결과 저장"""
+        self.parent.log_manager.write_log(f"[RECIPE] {message}", "green" if success else "yellow")
+        if result:
+            base = os.path.splitext(os.path.basename(self.recipe_path))[0]
+            out_path = os.path.join(
+                DATA_DIR, f"{base}_run_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            )
+            try:
+                save_run_result(out_path, result)
+                self.parent.log_manager.write_log(f"[RECIPE] 실행 기록 저장 → {out_path}", "cyan")
+            except Exception as e:
+                self.parent.log_manager.write_log(f"[ERROR] 실행 기록 저장 실패: {e}", "red")
+        if not success:
+            QMessageBox.warning(self.parent, "레시피 중단", message)
+
     def show_progress_start(self, tab_name):
         """진행 상황 표시 시작"""
         if not self.progress_dialog:
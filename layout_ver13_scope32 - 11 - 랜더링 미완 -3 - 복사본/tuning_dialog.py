@@ -6,12 +6,15 @@ RF 장비 튜닝 설정을 위한 다이얼로그 - 탭별 적용 기능 수정
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget, QFormLayout,
     QPushButton, QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QGroupBox,
-    QScrollArea, QLabel, QMessageBox, QApplication
+    QScrollArea, QLabel, QMessageBox, QApplication, QCheckBox
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 import ipaddress
+import numpy as np
+import pyqtgraph as pg
 
 from ui_widgets import SmartSpinBox, SmartDoubleSpinBox 
+import bank_equation
 
 
 class ImprovedTuningDialog(QDialog):
@@ -103,6 +106,11 @@ class ImprovedTuningDialog(QDialog):
 
         button_layout.addStretch()
 
+        # 전체 강제 적용 (해제 시 장비 값과 다른 명령어만 전송)
+        self.force_full_check = QCheckBox("전체 강제 적용")
+        self.force_full_check.setToolTip("체크 시 장비 캐시와 무관하게 모든 설정 명령어를 전송합니다.")
+        button_layout.addWidget(self.force_full_check)
+
         # 취소/전체 적용 버튼
         cancel_btn = QPushButton("취소")
         cancel_btn.clicked.connect(self.reject)
@@ -1283,6 +1291,52 @@ class ImprovedTuningDialog(QDialog):
         
         layout.addWidget(bank2_group)
 
+        # 방정식 미리보기 (적용 전 수열 확인)
+        preview_group = QGroupBox("방정식 미리보기")
+        preview_layout = QVBoxLayout(preview_group)
+
+        preview_options = QHBoxLayout()
+        preview_options.addWidget(QLabel("수열 길이:"))
+        self.bank_preview_length = QSpinBox()
+        self.bank_preview_length.setRange(2, 10000)
+        self.bank_preview_length.setValue(bank_equation.DEFAULT_LENGTH)
+        preview_options.addWidget(self.bank_preview_length)
+        preview_options.addStretch()
+        sweep_btn = QPushButton("안정성 스윕")
+        sweep_btn.setToolTip("현재 A/B/C/D 주변 ±50% 범위 9x9x9x9 조합 평가")
+        sweep_btn.clicked.connect(self.sweep_bank_stability)
+        preview_options.addWidget(sweep_btn)
+        preview_layout.addLayout(preview_options)
+
+        self.bank_preview_plot = pg.PlotWidget()
+        self.bank_preview_plot.setMinimumHeight(180)
+        self.bank_preview_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.bank_preview_plot.setLabel('bottom', 'n')
+        self.bank_preview_plot.setLabel('left', 'X(n)')
+        self.bank_preview_plot.addLegend()
+        self.bank_preview_curves = {
+            1: self.bank_preview_plot.plot(pen=pg.mkPen('#00f0ff', width=2), name="Bank1"),
+            2: self.bank_preview_plot.plot(pen=pg.mkPen('#ff9f43', width=2), name="Bank2"),
+        }
+        preview_layout.addWidget(self.bank_preview_plot)
+
+        self.bank_preview_labels = {}
+        for bank_num in (1, 2):
+            label = QLabel()
+            self.bank_preview_labels[bank_num] = label
+            preview_layout.addWidget(label)
+        self.bank_sweep_label = QLabel()
+        self.bank_sweep_label.setWordWrap(True)
+        preview_layout.addWidget(self.bank_sweep_label)
+
+        layout.addWidget(preview_group)
+
+        for bank_num in (1, 2):
+            for key in bank_equation.BANK_PARAM_KEYS:
+                self.inputs[f"Bank{bank_num} {key}"].valueChanged.connect(self.update_bank_preview)
+        self.bank_preview_length.valueChanged.connect(self.update_bank_preview)
+        self.update_bank_preview()
+
         # 로드 및 적용 버튼
         button_layout = QHBoxLayout()
         load_btn = self.create_tab_load_button("Bank")
@@ -1298,6 +1352,60 @@ class ImprovedTuningDialog(QDialog):
         tab_layout.addWidget(scroll)
         tab_widget.addTab(tab, "Bank")
 
+    def get_bank_params(self, bank_num):
+        """Bank 입력값 -> (X0, A, B, C, D) float32"""
+        return bank_equation.params_from_settings(
+            {f"Bank{bank_num} {key}": self.inputs[f"Bank{bank_num} {key}"].value()
+             for key in bank_equation.BANK_PARAM_KEYS}, bank_num)
+
+    def update_bank_preview(self):
+        """Bank1/2 수열 미리보기 갱신"""
+        length = self.bank_preview_length.value()
+        colors = {bank_equation.CONVERGED: "#2e7d32", bank_equation.OSCILLATING: "#f9a825",
+                  bank_equation.APERIODIC: "#f9a825", bank_equation.DIVERGED: "#c62828"}
+        for bank_num in (1, 2):
+            result = bank_equation.evaluate(*self.get_bank_params(bank_num), length)
+            sequence = result['sequence']
+            finite = np.isfinite(sequence)
+            # 발산 구간은 그리지 않음
+            self.bank_preview_curves[bank_num].setData(np.arange(length)[finite], sequence[finite])
+
+            label = self.bank_preview_labels[bank_num]
+            label.setText(f"Bank{bank_num}: {bank_equation.describe(result)}")
+            label.setStyleSheet(f"color: {colors[result['class']]}; font-weight: bold;")
+
+    def sweep_bank_stability(self):
+        """현재 파라미터 주변 그리드 스윕 - 발산/진동 조합 비율 표시"""
+        length = self.bank_preview_length.value()
+        lines = []
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            for bank_num in (1, 2):
+                x0, *coeffs = self.get_bank_params(bank_num)
+                axes = [np.linspace(v - max(abs(v) * 0.5, 0.1), v + max(abs(v) * 0.5, 0.1), 9)
+                        for v in coeffs]
+                result = bank_equation.sweep(x0, *axes, length=length)
+                total = int(np.prod(result['shape']))
+                summary = ", ".join(f"{name} {count * 100.0 / total:.1f}%"
+                                    for name, count in result['counts'].items())
+                lines.append(f"Bank{bank_num} 주변 {total}개 조합: {summary}")
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.bank_sweep_label.setText("\n".join(lines))
+
+    def _record_read_back(self, tab_name, responses):
+        """읽어온 응답을 SET 페이로드로 변환해 설정 캐시에 기록 (에러/길이 불일치 응답 제외)"""
+        from device_snapshot import check_replies
+
+        errors = check_replies(responses, [response['data'] for response in responses])
+        valid = [response for response, error in zip(responses, errors) if not error]
+        success, commands, msg = self.parent_window.tuning_manager.get_tab_commands_from_responses(tab_name, valid)
+        if not success:
+            return
+        config_cache = self.parent_window.network_manager.config_cache
+        for command in commands:
+            config_cache.update(command['cmd'], command['subcmd'], command['data'])
+
     def load_tab_settings(self, tab_name_korean):
         """장비에서 현재 탭의 설정값 읽어오기"""
         # 한글 탭 이름을 영문 키로 변환
@@ -1356,6 +1464,7 @@ class ImprovedTuningDialog(QDialog):
 
                         if parsed and 'data' in parsed:
                             responses.append({
+                                'cmd': cmd_info['cmd'],
                                 'subcmd': parsed['subcmd'],
                                 'data': parsed['data']
                             })
@@ -1399,6 +1508,9 @@ class ImprovedTuningDialog(QDialog):
             # UI에 적용
             self.apply_defaults_to_ui(settings)
 
+            # 장비 설정 캐시 반영 (변경분 적용 기준) - GET/SET 형식이 다른 항목이 있으므로 SET 형식으로 변환해 기록
+            self._record_read_back(tab_name, responses)
+
             # 결과 메시지
             success_count = len(responses)
             total_count = len(commands)
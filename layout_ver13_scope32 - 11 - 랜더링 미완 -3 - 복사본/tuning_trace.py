@@ -0,0 +1,314 @@
+"""
+Tuning Trace Module
+주파수 자동 튜닝 트레이스 기록/분석 - 상태 스트림에서 주파수/감마/위상 기록,
+튜닝 구간 검출, 수렴 시간/오버슈트/헌팅 분석, 여러 세션 설정별 통계
+
+사용 예 (GUI 없이):
+    python tuning_trace.py record --host 127.0.0.1 --port 5000 --duration 60 --label "step 1k-100k" --out run1.npz
+    python tuning_trace.py report run1.npz run2.npz --stop-gamma 0.1
+"""
+
+import json
+import time
+import datetime
+import argparse
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from status_stream import StatusSampleStream
+
+TRACE_FIELDS = ["frequency", "gamma", "real_gamma", "image_gamma", "rf_phase", "forward_power", "rf_on_off"]
+TRACE_FORMAT_VERSION = 1
+
+DEFAULT_FREQ_EPS_HZ = 1.0     # 이 값 이하 변화는 정지로 간주 (float32 분해능)
+DEFAULT_QUIET_S = 0.5         # 주파수 변화가 없는 시간이 이 이상이면 튜닝 구간 종료
+DEFAULT_PRE_S = 1.0           # 구간 시작 전 트리거(감마 상승) 탐색 범위
+DEFAULT_POST_S = 0.5          # 구간 종료 후 최종 감마 판정 범위
+DEFAULT_STOP_GAMMA = 0.1
+DEFAULT_HUNT_REVERSALS = 3    # 방향 반전 횟수 이상이면 헌팅
+
+
+class TuningTrace:
+    """
+    튜닝 트레이스 세션 (상태 샘플 열 배열 + 메타데이터)
+    - frequency: MHz, time: 세션 시작 기준 초
+    """
+
+    def __init__(self, time_array, columns, meta=None):
+        self.time = np.asarray(time_array, dtype=np.float64)
+        self.columns = {name: np.asarray(columns[name], dtype=np.float64) for name in TRACE_FIELDS}
+        self.meta = dict(meta or {})
+
+    def __len__(self):
+        return len(self.time)
+
+    @property
+    def label(self):
+        return self.meta.get("label", "")
+
+    @classmethod
+    def from_samples(cls, samples, meta=None):
+        """[(timestamp, status dict)] -> TuningTrace"""
+        if not samples:
+            return cls(np.empty(0), {name: np.empty(0) for name in TRACE_FIELDS}, meta)
+        t0 = samples[0][0]
+        time_array = np.array([timestamp - t0 for timestamp, _ in samples])
+        columns = {name: np.array([status[name] for _, status in samples], dtype=np.float64)
+                   for name in TRACE_FIELDS}
+        meta = dict(meta or {})
+        meta.setdefault("started", datetime.datetime.fromtimestamp(t0).isoformat(timespec='seconds'))
+        return cls(time_array, columns, meta)
+
+    def save(self, path):
+        meta = dict(self.meta, version=TRACE_FORMAT_VERSION, samples=len(self))
+        np.savez_compressed(path, time=self.time, meta=np.array(json.dumps(meta, ensure_ascii=False)),
+                            **self.columns)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as npz:
+            meta = json.loads(str(npz["meta"]))
+            return cls(npz["time"], {name: npz[name] for name in TRACE_FIELDS}, meta)
+
+
+# ========================================
+# 구간 검출 / 분석
+# ========================================
+def detect_runs(trace, freq_eps_hz=DEFAULT_FREQ_EPS_HZ, quiet_s=DEFAULT_QUIET_S,
+                pre_s=DEFAULT_PRE_S, post_s=DEFAULT_POST_S, trigger_gamma=DEFAULT_STOP_GAMMA):
+    """
+    튜닝 구간 검출 - 주파수가 움직인 샘플을 quiet_s 간격 기준으로 묶음
+    구간 시작: 첫 이동 직전 pre_s 안에서 감마가 trigger_gamma를 넘은 시점 (없으면 첫 이동 직전 샘플)
+    반환: [(start, move_end, end)] 샘플 인덱스 (end: post_s 포함, 미포함 상한)
+    """
+    t = trace.time
+    if len(t) < 2:
+        return []
+    freq_hz = trace.columns["frequency"] * 1_000_000
+    gamma = trace.columns["gamma"]
+    moving = np.flatnonzero(np.abs(np.diff(freq_hz)) > freq_eps_hz) + 1
+    if len(moving) == 0:
+        return []
+
+    breaks = np.flatnonzero(np.diff(t[moving]) > quiet_s)
+    firsts = np.concatenate(([moving[0]], moving[breaks + 1]))
+    lasts = np.concatenate((moving[breaks], [moving[-1]]))
+
+    runs = []
+    for first, last in zip(firsts, lasts):
+        start = first - 1
+        lower = np.searchsorted(t, t[start] - pre_s)
+        while start > lower and gamma[start - 1] > trigger_gamma:
+            start -= 1
+        end = min(np.searchsorted(t, t[last] + post_s, side='right'), len(t))
+        runs.append((int(start), int(last), int(end)))
+    return runs
+
+
+def analyze_run(trace, run, stop_gamma=DEFAULT_STOP_GAMMA, hunt_reversals=DEFAULT_HUNT_REVERSALS):
+    """
+    튜닝 구간 1개 분석
+    - time_to_match_s: 시작부터 감마가 stop_gamma 이하로 내려가 이후 계속 유지되는 시점까지 (미수렴 NaN)
+    - overshoot_hz: 최종 주파수를 이동 방향으로 지나친 최대량, overshoot_ratio: 총 이동량 대비
+    - reversals: 주파수 스텝 방향 반전 횟수 (hunting: reversals >= hunt_reversals)
+    """
+    start, move_end, end = run
+    t = trace.time[start:end] - trace.time[start]
+    freq_hz = trace.columns["frequency"][start:end] * 1_000_000
+    gamma = trace.columns["gamma"][start:end]
+
+    matched = gamma <= stop_gamma
+    holds = np.flip(np.logical_and.accumulate(np.flip(matched)))
+    match_index = np.argmax(holds) if holds.any() else None
+
+    final_freq = freq_hz[move_end - start]
+    travel = final_freq - freq_hz[0]
+    direction = np.sign(travel) if travel else 1.0
+    overshoot = max(float(np.max(direction * (freq_hz[:move_end - start + 1] - final_freq))), 0.0)
+
+    steps = np.diff(freq_hz[:move_end - start + 1])
+    signs = np.sign(steps[steps != 0])
+    reversals = int(np.count_nonzero(signs[1:] != signs[:-1]))
+
+    return {
+        'label': trace.label,
+        'start_s': float(trace.time[start]),
+        'move_time_s': float(t[move_end - start]),
+        'time_to_match_s': float(t[match_index]) if match_index is not None else float('nan'),
+        'converged': match_index is not None,
+        'start_freq_mhz': float(freq_hz[0] / 1_000_000),
+        'final_freq_mhz': float(final_freq / 1_000_000),
+        'travel_hz': float(abs(travel)),
+        'overshoot_hz': overshoot,
+        'overshoot_ratio': overshoot / abs(travel) if travel else 0.0,
+        'steps': int(len(signs)),
+        'reversals': reversals,
+        'hunting': reversals >= hunt_reversals,
+        'start_gamma': float(gamma[0]),
+        'min_gamma': float(gamma.min()),
+        'final_gamma': float(gamma[-1]),
+        'run': run,
+    }
+
+
+def analyze_trace(trace, stop_gamma=None, **detect_options):
+    """세션 전체 분석 - stop_gamma 미지정 시 메타데이터의 Stop Gamma 사용"""
+    if stop_gamma is None:
+        stop_gamma = float(trace.meta.get("stop_gamma") or DEFAULT_STOP_GAMMA)
+    runs = detect_runs(trace, trigger_gamma=stop_gamma, **detect_options)
+    return [analyze_run(trace, run, stop_gamma) for run in runs]
+
+
+def aggregate(metrics):
+    """
+    설정(label)별 통계
+    반환: {label: {'runs', 'converged_ratio', 'median_match_s', 'p90_match_s',
+                   'mean_overshoot_ratio', 'mean_reversals', 'hunting_ratio'}}
+    """
+    stats = {}
+    for label in dict.fromkeys(m['label'] for m in metrics):
+        group = [m for m in metrics if m['label'] == label]
+        match_times = np.array([m['time_to_match_s'] for m in group if m['converged']])
+        stats[label] = {
+            'runs': len(group),
+            'converged_ratio': len(match_times) / len(group),
+            'median_match_s': float(np.median(match_times)) if len(match_times) else float('nan'),
+            'p90_match_s': float(np.percentile(match_times, 90)) if len(match_times) else float('nan'),
+            'mean_overshoot_ratio': float(np.mean([m['overshoot_ratio'] for m in group])),
+            'mean_reversals': float(np.mean([m['reversals'] for m in group])),
+            'hunting_ratio': sum(1 for m in group if m['hunting']) / len(group),
+        }
+    return stats
+
+
+def best_label(stats, min_converged_ratio=0.9):
+    """수렴률 조건을 만족하는 설정 중 중앙 수렴 시간이 가장 짧은 label (없으면 None)"""
+    candidates = [(s['median_match_s'], label) for label, s in stats.items()
+                  if s['converged_ratio'] >= min_converged_ratio and np.isfinite(s['median_match_s'])]
+    return min(candidates)[1] if candidates else None
+
+
+def format_report(stats):
+    lines = [f"{'설정':<24} {'구간':>5} {'수렴률':>7} {'중앙(s)':>8} {'p90(s)':>8} "
+             f"{'오버슈트':>8} {'반전':>6} {'헌팅':>6}"]
+    for label, s in stats.items():
+        lines.append(f"{label or '-':<24} {s['runs']:>5} {s['converged_ratio'] * 100:>6.0f}% "
+                     f"{s['median_match_s']:>8.3f} {s['p90_match_s']:>8.3f} "
+                     f"{s['mean_overshoot_ratio'] * 100:>7.1f}% {s['mean_reversals']:>6.1f} "
+                     f"{s['hunting_ratio'] * 100:>5.0f}%")
+    best = best_label(stats)
+    if best is not None:
+        lines.append(f"권장 설정: {best}")
+    return "\n".join(lines)
+
+
+# ========================================
+# 기록
+# ========================================
+class TuningTraceRecorder(QThread):
+    """
+    상태 스트림 기록 스레드 - stop() 또는 duration 경과 시 종료
+    - sample_count(누적 샘플 수): 약 1초마다
+    - recording_finished(TuningTrace)
+    """
+
+    sample_count = pyqtSignal(int)
+    recording_finished = pyqtSignal(object)
+
+    def __init__(self, client_thread, meta=None, duration=None, parent=None):
+        super().__init__(parent)
+        self.stream = StatusSampleStream(client_thread, maxsize=100000)
+        self.meta = meta or {}
+        self.duration = duration
+        self._running = False
+
+    def stop(self):
+        self._running = False
+
+    def record(self):
+        """블로킹 기록 - 반환: TuningTrace"""
+        samples = []
+        self._running = True
+        self.stream.attach()
+        started = time.monotonic()
+        last_report = started
+        try:
+            while self._running:
+                now = time.monotonic()
+                if self.duration is not None and now - started >= self.duration:
+                    break
+                sample = self.stream.get(0.1)
+                if sample is not None:
+                    samples.append(sample)
+                if now - last_report >= 1.0:
+                    self.sample_count.emit(len(samples))
+                    last_report = now
+        finally:
+            self.stream.detach()
+        return TuningTrace.from_samples(samples, self.meta)
+
+    def run(self):
+        self.recording_finished.emit(self.record())
+
+
+def tuning_meta_from_settings(settings, label=None):
+    """튜닝 설정 -> 세션 메타데이터 (label 미지정 시 스텝 설정으로 생성)"""
+    keys = ["Min Step", "Max Step", "Stop Gamma", "Return Gamma", "Retuning Mode", "Start Frequency"]
+    meta = {key.lower().replace(" ", "_"): settings.get(key) for key in keys}
+    meta["label"] = label or f"step {settings.get('Min Step')}-{settings.get('Max Step')} kHz"
+    return meta
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주파수 튜닝 트레이스 기록/분석")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="상태 스트림 기록")
+    rec.add_argument("--host", default="127.0.0.1")
+    rec.add_argument("--port", type=int, default=5000)
+    rec.add_argument("--duration", type=float, default=60.0, help="기록 시간 (초)")
+    rec.add_argument("--label", default="", help="설정 이름 (통계 그룹)")
+    rec.add_argument("--stop-gamma", type=float, default=DEFAULT_STOP_GAMMA)
+    rec.add_argument("--out", required=True, help="저장 경로 (.npz)")
+
+    rep = sub.add_parser("report", help="세션 분석/통계")
+    rep.add_argument("files", nargs="+", help="기록 파일 (.npz)")
+    rep.add_argument("--stop-gamma", type=float, help="수렴 판정 감마 (기본: 세션 메타데이터)")
+    rep.add_argument("--runs", action="store_true", help="구간별 결과 출력")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        from rf_protocol import HybridRFClientThread
+
+        client_thread = HybridRFClientThread(args.host, args.port)
+        client_thread.start()
+        try:
+            recorder = TuningTraceRecorder(client_thread, {"label": args.label, "stop_gamma": args.stop_gamma},
+                                           duration=args.duration)
+            trace = recorder.record()
+        finally:
+            client_thread.stop()
+            client_thread.wait(3000)
+        trace.save(args.out)
+        print(f"{len(trace)}개 샘플, 튜닝 구간 {len(analyze_trace(trace))}개 → {args.out}")
+        return 0
+
+    metrics = []
+    for path in args.files:
+        trace = TuningTrace.load(path)
+        runs = analyze_trace(trace, args.stop_gamma)
+        metrics.extend(runs)
+        if args.runs:
+            for m in runs:
+                print(f"{path} {m['start_s']:8.2f}s {m['start_freq_mhz']:.4f}->{m['final_freq_mhz']:.4f} MHz "
+                      f"match {m['time_to_match_s']:.3f}s overshoot {m['overshoot_hz']:.0f}Hz "
+                      f"reversals {m['reversals']} gamma {m['start_gamma']:.3f}->{m['final_gamma']:.3f}")
+    if not metrics:
+        print("튜닝 구간이 없습니다")
+        return 1
+    print(format_report(aggregate(metrics)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
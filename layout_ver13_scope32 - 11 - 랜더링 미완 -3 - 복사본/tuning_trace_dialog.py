@@ -0,0 +1,209 @@
+"""
+Tuning Trace Dialog Module
+주파수 튜닝 트레이스 기록/분석 다이얼로그 - 감마-주파수 궤적, 구간별 결과, 설정별 통계
+"""
+
+import os
+import datetime
+import pyqtgraph as pg
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox, QSplitter, QPlainTextEdit
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+
+from data_manager import DATA_DIR
+from tuning_trace import (
+    TuningTrace, TuningTraceRecorder, analyze_trace, aggregate, format_report, tuning_meta_from_settings
+)
+
+RUN_COLUMNS = ["세션", "시작(s)", "주파수(MHz)", "수렴(s)", "오버슈트(Hz)", "반전", "감마"]
+
+
+class TuningTraceDialog(QDialog):
+    """주파수 튜닝 트레이스 다이얼로그"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parent_window = parent
+        self.recorder = None
+        self.traces = []    # TuningTrace 목록
+        self.metrics = []   # (trace 인덱스, 분석 결과)
+
+        self.setWindowTitle("Frequency Tuning Trace")
+        self.resize(1100, 700)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        # 기록 제어
+        control_layout = QHBoxLayout()
+        control_layout.addWidget(QLabel("설정 이름:"))
+        self.label_edit = QLineEdit()
+        settings = getattr(self.parent_window, 'tuning_settings', {})
+        self.label_edit.setText(tuning_meta_from_settings(settings)["label"])
+        control_layout.addWidget(self.label_edit)
+
+        self.record_btn = QPushButton("기록 시작")
+        self.record_btn.clicked.connect(self.toggle_recording)
+        control_layout.addWidget(self.record_btn)
+        self.record_status_label = QLabel("대기")
+        control_layout.addWidget(self.record_status_label)
+        control_layout.addStretch()
+
+        load_btn = QPushButton("세션 불러오기...")
+        load_btn.clicked.connect(self.load_sessions)
+        control_layout.addWidget(load_btn)
+        clear_btn = QPushButton("초기화")
+        clear_btn.clicked.connect(self.clear_sessions)
+        control_layout.addWidget(clear_btn)
+        layout.addLayout(control_layout)
+
+        # 플롯: 감마-주파수 궤적 / 감마-시간
+        splitter = QSplitter(Qt.Vertical)
+        plot_splitter = QSplitter(Qt.Horizontal)
+        self.trajectory_plot = pg.PlotWidget()
+        self.trajectory_plot.setLabel('bottom', 'Frequency', units='MHz')
+        self.trajectory_plot.setLabel('left', 'Gamma')
+        self.trajectory_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.time_plot = pg.PlotWidget()
+        self.time_plot.setLabel('bottom', 'Time', units='s')
+        self.time_plot.setLabel('left', 'Gamma')
+        self.time_plot.showGrid(x=True, y=True, alpha=0.3)
+        plot_splitter.addWidget(self.trajectory_plot)
+        plot_splitter.addWidget(self.time_plot)
+        splitter.addWidget(plot_splitter)
+
+        # 구간별 결과
+        self.run_table = QTableWidget(0, len(RUN_COLUMNS))
+        self.run_table.setHorizontalHeaderLabels(RUN_COLUMNS)
+        self.run_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.run_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.run_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.run_table.itemSelectionChanged.connect(self.plot_selected_runs)
+        splitter.addWidget(self.run_table)
+
+        # 설정별 통계
+        self.report_text = QPlainTextEdit()
+        self.report_text.setReadOnly(True)
+        self.report_text.setFont(QFont("Roboto Mono", 9))
+        splitter.addWidget(self.report_text)
+        splitter.setSizes([350, 200, 120])
+        layout.addWidget(splitter)
+
+    # ========================================
+    # 기록
+    # ========================================
+    def toggle_recording(self):
+        if self.recorder and self.recorder.isRunning():
+            self.recorder.stop()
+            self.record_btn.setEnabled(False)
+            return
+
+        client_thread = self.parent_window.network_manager.client_thread if self.parent_window else None
+        if not client_thread:
+            QMessageBox.warning(self, "오류", "네트워크가 연결되지 않았습니다.")
+            return
+
+        settings = getattr(self.parent_window, 'tuning_settings', {})
+        meta = tuning_meta_from_settings(settings, self.label_edit.text().strip())
+        self.recorder = TuningTraceRecorder(client_thread, meta)
+        self.recorder.sample_count.connect(lambda count: self.record_status_label.setText(f"기록 중: {count}개"))
+        self.recorder.recording_finished.connect(self.on_recording_finished)
+        self.recorder.start()
+        self.record_btn.setText("기록 정지")
+        self.record_status_label.setText("기록 중...")
+
+    def on_recording_finished(self, trace):
+        self.record_btn.setText("기록 시작")
+        self.record_btn.setEnabled(True)
+        if not len(trace):
+            self.record_status_label.setText("수신된 샘플 없음")
+            return
+
+        path = os.path.join(DATA_DIR, f"tuning_trace_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.npz")
+        try:
+            trace.save(path)
+            self.record_status_label.setText(f"{len(trace)}개 샘플 → {os.path.basename(path)}")
+        except Exception as e:
+            self.record_status_label.setText(f"저장 실패: {e}")
+        self.add_trace(trace)
+
+    def closeEvent(self, event):
+        if self.recorder and self.recorder.isRunning():
+            self.recorder.stop()
+            self.recorder.wait(2000)
+        super().closeEvent(event)
+
+    # ========================================
+    # 세션 / 분석
+    # ========================================
+    def load_sessions(self):
+        paths, _ = QFileDialog.getOpenFileNames(self, "튜닝 트레이스 불러오기", DATA_DIR, "Tuning Trace (*.npz)")
+        failed = []
+        for path in paths:
+            try:
+                self.add_trace(TuningTrace.load(path))
+            except Exception as e:
+                failed.append(f"{os.path.basename(path)}: {e}")
+        if failed:
+            QMessageBox.warning(self, "불러오기 실패", "\n".join(failed[:5]))
+
+    def clear_sessions(self):
+        self.traces = []
+        self.metrics = []
+        self.refresh()
+
+    def add_trace(self, trace):
+        index = len(self.traces)
+        self.traces.append(trace)
+        self.metrics.extend((index, m) for m in analyze_trace(trace))
+        self.refresh()
+
+    def refresh(self):
+        """구간 표/통계 갱신"""
+        self.run_table.setRowCount(len(self.metrics))
+        for row, (index, m) in enumerate(self.metrics):
+            values = [
+                f"{index + 1}: {m['label'] or '-'}",
+                f"{m['start_s']:.2f}",
+                f"{m['start_freq_mhz']:.4f} → {m['final_freq_mhz']:.4f}",
+                f"{m['time_to_match_s']:.3f}" if m['converged'] else "미수렴",
+                f"{m['overshoot_hz']:.0f} ({m['overshoot_ratio'] * 100:.0f}%)",
+                f"{m['reversals']}" + (" (헌팅)" if m['hunting'] else ""),
+                f"{m['start_gamma']:.3f} → {m['final_gamma']:.3f}",
+            ]
+            for col, text in enumerate(values):
+                self.run_table.setItem(row, col, QTableWidgetItem(text))
+
+        if self.metrics:
+            self.report_text.setPlainText(format_report(aggregate([m for _, m in self.metrics])))
+        else:
+            self.report_text.setPlainText("")
+        self.plot_selected_runs()
+
+    def plot_selected_runs(self):
+        """선택한 구간 궤적 표시 (선택 없으면 전체)"""
+        self.trajectory_plot.clear()
+        self.time_plot.clear()
+        rows = sorted({index.row() for index in self.run_table.selectedIndexes()}) or range(len(self.metrics))
+
+        for n, row in enumerate(rows):
+            trace_index, m = self.metrics[row]
+            trace = self.traces[trace_index]
+            start, _, end = m['run']
+            color = pg.intColor(n, hues=max(len(rows), 1))
+            freq = trace.columns["frequency"][start:end]
+            gamma = trace.columns["gamma"][start:end]
+            t = trace.time[start:end] - trace.time[start]
+
+            self.trajectory_plot.plot(freq, gamma, pen=pg.mkPen(color, width=1.5),
+                                      symbol='o', symbolSize=4, symbolBrush=color)
+            # 시작점 강조
+            self.trajectory_plot.plot(freq[:1], gamma[:1], pen=None, symbol='s', symbolSize=8, symbolBrush=color)
+            self.time_plot.plot(t, gamma, pen=pg.mkPen(color, width=1.5))
+            if m['converged']:
+                self.time_plot.addItem(pg.InfiniteLine(m['time_to_match_s'], angle=90,
+                                                       pen=pg.mkPen(color, style=Qt.DashLine)))
@@ -10,7 +10,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QColor, QFont
-from settings_dialog import SettingsManager  # SettingsManager 임포트
+from settings_dialog import get_settings_manager  # 공용 SettingsManager
 
 class UIController:
     """UI 컨트롤러 - 기본 UI 요소들 관리"""
@@ -18,7 +18,7 @@ class UIController:
     def __init__(self, parent):
         self.parent = parent
         
-        self.settings_manager = SettingsManager()  # SettingsManager 초기화
+        self.settings_manager = get_settings_manager()  # 공용 SettingsManager
         
         # UI 요소들 초기화
         self.status_table = None
@@ -41,6 +41,11 @@ class UIController:
         # Tuning Menu
         tuning_menu = QMenu("Tuning", self.parent)
         tuning_menu.addAction("Tuning Settings").triggered.connect(self.parent.show_tuning_dialog)
+        tuning_menu.addSeparator()
+        tuning_menu.addAction("Save Device Snapshot...").triggered.connect(self.parent.save_device_snapshot)
+        tuning_menu.addAction("Restore Device Snapshot...").triggered.connect(self.parent.restore_device_snapshot)
+        tuning_menu.addAction("Run Recipe...").triggered.connect(self.parent.run_recipe)
+        tuning_menu.addAction("Tuning Trace...").triggered.connect(self.parent.show_tuning_trace)
         
         # Settings Menu (GUI -> Settings로 변경)
         settings_menu = QMenu("Settings", self.parent)
@@ -64,6 +69,8 @@ class UIController:
         view_menu = QMenu("View", self.parent)
         view_menu.addAction("Oscilloscope").triggered.connect(self.parent.show_oscilloscope)
         view_menu.addAction("Status Monitor (Ctrl+M)").triggered.connect(self.parent.show_status_monitor)
+        view_menu.addAction("Performance Monitor").triggered.connect(self.parent.show_perf_monitor)
+        view_menu.addAction("Command Latency Report").triggered.connect(self.parent.show_command_journal)
         
         # Developer Menu
         developer_menu = QMenu("Developer", self.parent)